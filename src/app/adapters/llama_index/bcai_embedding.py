@@ -13,10 +13,22 @@ Supported Models:
 
 from __future__ import annotations
 
-from typing import Any, Sequence
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Coroutine, Sequence, TypeVar
 
+import httpx
 import requests
 
+from .utils import parse_retry_after
+
+
+_T = TypeVar("_T")
+
+_MAX_EMBED_WINDOW = 2048  # upper bound BaseEmbedding accepts for embed_batch_size
+
 try:
     from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
 except ImportError:  # pragma: no cover - optional dependency
@@ -40,6 +52,17 @@ class BCAIEmbedding(BaseEmbedding):
         timeout: Request timeout in seconds
         max_retries: Maximum number of retries on failure
         batch_size: Number of texts to embed in a single request
+        max_concurrent_batches: Batch requests kept in flight at once
+        rate_limiter: Optional shared limiter (see ``use_rate_limiter``),
+            acquired once per batch request
+        max_connections: Size of the pooled HTTP connection pool
+
+    Multi-text embedding splits the input into ``batch_size`` batches and
+    sends up to ``max_concurrent_batches`` of them concurrently over one
+    pooled ``httpx.AsyncClient``; results are reassembled in input order.
+    Requests run on an event loop owned by the embedding (a daemon thread),
+    so sync callers in worker threads and async callers on any loop share
+    the same connections and the same rate limiter.
     """
 
     def __init__(
@@ -52,8 +75,14 @@ class BCAIEmbedding(BaseEmbedding):
         timeout: float = 60.0,
         max_retries: int = 2,
         batch_size: int = 10,
+        max_concurrent_batches: int = 4,
+        rate_limiter: Any | None = None,
+        max_connections: int = 20,
     ) -> None:
-        super().__init__(model_name=model)
+        # LlamaIndex slices batch calls into embed_batch_size windows and waits
+        # for each before sending the next; use the largest window it allows so
+        # the concurrency limit below, not the window, paces the requests
+        super().__init__(model_name=model, embed_batch_size=_MAX_EMBED_WINDOW)
         self._api_base = api_base.rstrip("/")
         self._api_key = api_key
         self._model = model
@@ -61,14 +90,24 @@ class BCAIEmbedding(BaseEmbedding):
         self._timeout = timeout
         self._max_retries = max_retries
         self._batch_size = batch_size
-        
-        # Setup session with authentication
-        self._session = requests.Session()
-        self._session.headers.update({
+        self._max_concurrent_batches = max(1, max_concurrent_batches)
+        self._rate_limiter = rate_limiter
+        self._headers = {
             "Authorization": f"basic {api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json",
-        })
+        }
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+        self._client: httpx.AsyncClient | None = None
+        
+        # Setup session with authentication
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
         
         # Determine embedding dimension
         self._dimension = self._get_embedding_dimension()
@@ -106,8 +145,9 @@ class BCAIEmbedding(BaseEmbedding):
         return self._embed_single(query)
 
     async def _aget_query_embedding(self, query: str) -> Embedding:
-        """Async get query embedding (uses sync implementation)."""
-        return self._get_query_embedding(query)
+        """Async get query embedding over the pooled async client."""
+        embeddings = await self._aget_text_embeddings([query])
+        return embeddings[0]
 
     def _get_text_embedding(self, text: str) -> Embedding:
         """Get embedding for a single text.
@@ -121,34 +161,80 @@ class BCAIEmbedding(BaseEmbedding):
         return self._embed_single(text)
 
     async def _aget_text_embedding(self, text: str) -> Embedding:
-        """Async get text embedding (uses sync implementation)."""
-        return self._get_text_embedding(text)
+        """Async get text embedding over the pooled async client."""
+        embeddings = await self._aget_text_embeddings([text])
+        return embeddings[0]
 
     def _get_text_embeddings(self, texts: list[str]) -> list[Embedding]:
         """Get embeddings for multiple texts.
         
+        Batches are sent concurrently (see class docstring); this call blocks
+        until all of them are back.
+        
         Args:
             texts: List of texts to embed
             
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in the order of ``texts``
         """
         if not texts:
             return []
-        
-        # Batch texts to respect API limits and batch size
-        all_embeddings: list[Embedding] = []
-        
-        for i in range(0, len(texts), self._batch_size):
-            batch = texts[i:i + self._batch_size]
-            batch_embeddings = self._embed_batch(batch)
-            all_embeddings.extend(batch_embeddings)
-        
-        return all_embeddings
+        if len(texts) <= self._batch_size:
+            # A single request; nothing to overlap
+            return self._embed_batch(texts)
+        return self._submit(self._embed_concurrently(texts)).result()
 
     async def _aget_text_embeddings(self, texts: list[str]) -> list[Embedding]:
-        """Async get text embeddings (uses sync implementation)."""
-        return self._get_text_embeddings(texts)
+        """Async get text embeddings; batches are dispatched concurrently."""
+        if not texts:
+            return []
+        return await asyncio.wrap_future(self._submit(self._embed_concurrently(texts)))
+
+    def close(self) -> None:
+        """Close pooled connections and stop the request loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._close_client(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+        self._session.close()
+
+    async def _close_client(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _submit(self, coro: Coroutine[Any, Any, _T]) -> Future[_T]:
+        """Schedule ``coro`` on the embedding's own event loop."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="bcai-embedding-loop",
+                    daemon=True,
+                ).start()
+                self._loop = loop
+            return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _embed_concurrently(self, texts: list[str]) -> list[Embedding]:
+        """Embed ``texts`` in ``batch_size`` batches with bounded concurrency."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self._headers,
+                limits=self._limits,
+                timeout=httpx.Timeout(self._timeout),
+            )
+        semaphore = asyncio.Semaphore(self._max_concurrent_batches)
+
+        async def embed(batch: list[str]) -> list[Embedding]:
+            async with semaphore:
+                return await self._aembed_batch(batch)
+
+        batches = [texts[i:i + self._batch_size] for i in range(0, len(texts), self._batch_size)]
+        # gather keeps the batch order regardless of completion order
+        results = await asyncio.gather(*(embed(batch) for batch in batches))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
 
     def _embed_single(self, text: str) -> Embedding:
         """Embed a single text."""
@@ -167,20 +253,14 @@ class BCAIEmbedding(BaseEmbedding):
         Raises:
             RuntimeError: If API call fails after retries
         """
-        payload: dict[str, Any] = {
-            "input": texts if len(texts) > 1 else texts[0],
-            "model": self._model,
-        }
-        
-        # Add dimensions if specified (only for text-embedding-3 models)
-        if self._dimensions and "text-embedding-3" in self._model:
-            payload["dimensions"] = self._dimensions
-        
-        url = f"{self._api_base}/bcai-public-api/embedding"
+        url, payload = self._build_request(texts)
+        estimated_tokens = self._estimate_tokens(texts)
         
         # Retry logic
         last_exception = None
         for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire_blocking(1, estimated_tokens)
             try:
                 response = self._session.post(
                     url,
@@ -190,20 +270,91 @@ class BCAIEmbedding(BaseEmbedding):
                 response.raise_for_status()
                 
                 data = response.json()
+                if self._rate_limiter is not None:
+                    self._rate_limiter.record_success()
                 return self._extract_embeddings(data)
                 
             except requests.exceptions.RequestException as exc:
                 last_exception = exc
+                delay = self._retry_delay(attempt, getattr(exc, "response", None))
+                if attempt == self._max_retries:
+                    break
+                time.sleep(delay)
+        
+        raise RuntimeError(
+            f"BCAI Embedding API error after {self._max_retries + 1} attempts: {last_exception}"
+        ) from last_exception
+
+    async def _aembed_batch(self, texts: list[str]) -> list[Embedding]:
+        """Async counterpart of ``_embed_batch`` over the pooled client."""
+        assert self._client is not None  # created by _embed_concurrently
+        url, payload = self._build_request(texts)
+        estimated_tokens = self._estimate_tokens(texts)
+        
+        last_exception: Exception | None = None
+        for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(1, estimated_tokens)
+            try:
+                response = await self._client.post(url, json=payload)
+                response.raise_for_status()
+                data = response.json()
+            except (httpx.HTTPError, ValueError) as exc:
+                # ValueError: a non-JSON body, which requests reports as a RequestException
+                last_exception = exc
+                delay = self._retry_delay(
+                    attempt, exc.response if isinstance(exc, httpx.HTTPStatusError) else None
+                )
                 if attempt == self._max_retries:
                     break
-                # Wait before retrying (exponential backoff)
-                import time
-                time.sleep(2 ** attempt)
+                await asyncio.sleep(delay)
+                continue
+            if self._rate_limiter is not None:
+                self._rate_limiter.record_success()
+            return self._extract_embeddings(data)
         
         raise RuntimeError(
             f"BCAI Embedding API error after {self._max_retries + 1} attempts: {last_exception}"
         ) from last_exception
 
+    def use_rate_limiter(self, rate_limiter: Any | None) -> None:
+        """Pace batch requests with a shared limiter and report 429s/successes to it.
+
+        The limiter needs ``acquire``/``acquire_blocking`` taking a request
+        count and ``estimated_tokens``, plus ``record_success`` and
+        ``record_throttle(retry_after)`` (see ``services.rate_limiter``).
+        """
+        self._rate_limiter = rate_limiter
+
+    def _retry_delay(self, attempt: int, response: Any | None) -> float:
+        """Backoff before the next attempt; 429s also throttle the shared limiter."""
+        if response is not None and response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if self._rate_limiter is not None:
+                self._rate_limiter.record_throttle(retry_after)
+                if retry_after is not None:
+                    return 0.0  # the limiter's pause covers the wait
+            if retry_after is not None:
+                return retry_after
+        # Exponential backoff
+        return 2 ** attempt
+
+    def _estimate_tokens(self, texts: list[str]) -> int:
+        # ~4 characters per token
+        return sum(len(text) for text in texts) // 4
+
+    def _build_request(self, texts: list[str]) -> tuple[str, dict[str, Any]]:
+        payload: dict[str, Any] = {
+            "input": texts if len(texts) > 1 else texts[0],
+            "model": self._model,
+        }
+        
+        # Add dimensions if specified (only for text-embedding-3 models)
+        if self._dimensions and "text-embedding-3" in self._model:
+            payload["dimensions"] = self._dimensions
+        
+        return f"{self._api_base}/bcai-public-api/embedding", payload
+
     def _extract_embeddings(self, data: dict[str, Any]) -> list[Embedding]:
         """Extract embeddings from BCAI response.
         
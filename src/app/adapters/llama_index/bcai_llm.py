@@ -9,19 +9,27 @@ Key Features:
 - Structured outputs (JSON schema)
 - Streaming support
 - BCAI-specific parameters (conversation_mode, conversation_source, etc.)
+- Native async calls over a pooled httpx.AsyncClient (HTTP/2 when h2 is installed)
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import os
+import threading
+import time
 import uuid
 from pathlib import Path
 from typing import Any, Sequence
 
 import logging
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+from .utils import parse_retry_after
 
 # Module-level logger for consistent logging
 logger = logging.getLogger(__name__)
@@ -63,6 +71,17 @@ class BCAILLM(LlamaIndexLLM):
         conversation_mode: BCAI conversation mode (default: "non-rag")
         conversation_source: Identifier for the API caller's use case
         skip_db_save: Whether to skip saving conversation to BCAI database
+        max_connections: Upper bound on concurrent connections to the BCAI host,
+            for both the sync session and the async client
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection stays in the pool
+        http2: Multiplex async requests over HTTP/2 (needs the ``h2`` package)
+
+    ``achat``/``acomplete`` are native coroutines: requests go through one
+    ``httpx.AsyncClient`` per event loop with a bounded connection pool, so
+    hundreds of in-flight calls cost no threads. Requests beyond
+    ``max_connections`` wait for a free connection, and cancelling the
+    awaiting task aborts the request.
     """
 
     def __init__(
@@ -78,6 +97,10 @@ class BCAILLM(LlamaIndexLLM):
         conversation_mode: str = "non-rag",
         conversation_source: str = "rag-pipeline-worker",
         skip_db_save: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
     ) -> None:
         super().__init__()
         self._api_base = api_base.rstrip("/")
@@ -90,14 +113,29 @@ class BCAILLM(LlamaIndexLLM):
         self._conversation_mode = conversation_mode
         self._conversation_source = conversation_source
         self._skip_db_save = skip_db_save
-        
-        # Setup session with authentication
-        self._session = requests.Session()
-        self._session.headers.update({
+        self._headers = {
             "Authorization": f"basic {api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json",
-        })
+        }
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2 and _h2_available()
+        # One pooled client per event loop, closed when its loop shuts down
+        self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._async_closers: dict[asyncio.AbstractEventLoop, Any] = {}
+        self._async_clients_lock = threading.Lock()
+        self._rate_limiter: Any | None = None
+
+        # Setup session with authentication; size its pool for threaded callers
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     @property
     def metadata(self) -> LLMMetadata:
@@ -144,6 +182,18 @@ class BCAILLM(LlamaIndexLLM):
         Returns:
             ChatResponse with model's reply
         """
+        api_messages, response_format = self._prepare_chat(messages, kwargs)
+        response_text = self._call_api(
+            api_messages,
+            response_format=response_format,
+            **kwargs
+        )
+        return self._chat_response(response_text)
+
+    def _prepare_chat(
+        self, messages: Sequence[ChatMessage], kwargs: dict[str, Any]
+    ) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+        """Convert messages and pop the structured-output options out of ``kwargs``."""
         # Convert LlamaIndex ChatMessage to BCAI format
         api_messages = self._convert_messages(messages)
         
@@ -160,13 +210,9 @@ class BCAILLM(LlamaIndexLLM):
                     "schema": structured_schema,
                 }
             }
-        
-        response_text = self._call_api(
-            api_messages,
-            response_format=response_format,
-            **kwargs
-        )
-        
+        return api_messages, response_format
+
+    def _chat_response(self, response_text: str) -> ChatResponse:
         return ChatResponse(
             message=ChatMessage(role=MessageRole.ASSISTANT, content=response_text),
             raw={"content": response_text}
@@ -184,31 +230,88 @@ class BCAILLM(LlamaIndexLLM):
     async def acomplete(
         self, prompt: str, formatted: bool = False, **kwargs: Any
     ) -> CompletionResponse:
-        """Async complete (uses sync implementation)."""
-        return self.complete(prompt, formatted, **kwargs)
+        """Async complete over the pooled async client."""
+        messages = [{"role": "user", "content": prompt}]
+        response_text = await self._acall_api(messages, **kwargs)
+        return CompletionResponse(text=response_text)
 
     async def achat(
         self, messages: Sequence[ChatMessage], **kwargs: Any
     ) -> ChatResponse:
-        """Async chat (uses sync implementation)."""
-        return self.chat(messages, **kwargs)
+        """Async chat over the pooled async client."""
+        api_messages, response_format = self._prepare_chat(messages, kwargs)
+        response_text = await self._acall_api(
+            api_messages,
+            response_format=response_format,
+            **kwargs
+        )
+        return self._chat_response(response_text)
 
     async def astream_complete(
         self, prompt: str, formatted: bool = False, **kwargs: Any
     ) -> CompletionResponseAsyncGen:
-        """Async stream complete."""
+        """Async stream complete (single response, see ``stream_complete``)."""
         async def generator():
-            yield self.complete(prompt, formatted, **kwargs)
+            yield await self.acomplete(prompt, formatted, **kwargs)
         return generator()
 
     async def astream_chat(
         self, messages: Sequence[ChatMessage], **kwargs: Any
     ) -> ChatResponseAsyncGen:
-        """Async stream chat."""
+        """Async stream chat (single response, see ``stream_chat``)."""
         async def generator():
-            yield self.chat(messages, **kwargs)
+            yield await self.achat(messages, **kwargs)
         return generator()
 
+    async def aclose(self) -> None:
+        """Close the running event loop's async client and its pooled connections."""
+        with self._async_clients_lock:
+            closer = self._async_closers.get(asyncio.get_running_loop())
+        if closer is not None:
+            await closer.aclose()
+
+    def close(self) -> None:
+        """Close the sync session's pooled connections."""
+        self._session.close()
+
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        """The pooled client for the running event loop.
+
+        httpx connections belong to the loop that opened them, so each loop
+        gets its own client (e.g. successive ``asyncio.run`` calls, or loops
+        in several threads). A client is closed on its own loop when the loop
+        shuts down, via the async generator ``shutdown_asyncgens`` finalizes;
+        ``asyncio.run`` does that before closing the loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is not None:
+                return client
+            client = httpx.AsyncClient(
+                headers=self._headers,
+                limits=self._limits,
+                http2=self._http2,
+                timeout=httpx.Timeout(self._timeout),
+            )
+            self._async_clients[loop] = client
+            closer = self._close_with_loop(loop, client)
+            # Held here: the loop only keeps a weak reference to the generator
+            self._async_closers[loop] = closer
+        # Starting the generator registers it with the loop's shutdown_asyncgens
+        await closer.asend(None)
+        return client
+
+    async def _close_with_loop(self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient):
+        try:
+            yield
+        finally:
+            with self._async_clients_lock:
+                if self._async_clients.get(loop) is client:
+                    del self._async_clients[loop]
+                    del self._async_closers[loop]
+            await client.aclose()
+
     def _convert_messages(self, messages: Sequence[ChatMessage]) -> list[dict[str, Any]]:
         """Convert LlamaIndex ChatMessage objects to BCAI API format.
         
@@ -504,6 +607,158 @@ class BCAILLM(LlamaIndexLLM):
         Raises:
             RuntimeError: If API call fails after retries
         """
+        url, payload = self._build_request(messages, response_format, **kwargs)
+        
+        estimated_tokens = self._estimate_tokens(payload)
+        
+        # Retry logic
+        last_exception = None
+        last_response_body = None
+        for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire_blocking(1, estimated_tokens)
+            try:
+                response = self._session.post(
+                    url,
+                    json=payload,
+                    timeout=self._timeout,
+                )
+                
+                # For debugging, capture response body before raising
+                if hasattr(response, 'status_code') and response.status_code >= 400:
+                    try:
+                        last_response_body = response.text
+                    except Exception:
+                        last_response_body = None
+                
+                response.raise_for_status()
+                
+                data = response.json()
+                if self._rate_limiter is not None:
+                    self._rate_limiter.record_success()
+                return self._extract_text_from_response(data)
+                
+            except requests.exceptions.RequestException as exc:
+                last_exception = exc
+                error_response = getattr(exc, "response", None)
+                delay = self._retry_delay(
+                    attempt,
+                    error_response.status_code if error_response is not None else None,
+                    error_response.headers.get("Retry-After") if error_response is not None else None,
+                )
+                if attempt == self._max_retries or delay is None:
+                    break
+                time.sleep(delay)
+        
+        raise RuntimeError(self._error_message(last_exception, last_response_body)) from last_exception
+
+    async def _acall_api(
+        self,
+        messages: list[dict[str, Any]],
+        response_format: dict[str, Any] | None = None,
+        **kwargs: Any
+    ) -> str:
+        """Async counterpart of ``_call_api`` with the same retry policy.
+
+        Transport and HTTP errors and non-JSON bodies are retried, as in the
+        sync path; cancellation propagates immediately and releases the
+        connection.
+        """
+        url, payload = self._build_request(messages, response_format, **kwargs)
+        estimated_tokens = self._estimate_tokens(payload)
+        client = await self._get_async_client()
+        
+        last_exception: Exception | None = None
+        last_response_body = None
+        for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(1, estimated_tokens)
+            try:
+                response = await client.post(url, json=payload)
+                if response.status_code >= 400:
+                    last_response_body = response.text
+                response.raise_for_status()
+                
+                data = response.json()
+                if self._rate_limiter is not None:
+                    self._rate_limiter.record_success()
+                return self._extract_text_from_response(data)
+            except (httpx.HTTPError, ValueError) as exc:
+                # ValueError: a non-JSON body, which requests reports as a RequestException
+                last_exception = exc
+                error_response = exc.response if isinstance(exc, httpx.HTTPStatusError) else None
+                delay = self._retry_delay(
+                    attempt,
+                    error_response.status_code if error_response is not None else None,
+                    error_response.headers.get("Retry-After") if error_response is not None else None,
+                )
+                if attempt == self._max_retries or delay is None:
+                    break
+                await asyncio.sleep(delay)
+        
+        raise RuntimeError(self._error_message(last_exception, last_response_body)) from last_exception
+
+    def _retry_delay(
+        self, attempt: int, status_code: int | None, retry_after: str | None
+    ) -> float | None:
+        """Seconds to wait before the next attempt, or None when the error is final.
+
+        429s are reported to the shared rate limiter, which slows every
+        client down and, given a Retry-After, holds them all until then.
+        """
+        if status_code == 429:
+            delay = parse_retry_after(retry_after)
+            if self._rate_limiter is not None:
+                self._rate_limiter.record_throttle(delay)
+                if delay is not None:
+                    return 0.0  # the limiter's pause covers the wait
+            return delay if delay is not None else 2 ** attempt
+        # Don't retry on other 4xx errors (client errors) - only 5xx and network issues
+        if status_code is not None and 400 <= status_code < 500:
+            return None
+        # Exponential backoff
+        return 2 ** attempt
+
+    def _estimate_tokens(self, payload: dict[str, Any]) -> int:
+        """Rough provider-token cost of a request, for the rate limiter's token budget."""
+        text_chars = 0
+        images = 0
+        for message in payload.get("messages", []):
+            content = message.get("content")
+            if isinstance(content, str):
+                text_chars += len(content)
+            elif isinstance(content, list):
+                for part in content:
+                    if part.get("type") == "text":
+                        text_chars += len(part.get("text", ""))
+                    elif part.get("type") == "image_url":
+                        images += 1
+        # ~4 chars per token, ~1000 tokens per high-detail page image, plus the reply
+        return text_chars // 4 + images * 1000 + int(payload.get("response_max_tokens") or 0)
+
+    def use_rate_limiter(self, rate_limiter: Any | None) -> None:
+        """Pace requests with a shared limiter and report 429s/successes to it.
+
+        The limiter needs ``acquire``/``acquire_blocking`` taking a request
+        count and ``estimated_tokens``, plus ``record_success`` and
+        ``record_throttle(retry_after)`` (see ``services.rate_limiter``).
+        """
+        self._rate_limiter = rate_limiter
+
+    def _error_message(self, exc: Exception | None, response_body: str | None) -> str:
+        # Include response body in error message if available
+        error_msg = f"BCAI API error after {self._max_retries + 1} attempts: {exc}"
+        if response_body:
+            error_msg += f"\nResponse body: {response_body[:500]}"
+        return error_msg
+
+    def _build_request(
+        self,
+        messages: list[dict[str, Any]],
+        response_format: dict[str, Any] | None = None,
+        **kwargs: Any
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the conversation URL and payload, logging a debug summary."""
         payload: dict[str, Any] = {
             "model": self._model,
             "messages": messages,
@@ -594,48 +849,7 @@ class BCAILLM(LlamaIndexLLM):
         logger.debug(f"TOTALS: {total_text_chars:,} text chars, {total_images} images")
         logger.debug(f"ESTIMATED TOKENS: ~{estimated_text_tokens:,} (text) + ~{estimated_image_tokens:,} (images) = ~{total_estimated_tokens:,} total")
         logger.debug("=" * 60)
-        
-        # Retry logic
-        last_exception = None
-        last_response_body = None
-        for attempt in range(self._max_retries + 1):
-            try:
-                response = self._session.post(
-                    url,
-                    json=payload,
-                    timeout=self._timeout,
-                )
-                
-                # For debugging, capture response body before raising
-                if hasattr(response, 'status_code') and response.status_code >= 400:
-                    try:
-                        last_response_body = response.text
-                    except Exception:
-                        last_response_body = None
-                
-                response.raise_for_status()
-                
-                data = response.json()
-                return self._extract_text_from_response(data)
-                
-            except requests.exceptions.RequestException as exc:
-                last_exception = exc
-                if attempt == self._max_retries:
-                    break
-                # Don't retry on 4xx errors (client errors) - only 5xx and network issues
-                if hasattr(exc, 'response') and exc.response is not None:
-                    if 400 <= exc.response.status_code < 500:
-                        break  # Don't retry client errors
-                # Wait a bit before retrying (exponential backoff)
-                import time
-                time.sleep(2 ** attempt)
-        
-        # Include response body in error message if available
-        error_msg = f"BCAI API error after {self._max_retries + 1} attempts: {last_exception}"
-        if last_response_body:
-            error_msg += f"\nResponse body: {last_response_body[:500]}"
-        
-        raise RuntimeError(error_msg) from last_exception
+        return url, payload
 
     def _extract_text_from_response(self, data: dict[str, Any]) -> str:
         """Extract generated text from BCAI response.
@@ -666,3 +880,10 @@ class BCAILLM(LlamaIndexLLM):
             # Fallback to returning raw data as string
             return str(data)
 
+
+def _h2_available() -> bool:
+    try:
+        import h2  # type: ignore  # noqa: F401
+    except ImportError:
+        return False
+    return True
@@ -155,6 +155,9 @@ def _build_llm(settings: Settings, *, api_key: str | None = None, api_base: str
             max_retries=settings.llm.max_retries,
             conversation_mode=getattr(settings.llm, "conversation_mode", "non-rag"),
             conversation_source=getattr(settings.llm, "conversation_source", "rag-pipeline-worker"),
+            max_connections=settings.llm.max_connections,
+            max_keepalive_connections=settings.llm.max_keepalive_connections,
+            http2=settings.llm.http2,
         )
 
     raise LlamaIndexBootstrapError(
@@ -235,6 +238,7 @@ def _build_embedding(settings: Settings) -> Any:
             model=settings.embeddings.model,
             dimensions=getattr(settings.embeddings, "dimensions", None),
             batch_size=settings.embeddings.batch_size,
+            max_concurrent_batches=settings.embeddings.max_concurrent_batches,
         )
 
     raise LlamaIndexBootstrapError(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from typing import Any
@@ -12,6 +13,7 @@ from llama_index.core.multi_modal_llms.generic_utils import encode_image
 
 from ...application.interfaces import CleaningLLM
 from ...config import PromptSettings
+from ...parsing.pixmap_store import PixmapStore, guess_mimetype
 from ...parsing.schemas import (
     CleanedPage,
     CleanedSegment,
@@ -21,12 +23,16 @@ from ...parsing.schemas import (
     ParsedTableComponent,
 )
 from ...prompts.loader import load_prompt
+from .utils import llm_chat, llm_complete, run_blocking
 
 logger = logging.getLogger(__name__)
 
 
 class CleaningAdapter(CleaningLLM):
-    """LLM-backed cleaner that normalizes parsed page content."""
+    """LLM-backed cleaner that normalizes parsed page content.
+
+    ``aclean_page`` is ``clean_page`` over the LLM's native async calls.
+    """
 
     def __init__(
         self,
@@ -34,8 +40,10 @@ class CleaningAdapter(CleaningLLM):
         prompt_settings: PromptSettings,
         use_structured_outputs: bool = True,
         use_vision: bool = False,
+        pixmap_store: PixmapStore | None = None,
     ) -> None:
         self._llm = llm
+        self._pixmap_store = pixmap_store
         self._use_structured_outputs = use_structured_outputs
         self._use_vision = use_vision
         # Build prompt template from loaded prompts
@@ -45,7 +53,36 @@ class CleaningAdapter(CleaningLLM):
         full_prompt_text = f"{system_prompt}\n\n{user_prompt_template}\n\n{{request_json}}"
         self._prompt_template = PromptTemplate(full_prompt_text)
 
+    @property
+    def cache_identity(self) -> dict[str, Any]:
+        """Prompt/model identity used to key cached cleaning results."""
+        model_name = getattr(getattr(self._llm, "metadata", None), "model_name", None)
+        return {
+            "prompt_sha256": hashlib.sha256(self._prompt_template.template.encode("utf-8")).hexdigest(),
+            "model": str(model_name or getattr(self._llm, "model", None) or self._llm.__class__.__name__),
+            "uses_pixmap": self._use_vision,
+        }
+
+    def _pixmap_exists(self, pixmap_path: str) -> bool:
+        if self._pixmap_store is not None:
+            return self._pixmap_store.exists(pixmap_path)
+        return Path(pixmap_path).exists()
+
+    def _encode_pixmap(self, pixmap_path: str) -> tuple[str, str]:
+        if self._pixmap_store is not None:
+            encoded = self._pixmap_store.base64(pixmap_path)
+            if encoded is not None:
+                return encoded, self._pixmap_store.mimetype(pixmap_path)
+        return encode_image(pixmap_path), guess_mimetype(pixmap_path)
+
     def clean_page(self, parsed_page: ParsedPage, pixmap_path: str | None = None) -> CleanedPage:
+        return run_blocking(self._clean_page(parsed_page, pixmap_path, native_async=False))
+
+    async def aclean_page(self, parsed_page: ParsedPage, pixmap_path: str | None = None) -> CleanedPage:
+        """``clean_page`` awaiting the LLM's async calls instead of blocking on them."""
+        return await self._clean_page(parsed_page, pixmap_path, native_async=True)
+
+    async def _clean_page(self, parsed_page: ParsedPage, pixmap_path: str | None, native_async: bool) -> CleanedPage:
         # Build request with components instead of separate paragraphs/tables
         request = {
             "document_id": parsed_page.document_id,
@@ -65,17 +102,17 @@ class CleaningAdapter(CleaningLLM):
         
         try:
             # Use vision-based cleaning if enabled and pixmap is available
-            if self._use_vision and pixmap_path and Path(pixmap_path).exists():
-                cleaned_page = self._clean_with_vision(request_json, parsed_page, pixmap_path)
+            if self._use_vision and pixmap_path and self._pixmap_exists(pixmap_path):
+                cleaned_page = await self._clean_with_vision(request_json, parsed_page, pixmap_path, native_async)
                 if cleaned_page:
                     return cleaned_page
             elif self._use_structured_outputs:
-                cleaned_page = self._clean_with_structured_llm(request_json, parsed_page)
+                cleaned_page = await self._clean_with_structured_llm(request_json, parsed_page, native_async)
                 if cleaned_page:
                     return cleaned_page
             else:
                 # Fallback to non-structured parsing if disabled
-                cleaned_page = self._clean_without_structured_llm(request_json, parsed_page)
+                cleaned_page = await self._clean_without_structured_llm(request_json, parsed_page, native_async)
                 if cleaned_page:
                     return cleaned_page
         except Exception as exc:  # pragma: no cover - defensive
@@ -118,6 +155,7 @@ class CleaningAdapter(CleaningLLM):
             document_id=parsed_page.document_id,
             page_number=parsed_page.page_number,
             segments=segments,
+            cleaning_status="fallback",
         )
     
     @staticmethod
@@ -134,10 +172,11 @@ class CleaningAdapter(CleaningLLM):
                 base["type"] = "table"
         return base
     
-    def _clean_with_structured_llm(
+    async def _clean_with_structured_llm(
         self,
         request_json: str,
         parsed_page: ParsedPage,
+        native_async: bool = False,
     ) -> CleanedPage | None:
         """Clean using LlamaIndex structured LLM APIs."""
         try:
@@ -148,7 +187,7 @@ class CleaningAdapter(CleaningLLM):
             prompt_text = self._prompt_template.format(request_json=request_json)
             
             # Use structured LLM complete method
-            response = structured_llm.complete(prompt_text)
+            response = await llm_complete(structured_llm, prompt_text, native_async)
             
             # Extract Pydantic object from response.raw
             if hasattr(response, "raw") and isinstance(response.raw, CleanedPage):
@@ -165,16 +204,17 @@ class CleaningAdapter(CleaningLLM):
             )
         return None
     
-    def _clean_without_structured_llm(
+    async def _clean_without_structured_llm(
         self,
         request_json: str,
         parsed_page: ParsedPage,
+        native_async: bool = False,
     ) -> CleanedPage | None:
         """Fallback cleaning without structured outputs."""
         prompt_text = self._prompt_template.format(request_json=request_json)
         
         try:
-            response = self._llm.complete(prompt_text)
+            response = await llm_complete(self._llm, prompt_text, native_async)
             
             # Try to extract and parse JSON manually
             if hasattr(response, "text"):
@@ -205,11 +245,12 @@ class CleaningAdapter(CleaningLLM):
             )
         return None
     
-    def _clean_with_vision(
+    async def _clean_with_vision(
         self,
         request_json: str,
         parsed_page: ParsedPage,
         pixmap_path: str,
+        native_async: bool = False,
     ) -> CleanedPage | None:
         """Clean using vision-based LLM with page image for context."""
         try:
@@ -226,7 +267,8 @@ class CleaningAdapter(CleaningLLM):
             full_prompt = prompt_text + schema_instruction
             
             # Encode image as base64
-            image_data = encode_image(pixmap_path)
+            # Reuses the payload parsing already encoded for this page
+            image_data, image_mimetype = self._encode_pixmap(pixmap_path)
             
             # Create chat messages with system prompt + image
             messages = [
@@ -234,13 +276,13 @@ class CleaningAdapter(CleaningLLM):
                 ChatMessage(
                     role="user",
                     content=[
-                        ImageBlock(image=image_data, image_mimetype="image/png"),
+                        ImageBlock(image=image_data, image_mimetype=image_mimetype),
                     ],
                 ),
             ]
             
             # Call chat with vision
-            response = self._llm.chat(messages)
+            response = await llm_chat(self._llm, messages, native_async)
             
             # Extract content
             if hasattr(response, "message") and hasattr(response.message, "content"):
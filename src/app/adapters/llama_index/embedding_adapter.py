@@ -16,13 +16,23 @@ class LlamaIndexEmbeddingAdapter(EmbeddingGenerator):
     def dimension(self) -> int:  # noqa: D401
         return getattr(self._embed_model, "dimension", self._dimension)
 
+    @property
+    def cache_identity(self) -> dict[str, object]:
+        """Model identity used to key cached embeddings."""
+        model_name = getattr(self._embed_model, "model_name", None) or self._embed_model.__class__.__name__
+        return {"model": str(model_name), "dimensions": self.dimension}
+
     def embed(self, texts: Sequence[str]) -> Sequence[Sequence[float]]:
-        embeddings: list[list[float]] = []
-        for text in texts:
-            cleaned = text.strip()
-            if not cleaned:
-                embeddings.append([0.0] * self.dimension)
-                continue
-            vector = self._embed_model.get_text_embedding(cleaned)
-            embeddings.append([float(x) for x in vector])
+        embeddings: list[list[float]] = [[0.0] * self.dimension for _ in texts]
+        pending = [(index, text.strip()) for index, text in enumerate(texts) if text.strip()]
+        if not pending:
+            return embeddings
+        # One batch call lets models that batch (or parallelize) requests do so
+        get_batch = getattr(self._embed_model, "get_text_embedding_batch", None)
+        if get_batch is not None:
+            vectors = get_batch([text for _, text in pending])
+        else:
+            vectors = [self._embed_model.get_text_embedding(text) for _, text in pending]
+        for (index, _), vector in zip(pending, vectors):
+            embeddings[index] = [float(x) for x in vector]
         return embeddings
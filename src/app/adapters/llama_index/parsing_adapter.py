@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import time
@@ -13,15 +14,22 @@ from llama_index.core.multi_modal_llms.generic_utils import encode_image
 
 from ...application.interfaces import ParsingLLM
 from ...config import PromptSettings
+from ...parsing.pixmap_store import PixmapStore, guess_mimetype
 from ...parsing.schemas import ParsedPage
 from ...prompts.loader import load_prompt
 from ...observability.llm_error_logger import log_llm_parsing_error
+from .utils import llm_chat, llm_stream_chat, run_blocking
 
 logger = logging.getLogger("rag_pipeline.llm")
 
 
 class ImageAwareParsingAdapter(ParsingLLM):
-    """Calls an LLM to convert a page image into structured content."""
+    """Calls an LLM to convert a page image into structured content.
+
+    ``parse_page`` blocks on the LLM; ``aparse_page`` runs the same parsing
+    logic over the LLM's native async calls, so pages awaited concurrently
+    on one event loop do not each hold a thread.
+    """
 
     def __init__(
         self,
@@ -34,8 +42,10 @@ class ImageAwareParsingAdapter(ParsingLLM):
         streaming_repetition_window: int = 200,
         streaming_repetition_threshold: float = 0.8,
         streaming_max_consecutive_newlines: int = 100,
+        pixmap_store: PixmapStore | None = None,
     ) -> None:
         self._llm = llm
+        self._pixmap_store = pixmap_store
         self._vision_llm = vision_llm
         self._use_structured_outputs = use_structured_outputs
         self._use_streaming = use_streaming
@@ -52,7 +62,24 @@ class ImageAwareParsingAdapter(ParsingLLM):
         # Combine system and user prompts into a single system message
         # Include document_id and page_number placeholders for the LLM to use
         self._system_prompt = f"{system_prompt}\n\n{user_prompt_template}"
+
+    @property
+    def cache_identity(self) -> dict[str, str]:
+        """Prompt and model identity used to key cached parse results."""
+        model_name = getattr(getattr(self._llm, "metadata", None), "model_name", None)
+        return {
+            "prompt_sha256": hashlib.sha256(self._system_prompt.encode("utf-8")).hexdigest(),
+            "model": str(model_name or getattr(self._llm, "model", None) or self._llm.__class__.__name__),
+        }
     
+    def _encode_pixmap(self, pixmap_path: str) -> tuple[str, str]:
+        """Base64 payload and mimetype for the page image, shared through the pixmap store when present."""
+        if self._pixmap_store is not None:
+            encoded = self._pixmap_store.base64(pixmap_path)
+            if encoded is not None:
+                return encoded, self._pixmap_store.mimetype(pixmap_path)
+        return encode_image(pixmap_path), guess_mimetype(pixmap_path)
+
     def parse_page(
         self,
         *,
@@ -60,6 +87,26 @@ class ImageAwareParsingAdapter(ParsingLLM):
         page_number: int,
         raw_text: str = "",  # Optional, not used for image-only parsing
         pixmap_path: str | None = None,
+    ) -> ParsedPage:
+        return run_blocking(self._parse_page(document_id, page_number, pixmap_path, native_async=False))
+
+    async def aparse_page(
+        self,
+        *,
+        document_id: str,
+        page_number: int,
+        raw_text: str = "",  # Optional, not used for image-only parsing
+        pixmap_path: str | None = None,
+    ) -> ParsedPage:
+        """``parse_page`` awaiting the LLM's async chat instead of blocking on it."""
+        return await self._parse_page(document_id, page_number, pixmap_path, native_async=True)
+
+    async def _parse_page(
+        self,
+        document_id: str,
+        page_number: int,
+        pixmap_path: str | None,
+        native_async: bool,
     ) -> ParsedPage:
         # Require pixmap for vision parsing (image-only mode)
         if not pixmap_path:
@@ -82,7 +129,7 @@ class ImageAwareParsingAdapter(ParsingLLM):
             # Priority 1: Use structured API (non-streaming) for maximum reliability
             # This leverages native JSON mode (OpenAI response_format) when available
             if self._use_structured_outputs and not self._use_streaming:
-                parsed_page = self._parse_with_structured_api(document_id, page_number, pixmap_path)
+                parsed_page = await self._parse_with_structured_api(document_id, page_number, pixmap_path, native_async)
                 if parsed_page:
                     self._log_trace(document_id, page_number, pixmap_path, parsed_page)
                     return parsed_page
@@ -96,13 +143,17 @@ class ImageAwareParsingAdapter(ParsingLLM):
             # Priority 2: Use manual schema injection with streaming (for progress logs)
             # This is used when streaming is enabled or when structured API failed
             if self._use_structured_outputs:
-                parsed_page = self._parse_with_vision_structured(document_id, page_number, pixmap_path)
+                parsed_page = await self._parse_with_vision_structured(
+                    document_id, page_number, pixmap_path, native_async
+                )
                 if parsed_page:
                     self._log_trace(document_id, page_number, pixmap_path, parsed_page)
                     return parsed_page
             else:
                 # Priority 3: Fallback to non-structured parsing if disabled
-                parsed_page = self._parse_without_structured_llm(document_id, page_number, pixmap_path)
+                parsed_page = await self._parse_without_structured_llm(
+                    document_id, page_number, pixmap_path, native_async
+                )
                 if parsed_page:
                     self._log_trace(document_id, page_number, pixmap_path, parsed_page)
                     return parsed_page
@@ -140,11 +191,12 @@ class ImageAwareParsingAdapter(ParsingLLM):
             error_details="All parsing methods failed to return a valid page",
         )
 
-    def _parse_with_vision_structured(
+    async def _parse_with_vision_structured(
         self,
         document_id: str,
         page_number: int,
         pixmap_path: str,
+        native_async: bool = False,
     ) -> ParsedPage | None:
         """Parse using OpenAI LLM (GPT-4o-mini) with vision - image-only mode."""
         path_obj = Path(pixmap_path) if pixmap_path else None
@@ -175,7 +227,7 @@ class ImageAwareParsingAdapter(ParsingLLM):
             full_system_prompt = system_prompt_with_context + schema_instruction
             
             # Encode image as base64 string (not data URL)
-            image_data = encode_image(pixmap_path)
+            image_data, image_mimetype = self._encode_pixmap(pixmap_path)
             
             # Use system message + user message with image
             # System message contains instructions, user message contains the image
@@ -184,7 +236,7 @@ class ImageAwareParsingAdapter(ParsingLLM):
                 ChatMessage(
                     role="user",
                     content=[
-                        ImageBlock(image=image_data, image_mimetype="image/png"),
+                        ImageBlock(image=image_data, image_mimetype=image_mimetype),
                     ],
                 ),
             ]
@@ -200,9 +252,11 @@ class ImageAwareParsingAdapter(ParsingLLM):
             stream_error_details: str | None = None
             
             if self._use_streaming:
-                content, stream_error_type, stream_error_details = self._stream_chat_response(messages, document_id, page_number)
+                content, stream_error_type, stream_error_details = await self._stream_chat_response(
+                    messages, document_id, page_number, native_async
+                )
             else:
-                response = self._llm.chat(messages)
+                response = await llm_chat(self._llm, messages, native_async)
                 content = self._extract_content_from_response(response)
             
             elapsed_time = time.time() - start_time
@@ -320,11 +374,12 @@ class ImageAwareParsingAdapter(ParsingLLM):
             )
         return None
     
-    def _parse_with_structured_api(
+    async def _parse_with_structured_api(
         self,
         document_id: str,
         page_number: int,
         pixmap_path: str,
+        native_async: bool = False,
     ) -> ParsedPage | None:
         """Parse using LlamaIndex as_structured_llm() API with vision.
         
@@ -367,7 +422,7 @@ class ImageAwareParsingAdapter(ParsingLLM):
             )
             
             # Encode image as base64
-            image_data = encode_image(pixmap_path)
+            image_data, image_mimetype = self._encode_pixmap(pixmap_path)
             
             # Create messages: system prompt + user message with image
             messages = [
@@ -375,7 +430,7 @@ class ImageAwareParsingAdapter(ParsingLLM):
                 ChatMessage(
                     role="user",
                     content=[
-                        ImageBlock(image=image_data, image_mimetype="image/png"),
+                        ImageBlock(image=image_data, image_mimetype=image_mimetype),
                     ],
                 ),
             ]
@@ -383,7 +438,7 @@ class ImageAwareParsingAdapter(ParsingLLM):
             # Call chat() on structured LLM wrapper
             # This should automatically use native structured output support
             start_time = time.time()
-            response = structured_llm.chat(messages)
+            response = await llm_chat(structured_llm, messages, native_async)
             elapsed_time = time.time() - start_time
             
             # Extract raw text for error logging
@@ -503,11 +558,12 @@ class ImageAwareParsingAdapter(ParsingLLM):
             )
         return None
     
-    def _parse_without_structured_llm(
+    async def _parse_without_structured_llm(
         self,
         document_id: str,
         page_number: int,
         pixmap_path: str,
+        native_async: bool = False,
     ) -> ParsedPage | None:
         """Fallback parsing without structured outputs (for testing or when disabled)."""
         try:
@@ -519,7 +575,7 @@ class ImageAwareParsingAdapter(ParsingLLM):
             )
             
             # Encode image as base64 string
-            image_data = encode_image(pixmap_path)
+            image_data, image_mimetype = self._encode_pixmap(pixmap_path)
             
             # Use system message + user message with image
             messages = [
@@ -527,12 +583,12 @@ class ImageAwareParsingAdapter(ParsingLLM):
                 ChatMessage(
                     role="user",
                     content=[
-                        ImageBlock(image=image_data, image_mimetype="image/png"),
+                        ImageBlock(image=image_data, image_mimetype=image_mimetype),
                     ],
                 ),
             ]
             
-            response = self._llm.chat(messages)
+            response = await llm_chat(self._llm, messages, native_async)
             
             # Try to extract and parse JSON manually
             if hasattr(response, "message") and hasattr(response.message, "content"):
@@ -579,11 +635,12 @@ class ImageAwareParsingAdapter(ParsingLLM):
             )
         return None
 
-    def _stream_chat_response(
+    async def _stream_chat_response(
         self,
         messages: list[ChatMessage],
         document_id: str,
         page_number: int,
+        native_async: bool = False,
     ) -> tuple[str, str | None, str | None]:
         """Stream chat response and log progress in real-time with repetition detection.
         
@@ -627,9 +684,9 @@ class ImageAwareParsingAdapter(ParsingLLM):
         
         try:
             # Call stream_chat to get streaming response
-            stream_response = self._llm.stream_chat(messages)
+            stream_response = await llm_stream_chat(self._llm, messages, native_async)
             
-            for chunk in stream_response:
+            async for chunk in stream_response:
                 chunk_count += 1
                 current_time = time.time()
                 
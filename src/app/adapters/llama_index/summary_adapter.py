@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import Sequence
 
@@ -21,6 +22,16 @@ class LlamaIndexSummaryAdapter(SummaryGenerator):
         self._document_summary_prompt = load_prompt("docs/prompts/summarization/document_summary.md")
         self._chunk_summary_prompt = load_prompt("docs/prompts/summarization/chunk_summary.md")
 
+    @property
+    def cache_identity(self) -> dict[str, str]:
+        """Prompt/model identity used to fingerprint enrichment output."""
+        prompts = "\n".join([self._generic_prompt, self._document_summary_prompt, self._chunk_summary_prompt])
+        model_name = getattr(getattr(self._llm, "metadata", None), "model_name", None)
+        return {
+            "prompt_sha256": hashlib.sha256(prompts.encode("utf-8")).hexdigest(),
+            "model": str(model_name or getattr(self._llm, "model", None) or self._llm.__class__.__name__),
+        }
+
     def summarize(self, text: str) -> str:
         """Generic summarization (backwards compatibility)."""
         if not text.strip():
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterator, Coroutine, Iterable, Sequence, TypeVar
+
+T = TypeVar("T")
 
 
 def strip_code_fences(text: str) -> str:
@@ -38,3 +40,62 @@ def extract_response_text(response: Any) -> str:
                 return strip_code_fences(last.content or "")
     # Fallback to string representation
     return strip_code_fences(str(response))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from datetime import datetime, timezone
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def run_blocking(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run an adapter coroutine built with ``native_async=False`` to its result.
+
+    Such a coroutine only awaits the LLM helpers below, which call the
+    blocking LLM methods and never suspend, so no event loop is needed.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as finished:
+        return finished.value
+    coroutine.close()
+    raise RuntimeError("Blocking adapter call suspended; it awaited a native async LLM call")
+
+
+async def llm_chat(llm: Any, messages: Sequence[Any], native_async: bool) -> Any:
+    """``llm.achat`` on the event loop when ``native_async``, otherwise the blocking ``llm.chat``."""
+    if native_async:
+        return await llm.achat(messages)
+    return llm.chat(messages)
+
+
+async def llm_complete(llm: Any, prompt: str, native_async: bool) -> Any:
+    """``llm.acomplete`` on the event loop when ``native_async``, otherwise the blocking ``llm.complete``."""
+    if native_async:
+        return await llm.acomplete(prompt)
+    return llm.complete(prompt)
+
+
+async def llm_stream_chat(llm: Any, messages: Sequence[Any], native_async: bool) -> AsyncIterator[Any]:
+    """Response chunks from ``llm.astream_chat``, or ``llm.stream_chat``'s when blocking."""
+    if native_async:
+        return await llm.astream_chat(messages)
+    return _iterate(llm.stream_chat(messages))
+
+
+async def _iterate(items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
@@ -1,19 +1,60 @@
-"""PDF parser adapter using pdfplumber for text parsing."""
+"""PDF parser adapter using PyMuPDF for text parsing, with pdfplumber as fallback."""
 
 from __future__ import annotations
 
 import io
-from typing import Sequence
+import logging
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Iterator, Sequence
 
 import pdfplumber
 
 from ..application.interfaces import DocumentParser
+from ..parsing.pdf_backend import PdfBackendError, SharedPdfBytes, close_worker_pdf, open_pdf, worker_pdf
+
+logger = logging.getLogger(__name__)
 
 
 class PdfParserAdapter(DocumentParser):
-    """PDF parser adapter that extracts text from PDF files using pdfplumber."""
+    """PDF parser adapter that extracts text from PDF files.
+
+    Text comes from the shared PyMuPDF document (see ``parsing.pdf_backend``),
+    so a caller that already opened the PDF for rendering or triage does not
+    pay for a second parse. pdfplumber is only used when PyMuPDF is missing
+    or fails on the file.
+
+    With ``parallel_workers`` above one, PDFs of at least
+    ``parallel_min_pages`` pages are split into ranges of ``pages_per_task``
+    pages that a process pool extracts concurrently. ``iter_pages`` yields
+    the texts in page order as soon as each range lands, so callers can start
+    on page 1 while later ranges are still being extracted. The process pool
+    is started on first use and shared by every document until ``shutdown``.
+    """
 
     supported_types: Sequence[str] = ("pdf",)
+    accepts_mapped_files = True  # PyMuPDF opens a MappedFile's stored path directly
+
+    def __init__(
+        self,
+        parallel_workers: int = 0,
+        parallel_min_pages: int = 200,
+        pages_per_task: int = 32,
+    ) -> None:
+        self.parallel_workers = parallel_workers
+        self.parallel_min_pages = parallel_min_pages
+        self.pages_per_task = max(1, pages_per_task)
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the text extraction worker processes."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
 
     def supports_type(self, file_type: str) -> bool:
         """Return True if the parser handles PDF files."""
@@ -38,9 +79,84 @@ class PdfParserAdapter(DocumentParser):
             - Password-protected PDFs: returns empty list
             - PDFs with no extractable text: returns list with empty strings
         """
+        try:
+            return list(self.iter_pages(file_bytes, filename))
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning("PyMuPDF text extraction failed for %s, falling back to pdfplumber: %s", filename, exc)
+        return self._parse_with_pdfplumber(file_bytes)
+
+    def iter_pages(self, file_bytes: bytes, filename: str) -> Iterator[str]:
+        """Yield page texts in order, extracting large PDFs in parallel ranges."""
         if not file_bytes:
-            return []
+            return
 
+        try:
+            with open_pdf(file_bytes) as pdf:
+                page_count = pdf.page_count
+                if not self._extract_in_parallel(page_count):
+                    for page_number in range(1, page_count + 1):
+                        yield pdf.page_text(page_number)
+                    return
+        except PdfBackendError as exc:
+            logger.debug("PyMuPDF could not read %s, falling back to pdfplumber: %s", filename, exc)
+            yield from self._parse_with_pdfplumber(file_bytes)
+            return
+
+        logger.info(
+            "📄 Extracting %d pages of %s across %d processes",
+            page_count,
+            filename,
+            self.parallel_workers,
+        )
+        yield from self._iter_pages_parallel(file_bytes, page_count)
+
+    def _extract_in_parallel(self, page_count: int) -> bool:
+        return self.parallel_workers > 1 and page_count >= max(self.parallel_min_pages, 2)
+
+    def _iter_pages_parallel(self, file_bytes: bytes, page_count: int) -> Iterator[str]:
+        executor = self._ensure_executor()
+        shared_pdf = SharedPdfBytes.publish(file_bytes, on_release=partial(self._close_in_workers, executor))
+        futures: list[Future] = []
+        try:
+            for start in range(1, page_count + 1, self.pages_per_task):
+                stop = min(start + self.pages_per_task - 1, page_count)
+                futures.append(executor.submit(_extract_page_range, shared_pdf.source, start, stop))
+            for future in futures:
+                yield from future.result()
+        except BrokenProcessPool:
+            self._reset_executor(executor)
+            raise
+        finally:
+            # Also reached when the consumer stops early: drop the ranges nobody will read.
+            # Ranges already running keep their own mapping of the PDF until they finish.
+            for future in futures:
+                future.cancel()
+            shared_pdf.release()
+
+    def _close_in_workers(self, executor: ProcessPoolExecutor, source: tuple[str, str, int]) -> None:
+        """Tell every worker to close the released document instead of caching it."""
+        try:
+            for _ in range(self.parallel_workers):
+                executor.submit(close_worker_pdf, source)
+        except (BrokenProcessPool, RuntimeError) as exc:
+            logger.debug("Could not signal PDF release to extraction workers: %s", exc)
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.parallel_workers)
+            return self._executor
+
+    def _reset_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Drop a broken pool so the next document starts fresh workers."""
+        with self._executor_lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        logger.warning("Text extraction pool broke, restarting workers on next use")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _parse_with_pdfplumber(self, file_bytes: bytes) -> list[str]:
         try:
             # Create a file-like object from bytes for pdfplumber
             pdf_file = io.BytesIO(file_bytes)
@@ -64,3 +180,9 @@ class PdfParserAdapter(DocumentParser):
             # which wraps pdfminer errors (e.g., PDFSyntaxError). Catching Exception
             # catches all of these gracefully.
             return []
+
+
+def _extract_page_range(source: tuple[str, str, int], start: int, stop: int) -> list[str]:
+    """Worker entry point: texts of pages ``start``..``stop`` (1-based, inclusive)."""
+    with worker_pdf(source) as document:
+        return [document[index].get_text("text", sort=True).strip() for index in range(start - 1, stop)]
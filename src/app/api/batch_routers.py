@@ -34,6 +34,7 @@ def get_batch_repository() -> BatchJobRepository:
 async def batch_upload(
     files: list[UploadFile] = File(...),
     error_strategy: str = "continue",
+    priority: str = "batch",
     use_case: BatchUploadUseCase = Depends(get_batch_upload_use_case),
 ) -> dict:
     """Upload multiple documents for batch processing.
@@ -45,6 +46,8 @@ async def batch_upload(
     Args:
         files: List of files to upload (up to 50 files)
         error_strategy: How to handle failures - "continue" (default) or "fail_all"
+        priority: LLM scheduling class - "batch" (default) or "backfill"; single
+            uploads always run ahead of both
         use_case: Injected batch upload use case
         
     Returns:
@@ -55,36 +58,37 @@ async def batch_upload(
             "batch_id": "550e8400-e29b-41d4-a716-446655440000",
             "total_documents": 5,
             "status": "queued",
-            "error_strategy": "continue"
+            "error_strategy": "continue",
+            "priority": "batch"
         }
     """
     if not files:
         raise HTTPException(status_code=400, detail="No files provided")
 
-    # Read all files
+    # Hand over the upload streams; the use case spools them to storage in chunks
     file_data = []
     for file in files:
         if not file.filename:
             raise HTTPException(status_code=400, detail="All files must have filenames")
         
-        file_bytes = await file.read()
         extension = file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else ""
         
         file_data.append((
             file.filename,
             extension,
-            file_bytes,
+            file.file,
             file.content_type,
         ))
 
     # Execute batch upload
-    batch = use_case.execute(file_data, error_strategy=error_strategy)
+    batch = use_case.execute(file_data, error_strategy=error_strategy, priority=priority)
 
     return {
         "batch_id": batch.id,
         "total_documents": batch.total_documents,
         "status": batch.status,
         "error_strategy": batch.error_strategy,
+        "priority": batch.priority,
         "created_at": batch.created_at.isoformat(),
     }
 
@@ -131,6 +135,7 @@ async def get_batch_details(
         "failed_documents": batch.failed_documents,
         "progress_percentage": batch.progress_percentage,
         "error_strategy": batch.error_strategy,
+        "priority": batch.priority,
         "started_at": batch.started_at.isoformat() if batch.started_at else None,
         "completed_at": batch.completed_at.isoformat() if batch.completed_at else None,
         "is_finished": batch.is_finished,
@@ -291,18 +296,36 @@ async def batch_status_stream(
 @router.get("/")
 async def list_batches(
     limit: int = 20,
+    offset: int = 0,
+    status: str | None = None,
     repository: BatchJobRepository = Depends(get_batch_repository),
 ) -> dict:
     """List recent batch jobs.
     
+    Summaries come from the batch catalog, so no batch or document job
+    files are read.
+    
     Args:
         limit: Maximum number of batches to return (default 20)
+        offset: Number of most recent batches to skip, for pagination
+        status: Only list batches with this status
         repository: Injected batch repository
         
     Returns:
         Dictionary with list of batch summaries
     """
-    batches = repository.list_batches(limit=limit)
+    entries = repository.list_entries(status=status, limit=limit, offset=offset)
+    batches = [
+        BatchJob(
+            id=entry.id,
+            created_at=entry.created_at,
+            status=entry.status,
+            total_documents=entry.details.get("total_documents", 0),
+            completed_documents=entry.details.get("completed_documents", 0),
+            failed_documents=entry.details.get("failed_documents", 0),
+        )
+        for entry in entries
+    ]
     
     return {
         "batches": [
@@ -68,13 +68,19 @@ async def dashboard_upload(
     if extension not in {"pdf", "docx", "ppt", "pptx"}:
         raise HTTPException(status_code=400, detail="Unsupported file type")
 
-    file_bytes = await file.read()
     document = Document(
         filename=file.filename,
         file_type=extension,
-        size_bytes=len(file_bytes),
         metadata={"content_type": file.content_type},
     )
+    file_bytes = None
+    ingestion = run_manager.runner.ingestion
+    if ingestion.repository is not None:
+        # Spool to ingestion storage; the run reads the stored file
+        document = ingestion.spool(document, file.file)
+    else:
+        file_bytes = await file.read()
+        document = document.model_copy(update={"size_bytes": len(file_bytes)})
 
     run_id = str(uuid4())
     file.file.seek(0)
@@ -120,6 +126,39 @@ async def dashboard_run_fragment(
     )
 
 
+@router.post("/runs/{run_id}/rerun", response_class=HTMLResponse)
+async def dashboard_rerun(
+    request: Request,
+    run_id: str,
+    background_tasks: BackgroundTasks,
+    run_manager: PipelineRunManager = Depends(get_run_manager),
+) -> HTMLResponse:
+    previous = run_manager.get_run(run_id)
+    if not previous or previous.document is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    file_bytes = None
+    if not previous.document.metadata.get("raw_file_path") and previous.file_path:
+        # No stored raw file; re-read the dashboard's own copy of the upload
+        upload_path = UPLOAD_DIR.parent / previous.file_path
+        if upload_path.exists():
+            file_bytes = upload_path.read_bytes()
+
+    scheduler = BackgroundTaskScheduler(background_tasks)
+    run_record = run_manager.rerun(run_id, scheduler, file_bytes=file_bytes)
+    if run_record is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    return templates.TemplateResponse(
+        request,
+        "partials/run_details.html",
+        {
+            "run": run_record,
+            "stage_sequence": list(PipelineRunner.STAGE_SEQUENCE),
+        },
+    )
+
+
 @router.get("/review", response_class=HTMLResponse)
 async def review_page(request: Request) -> HTMLResponse:
     """Display the segment review queue page."""
@@ -32,21 +32,36 @@ async def upload_document(
     file: UploadFile = File(...),
     use_case: UploadDocumentUseCase = Depends(get_upload_use_case),
 ) -> dict:
-    file_bytes = await file.read()
+    # Spooled to ingestion storage in chunks rather than read into memory
     document = use_case.execute(
         filename=file.filename or "",
         file_type=file.filename.rsplit(".", 1)[-1].lower() if file.filename and "." in file.filename else "",
-        file_bytes=file_bytes,
         content_type=file.content_type,
+        stream=file.file,
     )
     return document.model_dump()
 
 
+@router.get("/llm/scheduler")
+async def llm_scheduler_stats() -> dict:
+    """Queue depth and wait times of LLM requests per priority class."""
+    container = get_app_container()
+    scheduler = container.llm_scheduler
+    return {
+        "enabled": scheduler is not None,
+        "classes": scheduler.stats if scheduler is not None else {},
+        "rate_limiter": container.rate_limiter.stats,
+    }
+
+
 @router.get("/documents")
 async def list_documents(
+    status: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
     use_case: ListDocumentsUseCase = Depends(get_list_use_case),
 ) -> list[dict]:
-    documents = use_case.execute()
+    documents = use_case.execute(status=status, limit=limit, offset=offset)
     return [doc.model_dump() for doc in documents]
 
 
@@ -23,7 +23,11 @@ class DocumentParser(Protocol):
         """Return True if the parser handles the provided file type."""
 
     def parse(self, file_bytes: bytes, filename: str) -> list[str]:
-        """Parse raw bytes and return a list of page texts."""
+        """Parse raw bytes and return a list of page texts.
+
+        Parsers with a truthy ``accepts_mapped_files`` attribute may be handed
+        a read-only memory map of the stored upload instead of ``bytes``.
+        """
 
 
 class SummaryGenerator(Protocol):
@@ -121,6 +125,26 @@ class ParsingLLM(Protocol):
         """Return a structured representation of a page (paragraphs, tables, figures)."""
 
 
+class ParsedPageCache(Protocol):
+    """Port for a content-addressed store of previously parsed pages."""
+
+    def get(self, key: Mapping[str, Any]) -> ParsedPage | None:
+        """Return the cached page for the key, or None on a miss."""
+
+    def put(self, key: Mapping[str, Any], parsed_page: ParsedPage) -> None:
+        """Store a parsed page under the key."""
+
+
+class CleanedPageCache(Protocol):
+    """Port for a content-addressed store of structured cleaning results."""
+
+    def get(self, key: Mapping[str, Any]) -> CleanedPage | None:
+        """Return the cached cleaning result for the key, or None on a miss."""
+
+    def put(self, key: Mapping[str, Any], cleaned_page: CleanedPage) -> None:
+        """Store a cleaning result under the key."""
+
+
 class CleaningLLM(Protocol):
     """LLM-driven cleaner that normalizes parsed content."""
 
@@ -144,6 +168,16 @@ class EmbeddingGenerator(Protocol):
         """Generate embeddings for one or more text inputs."""
 
 
+class EmbeddingCache(Protocol):
+    """Port for a content-addressed store of text embeddings."""
+
+    def get(self, key: Mapping[str, Any]) -> list[float] | None:
+        """Return the cached vector for the key, or None on a miss."""
+
+    def put(self, key: Mapping[str, Any], vector: Sequence[float]) -> None:
+        """Store a vector under the key."""
+
+
 class VectorStoreAdapter(Protocol):
     """Port describing how chunk vectors are stored and retrieved."""
 
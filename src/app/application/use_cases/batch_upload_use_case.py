@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
+from typing import BinaryIO
 from uuid import uuid4
 
 from fastapi import HTTPException
@@ -45,14 +46,18 @@ class BatchUploadUseCase:
 
     def execute(
         self,
-        files: list[tuple[str, str, bytes, str | None]],  # (filename, file_type, file_bytes, content_type)
+        files: list[tuple[str, str, bytes | BinaryIO, str | None]],  # (filename, file_type, content, content_type)
         error_strategy: str = "continue",
+        priority: str = "batch",
     ) -> BatchJob:
         """Execute batch document upload and schedule processing.
         
         Args:
-            files: List of (filename, file_type, file_bytes, content_type) tuples
+            files: List of (filename, file_type, content, content_type) tuples;
+                content is the file's bytes or a binary stream, which is
+                spooled to ingestion storage so the batch never holds it in memory
             error_strategy: How to handle failures ("continue" or "fail_all")
+            priority: LLM scheduling class ("batch" or "backfill")
             
         Returns:
             BatchJob with queued status (processing happens async)
@@ -76,10 +81,18 @@ class BatchUploadUseCase:
                 detail=f"Invalid error_strategy: {error_strategy}. Must be 'continue' or 'fail_all'.",
             )
 
+        # Interactive priority is reserved for single-document uploads
+        if priority not in ("batch", "backfill"):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid priority: {priority}. Must be 'batch' or 'backfill'.",
+            )
+
         # Validate all files first (fail fast before creating batch)
-        documents: list[tuple[Document, bytes]] = []
+        documents: list[tuple[Document, bytes | None]] = []
+        streams: list[BinaryIO | None] = []
         
-        for filename, file_type, file_bytes, content_type in files:
+        for filename, file_type, content, content_type in files:
             # Validate filename
             if not filename:
                 raise HTTPException(status_code=400, detail="All files must have filenames")
@@ -92,15 +105,28 @@ class BatchUploadUseCase:
                     detail=f"Unsupported file type: {extension}. Allowed: {ALLOWED_EXTENSIONS}",
                 )
 
+            file_bytes = content if isinstance(content, (bytes, bytearray)) else None
+            if file_bytes is None and self.batch_runner.runner.ingestion.repository is None:
+                # Nowhere to spool to: read the upload as before
+                file_bytes = content.read()  # type: ignore[union-attr]
+
             # Create Document instance
             document = Document(
                 filename=filename,
                 file_type=extension,
-                size_bytes=len(file_bytes),
+                size_bytes=len(file_bytes or b""),
                 metadata={"content_type": content_type} if content_type else {},
             )
             
             documents.append((document, file_bytes))
+            streams.append(None if file_bytes is not None else content)  # type: ignore[arg-type]
+
+        # Store streamed uploads now (their request-scoped streams close with the
+        # response); the runner memory-maps them from storage when it gets to them
+        for index, stream in enumerate(streams):
+            if stream is not None:
+                spooled = self.batch_runner.runner.ingestion.spool(documents[index][0], stream)
+                documents[index] = (spooled, None)
 
         # Create batch job
         batch_id = str(uuid4())
@@ -110,6 +136,7 @@ class BatchUploadUseCase:
             status="queued",
             total_documents=len(documents),
             error_strategy=error_strategy,  # type: ignore
+            priority=priority,  # type: ignore
         )
 
         # Add document jobs
@@ -127,7 +154,7 @@ class BatchUploadUseCase:
         # Schedule batch processing in background
         # Note: This runs in a separate asyncio task, so it doesn't block the response
         asyncio.create_task(
-            self._run_batch_async(batch_id, documents)
+            self._run_batch_async(batch_id, documents, priority)
         )
 
         return batch
@@ -135,7 +162,8 @@ class BatchUploadUseCase:
     async def _run_batch_async(
         self,
         batch_id: str,
-        documents: list[tuple[Document, bytes]],
+        documents: list[tuple[Document, bytes | None]],
+        priority: str = "batch",
     ) -> None:
         """Run batch processing asynchronously in background.
         
@@ -147,6 +175,7 @@ class BatchUploadUseCase:
                 batch_id=batch_id,
                 documents=documents,
                 progress_callback=None,  # No callback for background processing
+                priority=priority,
             )
         except Exception as exc:
             # Log error but don't raise (background task)
@@ -10,12 +10,23 @@ class ListDocumentsUseCase:
     def __init__(self, repository: DocumentRepository) -> None:
         self.repository = repository
 
-    def execute(self) -> list[Document]:
+    def execute(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Document]:
         """
         Execute the list documents use case.
 
+        Args:
+            status: Only return documents with this status
+            limit: Maximum number of documents to return (all when None)
+            offset: Number of documents to skip, for pagination
+
         Returns:
-            List of all documents in the repository
+            List of documents in the repository
         """
-        return self.repository.list()
+        return self.repository.list(status=status, limit=limit, offset=offset)
 
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from typing import BinaryIO
+
 from fastapi import HTTPException
 
 from ...domain.models import Document
 from ...persistence.ports import DocumentRepository
+from ...services.llm_scheduler import llm_priority
 from ...services.pipeline_runner import PipelineRunner
 
 ALLOWED_EXTENSIONS = {"pdf", "docx", "ppt", "pptx"}
@@ -16,7 +19,14 @@ class UploadDocumentUseCase:
         self.runner = runner
         self.repository = repository
 
-    def execute(self, filename: str, file_type: str, file_bytes: bytes, content_type: str | None = None) -> Document:
+    def execute(
+        self,
+        filename: str,
+        file_type: str,
+        file_bytes: bytes | None = None,
+        content_type: str | None = None,
+        stream: BinaryIO | None = None,
+    ) -> Document:
         """
         Execute the upload document use case.
 
@@ -25,6 +35,8 @@ class UploadDocumentUseCase:
             file_type: File extension (pdf, docx, ppt, pptx)
             file_bytes: Raw file content
             content_type: MIME type of the file (optional)
+            stream: Upload to spool to ingestion storage instead of passing
+                ``file_bytes``; the pipeline then reads the stored file
 
         Returns:
             Processed Document instance
@@ -39,14 +51,22 @@ class UploadDocumentUseCase:
         if extension not in ALLOWED_EXTENSIONS:
             raise HTTPException(status_code=400, detail="Unsupported file type")
 
+        if stream is not None and self.runner.ingestion.repository is None:
+            # Nowhere to spool to: read the upload as before
+            file_bytes, stream = stream.read(), None
+
         document = Document(
             filename=filename,
             file_type=extension,
-            size_bytes=len(file_bytes),
+            size_bytes=len(file_bytes or b""),
             metadata={"content_type": content_type} if content_type else {},
         )
+        if stream is not None:
+            document = self.runner.ingestion.spool(document, stream)
 
-        result = self.runner.run(document, file_bytes=file_bytes)
+        # The caller waits on the response, so its LLM calls go ahead of batch work
+        with llm_priority("interactive"):
+            result = self.runner.run(document, file_bytes=file_bytes)
         processed_document = result.document
         self.repository.save(processed_document)
         return processed_document
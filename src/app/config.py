@@ -77,6 +77,10 @@ class LLMSettings(BaseModel):
     # BCAI-specific settings (optional, only used when provider="bcai")
     conversation_mode: str = "non-rag"  # BCAI conversation mode ("non-rag" or a RAG name)
     conversation_source: str = "rag-pipeline-worker"  # System identifier for BCAI tracking
+    # Connection pool shared by concurrent requests (BCAI sync session and async client)
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    http2: bool = True  # Async client only; ignored unless the h2 package is installed
 
 
 class EmbeddingSettings(BaseModel):
@@ -88,6 +92,9 @@ class EmbeddingSettings(BaseModel):
     vector_dimension: int = 1536
     store_target: Literal["in_memory", "llama_index_local", "documentdb"] = "llama_index_local"
     cache_enabled: bool = True
+    cache_dir: Path = Path("artifacts/cache/embeddings")
+    cache_max_bytes: int = 1_000_000_000  # float32 vectors on disk, LRU-evicted past this
+    cache_memory_entries: int = 20_000
     
     # Optional API credentials (can inherit from LLM settings for BCAI)
     api_key: str | None = Field(default=None, repr=False)
@@ -95,6 +102,10 @@ class EmbeddingSettings(BaseModel):
     
     # BCAI-specific: Optional dimensions override (for text-embedding-3 models)
     dimensions: int | None = None
+    # Merge chunk texts from concurrently embedded pages/documents into batch_size requests
+    coalesce_enabled: bool = True
+    coalesce_max_wait_ms: float = 20.0  # Send a partial batch once its oldest text waited this long
+    max_concurrent_batches: int = 4  # Embedding batch requests in flight at once
 
 
 class ChunkingSettings(BaseModel):
@@ -111,6 +122,14 @@ class ChunkingSettings(BaseModel):
     pixmap_max_width: int = 1536
     pixmap_max_height: int = 1536
     pixmap_resize_quality: str = "LANCZOS"
+    # Encoded pixmaps held in memory and shared by parsing and cleaning
+    pixmap_memory_cache_bytes: int = 256_000_000
+    pixmap_persist: bool = True  # Also write pixmaps under pixmap_storage_dir
+    pixmap_write_behind: bool = True  # Persist from a background thread
+    # Adaptive rendering: DPI fitted to max width/height, lossy format for photographic pages
+    pixmap_adaptive: bool = False
+    pixmap_photo_format: Literal["jpeg", "webp"] = "jpeg"
+    pixmap_photo_quality: int = 85
     
     # NEW: Component-aware chunking settings
     strategy: Literal["component", "hybrid", "fixed"] = "component"
@@ -147,8 +166,67 @@ class BatchProcessingSettings(BaseModel):
     enable_page_parallelism: bool = True
     enable_document_parallelism: bool = True
     rate_limit_requests_per_minute: int = 60
+    rate_limit_tokens_per_minute: int | None = None  # Provider token budget; None = requests only
+    rate_limit_min_fraction: float = 0.1  # Floor for the rate after repeated 429s
     batch_artifacts_dir: Path = Path("artifacts/batches")
     pixmap_parallel_workers: int | None = None  # Defaults to CPU count
+    enable_page_streaming: bool = False  # Stream pages parse -> embed instead of stage barriers
+    page_queue_size: int = 8  # Pages buffered between streamed stages
+    text_extraction_workers: int = 0  # Processes for PDF text extraction; 0 or 1 extracts serially
+    text_extraction_min_pages: int = 200  # Smaller PDFs are not worth a process pool
+    text_extraction_pages_per_task: int = 32
+    cpu_stage_workers: int = 0  # Processes for chunking and LLM-free cleaning/enrichment; 0 keeps them on threads
+
+
+class SchedulingSettings(BaseModel):
+    """Weighted fair queuing of LLM requests between priority classes."""
+
+    enabled: bool = True
+    interactive_weight: float = 8.0  # Single uploads from the API and dashboard
+    batch_weight: float = 2.0
+    backfill_weight: float = 1.0
+
+
+class JobQueueSettings(BaseModel):
+    """Durable queue that hands dashboard runs to separate worker processes."""
+
+    enabled: bool = False  # Off: runs execute in the API process via BackgroundTasks
+    db_path: Path = Path("artifacts/queue/jobs.sqlite3")
+    lease_seconds: float = 120.0  # A job is re-leased when its worker misses heartbeats this long
+    heartbeat_seconds: float = 30.0
+    max_attempts: int = 3
+    retry_base_delay_seconds: float = 10.0  # Doubles per attempt
+    poll_interval_seconds: float = 1.0
+
+
+class TriageSettings(BaseModel):
+    """Routes simple born-digital PDF pages around the vision parser."""
+
+    enabled: bool = False
+    min_chars: int = 200  # Pages with less extractable text go to the vision parser
+    max_images: int = 0
+    max_drawings: int = 10  # Vector paths tolerated (rules, underlines) before a page counts as artwork
+
+
+class CacheSettings(BaseModel):
+    """Content-addressed caches that let re-ingested documents skip LLM calls."""
+
+    parse_cache_enabled: bool = True
+    parse_cache_dir: Path = Path("artifacts/cache/parsing")
+    parse_cache_max_bytes: int = 512_000_000  # LRU eviction once the cache grows past this
+    cleaning_cache_enabled: bool = True
+    cleaning_cache_dir: Path = Path("artifacts/cache/cleaning")
+    cleaning_cache_max_bytes: int = 256_000_000
+    cleaning_cache_memory_entries: int = 1024  # In-process tier in front of the disk tier
+
+
+class StorageSettings(BaseModel):
+    """Encoding of the document files the repositories write, and the catalog indexing them."""
+
+    document_format: Literal["json", "orjson", "msgpack"] = "json"  # json: indented, human-readable
+    document_compression: Literal["none", "zstd"] = "none"
+    catalog_enabled: bool = True  # Off: listings scan and load every stored file
+    catalog_db_path: Path | None = None  # None: catalog.sqlite3 beside the document store
 
 
 class LangfuseSettings(BaseModel):
@@ -175,11 +253,18 @@ class Settings(BaseSettings):
     vector_store: VectorStoreSettings = VectorStoreSettings()
     prompts: PromptSettings = PromptSettings()
     batch: BatchProcessingSettings = BatchProcessingSettings()
+    scheduling: SchedulingSettings = SchedulingSettings()
+    job_queue: JobQueueSettings = JobQueueSettings()
+    cache: CacheSettings = CacheSettings()
+    storage: StorageSettings = StorageSettings()
+    triage: TriageSettings = TriageSettings()
     langfuse: LangfuseSettings = LangfuseSettings()
     
     # NEW: Pipeline improvement settings
     use_vision_cleaning: bool = False  # Enable vision-based cleaning (requires vision-capable LLM)
     use_llm_summarization: bool = True  # Enable LLM-based document/chunk summarization
+    enable_incremental_reprocessing: bool = False  # Keep per-stage snapshots so re-runs skip unchanged stages
+    enable_in_place_stages: bool = True  # Stages update a run's own intermediate documents instead of copying them
     
     # Langfuse observability settings
     enable_langfuse: bool = Field(default=False)
@@ -22,10 +22,18 @@ from .adapters.llama_index.cleaning_adapter import CleaningAdapter
 from .adapters.llama_index.parsing_adapter import ImageAwareParsingAdapter
 from .adapters.llama_index.summary_adapter import LlamaIndexSummaryAdapter
 from .adapters.llama_index.embedding_adapter import LlamaIndexEmbeddingAdapter
+from .persistence.adapters.document_codec import DocumentCodec, JsonCodec, build_document_codec
 from .persistence.adapters.document_filesystem import FileSystemDocumentRepository
 from .persistence.adapters.filesystem import FileSystemPipelineRunRepository
 from .persistence.adapters.ingestion_filesystem import FileSystemIngestionRepository
 from .persistence.adapters.batch_filesystem import FileSystemBatchJobRepository
+from .persistence.adapters.job_queue_sqlite import SQLiteJobQueue
+from .persistence.adapters.catalog_sqlite import SQLiteCatalog
+from .persistence.adapters.cache_filesystem import (
+    FileSystemCleaningCache,
+    FileSystemEmbeddingCache,
+    FileSystemParseCache,
+)
 from .observability.logger import LoggingObservabilityRecorder
 from .observability.langfuse_handler import PipelineLangfuseHandler
 from .application.use_cases import GetDocumentUseCase, ListDocumentsUseCase, UploadDocumentUseCase
@@ -38,10 +46,18 @@ from .services.ingestion_service import IngestionService
 from .services.pipeline_runner import PipelineRunner
 from .services.run_manager import PipelineRunManager
 from .services.vector_service import VectorService
+from .services.embedding_batcher import EmbeddingBatcher
+from .services.llm_scheduler import LLMScheduler
 from .services.rate_limiter import RateLimiter
 from .services.parallel_page_processor import ParallelPageProcessor
 from .services.batch_pipeline_runner import BatchPipelineRunner
+from .services.cpu_stage_pool import CpuStagePool, cpu_bound_stages
+from .services.streaming_page_pipeline import StreamingPagePipeline
 from .parsing.parallel_pixmap_factory import ParallelPixmapFactory
+from .parsing.page_triage import PageTriage
+from .parsing.pixmap_encoding import PixmapEncoding
+from .parsing.pixmap_store import PixmapStore
+from .parsing.render_pool import PixmapRenderPool
 from .vector_store import DocumentDBVectorStore, InMemoryVectorStore
 
 
@@ -60,17 +76,52 @@ class AppContainer:
         ).resolve()
         self.ingestion_repository = FileSystemIngestionRepository(ingestion_storage_dir)
         documents_dir = Path(os.getenv("DOCUMENT_STORAGE_DIR", base_dir / "artifacts" / "documents")).resolve()
-        self.document_repository = FileSystemDocumentRepository(documents_dir)
+        self.document_codec = self._build_document_codec()
+        # Index of stored documents, runs and batches that listings page through
+        self.catalog = None
+        if self.settings.storage.catalog_enabled:
+            self.catalog = SQLiteCatalog(
+                Path(
+                    os.getenv(
+                        "CATALOG_DB_PATH",
+                        self.settings.storage.catalog_db_path or documents_dir.parent / "catalog.sqlite3",
+                    )
+                ).resolve()
+            )
+        self.document_repository = FileSystemDocumentRepository(
+            documents_dir,
+            codec=self.document_codec,
+            catalog=self.catalog,
+        )
         pixmap_dir = Path(
             os.getenv("PIXMAP_STORAGE_DIR", self.settings.chunking.pixmap_storage_dir)
         ).resolve()
+        # Encoded page images shared by pixmap rendering, parsing and cleaning
+        self.pixmap_store = None
+        if self.settings.chunking.include_images:
+            self.pixmap_store = PixmapStore(
+                max_bytes=self.settings.chunking.pixmap_memory_cache_bytes,
+                persist=self.settings.chunking.pixmap_persist,
+                write_behind=self.settings.chunking.pixmap_write_behind,
+            )
+        self.pixmap_encoding = PixmapEncoding(
+            adaptive=self.settings.chunking.pixmap_adaptive,
+            photo_format=self.settings.chunking.pixmap_photo_format,
+            quality=self.settings.chunking.pixmap_photo_quality,
+        )
+        self.pdf_parser = PdfParserAdapter(
+            parallel_workers=self.settings.batch.text_extraction_workers,
+            parallel_min_pages=self.settings.batch.text_extraction_min_pages,
+            pages_per_task=self.settings.batch.text_extraction_pages_per_task,
+        )
         self.document_parsers = [
-            PdfParserAdapter(),
+            self.pdf_parser,
             DocxParserAdapter(),
             PptParserAdapter(),
         ]
         self.summary_generator = LLMSummaryAdapter()
         self.embedding_generator = None
+        self.embedding_batcher = None
         self.structured_parser = None
         self.structured_cleaner = None
         self.text_splitter = None
@@ -108,6 +159,29 @@ class AppContainer:
             latency=stage_latency,
             repository=self.ingestion_repository,
         )
+        # One rate limiter shared by every LLM-backed call. Clients that accept
+        # it (BCAI) pace each HTTP request by estimated tokens and feed 429s
+        # back; for the others the batch pipelines acquire per LLM stage.
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=self.settings.batch.rate_limit_requests_per_minute,
+            tokens_per_minute=self.settings.batch.rate_limit_tokens_per_minute,
+            min_rate_fraction=self.settings.batch.rate_limit_min_fraction,
+        )
+        # Requests take their turn on the shared limit by priority class, so a
+        # dashboard upload is not queued behind a running batch
+        self.llm_scheduler = None
+        llm_gate: RateLimiter | LLMScheduler = self.rate_limiter
+        if self.settings.scheduling.enabled:
+            self.llm_scheduler = LLMScheduler(
+                self.rate_limiter,
+                weights={
+                    "interactive": self.settings.scheduling.interactive_weight,
+                    "batch": self.settings.scheduling.batch_weight,
+                    "backfill": self.settings.scheduling.backfill_weight,
+                },
+            )
+            llm_gate = self.llm_scheduler
+        llm_paced_by_client = False
         try:
             configure_llama_index(self.settings)
             
@@ -143,6 +217,11 @@ class AppContainer:
             
             llm_client = get_llama_llm()
             embed_model = get_llama_embedding_model()
+            for client in (llm_client, embed_model):
+                use_rate_limiter = getattr(client, "use_rate_limiter", None)
+                if callable(use_rate_limiter):
+                    use_rate_limiter(llm_gate)
+            llm_paced_by_client = callable(getattr(llm_client, "use_rate_limiter", None))
             self.text_splitter = get_llama_text_splitter()
             # Use the same OpenAI LLM (GPT-4o-mini) for both text and vision
             # GPT-4o-mini supports vision through ChatMessage with image content
@@ -156,22 +235,50 @@ class AppContainer:
                 streaming_repetition_window=self.settings.llm.streaming_repetition_window,
                 streaming_repetition_threshold=self.settings.llm.streaming_repetition_threshold,
                 streaming_max_consecutive_newlines=self.settings.llm.streaming_max_consecutive_newlines,
+                pixmap_store=self.pixmap_store,
             )
             self.structured_cleaner = CleaningAdapter(
                 llm=llm_client,
                 prompt_settings=self.settings.prompts,
                 use_structured_outputs=self.settings.llm.use_structured_outputs,
                 use_vision=self.settings.use_vision_cleaning,  # NEW: Vision-based cleaning
+                pixmap_store=self.pixmap_store,
             )
             self.summary_generator = LlamaIndexSummaryAdapter(llm=llm_client, prompt_settings=self.settings.prompts)
             self.embedding_generator = LlamaIndexEmbeddingAdapter(
                 embed_model=embed_model,
                 dimension=self.settings.embeddings.vector_dimension,
             )
+            if self.settings.embeddings.coalesce_enabled:
+                self.embedding_batcher = EmbeddingBatcher(
+                    self.embedding_generator,
+                    batch_size=self.settings.embeddings.batch_size,
+                    max_wait_ms=self.settings.embeddings.coalesce_max_wait_ms,
+                    max_in_flight=self.settings.embeddings.max_concurrent_batches,
+                )
+                self.embedding_generator = self.embedding_batcher
         except LlamaIndexBootstrapError as exc:
             logger.warning("LlamaIndex not configured, falling back to stubbed pipeline: %s", exc)
             self.embedding_generator = None
 
+        self.parse_cache = None
+        if self.settings.cache.parse_cache_enabled:
+            parse_cache_dir = Path(
+                os.getenv("PARSE_CACHE_DIR", self.settings.cache.parse_cache_dir)
+            ).resolve()
+            self.parse_cache = FileSystemParseCache(
+                parse_cache_dir,
+                max_bytes=self.settings.cache.parse_cache_max_bytes,
+            )
+
+        self.page_triage = None
+        if self.settings.triage.enabled:
+            self.page_triage = PageTriage(
+                min_chars=self.settings.triage.min_chars,
+                max_images=self.settings.triage.max_images,
+                max_drawings=self.settings.triage.max_drawings,
+            )
+
         self.parsing_service = ParsingService(
             observability=self.observability,
             latency=stage_latency,
@@ -184,11 +291,27 @@ class AppContainer:
             pixmap_max_width=self.settings.chunking.pixmap_max_width,
             pixmap_max_height=self.settings.chunking.pixmap_max_height,
             pixmap_resize_quality=self.settings.chunking.pixmap_resize_quality,
+            parse_cache=self.parse_cache,
+            pixmap_store=self.pixmap_store,
+            pixmap_encoding=self.pixmap_encoding,
+            page_triage=self.page_triage,
         )
+        self.cleaning_cache = None
+        if self.settings.cache.cleaning_cache_enabled:
+            cleaning_cache_dir = Path(
+                os.getenv("CLEANING_CACHE_DIR", self.settings.cache.cleaning_cache_dir)
+            ).resolve()
+            self.cleaning_cache = FileSystemCleaningCache(
+                cleaning_cache_dir,
+                max_bytes=self.settings.cache.cleaning_cache_max_bytes,
+                memory_entries=self.settings.cache.cleaning_cache_memory_entries,
+            )
         self.cleaning_service = CleaningService(
             observability=self.observability,
             latency=stage_latency,
             structured_cleaner=self.structured_cleaner,
+            cleaning_cache=self.cleaning_cache,
+            pixmap_store=self.pixmap_store,
         )
         self.chunking_service = ChunkingService(
             observability=self.observability,
@@ -209,17 +332,32 @@ class AppContainer:
         
         # Initialize vector store based on configuration
         self.vector_store = self._create_vector_store()
+        self.embedding_cache = None
+        if self.settings.embeddings.cache_enabled:
+            embedding_cache_dir = Path(
+                os.getenv("EMBEDDING_CACHE_DIR", self.settings.embeddings.cache_dir)
+            ).resolve()
+            self.embedding_cache = FileSystemEmbeddingCache(
+                embedding_cache_dir,
+                max_bytes=self.settings.embeddings.cache_max_bytes,
+                memory_entries=self.settings.embeddings.cache_memory_entries,
+            )
         self.vector_service = VectorService(
             observability=self.observability,
             latency=stage_latency,
             embedding_generator=self.embedding_generator,
             vector_store=self.vector_store,
+            embedding_cache=self.embedding_cache,
         )
 
         artifacts_dir = Path(
             os.getenv("RUN_ARTIFACTS_DIR", base_dir / "artifacts" / "runs")
         ).resolve()
-        self.run_repository = FileSystemPipelineRunRepository(artifacts_dir)
+        self.run_repository = FileSystemPipelineRunRepository(
+            artifacts_dir,
+            codec=self.document_codec,
+            catalog=self.catalog,
+        )
 
         self.pipeline_runner = PipelineRunner(
             ingestion=self.ingestion_service,
@@ -230,11 +368,22 @@ class AppContainer:
             vectorization=self.vector_service,
             observability=self.observability,
             langfuse_handler=self.langfuse_handler,
+            in_place_stages=self.settings.enable_in_place_stages,
         )
+        self.job_queue = None
+        if self.settings.job_queue.enabled:
+            self.job_queue = SQLiteJobQueue(
+                Path(os.getenv("JOB_QUEUE_DB_PATH", self.settings.job_queue.db_path)).resolve(),
+                lease_seconds=self.settings.job_queue.lease_seconds,
+                max_attempts=self.settings.job_queue.max_attempts,
+            )
         self.pipeline_run_manager = PipelineRunManager(
             self.run_repository,
             self.pipeline_runner,
             document_repository=self.document_repository,
+            keep_stage_snapshots=self.settings.enable_incremental_reprocessing,
+            job_queue=self.job_queue,
+            ingestion_repository=self.ingestion_repository,
         )
 
         # Use cases
@@ -249,16 +398,17 @@ class AppContainer:
         batch_artifacts_dir = Path(
             os.getenv("BATCH_ARTIFACTS_DIR", self.settings.batch.batch_artifacts_dir)
         ).resolve()
-        self.batch_job_repository = FileSystemBatchJobRepository(batch_artifacts_dir)
-        
-        # Rate limiter for API calls
-        self.rate_limiter = RateLimiter(
-            requests_per_minute=self.settings.batch.rate_limit_requests_per_minute
-        )
+        self.batch_job_repository = FileSystemBatchJobRepository(batch_artifacts_dir, catalog=self.catalog)
         
-        # Parallel pixmap factory
+        # Parallel pixmap factory backed by one app-scoped render pool, so
+        # concurrent documents share worker processes instead of each
+        # starting their own
         self.parallel_pixmap_factory = None
+        self.pixmap_render_pool = None
         if self.settings.chunking.include_images:
+            self.pixmap_render_pool = PixmapRenderPool(
+                max_workers=self.settings.batch.pixmap_parallel_workers,
+            )
             self.parallel_pixmap_factory = ParallelPixmapFactory(
                 base_dir=pixmap_dir,
                 dpi=self.settings.chunking.pixmap_dpi,
@@ -266,6 +416,9 @@ class AppContainer:
                 max_height=self.settings.chunking.pixmap_max_height,
                 resize_quality=self.settings.chunking.pixmap_resize_quality,
                 max_workers=self.settings.batch.pixmap_parallel_workers,
+                render_pool=self.pixmap_render_pool,
+                pixmap_store=self.pixmap_store,
+                encoding=self.pixmap_encoding,
             )
         
         # Parallel page processor
@@ -273,11 +426,36 @@ class AppContainer:
             parsing_service=self.parsing_service,
             cleaning_service=self.cleaning_service,
             parallel_pixmap_factory=self.parallel_pixmap_factory,
-            rate_limiter=self.rate_limiter,
+            rate_limiter=None if llm_paced_by_client else llm_gate,
             max_workers=self.settings.batch.max_workers_per_document,
             enable_page_parallelism=self.settings.batch.enable_page_parallelism,
         )
         
+        # Page-level streaming pipeline for batch documents
+        self.streaming_page_pipeline = None
+        if self.settings.batch.enable_page_streaming:
+            self.streaming_page_pipeline = StreamingPagePipeline(
+                observability=self.observability,
+                parsing_service=self.parsing_service,
+                cleaning_service=self.cleaning_service,
+                chunking_service=self.chunking_service,
+                enrichment_service=self.enrichment_service,
+                vector_service=self.vector_service,
+                parallel_pixmap_factory=self.parallel_pixmap_factory,
+                rate_limiter=None if llm_paced_by_client else llm_gate,
+                max_workers=self.settings.batch.max_workers_per_document,
+                queue_size=self.settings.batch.page_queue_size,
+            )
+        
+        # Worker processes for the CPU-bound stages of stage-by-stage batch documents
+        self.cpu_stage_pool = None
+        if self.settings.batch.cpu_stage_workers > 0:
+            self.cpu_stage_pool = CpuStagePool(
+                cpu_bound_stages(self.chunking_service, self.cleaning_service, self.enrichment_service),
+                observability=self.observability,
+                max_workers=self.settings.batch.cpu_stage_workers,
+            )
+
         # Batch pipeline runner
         self.batch_pipeline_runner = BatchPipelineRunner(
             pipeline_runner=self.pipeline_runner,
@@ -286,6 +464,8 @@ class AppContainer:
             run_manager=self.pipeline_run_manager,
             max_concurrent_documents=self.settings.batch.max_concurrent_documents,
             langfuse_handler=self.langfuse_handler,  # Pass Langfuse handler for tracing
+            streaming_pipeline=self.streaming_page_pipeline,
+            cpu_stage_pool=self.cpu_stage_pool,
         )
         
         # Batch upload use case
@@ -294,6 +474,35 @@ class AppContainer:
             batch_repository=self.batch_job_repository,
         )
 
+    def shutdown(self) -> None:
+        """Release app-scoped worker pools and flush pending pixmap and embedding work."""
+        if self.pixmap_render_pool is not None:
+            self.pixmap_render_pool.shutdown()
+        if self.cpu_stage_pool is not None:
+            self.cpu_stage_pool.shutdown()
+        self.pdf_parser.shutdown()
+        if self.pixmap_store is not None:
+            self.pixmap_store.close()
+        if self.embedding_batcher is not None:
+            self.embedding_batcher.close()
+        if self.llm_scheduler is not None:
+            self.llm_scheduler.close()
+
+    def _build_document_codec(self) -> DocumentCodec:
+        """Codec for stored documents from ``settings.storage``; indented JSON if its package is missing."""
+        storage = self.settings.storage
+        try:
+            codec = build_document_codec(storage.document_format, storage.document_compression)
+        except ImportError as exc:
+            logger.warning("%s Falling back to JSON documents.", exc)
+            return JsonCodec()
+        logger.info(
+            "💾 Storing documents as %s (compression=%s)",
+            storage.document_format,
+            storage.document_compression,
+        )
+        return codec
+
     def _create_vector_store(self):
         """
         Factory method to create vector store adapter based on configuration.
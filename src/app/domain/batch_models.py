@@ -81,6 +81,7 @@ class BatchJob:
         failed_documents: Number of documents that failed
         document_jobs: Mapping of document_id to DocumentJob
         error_strategy: How to handle individual document failures
+        priority: Scheduling class of the batch's LLM requests ("batch" or "backfill")
         started_at: Timestamp when batch processing started
         completed_at: Timestamp when batch processing finished
     """
@@ -93,6 +94,7 @@ class BatchJob:
     failed_documents: int = 0
     document_jobs: dict[str, DocumentJob] = field(default_factory=dict)
     error_strategy: Literal["fail_all", "continue"] = "continue"
+    priority: Literal["batch", "backfill"] = "batch"
     started_at: datetime | None = None
     completed_at: datetime | None = None
     
@@ -0,0 +1,46 @@
+"""Domain models for the durable background job queue."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Literal
+
+
+@dataclass
+class QueuedJob:
+    """A unit of background work held by the job queue until a worker finishes it.
+
+    A worker leases a job for a limited time and keeps the lease alive with
+    heartbeats while it runs. A lease that runs out (the worker crashed or
+    was restarted) makes the job available to other workers again.
+
+    Attributes:
+        id: Unique identifier for the job
+        kind: Handler the job is dispatched to (e.g. "pipeline_run")
+        payload: JSON-serializable arguments for the handler
+        status: queued (waiting or backing off), leased, completed or failed
+        attempts: Number of times the job has been leased
+        max_attempts: Attempts allowed before the job is marked failed
+        created_at: Timestamp when the job was enqueued
+        available_at: Earliest time the job may be leased (retry backoff)
+        lease_owner: Worker currently holding the lease
+        lease_expires_at: When the current lease runs out without a heartbeat
+        last_error: Error from the most recent failed attempt
+    """
+
+    id: str
+    kind: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    status: Literal["queued", "leased", "completed", "failed"] = "queued"
+    attempts: int = 0
+    max_attempts: int = 3
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    available_at: datetime = field(default_factory=datetime.utcnow)
+    lease_owner: str | None = None
+    lease_expires_at: datetime | None = None
+    last_error: str | None = None
+
+    @property
+    def is_final_attempt(self) -> bool:
+        return self.attempts >= self.max_attempts
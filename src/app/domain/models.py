@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal, Optional
+from typing import Any, Literal, Mapping, Optional, Sequence
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -205,7 +205,11 @@ class Document(BaseModel):
         return self.model_copy(update={"pages": updated_pages})
 
     def add_chunk(self, page_number: int, chunk: Chunk) -> Document:
-        """Return a new document with the chunk added to the appropriate page, creating the page if needed."""
+        """Return a new document with the chunk added to the appropriate page, creating the page if needed.
+
+        Copies the whole document per call; to add many chunks use
+        ``chunk_batch()`` or ``add_chunks``.
+        """
 
         normalized_chunk = chunk.model_copy(
             update={
@@ -237,3 +241,87 @@ class Document(BaseModel):
             updated_pages = [*self.pages, new_page]
         
         return self.model_copy(update={"pages": updated_pages})
+
+    def add_chunks(self, chunks_by_page: Mapping[int, Sequence[Chunk]]) -> Document:
+        """Return a new document with every chunk appended to its page, in one copy.
+
+        Same result as calling ``add_chunk`` for each chunk in order, but each
+        touched page and the document are copied once, and chunks are only
+        copied when their document/page references need normalizing. Pages
+        that do not exist yet are created in the order they first appear.
+        """
+        if not chunks_by_page:
+            return self
+        page_index = {page.page_number: index for index, page in enumerate(self.pages)}
+        updated_pages = self.pages.copy()
+        for page_number, chunks in chunks_by_page.items():
+            normalized = [self._normalize_chunk(page_number, chunk) for chunk in chunks]
+            index = page_index.get(page_number)
+            if index is None:
+                page_index[page_number] = len(updated_pages)
+                updated_pages.append(
+                    Page(document_id=self.id, page_number=page_number, text="", chunks=normalized)
+                )
+            else:
+                existing_page = updated_pages[index]
+                updated_pages[index] = existing_page.model_copy(
+                    update={"chunks": [*existing_page.chunks, *normalized]}
+                )
+        return self.model_copy(update={"pages": updated_pages})
+
+    def chunk_batch(self) -> ChunkBatch:
+        """Start accumulating chunks to add to this document with one ``add_chunks`` call."""
+        return ChunkBatch(self)
+
+    def _normalize_chunk(self, page_number: int, chunk: Chunk) -> Chunk:
+        metadata = chunk.metadata
+        if chunk.document_id == self.id and chunk.page_number == page_number and (
+            metadata is None
+            or (
+                metadata.document_id == self.id
+                and metadata.page_number == page_number
+                and metadata.chunk_id == chunk.id
+            )
+        ):
+            return chunk
+        return chunk.model_copy(
+            update={
+                "document_id": self.id,
+                "page_number": page_number,
+                "metadata": None if metadata is None else metadata.model_copy(
+                    update={
+                        "document_id": self.id,
+                        "page_number": page_number,
+                        "chunk_id": chunk.id,
+                    }
+                ),
+            }
+        )
+
+
+class ChunkBatch:
+    """Builder that collects chunks per page and materializes the document once.
+
+    Usage:
+        batch = document.chunk_batch()
+        for chunk in chunks:
+            batch.add(chunk.page_number, chunk)
+        document = batch.build()
+    """
+
+    def __init__(self, document: Document) -> None:
+        self.document = document
+        self._chunks_by_page: dict[int, list[Chunk]] = {}
+
+    def add(self, page_number: int, chunk: Chunk) -> None:
+        self._chunks_by_page.setdefault(page_number, []).append(chunk)
+
+    def extend(self, page_number: int, chunks: Sequence[Chunk]) -> None:
+        self._chunks_by_page.setdefault(page_number, []).extend(chunks)
+
+    def __len__(self) -> int:
+        return sum(len(chunks) for chunks in self._chunks_by_page.values())
+
+    def build(self) -> Document:
+        """The document with every accumulated chunk added."""
+        return self.document.add_chunks(self._chunks_by_page)
@@ -1,4 +1,6 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -16,7 +18,18 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 # This is the SINGLE source of truth for log level configuration
 setup_logging()
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    from .container import get_app_container  # resolved late: tests reload the container module
+
+    # Only tear down a container that was actually built
+    if get_app_container.cache_info().currsize:
+        get_app_container().shutdown()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 app.include_router(pipeline_router)
 app.include_router(dashboard_router)
 app.include_router(batch_router)
@@ -0,0 +1,30 @@
+"""Read-only memory maps of stored uploads, used in place of their bytes."""
+
+from __future__ import annotations
+
+import mmap
+import os
+from pathlib import Path
+
+
+class MappedFile(mmap.mmap):
+    """Read-only memory map of a stored file that stands in for its bytes.
+
+    Supports ``len``, slicing, hashing and the buffer protocol, so it can be
+    passed wherever the file's bytes were. The OS pages the file in on demand
+    and can drop those pages again under memory pressure, so a batch of large
+    uploads does not sit in the process heap. ``path`` lets PDF code open the
+    stored file directly instead of copying it.
+    """
+
+    path: str
+
+    @classmethod
+    def open(cls, path: str | Path) -> MappedFile | None:
+        """Map ``path``; None for an empty file, which cannot be mapped."""
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return None
+            mapped = cls(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        mapped.path = str(path)
+        return mapped
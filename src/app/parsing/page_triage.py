@@ -0,0 +1,199 @@
+"""Page triage: decide which PDF pages need vision parsing at all."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from statistics import median
+from typing import Dict
+
+from .pdf_backend import PdfBackendError, open_pdf
+from .schemas import BoundingBox, ParsedPage, ParsedTextComponent
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TextBlock:
+    """One text block from the PDF text layer, in reading order."""
+
+    text: str
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    font_size: float
+    line_count: int
+
+
+@dataclass(frozen=True)
+class PageLayout:
+    """What the PDF text layer and drawing list say about one page."""
+
+    page_number: int
+    width: float
+    height: float
+    blocks: tuple[TextBlock, ...]
+    image_count: int
+    drawing_count: int
+    table_count: int
+
+    @property
+    def char_count(self) -> int:
+        return sum(len(block.text) for block in self.blocks)
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(block.text for block in self.blocks)
+
+
+class PageTriage:
+    """Scores pages from their PDF text layer and routes simple ones around the LLM.
+
+    A page is "simple" when it has a substantial, clean text layer and no
+    raster images, tables or vector artwork beyond a few rules. Those pages
+    are turned into a ParsedPage locally, one text component per text block;
+    everything else keeps going to the vision parser.
+    """
+
+    def __init__(
+        self,
+        min_chars: int = 200,
+        max_images: int = 0,
+        max_drawings: int = 10,
+        max_garbled_ratio: float = 0.01,
+        heading_size_ratio: float = 1.15,
+    ) -> None:
+        self.min_chars = min_chars
+        self.max_images = max_images
+        self.max_drawings = max_drawings
+        self.max_garbled_ratio = max_garbled_ratio
+        self.heading_size_ratio = heading_size_ratio
+
+    @property
+    def cache_identity(self) -> dict[str, object]:
+        """Thresholds that determine which pages skip the vision parser."""
+        return {
+            "min_chars": self.min_chars,
+            "max_images": self.max_images,
+            "max_drawings": self.max_drawings,
+            "max_garbled_ratio": self.max_garbled_ratio,
+            "heading_size_ratio": self.heading_size_ratio,
+        }
+
+    def analyze(self, pdf_bytes: bytes) -> Dict[int, PageLayout]:
+        """Collect text blocks, image, drawing and table counts for every page.
+
+        Returns an empty mapping when PyMuPDF is unavailable or the PDF cannot
+        be read, which routes every page to the structured parser.
+        """
+        layouts: Dict[int, PageLayout] = {}
+        try:
+            with open_pdf(pdf_bytes) as pdf:
+                for index, page in pdf.pages():
+                    try:
+                        layouts[index] = self._analyze_page(page, index)
+                    except Exception as exc:  # pragma: no cover - defensive logging
+                        logger.debug("Page triage skipped page %s: %s", index, exc)
+        except PdfBackendError as exc:
+            logger.warning("Page triage could not open PDF: %s", exc)
+            return {}
+        return layouts
+
+    def complexity_reasons(self, layout: PageLayout) -> list[str]:
+        """Why a page needs the vision parser; empty when it is simple text."""
+        reasons: list[str] = []
+        char_count = layout.char_count
+        if char_count < self.min_chars:
+            reasons.append("sparse_text")
+        if layout.image_count > self.max_images:
+            reasons.append("images")
+        if layout.drawing_count > self.max_drawings:
+            reasons.append("drawings")
+        if layout.table_count:
+            reasons.append("tables")
+        if char_count:
+            # U+FFFD marks glyphs the text layer could not map to characters
+            garbled = sum(block.text.count("\ufffd") for block in layout.blocks)
+            if garbled / char_count > self.max_garbled_ratio:
+                reasons.append("garbled_text")
+        return reasons
+
+    def is_simple(self, layout: PageLayout) -> bool:
+        return not self.complexity_reasons(layout)
+
+    def build_parsed_page(self, document_id: str, layout: PageLayout) -> ParsedPage:
+        """Build the ParsedPage for a simple page straight from its text layer."""
+        body_size = median(block.font_size for block in layout.blocks) if layout.blocks else 0.0
+        components: list[ParsedTextComponent] = []
+        markdown: list[str] = []
+        for order, block in enumerate(layout.blocks):
+            is_heading = (
+                block.line_count <= 2
+                and len(block.text) <= 120
+                and not block.text.rstrip().endswith((".", ":", ";", ","))
+                and block.font_size >= body_size * self.heading_size_ratio
+            )
+            text_type = "heading" if is_heading else "paragraph"
+            components.append(
+                ParsedTextComponent(
+                    order=order,
+                    text=block.text,
+                    text_type=text_type,
+                    bbox=BoundingBox(
+                        x=block.x0 / layout.width,
+                        y=block.y0 / layout.height,
+                        width=(block.x1 - block.x0) / layout.width,
+                        height=(block.y1 - block.y0) / layout.height,
+                    ),
+                )
+            )
+            markdown.append(f"## {block.text}" if is_heading else block.text)
+        return ParsedPage(
+            document_id=document_id,
+            page_number=layout.page_number,
+            raw_text="\n\n".join(markdown),
+            components=components,
+        )
+
+    def _analyze_page(self, page, page_number: int) -> PageLayout:
+        blocks: list[TextBlock] = []
+        for block in page.get_text("dict", sort=True)["blocks"]:
+            if block.get("type") != 0:
+                continue
+            lines = [
+                "".join(span["text"] for span in line["spans"]).strip()
+                for line in block["lines"]
+            ]
+            text = " ".join(line for line in lines if line)
+            if not text:
+                continue
+            sizes = [span["size"] for line in block["lines"] for span in line["spans"] if span["text"].strip()]
+            x0, y0, x1, y1 = block["bbox"]
+            blocks.append(
+                TextBlock(
+                    text=text,
+                    x0=x0,
+                    y0=y0,
+                    x1=x1,
+                    y1=y1,
+                    font_size=max(sizes) if sizes else 0.0,
+                    line_count=len(lines),
+                )
+            )
+
+        drawing_count = len(page.get_drawings())
+        table_count = 0
+        # Ruled tables need vector lines; skip the (slow) detector on pages without any
+        if 0 < drawing_count <= self.max_drawings and hasattr(page, "find_tables"):
+            table_count = len(page.find_tables().tables)
+
+        return PageLayout(
+            page_number=page_number,
+            width=page.rect.width or 1.0,
+            height=page.rect.height or 1.0,
+            blocks=tuple(blocks),
+            image_count=len(page.get_images(full=False)),
+            drawing_count=drawing_count,
+            table_count=table_count,
+        )
@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import logging
 import os
+from contextlib import ExitStack
 from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict
+from time import monotonic
+from typing import Any, Dict, Iterator
+
+from .pdf_backend import PdfBackendError, SharedPdfBytes, close_worker_pdf, open_pdf, worker_pdf
+from .pixmap_encoding import PixmapEncoding, render_adaptive
+from .pixmap_store import PixmapStore
+from .render_pool import PixmapRenderPool
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +29,9 @@ class PixmapInfo:
     page_number: int
     path: Path
     size_bytes: int
+    mimetype: str = "image/png"
+    dpi: float | None = None
+    bytes_saved: int = 0
 
 
 class PixmapGenerationError(RuntimeError):
@@ -33,9 +45,13 @@ class ParallelPixmapFactory:
     uses ProcessPoolExecutor to render pages in parallel across multiple
     CPU cores, providing 3-5x speedup for multi-page documents.
     
-    Each worker process opens its own PDF document instance and renders
-    assigned pages independently, maximizing parallelism while respecting
-    PyMuPDF's constraints.
+    The PDF bytes are placed once in shared memory (or a temp file when
+    shared memory is unavailable) and workers open that buffer zero-copy
+    instead of receiving the bytes with every page task. Each worker process
+    keeps its PDF document open across all the pages it renders.
+
+    With a pixmap store, workers return the encoded PNG instead of writing it
+    and the store keeps it in memory (persisting it in the background).
     """
 
     def __init__(
@@ -47,6 +63,9 @@ class ParallelPixmapFactory:
         resize_quality: str = "LANCZOS",
         max_workers: int | None = None,
         timeout_per_page: float = 30.0,
+        render_pool: PixmapRenderPool | None = None,
+        pixmap_store: PixmapStore | None = None,
+        encoding: PixmapEncoding | None = None,
     ) -> None:
         """Initialize the parallel pixmap factory.
         
@@ -58,6 +77,11 @@ class ParallelPixmapFactory:
             resize_quality: PIL resampling filter name (e.g., "LANCZOS")
             max_workers: Number of worker processes (default: CPU count)
             timeout_per_page: Timeout in seconds for rendering each page
+            render_pool: Shared long-lived pool; without one, each generate()
+                call starts and tears down its own process pool
+            pixmap_store: In-memory store receiving the encoded pages; without
+                one, workers write each page to disk themselves
+            encoding: Adaptive DPI / lossy format selection (PNG at ``dpi`` by default)
         """
         self.base_dir = base_dir
         self.dpi = dpi
@@ -66,6 +90,11 @@ class ParallelPixmapFactory:
         self.resize_quality = resize_quality
         self.max_workers = max_workers or os.cpu_count() or 4
         self.timeout_per_page = timeout_per_page
+        self.render_pool = render_pool
+        self.pixmap_store = pixmap_store
+        self.encoding = encoding or PixmapEncoding()
+        if render_pool is not None:
+            self.max_workers = render_pool.max_workers
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
     def generate(
@@ -89,20 +118,12 @@ class ParallelPixmapFactory:
         Raises:
             PixmapGenerationError: If PDF cannot be opened or rendering fails
         """
+        # Page count from the caller's shared document, or a brief open
         try:
-            import fitz  # type: ignore
-        except ImportError as exc:  # pragma: no cover
-            raise PixmapGenerationError(
-                "PyMuPDF is required for pixmap generation. Install `pymupdf`."
-            ) from exc
-
-        # Open PDF briefly to get page count
-        try:
-            pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-            page_count = len(pdf_document)
-            pdf_document.close()
-        except Exception as exc:  # pragma: no cover
-            raise PixmapGenerationError(f"Unable to read PDF bytes: {exc}") from exc
+            with open_pdf(pdf_bytes) as pdf:
+                page_count = pdf.page_count
+        except PdfBackendError as exc:  # pragma: no cover
+            raise PixmapGenerationError(str(exc)) from exc
 
         if page_count == 0:
             return {}
@@ -111,19 +132,38 @@ class ParallelPixmapFactory:
         output_dir = self.base_dir / document_id
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # A per-call executor exits with its workers; the shared pool is told to close the PDF
+        on_release = partial(self.render_pool.broadcast, close_worker_pdf) if self.render_pool is not None else None
+        shared_pdf = SharedPdfBytes.publish(pdf_bytes, self.base_dir, on_release=on_release)
+        try:
+            return self._render_pages(shared_pdf, page_count, output_dir, document_id, doc_logger, filename)
+        finally:
+            shared_pdf.release()
+
+    def _render_pages(
+        self,
+        shared_pdf: SharedPdfBytes,
+        page_count: int,
+        output_dir: Path,
+        document_id: str,
+        doc_logger=None,
+        filename: str = "",
+    ) -> Dict[int, PixmapInfo]:
         # Prepare tasks for each page
         tasks = []
         for page_num in range(1, page_count + 1):
             output_path = output_dir / f"page_{page_num:04d}.png"
             task = (
                 page_num,
-                pdf_bytes,
+                shared_pdf.source,
                 str(output_path),
                 self.dpi,
                 self.max_width,
                 self.max_height,
                 self.resize_quality,
                 document_id,
+                self.pixmap_store is not None,
+                self.encoding,
             )
             tasks.append(task)
 
@@ -138,22 +178,31 @@ class ParallelPixmapFactory:
         failed_pages = []
 
         try:
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                # Use map with chunksize for better task distribution
-                chunksize = max(1, page_count // (self.max_workers * 4))
-                results = executor.map(
-                    _render_page_worker,
-                    tasks,
-                    timeout=self.timeout_per_page * page_count,
-                    chunksize=chunksize,
-                )
+            with ExitStack() as stack:
+                if self.render_pool is not None:
+                    results = self._render_with_pool(tasks, page_count)
+                else:
+                    executor = stack.enter_context(ProcessPoolExecutor(max_workers=self.max_workers))
+                    # Use map with chunksize for better task distribution
+                    chunksize = max(1, page_count // (self.max_workers * 4))
+                    results = executor.map(
+                        _render_page_worker,
+                        tasks,
+                        timeout=self.timeout_per_page * page_count,
+                        chunksize=chunksize,
+                    )
 
                 for result in results:
                     if result.success:
+                        if result.data is not None and self.pixmap_store is not None:
+                            self.pixmap_store.put(result.output_path, result.data, result.mimetype)
                         pixmap_info[result.page_number] = PixmapInfo(
                             page_number=result.page_number,
                             path=Path(result.output_path),
                             size_bytes=result.size_bytes,
+                            mimetype=result.mimetype,
+                            dpi=result.dpi,
+                            bytes_saved=result.bytes_saved,
                         )
                         
                         # Log per-page progress (clean minimal format)
@@ -190,6 +239,18 @@ class ParallelPixmapFactory:
 
         return pixmap_info
 
+    def _render_with_pool(self, tasks: list[tuple], page_count: int) -> Iterator[_RenderResult]:
+        """Yield page results from the shared render pool, in page order."""
+        assert self.render_pool  # for mypy
+        deadline = monotonic() + self.timeout_per_page * page_count
+        futures = self.render_pool.submit_document(_render_page_worker, tasks)
+        try:
+            for future in futures:
+                yield future.result(timeout=max(0.0, deadline - monotonic()))
+        finally:
+            for future in futures:
+                future.cancel()
+
     async def generate_async(
         self,
         document_id: str,
@@ -228,34 +289,43 @@ class _RenderResult:
     size_bytes: int
     success: bool
     error_message: str | None = None
+    data: bytes | None = None
+    mimetype: str = "image/png"
+    dpi: float | None = None
+    bytes_saved: int = 0
 
 
 def _render_page_worker(args: tuple) -> _RenderResult:
     """Worker function for parallel pixmap rendering.
     
     This function runs in a separate process. Each worker opens its own
-    PDF document instance to ensure process safety with PyMuPDF.
+    PDF document instance to ensure process safety with PyMuPDF, and reuses
+    it for every page of the same document it is handed.
     
     Args:
-        args: Tuple of (page_num, pdf_bytes, output_path, dpi, max_width,
-              max_height, resize_quality, document_id)
+        args: Tuple of (page_num, pdf_source, output_path, dpi, max_width,
+              max_height, resize_quality, document_id, return_bytes,
+              encoding)
               
     Returns:
         _RenderResult with rendering outcome
     """
     (
         page_num,
-        pdf_bytes,
+        pdf_source,
         output_path,
         dpi,
         max_width,
         max_height,
         resize_quality,
         document_id,
+        return_bytes,
+        encoding,
     ) = args
 
     try:
-        import fitz  # type: ignore
+        if importlib.util.find_spec("fitz") is None:
+            raise ImportError("No module named 'fitz'")
         from PIL import Image
     except ImportError as exc:
         return _RenderResult(
@@ -268,28 +338,40 @@ def _render_page_worker(args: tuple) -> _RenderResult:
 
     try:
         # Each worker opens its own PDF instance (process-safe)
-        pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-        page = pdf_document[page_num - 1]
-
-        # Render pixmap at specified DPI
-        pix = page.get_pixmap(dpi=dpi)
-
-        # Resize if needed
-        if max_width or max_height:
-            pix = _resize_pixmap(pix, max_width, max_height, resize_quality, document_id, page_num)
-
-        # Save to disk
-        output_file = Path(output_path)
-        pix.save(output_file)
+        with worker_pdf(pdf_source) as pdf_document:
+            page = pdf_document[page_num - 1]
+
+            if encoding is not None and encoding.adaptive:
+                return _render_adaptive_page(page, page_num, output_path, dpi, max_width, max_height, encoding, return_bytes)
+
+            # Render pixmap at specified DPI
+            pix = page.get_pixmap(dpi=dpi)
+
+            # Resize if needed
+            if max_width or max_height:
+                pix = _resize_pixmap(pix, max_width, max_height, resize_quality, document_id, page_num)
+
+            if return_bytes:
+                # Hand the encoded page back; the parent's pixmap store persists it
+                data = pix.tobytes("png")
+                return _RenderResult(
+                    page_number=page_num,
+                    output_path=output_path,
+                    size_bytes=len(data),
+                    success=True,
+                    data=data,
+                )
 
-        pdf_document.close()
+            # Save to disk
+            output_file = Path(output_path)
+            pix.save(output_file)
 
-        return _RenderResult(
-            page_number=page_num,
-            output_path=output_path,
-            size_bytes=output_file.stat().st_size,
-            success=True,
-        )
+            return _RenderResult(
+                page_number=page_num,
+                output_path=output_path,
+                size_bytes=output_file.stat().st_size,
+                success=True,
+            )
 
     except Exception as exc:
         return _RenderResult(
@@ -301,6 +383,33 @@ def _render_page_worker(args: tuple) -> _RenderResult:
         )
 
 
+def _render_adaptive_page(
+    page: Any,
+    page_num: int,
+    output_path: str,
+    dpi: int,
+    max_width: int | None,
+    max_height: int | None,
+    encoding: PixmapEncoding,
+    return_bytes: bool,
+) -> _RenderResult:
+    """Render one page at its fitted DPI; the file suffix follows the chosen format."""
+    encoded = render_adaptive(page, dpi, max_width, max_height, encoding)
+    output_file = Path(output_path).with_suffix(encoded.suffix)
+    if not return_bytes:
+        output_file.write_bytes(encoded.data)
+    return _RenderResult(
+        page_number=page_num,
+        output_path=str(output_file),
+        size_bytes=len(encoded.data),
+        success=True,
+        data=encoded.data if return_bytes else None,
+        mimetype=encoded.mimetype,
+        dpi=round(encoded.dpi, 1),
+        bytes_saved=encoded.bytes_saved,
+    )
+
+
 def _resize_pixmap(
     pixmap: "fitz.Pixmap",
     max_width: int | None,
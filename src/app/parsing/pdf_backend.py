@@ -0,0 +1,265 @@
+"""One PyMuPDF document per PDF, shared by text extraction, triage and rendering.
+
+Worker processes (parallel rendering and text extraction) cannot share the
+parent's document; they open the bytes the parent published once through
+``SharedPdfBytes`` and keep that document open across their tasks until the
+parent releases it and tells the workers to close it.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from .mapped_file import MappedFile
+
+logger = logging.getLogger(__name__)
+
+
+class PdfBackendError(RuntimeError):
+    """Raised when PyMuPDF is missing or cannot open the PDF."""
+
+
+class OpenPdf:
+    """An open PyMuPDF document with page-level accessors."""
+
+    def __init__(self, document: Any) -> None:
+        self.document = document
+
+    @property
+    def page_count(self) -> int:
+        return len(self.document)
+
+    def pages(self) -> Iterator[tuple[int, Any]]:
+        """Yield ``(page_number, page)`` pairs, 1-based."""
+        for index, page in enumerate(self.document, start=1):
+            yield index, page
+
+    def page(self, page_number: int) -> Any:
+        return self.document[page_number - 1]
+
+    def page_text(self, page_number: int) -> str:
+        return self.page(page_number).get_text("text", sort=True).strip()
+
+    def page_texts(self) -> list[str]:
+        return [page.get_text("text", sort=True).strip() for _, page in self.pages()]
+
+
+# Documents opened by share_pdf() in the current context, keyed by the
+# identity of the bytes object they were opened from
+_shared: ContextVar[tuple[tuple[bytes, OpenPdf], ...]] = ContextVar("shared_pdfs", default=())
+
+
+@contextmanager
+def open_pdf(pdf_bytes: bytes) -> Iterator[OpenPdf]:
+    """Open ``pdf_bytes``, or reuse the document an enclosing ``share_pdf`` opened.
+
+    Raises:
+        PdfBackendError: If PyMuPDF is unavailable or the bytes are not a PDF
+    """
+    for source, opened in _shared.get():
+        if source is pdf_bytes:
+            yield opened
+            return
+
+    document = _open_document(pdf_bytes)
+    try:
+        yield OpenPdf(document)
+    finally:
+        document.close()
+
+
+@contextmanager
+def share_pdf(pdf_bytes: bytes) -> Iterator[OpenPdf | None]:
+    """Keep one document open for the block so nested ``open_pdf`` calls reuse it.
+
+    Yields None (and shares nothing) when the PDF cannot be opened; callers
+    then fall back to their own handling.
+    """
+    try:
+        document = _open_document(pdf_bytes)
+    except PdfBackendError as exc:
+        logger.debug("Not sharing PDF document: %s", exc)
+        yield None
+        return
+
+    opened = OpenPdf(document)
+    token = _shared.set((*_shared.get(), (pdf_bytes, opened)))
+    try:
+        yield opened
+    finally:
+        _shared.reset(token)
+        document.close()
+
+
+def _open_document(pdf_bytes: bytes) -> Any:
+    try:
+        import fitz  # type: ignore
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise PdfBackendError("PyMuPDF is required for the PDF backend. Install `pymupdf`.") from exc
+    try:
+        if isinstance(pdf_bytes, MappedFile):
+            # MuPDF reads the stored upload itself rather than a copy of it
+            return fitz.open(pdf_bytes.path, filetype="pdf")
+        return fitz.open(stream=pdf_bytes, filetype="pdf")
+    except Exception as exc:
+        raise PdfBackendError(f"Unable to read PDF bytes: {exc}") from exc
+
+
+class SharedPdfBytes:
+    """PDF bytes published once for all worker processes.
+
+    ``source`` is a small picklable descriptor, ``("shm", name, size)`` or
+    ``("file", path, size)``, that workers resolve without copying the bytes
+    through the process pool pipes. A ``MappedFile`` is published as its own
+    stored file, which is left in place on release.
+
+    ``on_release`` is called with ``source`` once the bytes are released, so
+    the pool that served the job can tell its workers to close the document.
+    """
+
+    def __init__(
+        self,
+        source: tuple[str, str, int],
+        shared: shared_memory.SharedMemory | None = None,
+        owns_file: bool = True,
+        on_release: Callable[[tuple[str, str, int]], None] | None = None,
+    ) -> None:
+        self.source = source
+        self._shared = shared
+        self._owns_file = owns_file
+        self._on_release = on_release
+        self._released = False
+
+    @classmethod
+    def publish(
+        cls,
+        pdf_bytes: bytes,
+        spill_dir: Path | None = None,
+        on_release: Callable[[tuple[str, str, int]], None] | None = None,
+    ) -> SharedPdfBytes:
+        size = len(pdf_bytes)
+        if isinstance(pdf_bytes, MappedFile):
+            return cls(("file", pdf_bytes.path, size), owns_file=False, on_release=on_release)
+        try:
+            shared = shared_memory.SharedMemory(create=True, size=size)
+        except OSError as exc:
+            logger.debug("Shared memory unavailable, spilling PDF to disk: %s", exc)
+        else:
+            shared.buf[:size] = pdf_bytes
+            return cls(("shm", shared.name, size), shared=shared, on_release=on_release)
+        handle, path = tempfile.mkstemp(suffix=".pdf", dir=spill_dir)
+        with os.fdopen(handle, "wb") as spill:
+            spill.write(pdf_bytes)
+        return cls(("file", path, size), on_release=on_release)
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        kind, location, _ = self.source
+        if self._shared is not None:
+            self._shared.close()
+            self._shared.unlink()
+            self._shared = None
+        elif kind == "file" and self._owns_file:
+            Path(location).unlink(missing_ok=True)
+        if self._on_release is not None:
+            try:
+                self._on_release(self.source)
+            except Exception as exc:  # pragma: no cover - workers still evict by LRU
+                logger.debug("Failed to signal PDF release to workers: %s", exc)
+
+
+@dataclass
+class _WorkerPdf:
+    """PDF document a worker process keeps open between tasks."""
+
+    source: tuple[str, str, int]
+    document: Any
+    view: memoryview | None = None
+    shared: shared_memory.SharedMemory | None = None
+    users: int = 0
+    released: bool = False
+
+
+# Documents a worker keeps open. More than one so a long-lived pool that
+# interleaves tasks from concurrent documents does not reopen on every task.
+# When a job ends the parent submits a ``close_worker_pdf`` task per worker
+# (see ``SharedPdfBytes.on_release``); a worker that misses it still closes
+# the document once it falls out of this cache.
+_WORKER_PDF_CACHE_SIZE = 4
+_worker_pdfs: OrderedDict[tuple[str, str, int], _WorkerPdf] = OrderedDict()
+
+
+@contextmanager
+def worker_pdf(source: tuple[str, str, int]) -> Iterator[Any]:
+    """This worker's open document for ``source``, opened on first use.
+
+    The document stays cached for the job's later tasks until
+    ``close_worker_pdf`` is called for it or it is evicted.
+    """
+    cached = _worker_pdfs.get(source)
+    if cached is None:
+        cached = _open_worker_pdf(source)
+        _worker_pdfs[source] = cached
+    else:
+        _worker_pdfs.move_to_end(source)
+    cached.users += 1
+    for key in [key for key, entry in _worker_pdfs.items() if not entry.users]:
+        if len(_worker_pdfs) <= _WORKER_PDF_CACHE_SIZE:
+            break
+        _close_cached(_worker_pdfs.pop(key))
+    try:
+        yield cached.document
+    finally:
+        cached.users -= 1
+        if cached.released and not cached.users and _worker_pdfs.get(source) is cached:
+            _close_cached(_worker_pdfs.pop(source))
+
+
+def _open_worker_pdf(source: tuple[str, str, int]) -> _WorkerPdf:
+    import fitz  # type: ignore
+
+    kind, location, size = source
+    if kind == "shm":
+        shared = shared_memory.SharedMemory(name=location)
+        view = shared.buf[:size]
+        return _WorkerPdf(source=source, document=fitz.open(stream=view, filetype="pdf"), view=view, shared=shared)
+    return _WorkerPdf(source=source, document=fitz.open(location, filetype="pdf"))
+
+
+def close_worker_pdf(source: tuple[str, str, int] | None = None) -> None:
+    """Close one cached worker document, or all of them when ``source`` is None.
+
+    Also the task a pool submits to its workers when a job releases its PDF.
+    A document still in use by a task is closed when that task finishes.
+    """
+    sources = list(_worker_pdfs) if source is None else [source]
+    for key in sources:
+        cached = _worker_pdfs.get(key)
+        if cached is None:
+            continue
+        if cached.users:
+            cached.released = True
+            continue
+        _close_cached(_worker_pdfs.pop(key))
+
+
+def _close_cached(cached: _WorkerPdf) -> None:
+    try:
+        cached.document.close()
+        if cached.view is not None:
+            cached.view.release()
+        if cached.shared is not None:
+            cached.shared.close()
+    except (BufferError, ValueError) as exc:  # pragma: no cover - best effort
+        logger.debug("Failed to release cached worker PDF: %s", exc)
@@ -3,8 +3,11 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator
 
+from .pdf_backend import PdfBackendError, open_pdf
+from .pixmap_encoding import PixmapEncoding, render_adaptive
+from .pixmap_store import PixmapStore
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,9 @@ class PixmapInfo:
     page_number: int
     path: Path
     size_bytes: int
+    mimetype: str = "image/png"
+    dpi: float | None = None
+    bytes_saved: int = 0
 
 
 class PixmapFactory:
@@ -32,34 +38,54 @@ class PixmapFactory:
         max_width: int | None = None,
         max_height: int | None = None,
         resize_quality: str = "LANCZOS",
+        pixmap_store: PixmapStore | None = None,
+        encoding: PixmapEncoding | None = None,
     ) -> None:
         self.base_dir = base_dir
         self.dpi = dpi
         self.max_width = max_width
         self.max_height = max_height
         self.resize_quality = resize_quality
+        self.pixmap_store = pixmap_store
+        self.encoding = encoding or PixmapEncoding()
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def cache_identity(self) -> dict[str, object]:
+        """Rendering settings that determine the produced pixmaps."""
+        return {
+            "dpi": self.dpi,
+            "max_width": self.max_width,
+            "max_height": self.max_height,
+            "resize_quality": self.resize_quality,
+            "adaptive": self.encoding.adaptive,
+            "photo_format": self.encoding.photo_format if self.encoding.adaptive else None,
+            "quality": self.encoding.quality if self.encoding.adaptive else None,
+        }
+
     def generate(self, document_id: str, pdf_bytes: bytes) -> Dict[int, PixmapInfo]:
-        """Render every PDF page to disk and return metadata per page."""
+        """Render every PDF page and return metadata per page.
 
-        try:
-            import fitz  # type: ignore
-        except ImportError as exc:  # pragma: no cover - optional dependency
-            raise PixmapGenerationError(
-                "PyMuPDF is required for pixmap generation. Install `pymupdf`."
-            ) from exc
+        With a pixmap store the encoded PNG stays in memory and the store
+        decides whether and when it reaches ``path`` on disk. Inside
+        ``share_pdf`` the already open document is rendered from.
+        """
 
         try:
-            pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-        except Exception as exc:  # pragma: no cover - defensive logging
-            raise PixmapGenerationError(f"Unable to read PDF bytes: {exc}") from exc
+            with open_pdf(pdf_bytes) as pdf:
+                return self._render_pages(pdf.pages(), document_id)
+        except PdfBackendError as exc:
+            raise PixmapGenerationError(str(exc)) from exc
 
+    def _render_pages(self, pages: Iterator[tuple[int, "fitz.Page"]], document_id: str) -> Dict[int, PixmapInfo]:
         output_dir = self.base_dir / document_id
         output_dir.mkdir(parents=True, exist_ok=True)
         pixmap_info: Dict[int, PixmapInfo] = {}
 
-        for index, page in enumerate(pdf_document, start=1):
+        for index, page in pages:
+            if self.encoding.adaptive:
+                pixmap_info[index] = self._render_adaptive(page, output_dir, index)
+                continue
             try:
                 pix = page.get_pixmap(dpi=self.dpi)
             except Exception as exc:  # pragma: no cover - defensive logging
@@ -69,15 +95,40 @@ class PixmapFactory:
             pix = self._resize_if_needed(pix, document_id, index)
 
             file_path = output_dir / f"page_{index:04d}.png"
-            pix.save(file_path)
+            if self.pixmap_store is not None:
+                size_bytes = self.pixmap_store.put(file_path, pix.tobytes("png"), "image/png").size_bytes
+            else:
+                pix.save(file_path)
+                size_bytes = file_path.stat().st_size
             pixmap_info[index] = PixmapInfo(
                 page_number=index,
                 path=file_path,
-                size_bytes=file_path.stat().st_size,
+                size_bytes=size_bytes,
             )
 
         return pixmap_info
 
+    def _render_adaptive(self, page: "fitz.Page", output_dir: Path, index: int) -> PixmapInfo:
+        """Render at the DPI that fits the max dimensions and encode per page content."""
+        try:
+            encoded = render_adaptive(page, self.dpi, self.max_width, self.max_height, self.encoding)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            raise PixmapGenerationError(f"Failed to render pixmap for page {index}: {exc}") from exc
+
+        file_path = output_dir / f"page_{index:04d}{encoded.suffix}"
+        if self.pixmap_store is not None:
+            self.pixmap_store.put(file_path, encoded.data, encoded.mimetype)
+        else:
+            file_path.write_bytes(encoded.data)
+        return PixmapInfo(
+            page_number=index,
+            path=file_path,
+            size_bytes=len(encoded.data),
+            mimetype=encoded.mimetype,
+            dpi=round(encoded.dpi, 1),
+            bytes_saved=encoded.bytes_saved,
+        )
+
     def _resize_if_needed(self, pixmap: "fitz.Pixmap", document_id: str, page_number: int) -> "fitz.Pixmap":
         """Resize pixmap if it exceeds max dimensions, maintaining aspect ratio."""
         if not self.max_width and not self.max_height:
@@ -0,0 +1,255 @@
+"""In-process store for encoded page pixmaps, shared by parsing and cleaning."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_MIMETYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+
+
+class EncodedPixmap:
+    """Handle to one rendered page image held in memory.
+
+    Keeps the encoded file bytes and derives the sha256 and base64 payload on
+    first use, so every consumer of the same page shares one encoding.
+    """
+
+    def __init__(self, path: str, data: bytes, mimetype: str) -> None:
+        self.path = path
+        self.data = data
+        self.mimetype = mimetype
+        self._sha256: str | None = None
+        self._base64: str | None = None
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.data)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held for this pixmap, including the cached base64 payload."""
+        return len(self.data) + (len(self._base64) if self._base64 is not None else 0)
+
+    @property
+    def base64_cached(self) -> bool:
+        """Whether the base64 payload has already been derived."""
+        return self._base64 is not None
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    def base64(self) -> str:
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.data).decode("ascii")
+        return self._base64
+
+    def data_url(self) -> str:
+        return f"data:{self.mimetype};base64,{self.base64()}"
+
+
+class PixmapStore:
+    """Byte-bounded LRU of encoded pixmaps keyed by their artifact path.
+
+    Pixmap factories ``put`` freshly rendered images here instead of writing
+    them and reading them back. Disk persistence is optional; when enabled,
+    files are written by a single background thread (or inline with
+    ``write_behind=False``) and a page stays readable from memory until its
+    write lands, even if it has been evicted meanwhile.
+
+    Lookups for paths that are not in memory fall back to reading the file,
+    so pixmaps rendered by an earlier process are still served.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256_000_000,
+        persist: bool = True,
+        write_behind: bool = True,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.persist = persist
+        self.write_behind = write_behind
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, EncodedPixmap] = OrderedDict()
+        self._charged: dict[str, int] = {}
+        self._total_bytes = 0
+        self._pending: dict[str, EncodedPixmap] = {}
+        self._writes: set[Future] = set()
+        self._writer: ThreadPoolExecutor | None = None
+        self._stats = {"memory_hits": 0, "disk_reads": 0, "misses": 0, "writes": 0}
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, path: Path | str, data: bytes, mimetype: str | None = None) -> EncodedPixmap:
+        """Hold ``data`` in memory for ``path`` and persist it if configured."""
+        key = str(path)
+        pixmap = EncodedPixmap(key, data, mimetype or guess_mimetype(key))
+        with self._lock:
+            self._store(key, pixmap)
+            if self.persist:
+                self._pending[key] = pixmap
+        if self.persist:
+            if self.write_behind:
+                self._schedule_write(pixmap)
+            else:
+                self._write(pixmap)
+        return pixmap
+
+    def get(self, path: Path | str) -> EncodedPixmap | None:
+        """Return the pixmap for ``path`` from memory, falling back to disk."""
+        key = str(path)
+        with self._lock:
+            pixmap = self._entries.get(key) or self._pending.get(key)
+            if pixmap is not None:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return pixmap
+        try:
+            data = Path(key).read_bytes()
+        except OSError:
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        pixmap = EncodedPixmap(key, data, guess_mimetype(key))
+        with self._lock:
+            self._stats["disk_reads"] += 1
+            self._store(key, pixmap)
+        return pixmap
+
+    def exists(self, path: Path | str) -> bool:
+        key = str(path)
+        with self._lock:
+            if key in self._entries or key in self._pending:
+                return True
+        return Path(key).exists()
+
+    def base64(self, path: Path | str) -> str | None:
+        """Base64 payload for ``path``; encoded once and cached with the bytes."""
+        pixmap = self.get(path)
+        if pixmap is None:
+            return None
+        if not pixmap.base64_cached:
+            encoded = pixmap.base64()
+            with self._lock:
+                if self._entries.get(pixmap.path) is pixmap:
+                    self._charge(pixmap.path, pixmap.memory_bytes)
+                    self._evict()
+            return encoded
+        return pixmap.base64()
+
+    def data_url(self, path: Path | str) -> str | None:
+        encoded = self.base64(path)
+        if encoded is None:
+            return None
+        return f"data:{self.mimetype(path)};base64,{encoded}"
+
+    def mimetype(self, path: Path | str) -> str:
+        key = str(path)
+        with self._lock:
+            pixmap = self._entries.get(key) or self._pending.get(key)
+        return pixmap.mimetype if pixmap is not None else guess_mimetype(key)
+
+    def sha256(self, path: Path | str) -> str | None:
+        pixmap = self.get(path)
+        return pixmap.sha256 if pixmap is not None else None
+
+    def flush(self) -> None:
+        """Block until every scheduled disk write has finished."""
+        while True:
+            with self._lock:
+                writes = list(self._writes)
+            if not writes:
+                return
+            for write in writes:
+                write.result()
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread."""
+        self.flush()
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
+
+    def _store(self, key: str, pixmap: EncodedPixmap) -> None:
+        self._entries.pop(key, None)
+        self._charge(key, 0)
+        if pixmap.memory_bytes > self.max_bytes:
+            return
+        self._entries[key] = pixmap
+        self._charge(key, pixmap.memory_bytes)
+        self._evict()
+
+    def _charge(self, key: str, size: int) -> None:
+        """Set the bytes accounted to ``key`` (0 forgets it)."""
+        self._total_bytes += size - self._charged.pop(key, 0)
+        if size:
+            self._charged[key] = size
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._charge(evicted, 0)
+
+    def _schedule_write(self, pixmap: EncodedPixmap) -> None:
+        with self._lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pixmap-writer")
+            write = self._writer.submit(self._write, pixmap)
+            self._writes.add(write)
+        write.add_done_callback(self._write_done)
+
+    def _write_done(self, write: Future) -> None:
+        with self._lock:
+            self._writes.discard(write)
+
+    def _write(self, pixmap: EncodedPixmap) -> None:
+        path = Path(pixmap.path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(pixmap.data)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to persist pixmap %s: %s", path, exc)
+            tmp_path.unlink(missing_ok=True)
+        else:
+            with self._lock:
+                self._stats["writes"] += 1
+        finally:
+            with self._lock:
+                if self._pending.get(pixmap.path) is pixmap:
+                    del self._pending[pixmap.path]
+
+
+def guess_mimetype(path: str) -> str:
+    """Image mimetype implied by a pixmap file extension (PNG when unknown)."""
+    return _MIMETYPES.get(Path(path).suffix.lower(), "image/png")
@@ -0,0 +1,165 @@
+"""Long-lived process pool that renders pixmap pages for every document."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class PixmapRenderPool:
+    """App-scoped render pool shared by all concurrent documents.
+
+    Page tasks from every document wait in per-document queues and are handed
+    to one long-lived ProcessPoolExecutor round-robin, one page per document
+    at a time, so a 400-page manual cannot starve a 3-page memo submitted
+    after it. At most ``max_in_flight`` pages sit in the executor; the rest
+    stay in the fair queues.
+
+    Worker processes (and their PyMuPDF imports) survive across documents and
+    are only started on first use.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_in_flight: int | None = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.max_in_flight = max_in_flight or self.max_workers * 2
+        self._wakeup = threading.Condition()
+        self._dispatcher: threading.Thread | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._queues: OrderedDict[int, deque[tuple[Callable[[Any], Any], Any, Future]]] = OrderedDict()
+        self._tickets = itertools.count()
+        self._in_flight = 0
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Pages queued but not yet handed to a worker process."""
+        with self._wakeup:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def submit_document(self, fn: Callable[[Any], Any], tasks: Sequence[Any]) -> list[Future]:
+        """Queue one document's page tasks and return a future per task, in order."""
+        futures: list[Future] = []
+        with self._wakeup:
+            if self._closed:
+                raise RuntimeError("PixmapRenderPool has been shut down")
+            queue: deque[tuple[Callable[[Any], Any], Any, Future]] = deque()
+            for task in tasks:
+                future: Future = Future()
+                futures.append(future)
+                queue.append((fn, task, future))
+            if queue:
+                self._queues[next(self._tickets)] = queue
+                self._ensure_dispatcher()
+                self._wakeup.notify()
+        return futures
+
+    def broadcast(self, fn: Callable[[Any], Any], arg: Any) -> None:
+        """Submit ``fn(arg)`` once per worker slot, ahead of the fair queues.
+
+        Used to drop per-document worker state (an open PDF) when a document's
+        job ends. Nothing is sent before the worker processes have started.
+        """
+        with self._wakeup:
+            executor = self._executor
+        if executor is None:
+            return
+        try:
+            for _ in range(self.max_workers):
+                executor.submit(fn, arg)
+        except (BrokenProcessPool, RuntimeError) as exc:
+            logger.debug("Could not broadcast to render workers: %s", exc)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work, cancel queued pages and stop the worker processes."""
+        with self._wakeup:
+            self._closed = True
+            queued = [future for queue in self._queues.values() for _, _, future in queue]
+            self._queues.clear()
+            executor, self._executor = self._executor, None
+            dispatcher, self._dispatcher = self._dispatcher, None
+            self._wakeup.notify_all()
+        for future in queued:
+            future.cancel()
+        if dispatcher is not None and wait:
+            dispatcher.join()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, name="pixmap-render-dispatch", daemon=True
+            )
+            self._dispatcher.start()
+
+    def _dispatch_loop(self) -> None:
+        """Move pages from the fair queues into the executor while capacity remains."""
+        while True:
+            with self._wakeup:
+                while not self._closed and (self._in_flight >= self.max_in_flight or not self._queues):
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                ticket, queue = next(iter(self._queues.items()))
+                fn, task, future = queue.popleft()
+                # Rotate: this document goes to the back of the line
+                del self._queues[ticket]
+                if queue:
+                    self._queues[ticket] = queue
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._in_flight += 1
+                executor = self._ensure_executor()
+            try:
+                inner = executor.submit(fn, task)
+            except (BrokenProcessPool, RuntimeError) as exc:
+                self._reset_executor(executor, exc)
+                self._finish(future, exc=exc)
+                continue
+            inner.add_done_callback(lambda done, outer=future: self._on_done(done, outer))
+
+    def _on_done(self, inner: Future, outer: Future) -> None:
+        if inner.cancelled():
+            self._finish(outer, exc=RuntimeError("Render task was cancelled"))
+            return
+        exc = inner.exception()
+        if isinstance(exc, BrokenProcessPool):
+            self._reset_executor(None, exc)
+        if exc is not None:
+            self._finish(outer, exc=exc)
+        else:
+            self._finish(outer, result=inner.result())
+
+    def _finish(self, future: Future, result: Any = None, exc: BaseException | None = None) -> None:
+        with self._wakeup:
+            self._in_flight -= 1
+            self._wakeup.notify()
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info("🚀 Starting pixmap render pool with %d workers", self.max_workers)
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _reset_executor(self, executor: ProcessPoolExecutor | None, exc: BaseException) -> None:
+        """Drop a broken executor so the next page starts a fresh one."""
+        with self._wakeup:
+            if executor is None or self._executor is executor:
+                broken, self._executor = self._executor, None
+            else:
+                broken = None
+        if broken is not None:
+            logger.warning("Pixmap render pool broke, restarting workers: %s", exc)
+            broken.shutdown(wait=False, cancel_futures=True)
@@ -4,6 +4,7 @@ from typing import Literal, Optional, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator
+from pydantic.json_schema import SkipJsonSchema
 
 
 class BoundingBox(BaseModel):
@@ -142,3 +143,8 @@ class CleanedPage(BaseModel):
     document_id: str
     page_number: int
     segments: list[CleanedSegment] = Field(default_factory=list)
+    # Set by the cleaner, never by the LLM: kept out of the structured-output schema
+    cleaning_status: SkipJsonSchema[Literal["success", "fallback"]] = Field(
+        default="success",
+        description="success (cleaned by the LLM) or fallback (raw component text after the LLM failed)",
+    )
@@ -9,7 +9,8 @@ from pathlib import Path
 from typing import Any
 
 from ...domain.batch_models import BatchJob, DocumentJob
-from ..ports import BatchJobRepository
+from ..ports import BatchJobRepository, Catalog, CatalogEntry
+from .catalog_sqlite import load_listed, select_entries
 
 
 class FileSystemBatchJobRepository(BatchJobRepository):
@@ -20,11 +21,22 @@ class FileSystemBatchJobRepository(BatchJobRepository):
             batch.json          - Batch metadata and aggregate status
             documents/
                 {doc_id}.json   - Individual document job details
+
+    With a ``catalog``, every write to ``batch.json`` also upserts the
+    batch's catalog row, and ``list_batches``/``list_entries`` page through
+    the catalog instead of stat-ing and loading every batch directory.
+    Batches stored before the catalog existed are indexed once, on first use.
     """
 
-    def __init__(self, base_dir: Path | str) -> None:
+    catalog_kind = "batch"
+
+    def __init__(self, base_dir: Path | str, catalog: Catalog | None = None) -> None:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Rows are kept per directory, so repositories sharing a catalog stay apart
+        self.catalog = catalog.scoped(str(self.base_dir.resolve())) if catalog is not None else None
+        if self.catalog is not None and not self.catalog.is_indexed(self.catalog_kind):
+            self.catalog.index(self.catalog_kind, self._scan_entries())
 
     # ------------------------------------------------------------------
     # Public API
@@ -38,7 +50,7 @@ class FileSystemBatchJobRepository(BatchJobRepository):
         
         # Write batch metadata
         batch_data = self._serialize_batch(batch)
-        self._write_json(batch_dir / "batch.json", batch_data)
+        self._write_batch_metadata(batch.id, batch_data)
         
         # Write individual document jobs
         for doc_job in batch.document_jobs.values():
@@ -71,7 +83,7 @@ class FileSystemBatchJobRepository(BatchJobRepository):
         
         # Update batch metadata
         batch_data = self._serialize_batch(batch)
-        self._write_json(batch_dir / "batch.json", batch_data)
+        self._write_batch_metadata(batch.id, batch_data)
         
         # Update all document jobs
         for doc_job in batch.document_jobs.values():
@@ -88,12 +100,24 @@ class FileSystemBatchJobRepository(BatchJobRepository):
             batch.update_status()
             # Write updated batch metadata
             batch_data = self._serialize_batch(batch)
-            self._write_json(self._batch_dir(batch_id) / "batch.json", batch_data)
+            self._write_batch_metadata(batch_id, batch_data)
 
-    def list_batches(self, limit: int = 20) -> list[BatchJob]:
+    def list_batches(
+        self,
+        limit: int = 20,
+        *,
+        status: str | None = None,
+        offset: int = 0,
+    ) -> list[BatchJob]:
         """Return the most recent batch jobs, sorted by creation time."""
         batches: list[BatchJob] = []
         
+        if self.catalog is not None:
+            return load_listed(
+                self.catalog, self.catalog_kind, self.get_batch, status=status, limit=limit, offset=offset
+            )
+        
+        skipped = 0
         for batch_dir in sorted(
             self.base_dir.iterdir(),
             key=lambda path: path.stat().st_mtime,
@@ -103,14 +127,30 @@ class FileSystemBatchJobRepository(BatchJobRepository):
                 continue
             
             batch = self.get_batch(batch_dir.name)
-            if batch:
-                batches.append(batch)
+            if batch is None or (status is not None and batch.status != status):
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            batches.append(batch)
             
             if len(batches) >= limit:
                 break
         
         return batches
 
+    def list_entries(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = 20,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        """Return catalog rows for the most recent batches without loading their document jobs."""
+        if self.catalog is None:
+            return select_entries(self._scan_entries(), status=status, limit=limit, offset=offset)
+        return self.catalog.list(self.catalog_kind, status=status, limit=limit, offset=offset)
+
     # ------------------------------------------------------------------
     # Serialization helpers
     # ------------------------------------------------------------------
@@ -124,6 +164,7 @@ class FileSystemBatchJobRepository(BatchJobRepository):
             "completed_documents": batch.completed_documents,
             "failed_documents": batch.failed_documents,
             "error_strategy": batch.error_strategy,
+            "priority": batch.priority,
             "started_at": batch.started_at.isoformat() if batch.started_at else None,
             "completed_at": batch.completed_at.isoformat() if batch.completed_at else None,
             "document_job_ids": list(batch.document_jobs.keys()),  # Just store IDs, not full objects
@@ -145,10 +186,28 @@ class FileSystemBatchJobRepository(BatchJobRepository):
             failed_documents=data.get("failed_documents", 0),
             document_jobs=document_jobs,
             error_strategy=data.get("error_strategy", "continue"),
+            priority=data.get("priority", "batch"),
             started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
             completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
         )
 
+    def _catalog_entry(self, data: dict[str, Any], updated_at: datetime) -> CatalogEntry:
+        """Build the catalog row for a serialized batch."""
+        return CatalogEntry(
+            kind=self.catalog_kind,
+            id=data["id"],
+            status=data.get("status", "queued"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=updated_at,
+            path=str(self._batch_dir(data["id"])),
+            details={
+                "total_documents": data.get("total_documents", 0),
+                "completed_documents": data.get("completed_documents", 0),
+                "failed_documents": data.get("failed_documents", 0),
+                "priority": data.get("priority", "batch"),
+            },
+        )
+
     def _serialize_document_job(self, doc_job: DocumentJob) -> dict[str, Any]:
         """Convert DocumentJob to JSON-serializable dict."""
         return {
@@ -192,6 +251,23 @@ class FileSystemBatchJobRepository(BatchJobRepository):
         docs_dir.mkdir(parents=True, exist_ok=True)
         return docs_dir
 
+    def _write_batch_metadata(self, batch_id: str, batch_data: dict[str, Any]) -> None:
+        """Write batch.json and keep the catalog row in step."""
+        self._write_json(self._batch_dir(batch_id) / "batch.json", batch_data)
+        if self.catalog is not None:
+            self.catalog.upsert(self._catalog_entry(batch_data, datetime.utcnow()))
+
+    def _scan_entries(self) -> list[CatalogEntry]:
+        """Catalog rows for every stored batch, read from each ``batch.json``."""
+        entries: list[CatalogEntry] = []
+        for batch_dir in self.base_dir.iterdir():
+            batch_path = batch_dir / "batch.json"
+            batch_data = self._read_json(batch_path) if batch_dir.is_dir() else None
+            if batch_data:
+                updated_at = datetime.utcfromtimestamp(batch_path.stat().st_mtime)
+                entries.append(self._catalog_entry(batch_data, updated_at))
+        return entries
+
     def _write_document_job(self, batch_id: str, doc_job: DocumentJob) -> None:
         """Write a document job to disk."""
         doc_path = self._documents_dir(batch_id) / f"{doc_job.document_id}.json"
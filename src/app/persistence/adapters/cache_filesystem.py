@@ -0,0 +1,294 @@
+"""Filesystem adapters for content-addressed pipeline caches."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from pydantic import ValidationError
+
+from ...application.interfaces import CleanedPageCache, EmbeddingCache, ParsedPageCache
+from ...parsing.schemas import CleanedPage, ParsedPage
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key_digest(key: Mapping[str, Any]) -> str:
+    """Return a stable sha256 digest for a cache key mapping."""
+    encoded = json.dumps(dict(key), sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class InMemoryLRUCache:
+    """Thread-safe, entry-bounded in-process LRU map."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str) -> Any | None:
+        with self._lock:
+            if digest not in self._entries:
+                return None
+            self._entries.move_to_end(digest)
+            return self._entries[digest]
+
+    def put(self, digest: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[digest] = value
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class FileSystemBlobCache:
+    """Size-bounded blob store with least-recently-used eviction.
+
+    Storage structure:
+        {base_dir}/{digest[:2]}/{digest}{suffix}
+
+    Recency is tracked in memory and mirrored to file mtimes so the LRU
+    order survives restarts. Several processes may share one directory: a
+    lookup that misses the in-process index checks the disk and adopts the
+    entry, and writes rescan the directory (at most every ``rescan_seconds``)
+    so eviction counts and orders what other processes wrote.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path | str,
+        max_bytes: int,
+        suffix: str = ".json",
+        rescan_seconds: float = 5.0,
+    ) -> None:
+        self.base_dir = Path(base_dir)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.rescan_seconds = rescan_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._scanned_at = 0.0
+        with self._lock:
+            self._rescan()
+            self._evict()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._entries or self._path(digest).exists()
+
+    def get(self, digest: str) -> bytes | None:
+        with self._lock:
+            path = self._path(digest)
+            try:
+                data = path.read_bytes()
+                os.utime(path)
+            except OSError:
+                # Never written, or evicted by this or another process
+                self._forget(digest, remove_file=False)
+                return None
+            if digest not in self._entries:
+                # Written by another process sharing the directory
+                self._total_bytes += len(data)
+            self._entries[digest] = len(data)
+            self._entries.move_to_end(digest)
+            return data
+
+    def put(self, digest: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            path = self._path(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            except OSError as exc:
+                logger.warning("Failed to write cache entry %s: %s", path, exc)
+                tmp_path.unlink(missing_ok=True)
+                return
+            self._forget(digest, remove_file=False)
+            self._entries[digest] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def discard(self, digest: str) -> None:
+        with self._lock:
+            self._forget(digest)
+
+    def _path(self, digest: str) -> Path:
+        return self.base_dir / digest[:2] / f"{digest}{self.suffix}"
+
+    def _forget(self, digest: str, remove_file: bool = True) -> None:
+        size = self._entries.pop(digest, None)
+        if size is not None:
+            self._total_bytes -= size
+        if remove_file:
+            self._path(digest).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        # This process's total misses what others wrote since the last scan
+        if time.monotonic() - self._scanned_at >= self.rescan_seconds:
+            self._rescan()
+        while self._total_bytes > self.max_bytes and self._entries:
+            digest, _ = next(iter(self._entries.items()))
+            self._forget(digest)
+
+    def _rescan(self) -> None:
+        """Rebuild the index from the directory, which every sharing process writes to.
+
+        Entries are ordered by mtime (refreshed on every hit); entries whose
+        mtimes tie at the filesystem's timestamp granularity keep this
+        process's recency order, with entries it has not seen first.
+        """
+        local_rank = {digest: rank for rank, digest in enumerate(self._entries)}
+        found: list[tuple[float, int, str, int]] = []
+        for path in self.base_dir.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest = path.name[: -len(self.suffix)]
+            found.append((stat.st_mtime, local_rank.get(digest, -1), digest, stat.st_size))
+        self._entries = OrderedDict((digest, size) for _, _, digest, size in sorted(found))
+        self._total_bytes = sum(self._entries.values())
+        self._scanned_at = time.monotonic()
+
+
+class FileSystemParseCache(ParsedPageCache):
+    """Persists successfully parsed pages keyed by their content identity."""
+
+    def __init__(self, base_dir: Path | str, max_bytes: int = 512_000_000) -> None:
+        self._blobs = FileSystemBlobCache(base_dir, max_bytes=max_bytes)
+
+    def get(self, key: Mapping[str, Any]) -> ParsedPage | None:
+        digest = cache_key_digest(key)
+        data = self._blobs.get(digest)
+        if data is None:
+            return None
+        try:
+            return ParsedPage.model_validate_json(data)
+        except ValidationError as exc:
+            logger.warning("Discarding unreadable parse cache entry %s: %s", digest, exc)
+            self._blobs.discard(digest)
+            return None
+
+    def put(self, key: Mapping[str, Any], parsed_page: ParsedPage) -> None:
+        self._blobs.put(cache_key_digest(key), parsed_page.model_dump_json().encode("utf-8"))
+
+
+class FileSystemCleaningCache(CleanedPageCache):
+    """Two-tier cache for cleaning results: in-process LRU backed by disk.
+
+    Disk hits are promoted into the memory tier. ``stats`` counts lookups per
+    tier for the lifetime of the process.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path | str,
+        max_bytes: int = 256_000_000,
+        memory_entries: int = 1024,
+    ) -> None:
+        self._memory = InMemoryLRUCache(memory_entries)
+        self._blobs = FileSystemBlobCache(base_dir, max_bytes=max_bytes)
+        self._stats_lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def get(self, key: Mapping[str, Any]) -> CleanedPage | None:
+        digest = cache_key_digest(key)
+        cached = self._memory.get(digest)
+        if cached is not None:
+            self._count("memory_hits")
+            return cached.model_copy(deep=True)
+        data = self._blobs.get(digest)
+        if data is None:
+            self._count("misses")
+            return None
+        try:
+            cleaned_page = CleanedPage.model_validate_json(data)
+        except ValidationError as exc:
+            logger.warning("Discarding unreadable cleaning cache entry %s: %s", digest, exc)
+            self._blobs.discard(digest)
+            self._count("misses")
+            return None
+        self._memory.put(digest, cleaned_page)
+        self._count("disk_hits")
+        return cleaned_page.model_copy(deep=True)
+
+    def put(self, key: Mapping[str, Any], cleaned_page: CleanedPage) -> None:
+        digest = cache_key_digest(key)
+        stored = cleaned_page.model_copy(deep=True)
+        self._memory.put(digest, stored)
+        self._blobs.put(digest, stored.model_dump_json().encode("utf-8"))
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+
+class FileSystemEmbeddingCache(EmbeddingCache):
+    """Two-tier embedding cache storing vectors as raw float32 arrays.
+
+    Each entry is ``4 * dimension`` bytes on disk instead of a JSON list, and
+    hot vectors stay in an in-process LRU tier.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path | str,
+        max_bytes: int = 1_000_000_000,
+        memory_entries: int = 20_000,
+    ) -> None:
+        self._memory = InMemoryLRUCache(memory_entries)
+        self._blobs = FileSystemBlobCache(base_dir, max_bytes=max_bytes, suffix=".f32")
+
+    def get(self, key: Mapping[str, Any]) -> list[float] | None:
+        digest = cache_key_digest(key)
+        cached = self._memory.get(digest)
+        if cached is not None:
+            return cached.tolist()
+        data = self._blobs.get(digest)
+        if data is None:
+            return None
+        if len(data) % 4:
+            logger.warning("Discarding truncated embedding cache entry %s", digest)
+            self._blobs.discard(digest)
+            return None
+        vector = array("f")
+        vector.frombytes(data)
+        self._memory.put(digest, vector)
+        return vector.tolist()
+
+    def put(self, key: Mapping[str, Any], vector: Sequence[float]) -> None:
+        digest = cache_key_digest(key)
+        packed = array("f", vector)
+        self._memory.put(digest, packed)
+        self._blobs.put(digest, packed.tobytes())
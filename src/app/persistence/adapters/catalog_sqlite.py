@@ -0,0 +1,258 @@
+"""SQLite catalog indexing the documents, runs and batches stored on disk."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from ..ports import Catalog, CatalogEntry
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    store TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    filename TEXT,
+    status TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    size_bytes INTEGER,
+    path TEXT,
+    details TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (store, kind, id)
+);
+CREATE INDEX IF NOT EXISTS entries_recent ON entries (store, kind, created_at);
+CREATE INDEX IF NOT EXISTS entries_status ON entries (store, kind, status, created_at);
+CREATE TABLE IF NOT EXISTS indexed_kinds (
+    store TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    PRIMARY KEY (store, kind)
+);
+"""
+
+
+class SQLiteCatalog(Catalog):
+    """One row per stored document, run or batch, written by the filesystem repositories.
+
+    The repositories upsert a row on every write, so listing, filtering by
+    status and paginating newest-first are index lookups that never open a
+    document, run or batch file. Timestamps are stored as ISO strings, which
+    sort chronologically.
+
+    Rows and indexed flags belong to a ``store``: each repository works
+    through ``scoped(base_dir)``, so repositories over different directories
+    can share one catalog file without indexing or pruning each other's
+    rows. Without a store, reads and removals cover every store and writes
+    go to the default store "".
+
+    Storage:
+        artifacts/catalog.sqlite3 (WAL mode, so the API lists while workers write)
+    """
+
+    def __init__(self, db_path: Path, store: str | None = None) -> None:
+        self.db_path = Path(db_path)
+        self.store = store
+        self._create()
+
+    def scoped(self, store: str) -> SQLiteCatalog:
+        return SQLiteCatalog(self.db_path, store=store)
+
+    def upsert(self, entry: CatalogEntry) -> None:
+        with self._connect() as connection:
+            self._upsert(connection, entry)
+
+    def remove(self, kind: str, entry_id: str) -> None:
+        scope, params = self._scope()
+        with self._connect() as connection:
+            connection.execute(
+                f"DELETE FROM entries WHERE {scope}kind = ? AND id = ?", [*params, kind, entry_id]
+            )
+
+    def get(self, kind: str, entry_id: str) -> CatalogEntry | None:
+        scope, params = self._scope()
+        with self._connect() as connection:
+            row = connection.execute(
+                f"SELECT * FROM entries WHERE {scope}kind = ? AND id = ?", [*params, kind, entry_id]
+            ).fetchone()
+        return self._deserialize(row) if row else None
+
+    def list(
+        self,
+        kind: str,
+        *,
+        status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        scope, params = self._scope()
+        query = f"SELECT * FROM entries WHERE {scope}kind = ?"
+        params.append(kind)
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        # LIMIT -1 is SQLite's "no limit", which OFFSET requires
+        query += " ORDER BY created_at DESC, id LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+        with self._connect() as connection:
+            rows = connection.execute(query, params).fetchall()
+        return [self._deserialize(row) for row in rows]
+
+    def count(self, kind: str, *, status: str | None = None) -> int:
+        scope, params = self._scope()
+        query = f"SELECT COUNT(*) FROM entries WHERE {scope}kind = ?"
+        params.append(kind)
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        with self._connect() as connection:
+            return connection.execute(query, params).fetchone()[0]
+
+    def is_indexed(self, kind: str) -> bool:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM indexed_kinds WHERE store = ? AND kind = ?", (self.store or "", kind)
+            ).fetchone()
+        return row is not None
+
+    def index(self, kind: str, entries: Iterable[CatalogEntry]) -> None:
+        with self._transaction() as connection:
+            for entry in entries:
+                self._upsert(connection, entry)
+            connection.execute(
+                "INSERT OR IGNORE INTO indexed_kinds (store, kind) VALUES (?, ?)", (self.store or "", kind)
+            )
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _create(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(entries)")}
+            if columns and "store" not in columns:
+                # Written before rows were scoped by store: drop it, the repositories re-index
+                connection.executescript("DROP TABLE entries; DROP TABLE IF EXISTS indexed_kinds;")
+            connection.executescript(_SCHEMA)
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self.db_path.exists():
+            # Deleted along with the artifacts it indexes: start an empty catalog
+            self._create()
+        # One short-lived connection per call: safe across threads and processes
+        connection = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _scope(self) -> tuple[str, list[Any]]:
+        """WHERE prefix and parameters restricting a query to this catalog's store."""
+        if self.store is None:
+            return "", []
+        return "store = ? AND ", [self.store]
+
+    def _upsert(self, connection: sqlite3.Connection, entry: CatalogEntry) -> None:
+        connection.execute(
+            "INSERT INTO entries "
+            "(store, kind, id, filename, status, created_at, updated_at, size_bytes, path, details) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (store, kind, id) DO UPDATE SET filename = excluded.filename, "
+            "status = excluded.status, created_at = excluded.created_at, "
+            "updated_at = excluded.updated_at, size_bytes = excluded.size_bytes, "
+            "path = excluded.path, details = excluded.details",
+            (
+                self.store or "",
+                entry.kind,
+                entry.id,
+                entry.filename,
+                entry.status,
+                entry.created_at.isoformat(),
+                entry.updated_at.isoformat(),
+                entry.size_bytes,
+                entry.path,
+                json.dumps(entry.details),
+            ),
+        )
+
+    def _deserialize(self, row: sqlite3.Row) -> CatalogEntry:
+        return CatalogEntry(
+            kind=row["kind"],
+            id=row["id"],
+            filename=row["filename"],
+            status=row["status"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            size_bytes=row["size_bytes"],
+            path=row["path"],
+            details=json.loads(row["details"]),
+        )
+
+
+def select_entries(
+    entries: Iterable[CatalogEntry],
+    *,
+    status: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[CatalogEntry]:
+    """``SQLiteCatalog.list`` over entries in memory, for repositories built without a catalog."""
+    selected = sorted(
+        (entry for entry in entries if status is None or entry.status == status),
+        key=lambda entry: entry.id,
+    )
+    selected.sort(key=lambda entry: entry.created_at, reverse=True)
+    return selected[offset:] if limit is None else selected[offset : offset + limit]
+
+
+def load_listed(
+    catalog: Catalog,
+    kind: str,
+    load: Callable[[str], T | None],
+    *,
+    status: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[T]:
+    """Load the records a catalog listing names, dropping rows whose record is gone.
+
+    Rows for records deleted (or left unreadable) outside the repository are
+    removed and replaced from further down the listing, so a page still
+    holds ``limit`` records when that many exist.
+    """
+    records: list[T] = []
+    while True:
+        wanted = None if limit is None else limit - len(records)
+        entries = catalog.list(kind, status=status, limit=wanted, offset=offset + len(records))
+        dropped = False
+        for entry in entries:
+            record = load(entry.id)
+            if record is None:
+                catalog.remove(kind, entry.id)
+                dropped = True
+            else:
+                records.append(record)
+        if not dropped or wanted is None or len(entries) < wanted:
+            return records
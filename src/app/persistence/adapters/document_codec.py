@@ -0,0 +1,153 @@
+"""Pluggable encodings for the document files the filesystem repositories write.
+
+``json`` (the default) keeps documents human-readable; ``orjson`` writes the
+same JSON compactly and several times faster; ``msgpack`` is a binary format.
+Any of them can be zstd-compressed. The file suffix records the encoding
+(``.json``, ``.msgpack``, plus ``.zst``), so documents written under an earlier
+setting stay readable after the setting changes.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Protocol
+
+DOCUMENT_FORMATS = ("json", "orjson", "msgpack")
+DOCUMENT_COMPRESSIONS = ("none", "zstd")
+# Every suffix a document file can have, for globbing stores written under any setting
+DOCUMENT_SUFFIXES = (".json", ".json.zst", ".msgpack", ".msgpack.zst")
+
+
+class DocumentCodec(Protocol):
+    """Turns a ``Document.model_dump(mode="json")`` payload into file bytes and back."""
+
+    suffix: str
+
+    def dumps(self, payload: dict[str, Any]) -> bytes:
+        ...
+
+    def loads(self, data: bytes) -> dict[str, Any]:
+        """Decode ``data``; raises ValueError when it is corrupt."""
+        ...
+
+
+class JsonCodec:
+    """Indented JSON, as the repositories always wrote it; parsed with orjson when installed."""
+
+    suffix = ".json"
+
+    def dumps(self, payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload, indent=2).encode("utf-8")
+
+    def loads(self, data: bytes) -> dict[str, Any]:
+        try:
+            import orjson
+        except ImportError:
+            return json.loads(data)
+        return orjson.loads(data)
+
+
+class OrjsonCodec:
+    """Compact JSON through orjson."""
+
+    suffix = ".json"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("The orjson document format requires `orjson`. Install `orjson`.") from exc
+        self._orjson = orjson
+
+    def dumps(self, payload: dict[str, Any]) -> bytes:
+        return self._orjson.dumps(payload, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes) -> dict[str, Any]:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec:
+    """Binary MessagePack."""
+
+    suffix = ".msgpack"
+
+    def __init__(self) -> None:
+        try:
+            import msgpack  # type: ignore
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("The msgpack document format requires `msgpack`. Install `msgpack`.") from exc
+        self._msgpack = msgpack
+
+    def dumps(self, payload: dict[str, Any]) -> bytes:
+        return self._msgpack.packb(payload, use_bin_type=True)
+
+    def loads(self, data: bytes) -> dict[str, Any]:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class ZstdCodec:
+    """zstd compression around another codec."""
+
+    def __init__(self, inner: DocumentCodec, level: int = 3) -> None:
+        try:
+            import zstandard  # type: ignore
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("zstd document compression requires `zstandard`. Install `zstandard`.") from exc
+        self.inner = inner
+        self.suffix = f"{inner.suffix}.zst"
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._zstd_error = zstandard.ZstdError
+
+    def dumps(self, payload: dict[str, Any]) -> bytes:
+        return self._compressor.compress(self.inner.dumps(payload))
+
+    def loads(self, data: bytes) -> dict[str, Any]:
+        try:
+            raw = self._decompressor.decompress(data)
+        except self._zstd_error as exc:
+            raise ValueError(f"Corrupt zstd document: {exc}") from exc
+        return self.inner.loads(raw)
+
+
+def build_document_codec(format: str = "json", compression: str = "none") -> DocumentCodec:
+    """The codec for a configured format and compression.
+
+    Raises ValueError for unknown names and ImportError when the package the
+    choice needs is not installed.
+    """
+    if format not in DOCUMENT_FORMATS:
+        raise ValueError(f"Unknown document format {format!r}; expected one of {', '.join(DOCUMENT_FORMATS)}")
+    if compression not in DOCUMENT_COMPRESSIONS:
+        raise ValueError(
+            f"Unknown document compression {compression!r}; expected one of {', '.join(DOCUMENT_COMPRESSIONS)}"
+        )
+    codec: DocumentCodec
+    if format == "orjson":
+        codec = OrjsonCodec()
+    elif format == "msgpack":
+        codec = MsgpackCodec()
+    else:
+        codec = JsonCodec()
+    if compression == "zstd":
+        codec = ZstdCodec(codec)
+    return codec
+
+
+def codec_for_name(filename: str, preferred: DocumentCodec) -> DocumentCodec | None:
+    """The codec that reads ``filename``, judged by its suffix; None if none does.
+
+    ``preferred`` is used when its suffix matches, so reads reuse the
+    configured codec's instances.
+    """
+    if filename.endswith(preferred.suffix):
+        return preferred
+    compressed = filename.endswith(".zst")
+    base = filename[: -len(".zst")] if compressed else filename
+    if base.endswith(".msgpack"):
+        inner: DocumentCodec = MsgpackCodec()
+    elif base.endswith(".json"):
+        inner = JsonCodec()
+    else:
+        return None
+    return ZstdCodec(inner) if compressed else inner
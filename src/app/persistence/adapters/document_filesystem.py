@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from ...domain.models import Document
-from ..ports import DocumentRepository
+from ..ports import Catalog, CatalogEntry, DocumentRepository
+from .catalog_sqlite import load_listed, select_entries
+from .document_codec import DOCUMENT_SUFFIXES, DocumentCodec, JsonCodec, codec_for_name
+from .vector_matrix import load_vector_matrix, save_vector_matrix, split_vectors
 
 
 def _get_page_cleaning_metadata(cleaning_metadata: dict[Any, dict], page_number: int) -> dict:
@@ -17,35 +21,143 @@ def _get_page_cleaning_metadata(cleaning_metadata: dict[Any, dict], page_number:
 
 
 class FileSystemDocumentRepository(DocumentRepository):
-    """Stores documents as JSON blobs on disk."""
+    """Stores documents as files on disk, one per document.
+
+    ``codec`` picks the encoding (indented JSON by default; see
+    ``document_codec``). Chunk vectors are kept out of the document file in a
+    ``<id>.vectors.npy`` matrix next to it (see ``vector_matrix``); ``get``
+    returns chunks that reference their row and ``get_vectors`` memory-maps
+    the matrix.
+
+    With a ``catalog``, every save also upserts the document's catalog row,
+    and ``list``/``list_entries`` page through the catalog instead of
+    reading every file in the directory. Documents stored before the
+    catalog existed are indexed once, on first use.
+    """
 
-    def __init__(self, base_dir: Path | str) -> None:
+    catalog_kind = "document"
+
+    def __init__(
+        self,
+        base_dir: Path | str,
+        codec: DocumentCodec | None = None,
+        catalog: Catalog | None = None,
+    ) -> None:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or JsonCodec()
+        # Rows are kept per directory, so repositories sharing a catalog stay apart
+        self.catalog = catalog.scoped(str(self.base_dir.resolve())) if catalog is not None else None
+        if self.catalog is not None and not self.catalog.is_indexed(self.catalog_kind):
+            self.catalog.index(self.catalog_kind, self._scan_entries())
 
     def save(self, document: Document) -> None:
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        target = self.base_dir / f"{document.id}.json"
-        with target.open("w", encoding="utf-8") as handle:
-            json.dump(document.model_dump(mode="json"), handle, indent=2)
+        payload = document.model_dump(mode="json")
+        vectors_path = self._vectors_path(document.id)
+        save_vector_matrix(vectors_path, split_vectors(payload, load_vector_matrix(vectors_path)))
+        path = self.base_dir / f"{document.id}{self.codec.suffix}"
+        data = self.codec.dumps(payload)
+        path.write_bytes(data)
+        # Drop the copy written under an earlier codec setting, which reads would otherwise find
+        for suffix in DOCUMENT_SUFFIXES:
+            if suffix != self.codec.suffix:
+                (self.base_dir / f"{document.id}{suffix}").unlink(missing_ok=True)
+        if self.catalog is not None:
+            self.catalog.upsert(self._catalog_entry(document, path, len(data), datetime.utcnow()))
 
     def get(self, document_id: str) -> Document | None:
-        target = self.base_dir / f"{document_id}.json"
-        if not target.exists():
+        for suffix in (self.codec.suffix, *DOCUMENT_SUFFIXES):
+            target = self.base_dir / f"{document_id}{suffix}"
+            if target.exists():
+                return self._read(target)
+        return None
+
+    def get_vectors(self, document_id: str) -> np.ndarray | None:
+        return load_vector_matrix(self._vectors_path(document_id))
+
+    def list(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Document]:
+        """Documents, newest first when served from the catalog (by id without one)."""
+        if self.catalog is None:
+            stored = [
+                document
+                for document in map(self.get, sorted(self._stored_ids()))
+                if document and (status is None or document.status == status)
+            ]
+            return stored[offset:] if limit is None else stored[offset : offset + limit]
+        return load_listed(self.catalog, self.catalog_kind, self.get, status=status, limit=limit, offset=offset)
+
+    def list_entries(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = 20,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        if self.catalog is None:
+            return select_entries(self._scan_entries(), status=status, limit=limit, offset=offset)
+        return self.catalog.list(self.catalog_kind, status=status, limit=limit, offset=offset)
+
+    def _stored_ids(self) -> set[str]:
+        return {
+            path.name[: -len(suffix)]
+            for path in self.base_dir.iterdir()
+            for suffix in DOCUMENT_SUFFIXES
+            if path.name.endswith(suffix)
+        }
+
+    def _scan_entries(self) -> list[CatalogEntry]:
+        """Catalog rows for every stored document, read from the files themselves."""
+        entries: list[CatalogEntry] = []
+        for document_id in sorted(self._stored_ids()):
+            for suffix in (self.codec.suffix, *DOCUMENT_SUFFIXES):
+                path = self.base_dir / f"{document_id}{suffix}"
+                if path.exists():
+                    break
+            document = self._read(path)
+            if document is not None:
+                stat = path.stat()
+                entries.append(
+                    self._catalog_entry(document, path, stat.st_size, datetime.utcfromtimestamp(stat.st_mtime))
+                )
+        return entries
+
+    def _catalog_entry(self, document: Document, path: Path, stored_bytes: int, updated_at: datetime) -> CatalogEntry:
+        return CatalogEntry(
+            kind=self.catalog_kind,
+            id=document.id,
+            filename=document.filename,
+            status=document.status,
+            created_at=document.uploaded_at,
+            updated_at=updated_at,
+            size_bytes=stored_bytes,
+            path=str(path),
+            details={
+                "file_type": document.file_type,
+                "upload_bytes": document.size_bytes,
+                "page_count": len(document.pages),
+                "chunk_count": sum(len(page.chunks) for page in document.pages),
+            },
+        )
+
+    def _read(self, path: Path) -> Document | None:
+        codec = codec_for_name(path.name, self.codec)
+        if codec is None:
             return None
         try:
-            data = json.loads(target.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            data = codec.loads(path.read_bytes())
+        except ValueError:
             return None
         return Document.model_validate(data)
 
-    def list(self) -> list[Document]:
-        documents: list[Document] = []
-        for path in sorted(self.base_dir.glob("*.json")):
-            document = self.get(path.stem)
-            if document:
-                documents.append(document)
-        return documents
+    def _vectors_path(self, document_id: str) -> Path:
+        return self.base_dir / f"{document_id}.vectors.npy"
     
     def approve_segment(self, document_id: str, segment_id: str) -> bool:
         """Mark a segment as reviewed/approved."""
@@ -5,17 +5,45 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from ...domain.models import Document
 from ...domain.run_models import PipelineResult, PipelineRunRecord, PipelineStage
-from ..ports import PipelineRunRepository
+from ..ports import Catalog, CatalogEntry, PipelineRunRepository
+from .catalog_sqlite import load_listed, select_entries
+from .document_codec import DOCUMENT_SUFFIXES, DocumentCodec, JsonCodec, codec_for_name
+from .vector_matrix import inline_vectors, load_vector_matrix, save_vector_matrix, split_vectors
 
 
 class FileSystemPipelineRunRepository(PipelineRunRepository):
-    """Stores pipeline runs as JSON artifacts on disk."""
+    """Stores pipeline runs as JSON artifacts on disk.
+
+    Run and stage records are always JSON; documents and stage snapshots use
+    ``codec`` (see ``document_codec``). Documents are written without their
+    chunk vectors, which go to a float32 ``.npy`` matrix beside each
+    document file (see ``vector_matrix``).
+
+    With a ``catalog``, every write to ``run.json`` also upserts the run's
+    catalog row, and ``list_runs``/``list_entries`` page through the catalog
+    instead of stat-ing and loading every run directory. Runs stored before
+    the catalog existed are indexed once, on first use.
+    """
 
-    def __init__(self, base_dir: Path | str) -> None:
+    catalog_kind = "run"
+
+    def __init__(
+        self,
+        base_dir: Path | str,
+        codec: DocumentCodec | None = None,
+        catalog: Catalog | None = None,
+    ) -> None:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or JsonCodec()
+        # Rows are kept per directory, so repositories sharing a catalog stay apart
+        self.catalog = catalog.scoped(str(self.base_dir.resolve())) if catalog is not None else None
+        if self.catalog is not None and not self.catalog.is_indexed(self.catalog_kind):
+            self.catalog.index(self.catalog_kind, self._scan_entries())
 
     # ------------------------------------------------------------------
     # Public API
@@ -27,6 +55,7 @@ class FileSystemPipelineRunRepository(PipelineRunRepository):
         self._write_json(run_dir / "run.json", metadata)
         if run.document:
             self._write_document(run.id, run.document)
+        self._index_run(run_dir, metadata)
 
     def update_stage(self, run_id: str, stage: PipelineStage, document: Document | None = None) -> None:
         run_dir = self._run_dir(run_id)
@@ -43,6 +72,7 @@ class FileSystemPipelineRunRepository(PipelineRunRepository):
         self._write_stage(run_id, stage)
         if document:
             self._write_document(run_id, document)
+        self._index_run(run_dir, metadata)
 
     def complete_run(self, run_id: str, result: PipelineResult) -> None:
         run_dir = self._run_dir(run_id)
@@ -58,6 +88,7 @@ class FileSystemPipelineRunRepository(PipelineRunRepository):
         self._write_document(run_id, result.document)
         for stage in result.stages:
             self._write_stage(run_id, stage)
+        self._index_run(run_dir, metadata)
 
     def fail_run(self, run_id: str, error_message: str) -> None:
         run_dir = self._run_dir(run_id)
@@ -70,6 +101,7 @@ class FileSystemPipelineRunRepository(PipelineRunRepository):
         metadata["error_message"] = error_message
         metadata["updated_at"] = datetime.utcnow().isoformat()
         self._write_json(run_dir / "run.json", metadata)
+        self._index_run(run_dir, metadata)
 
     def get_run(self, run_id: str) -> PipelineRunRecord | None:
         run_dir = self._run_dir(run_id)
@@ -85,8 +117,20 @@ class FileSystemPipelineRunRepository(PipelineRunRepository):
         record = self._deserialize_run_metadata(run_meta, document, stage_map)
         return record
 
-    def list_runs(self, limit: int = 10) -> list[PipelineRunRecord]:
+    def list_runs(
+        self,
+        limit: int = 10,
+        *,
+        status: str | None = None,
+        offset: int = 0,
+    ) -> list[PipelineRunRecord]:
+        """Runs, newest first: by creation time from the catalog, by directory mtime without one."""
         records: list[PipelineRunRecord] = []
+        if self.catalog is not None:
+            return load_listed(
+                self.catalog, self.catalog_kind, self.get_run, status=status, limit=limit, offset=offset
+            )
+        skipped = 0
         for run_dir in sorted(
             self.base_dir.iterdir(),
             key=lambda path: path.stat().st_mtime,
@@ -95,12 +139,51 @@ class FileSystemPipelineRunRepository(PipelineRunRepository):
             if not run_dir.is_dir():
                 continue
             run = self.get_run(run_dir.name)
-            if run:
-                records.append(run)
+            if run is None or (status is not None and run.status != status):
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            records.append(run)
             if len(records) >= limit:
                 break
         return records
 
+    def list_entries(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = 20,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        if self.catalog is None:
+            return select_entries(self._scan_entries(), status=status, limit=limit, offset=offset)
+        return self.catalog.list(self.catalog_kind, status=status, limit=limit, offset=offset)
+
+    def save_stage_snapshot(self, run_id: str, stage_name: str, document: Document) -> None:
+        if not self._run_dir(run_id).exists():
+            return
+        stages_dir = self._stages_dir(run_id)
+        vectors_path = stages_dir / f"{stage_name}.vectors.npy"
+        self._write_document_at(stages_dir, f"{stage_name}.document", vectors_path, document)
+
+    def get_stage_snapshots(self, run_id: str) -> dict[str, Document]:
+        stages_dir = self._run_dir(run_id) / "stages"
+        if not stages_dir.exists():
+            return {}
+        stage_names = {path.name.split(".document.")[0] for path in stages_dir.glob("*.document.*")}
+        snapshots: dict[str, Document] = {}
+        for stage_name in stage_names:
+            data = self._read_document_payload(stages_dir, f"{stage_name}.document")
+            if data:
+                # Reused snapshots become run output again, so they carry their vectors inline
+                inline_vectors(data, load_vector_matrix(stages_dir / f"{stage_name}.vectors.npy"))
+                snapshots[stage_name] = Document.model_validate(data)
+        return snapshots
+
+    def get_document_vectors(self, run_id: str) -> np.ndarray | None:
+        return load_vector_matrix(self._run_dir(run_id) / "document.vectors.npy")
+
     # ------------------------------------------------------------------
     # Serialization helpers
     # ------------------------------------------------------------------
@@ -157,9 +240,47 @@ class FileSystemPipelineRunRepository(PipelineRunRepository):
             completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
         )
 
+    def _catalog_entry(self, run_dir: Path, metadata: dict[str, Any]) -> CatalogEntry:
+        document_bytes = None
+        for suffix in (self.codec.suffix, *DOCUMENT_SUFFIXES):
+            document_path = run_dir / f"document{suffix}"
+            if document_path.exists():
+                document_bytes = document_path.stat().st_size
+                break
+        created_at = datetime.fromisoformat(metadata["created_at"])
+        updated_at = metadata.get("updated_at")
+        return CatalogEntry(
+            kind=self.catalog_kind,
+            id=metadata["id"],
+            filename=metadata.get("filename"),
+            status=metadata.get("status", "running"),
+            created_at=created_at,
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else created_at,
+            size_bytes=document_bytes,
+            path=str(run_dir),
+            details={
+                "content_type": metadata.get("content_type"),
+                "stage_count": len(metadata.get("stage_order", [])),
+                "error_message": metadata.get("error_message"),
+            },
+        )
+
     # ------------------------------------------------------------------
     # IO utilities
     # ------------------------------------------------------------------
+    def _index_run(self, run_dir: Path, metadata: dict[str, Any]) -> None:
+        if self.catalog is not None:
+            self.catalog.upsert(self._catalog_entry(run_dir, metadata))
+
+    def _scan_entries(self) -> list[CatalogEntry]:
+        """Catalog rows for every stored run, read from each ``run.json``."""
+        entries: list[CatalogEntry] = []
+        for run_dir in self.base_dir.iterdir():
+            metadata = self._read_json(run_dir / "run.json") if run_dir.is_dir() else None
+            if metadata:
+                entries.append(self._catalog_entry(run_dir, metadata))
+        return entries
+
     def _run_dir(self, run_id: str) -> Path:
         return self.base_dir / run_id
 
@@ -169,18 +290,37 @@ class FileSystemPipelineRunRepository(PipelineRunRepository):
         return stages_dir
 
     def _write_document(self, run_id: str, document: Document) -> None:
-        doc_path = self._run_dir(run_id) / "document.json"
-        self._write_json(doc_path, document.model_dump(mode="json"))
+        run_dir = self._run_dir(run_id)
+        self._write_document_at(run_dir, "document", run_dir / "document.vectors.npy", document)
+
+    def _write_document_at(self, directory: Path, stem: str, vectors_path: Path, document: Document) -> None:
+        """Write ``document`` to ``<stem><codec suffix>`` in ``directory``, its vectors to ``vectors_path``."""
+        payload = document.model_dump(mode="json")
+        directory.mkdir(parents=True, exist_ok=True)
+        save_vector_matrix(vectors_path, split_vectors(payload, load_vector_matrix(vectors_path)))
+        (directory / f"{stem}{self.codec.suffix}").write_bytes(self.codec.dumps(payload))
+        for suffix in DOCUMENT_SUFFIXES:
+            if suffix != self.codec.suffix:
+                (directory / f"{stem}{suffix}").unlink(missing_ok=True)
 
     def _read_document(self, run_id: str) -> Document | None:
-        doc_path = self._run_dir(run_id) / "document.json"
-        if not doc_path.exists():
-            return None
-        data = self._read_json(doc_path)
+        data = self._read_document_payload(self._run_dir(run_id), "document")
         if not data:
             return None
         return Document.model_validate(data)
 
+    def _read_document_payload(self, directory: Path, stem: str) -> dict[str, Any] | None:
+        """The payload of ``<stem>.*`` in ``directory``, in whichever encoding it was written."""
+        for suffix in (self.codec.suffix, *DOCUMENT_SUFFIXES):
+            path = directory / f"{stem}{suffix}"
+            if path.exists():
+                codec = codec_for_name(path.name, self.codec)
+                try:
+                    return codec.loads(path.read_bytes()) if codec else None
+                except ValueError:
+                    return None
+        return None
+
     def _write_stage(self, run_id: str, stage: PipelineStage) -> None:
         stage_path = self._stages_dir(run_id) / f"{stage.name}.json"
         self._write_json(stage_path, self._serialize_stage(stage))
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import os
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 
-from ..ports import IngestionRepository
+from ..ports import IngestionRepository, StoredUpload
+
+STREAM_CHUNK_SIZE = 1024 * 1024
 
 
 class FileSystemIngestionRepository(IngestionRepository):
@@ -14,12 +19,36 @@ class FileSystemIngestionRepository(IngestionRepository):
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
     def store(self, *, document_id: str, filename: str, data: bytes) -> str:
+        destination = self._destination(document_id, filename)
+        with destination.open("wb") as handle:
+            handle.write(data)
+        return str(destination)
+
+    def store_stream(self, *, document_id: str, filename: str, stream: BinaryIO) -> StoredUpload:
+        """Copy ``stream`` to disk one chunk at a time, so only a chunk is ever in memory.
+
+        The file is written under a temporary name and renamed once complete,
+        so a reader never sees a partial upload at the returned path.
+        """
+        destination = self._destination(document_id, filename)
+        partial = destination.with_name(f"{destination.name}.part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with partial.open("wb") as handle:
+                while chunk := stream.read(STREAM_CHUNK_SIZE):
+                    digest.update(chunk)
+                    handle.write(chunk)
+                    size += len(chunk)
+            os.replace(partial, destination)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        return StoredUpload(path=str(destination), sha256=digest.hexdigest(), size_bytes=size)
+
+    def _destination(self, document_id: str, filename: str) -> Path:
         document_dir = self.base_dir / document_id
         document_dir.mkdir(parents=True, exist_ok=True)
         suffix = Path(filename or "document").suffix or ".bin"
         timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
-        stored_name = f"{timestamp}{suffix}"
-        destination = document_dir / stored_name
-        with destination.open("wb") as handle:
-            handle.write(data)
-        return str(destination)
+        return document_dir / f"{timestamp}{suffix}"
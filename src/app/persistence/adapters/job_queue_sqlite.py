@@ -0,0 +1,195 @@
+"""SQLite adapter for the durable job queue."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+from uuid import uuid4
+
+from ...domain.job_models import QueuedJob
+from ..ports import JobQueue
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, available_at);
+"""
+
+
+class SQLiteJobQueue(JobQueue):
+    """Stores jobs in one SQLite database that any number of worker processes share.
+
+    Leasing runs in a ``BEGIN IMMEDIATE`` transaction, so two workers never
+    claim the same job. A job is leasable when it is queued and its backoff
+    has elapsed, or when it is leased but the lease expired without a
+    heartbeat. Each lease counts as an attempt; a job whose lease keeps
+    expiring (the worker dies on it every time) is failed once its attempts
+    are used up instead of crashing workers forever.
+
+    Storage:
+        artifacts/queue/jobs.sqlite3 (WAL mode, so the API can enqueue while
+        workers lease)
+    """
+
+    def __init__(self, db_path: Path, lease_seconds: float = 60.0, max_attempts: int = 3) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+    def enqueue(self, kind: str, payload: dict[str, Any], *, max_attempts: int | None = None) -> QueuedJob:
+        now = time.time()
+        job_id = str(uuid4())
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO jobs (id, kind, payload, status, max_attempts, created_at, available_at) "
+                "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), max_attempts or self.max_attempts, now, now),
+            )
+        return self.get(job_id)  # type: ignore[return-value]
+
+    def lease(
+        self,
+        worker_id: str,
+        kinds: Sequence[str] | None = None,
+        on_expired: Callable[[QueuedJob], None] | None = None,
+    ) -> QueuedJob | None:
+        now = time.time()
+        kind_filter = ""
+        params: list[Any] = [now, now]
+        if kinds:
+            kind_filter = f" AND kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kinds)
+        expired: list[QueuedJob] = []
+        leased: QueuedJob | None = None
+        with self._transaction() as connection:
+            while True:
+                row = connection.execute(
+                    "SELECT * FROM jobs WHERE ((status = 'queued' AND available_at <= ?) "
+                    "OR (status = 'leased' AND lease_expires_at < ?))"
+                    f"{kind_filter} ORDER BY available_at LIMIT 1",
+                    params,
+                ).fetchone()
+                if row is None:
+                    break
+                if row["status"] == "leased" and row["attempts"] >= row["max_attempts"]:
+                    # The worker died on its last attempt
+                    connection.execute(
+                        "UPDATE jobs SET status = 'failed', lease_owner = NULL, lease_expires_at = NULL, "
+                        "last_error = COALESCE(last_error, 'lease expired') WHERE id = ?",
+                        (row["id"],),
+                    )
+                    expired.append(self._get(connection, row["id"]))  # type: ignore[arg-type]
+                    continue
+                connection.execute(
+                    "UPDATE jobs SET status = 'leased', attempts = attempts + 1, "
+                    "lease_owner = ?, lease_expires_at = ? WHERE id = ?",
+                    (worker_id, now + self.lease_seconds, row["id"]),
+                )
+                leased = self._get(connection, row["id"])
+                break
+        # Outside the transaction, so the callback can take its own locks
+        if on_expired is not None:
+            for job in expired:
+                on_expired(job)
+        return leased
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (time.time() + self.lease_seconds, job_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = 'completed', lease_owner = NULL, lease_expires_at = NULL "
+                "WHERE id = ? AND lease_owner = ?",
+                (job_id, worker_id),
+            )
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: float) -> QueuedJob | None:
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END, "
+                "available_at = ?, lease_owner = NULL, lease_expires_at = NULL, last_error = ? "
+                "WHERE id = ? AND lease_owner = ?",
+                (time.time() + retry_delay, error, job_id, worker_id),
+            )
+            return self._get(connection, job_id)
+
+    def get(self, job_id: str) -> QueuedJob | None:
+        with self._connect() as connection:
+            return self._get(connection, job_id)
+
+    def counts(self) -> dict[str, int]:
+        with self._connect() as connection:
+            rows = connection.execute("SELECT status, COUNT(*) AS total FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["total"] for row in rows}
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call: safe across threads and processes
+        connection = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _get(self, connection: sqlite3.Connection, job_id: str) -> QueuedJob | None:
+        row = connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._deserialize(row) if row else None
+
+    def _deserialize(self, row: sqlite3.Row) -> QueuedJob:
+        return QueuedJob(
+            id=row["id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            created_at=datetime.utcfromtimestamp(row["created_at"]),
+            available_at=datetime.utcfromtimestamp(row["available_at"]),
+            lease_owner=row["lease_owner"],
+            lease_expires_at=(
+                datetime.utcfromtimestamp(row["lease_expires_at"]) if row["lease_expires_at"] else None
+            ),
+            last_error=row["last_error"],
+        )
@@ -0,0 +1,86 @@
+"""Columnar storage for chunk vectors next to a document's JSON.
+
+Inline, every chunk carries its embedding in ``metadata.extra["vector"]`` as a
+list of floats; a 1536-dim vector costs ~30 KB of JSON per chunk and has to be
+parsed back into Python floats on every load. Before a document is written,
+``split_vectors`` moves those vectors into one float32 matrix (saved as
+``.npy``) and leaves each chunk with ``extra["vector_row"]``, its row index.
+``load_vector_matrix`` memory-maps the file, so loading a document reads none
+of its vectors until a row is used.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+VECTOR_KEY = "vector"
+VECTOR_ROW_KEY = "vector_row"
+
+
+def _chunk_extras(payload: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """``metadata.extra`` of every chunk in a ``Document.model_dump(mode="json")`` payload."""
+    for page in payload.get("pages") or []:
+        for chunk in page.get("chunks") or []:
+            extra = (chunk.get("metadata") or {}).get("extra")
+            if extra is not None:
+                yield extra
+
+
+def split_vectors(payload: dict[str, Any], existing: np.ndarray | None = None) -> np.ndarray | None:
+    """Move chunk vectors out of ``payload`` (in place) into a float32 matrix.
+
+    Chunks that already reference a row (a document loaded without its
+    vectors and saved again) take that row from ``existing``. Vectors whose
+    length differs from the first one stay inline. Returns None when the
+    document has no vectors.
+    """
+    rows: list[Any] = []
+    dimension: int | None = None
+    for extra in _chunk_extras(payload):
+        row = extra.pop(VECTOR_ROW_KEY, None)
+        if VECTOR_KEY in extra:
+            vector = extra.pop(VECTOR_KEY)
+        elif row is not None and existing is not None and row < len(existing):
+            vector = existing[row]
+        else:
+            continue
+        if dimension is None:
+            dimension = len(vector)
+        if len(vector) != dimension:
+            extra[VECTOR_KEY] = np.asarray(vector).tolist()
+            continue
+        extra[VECTOR_ROW_KEY] = len(rows)
+        rows.append(vector)
+    if not rows:
+        return None
+    return np.asarray(rows, dtype=np.float32)
+
+
+def inline_vectors(payload: dict[str, Any], matrix: np.ndarray | None) -> None:
+    """Undo ``split_vectors``: put each referenced row back as ``extra["vector"]``."""
+    for extra in _chunk_extras(payload):
+        row = extra.pop(VECTOR_ROW_KEY, None)
+        if row is not None and matrix is not None and row < len(matrix):
+            extra[VECTOR_KEY] = matrix[row].tolist()
+
+
+def save_vector_matrix(path: Path, matrix: np.ndarray | None) -> None:
+    """Write ``matrix`` to ``path`` atomically, or remove ``path`` when there is none."""
+    if matrix is None:
+        path.unlink(missing_ok=True)
+        return
+    partial = path.with_name(f"{path.name}.part")
+    with partial.open("wb") as handle:
+        np.save(handle, matrix, allow_pickle=False)
+    os.replace(partial, path)
+
+
+def load_vector_matrix(path: Path) -> np.ndarray | None:
+    """Memory-map the matrix at ``path`` read-only; None when it does not exist."""
+    if not path.exists():
+        return None
+    return np.load(path, mmap_mode="r", allow_pickle=False)
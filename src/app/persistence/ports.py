@@ -1,10 +1,68 @@
 from __future__ import annotations
 
-from typing import Protocol
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, BinaryIO, Callable, Iterable, Protocol, Sequence
 
 from ..domain.models import Document
 from ..domain.run_models import PipelineResult, PipelineRunRecord, PipelineStage
 from ..domain.batch_models import BatchJob, DocumentJob
+from ..domain.job_models import QueuedJob
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Index row for one stored document, run or batch: enough to list it without loading it.
+
+    ``kind`` is "document", "run" or "batch"; ``path`` is where the record
+    lives on disk; ``details`` holds kind-specific counters (page and chunk
+    counts, batch progress).
+    """
+
+    kind: str
+    id: str
+    created_at: datetime
+    updated_at: datetime
+    status: str | None = None
+    filename: str | None = None
+    size_bytes: int | None = None
+    path: str | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+class Catalog(Protocol):
+    """Port for the index the repositories keep of what they have stored."""
+
+    def upsert(self, entry: CatalogEntry) -> None:
+        """Insert or replace the row for ``entry.kind``/``entry.id``."""
+
+    def remove(self, kind: str, entry_id: str) -> None:
+        """Drop a row whose record no longer exists."""
+
+    def get(self, kind: str, entry_id: str) -> CatalogEntry | None:
+        """Fetch one row."""
+
+    def list(
+        self,
+        kind: str,
+        *,
+        status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        """Return rows of ``kind``, newest first, optionally only those with ``status``."""
+
+    def count(self, kind: str, *, status: str | None = None) -> int:
+        """Count rows of ``kind``, optionally only those with ``status``."""
+
+    def is_indexed(self, kind: str) -> bool:
+        """Whether records of ``kind`` written before the catalog existed have been indexed."""
+
+    def index(self, kind: str, entries: Iterable[CatalogEntry]) -> None:
+        """Upsert ``entries`` and mark ``kind`` as indexed, in one transaction."""
+
+    def scoped(self, store: str) -> Catalog:
+        """The same catalog restricted to the rows and indexed flags of ``store``."""
 
 
 class PipelineRunRepository(Protocol):
@@ -25,8 +83,44 @@ class PipelineRunRepository(Protocol):
     def get_run(self, run_id: str) -> PipelineRunRecord | None:
         """Fetch a run with its current metadata."""
 
-    def list_runs(self, limit: int = 10) -> list[PipelineRunRecord]:
-        """Return the most recent runs for dashboard display."""
+    def list_runs(
+        self,
+        limit: int = 10,
+        *,
+        status: str | None = None,
+        offset: int = 0,
+    ) -> list[PipelineRunRecord]:
+        """Return the most recent runs for dashboard display, optionally only those with ``status``."""
+
+    def list_entries(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = 20,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        """Return catalog rows for the most recent runs without loading them."""
+
+    def save_stage_snapshot(self, run_id: str, stage_name: str, document: Document) -> None:
+        """Persist the document as it stood after the named stage."""
+
+    def get_stage_snapshots(self, run_id: str) -> dict[str, Document]:
+        """Return per-stage document snapshots keyed by stage name."""
+
+    def get_document_vectors(self, run_id: str) -> Sequence[Sequence[float]] | None:
+        """Return the chunk vectors of the run's document as a (chunks x dimension) matrix.
+
+        Stored documents reference their vectors by row: chunk ``metadata.extra["vector_row"]``.
+        """
+
+
+@dataclass(frozen=True)
+class StoredUpload:
+    """Where a streamed upload was stored, with its checksum and size."""
+
+    path: str
+    sha256: str
+    size_bytes: int
 
 
 class IngestionRepository(Protocol):
@@ -35,6 +129,9 @@ class IngestionRepository(Protocol):
     def store(self, *, document_id: str, filename: str, data: bytes) -> str:
         """Persist the upload and return a stable path/identifier."""
 
+    def store_stream(self, *, document_id: str, filename: str, stream: BinaryIO) -> StoredUpload:
+        """Persist an upload read from ``stream`` in chunks, hashing it on the way."""
+
 
 class DocumentRepository(Protocol):
     """Port defining CRUD for processed documents."""
@@ -45,8 +142,29 @@ class DocumentRepository(Protocol):
     def get(self, document_id: str) -> Document | None:
         """Fetch a single document by id."""
 
-    def list(self) -> list[Document]:
-        """Return all documents known to the repository."""
+    def list(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Document]:
+        """Return documents known to the repository, optionally filtered by status and paginated."""
+
+    def list_entries(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = 20,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        """Return catalog rows for the most recent documents without loading them."""
+
+    def get_vectors(self, document_id: str) -> Sequence[Sequence[float]] | None:
+        """Return the document's chunk vectors as a (chunks x dimension) matrix.
+
+        Stored documents reference their vectors by row: chunk ``metadata.extra["vector_row"]``.
+        """
     
     def approve_segment(self, document_id: str, segment_id: str) -> bool:
         """Mark a segment as reviewed/approved.
@@ -89,5 +207,54 @@ class BatchJobRepository(Protocol):
     def update_document_job(self, batch_id: str, doc_job: DocumentJob) -> None:
         """Update a specific document job within a batch."""
 
-    def list_batches(self, limit: int = 20) -> list[BatchJob]:
-        """Return the most recent batch jobs."""
+    def list_batches(
+        self,
+        limit: int = 20,
+        *,
+        status: str | None = None,
+        offset: int = 0,
+    ) -> list[BatchJob]:
+        """Return the most recent batch jobs, optionally only those with ``status``."""
+
+    def list_entries(
+        self,
+        *,
+        status: str | None = None,
+        limit: int | None = 20,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        """Return catalog rows for the most recent batches without loading them."""
+
+
+class JobQueue(Protocol):
+    """Port for a durable queue of background jobs shared by worker processes."""
+
+    def enqueue(self, kind: str, payload: dict[str, Any], *, max_attempts: int | None = None) -> QueuedJob:
+        """Persist a new job and return it."""
+
+    def lease(
+        self,
+        worker_id: str,
+        kinds: Sequence[str] | None = None,
+        on_expired: Callable[[QueuedJob], None] | None = None,
+    ) -> QueuedJob | None:
+        """Claim the next available job (or one whose lease expired) for ``worker_id``.
+
+        Jobs whose lease expired on their last attempt are failed instead and
+        passed to ``on_expired``.
+        """
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """Extend the lease; False when the worker no longer holds it."""
+
+    def complete(self, job_id: str, worker_id: str) -> None:
+        """Mark a leased job as done."""
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: float) -> QueuedJob | None:
+        """Record a failed attempt; requeue after ``retry_delay`` unless attempts are exhausted."""
+
+    def get(self, job_id: str) -> QueuedJob | None:
+        """Fetch a job by id."""
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs per status."""
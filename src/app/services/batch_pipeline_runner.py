@@ -8,6 +8,7 @@ import mimetypes
 import os
 import traceback
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable
 from uuid import uuid4
@@ -21,9 +22,13 @@ from ..domain.batch_models import BatchJob, DocumentJob
 from ..domain.models import Document
 from ..observability.batch_logger import create_batch_logger
 from ..persistence.ports import BatchJobRepository
+from .cpu_stage_pool import CpuStagePool, StageTiming, StageTimingReport, measure_stage
+from .document_ownership import run_owned
 from .parallel_page_processor import ParallelPageProcessor
+from .llm_scheduler import llm_priority
 from .pipeline_runner import PipelineRunner
 from .run_manager import PipelineRunManager
+from .streaming_page_pipeline import STREAMED_STAGES, StreamingPagePipeline
 
 logger = logging.getLogger(__name__)
 DEFAULT_PIXMAP_PREVIEW_LIMIT = int(os.getenv("LANGFUSE_PIXMAP_PREVIEW_LIMIT", "2"))
@@ -51,6 +56,8 @@ class BatchPipelineRunner:
         run_manager: PipelineRunManager,
         max_concurrent_documents: int = 5,
         langfuse_handler: Any | None = None,
+        streaming_pipeline: StreamingPagePipeline | None = None,
+        cpu_stage_pool: CpuStagePool | None = None,
     ) -> None:
         """Initialize the batch pipeline runner.
         
@@ -61,6 +68,11 @@ class BatchPipelineRunner:
             run_manager: Manager for individual pipeline runs
             max_concurrent_documents: Maximum documents to process simultaneously
             langfuse_handler: Optional Langfuse callback handler for tracing
+            streaming_pipeline: Streams pages from parsing to vectorization when
+                page parallelism is enabled, instead of running stage by stage
+            cpu_stage_pool: Runs the CPU-bound stages (chunking, and cleaning and
+                enrichment when they make no LLM calls) in worker processes
+                when documents go stage by stage
         """
         self.runner = pipeline_runner
         self.parallel = parallel_processor
@@ -68,24 +80,42 @@ class BatchPipelineRunner:
         self.run_manager = run_manager
         self.max_concurrent = max_concurrent_documents
         self.langfuse_handler = langfuse_handler
+        self.streaming_pipeline = streaming_pipeline
+        self.cpu_stage_pool = cpu_stage_pool
         self.pixmap_preview_limit = max(0, DEFAULT_PIXMAP_PREVIEW_LIMIT)
 
     async def run_batch(
         self,
         batch_id: str,
-        documents: list[tuple[Document, bytes]],
+        documents: list[tuple[Document, bytes | None]],
         progress_callback: Callable[[str, DocumentJob], None] | None = None,
+        priority: str = "batch",
     ) -> BatchJob:
         """Process multiple documents in parallel as a batch.
         
         Args:
             batch_id: Unique identifier for this batch
-            documents: List of (Document, file_bytes) tuples to process
+            documents: List of (Document, file_bytes) tuples to process; file_bytes
+                is None for uploads already spooled to ingestion storage, which
+                are memory-mapped once the document gets a concurrency slot
             progress_callback: Optional callback for progress updates (for SSE)
+            priority: LLM scheduling class for every request the batch makes
+                ("batch" or "backfill")
             
         Returns:
             Completed BatchJob with all document results
         """
+        # Document tasks and worker threads inherit the priority from this context
+        with llm_priority(priority):
+            return await self._run_batch(batch_id, documents, progress_callback, priority)
+
+    async def _run_batch(
+        self,
+        batch_id: str,
+        documents: list[tuple[Document, bytes | None]],
+        progress_callback: Callable[[str, DocumentJob], None] | None,
+        priority: str,
+    ) -> BatchJob:
         # Create clean batch logger
         batch_logger = create_batch_logger(
             batch_id=batch_id,
@@ -117,6 +147,7 @@ class BatchPipelineRunner:
             created_at=datetime.utcnow(),
             status="queued",
             total_documents=len(documents),
+            priority=priority,  # type: ignore[arg-type]
         )
 
         # Create document jobs for each document
@@ -131,12 +162,15 @@ class BatchPipelineRunner:
         # Persist initial batch state
         self.batch_repo.create_batch(batch)
 
+        # CPU vs wall time of the stage-by-stage stages, summed over documents
+        stage_timings = StageTimingReport()
+
         # Use semaphore to limit concurrent documents
         semaphore = asyncio.Semaphore(self.max_concurrent)
 
         async def process_single_document(
             document: Document,
-            file_bytes: bytes,
+            file_bytes: bytes | None,
         ) -> tuple[str, bool, str | None]:
             """Process a single document through the pipeline.
             
@@ -198,6 +232,9 @@ class BatchPipelineRunner:
                         document,
                         file_bytes=file_bytes,
                     )
+                    if file_bytes is None:
+                        # Spooled upload: map it only while this document holds a slot
+                        file_bytes = self.runner.parsing.open_raw_file(document)
                     doc_job.mark_stage_completed("ingestion")
                     self.batch_repo.update_document_job(batch_id, doc_job)
                     
@@ -211,187 +248,203 @@ class BatchPipelineRunner:
                     if progress_callback:
                         progress_callback(batch_id, doc_job)
 
-                    # Parsing (with parallel page processing)
-                    doc_job.mark_stage_started("parsing")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
-                    
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
-
-                    doc_logger.start_span("parsing", {"page_count": len(document.pages)})
-                    
-                    if self.parallel.enable:
-                        # Pass document logger to parallel processor for page-level logging
-                        document = await self.parallel.parse_pages_parallel(
+                    if self.streaming_pipeline is not None and self.parallel.enable:
+                        document = await self._run_streamed_stages(
+                            batch_id,
+                            doc_job,
                             document,
                             file_bytes,
-                            doc_logger=doc_logger,
+                            doc_logger,
+                            progress_callback,
                         )
                     else:
-                        loop = asyncio.get_event_loop()
-                        document = await loop.run_in_executor(
-                            None,
-                            self.runner.parsing.parse,
+                        # Parsing (with parallel page processing)
+                        doc_job.mark_stage_started("parsing")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
+                    
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
+
+                        doc_logger.start_span("parsing", {"page_count": len(document.pages)})
+                    
+                        if self.parallel.enable:
+                            # Pass document logger to parallel processor for page-level logging
+                            document = await self.parallel.parse_pages_parallel(
+                                document,
+                                file_bytes,
+                                doc_logger=doc_logger,
+                            )
+                        else:
+                            document = await asyncio.to_thread(
+                                self.runner.parsing.parse,
+                                document,
+                                file_bytes,
+                            )
+
+                        doc_job.mark_stage_completed("parsing")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
+                    
+                        # Collect pixmap previews for Langfuse (consistent with single-file pipeline)
+                        pixmap_previews = self._collect_pixmap_previews(document)
+                        pixmap_metrics = document.metadata.get("pixmap_metrics") if document.metadata else None
+                    
+                        doc_logger.end_span("parsing", {
+                            "pages_parsed": len(document.pages),
+                            "pixmap_metrics": pixmap_metrics or {},
+                            "pixmap_previews": [
+                                {
+                                    "page_number": preview["page_number"],
+                                    "image": preview["media"],
+                                }
+                                for preview in pixmap_previews
+                            ],
+                        })
+                        doc_logger.record_event("parsing", {
+                            "document_id": document.id,
+                            "filename": document.filename,
+                            "page_count": len(document.pages),
+                            "pixmap_count": len(pixmap_previews),
+                        })
+                    
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
+
+                        # Cleaning (with parallel page processing)
+                        doc_job.mark_stage_started("cleaning")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
+                    
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
+
+                        doc_logger.start_span("cleaning", {"page_count": len(document.pages)})
+                    
+                        cleaning_timing = None
+                        if self.parallel.enable and not self._offloads("cleaning"):
+                            document = await self.parallel.clean_pages_parallel(
+                                document,
+                                doc_logger=doc_logger,
+                            )
+                        else:
+                            document, cleaning_timing = await self._run_cpu_stage(
+                                "cleaning",
+                                self.runner.cleaning.clean,
+                                document,
+                                stage_timings,
+                            )
+
+                        doc_job.mark_stage_completed("cleaning")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
+                    
+                        doc_logger.end_span("cleaning", {
+                            "pages_cleaned": len(document.pages),
+                            **self._timing_details(cleaning_timing),
+                        })
+                        doc_logger.record_event("cleaning", {
+                            "document_id": document.id,
+                            "filename": document.filename,
+                            "page_count": len(document.pages),
+                        })
+                    
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
+
+                        # Chunking
+                        doc_job.mark_stage_started("chunking")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
+                    
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
+                    
+                        doc_logger.start_span("chunking")
+
+                        document, chunking_timing = await self._run_cpu_stage(
+                            "chunking",
+                            self.runner.chunking.chunk,
                             document,
-                            file_bytes,
+                            stage_timings,
                         )
 
-                    doc_job.mark_stage_completed("parsing")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
+                        doc_job.mark_stage_completed("chunking")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
                     
-                    # Collect pixmap previews for Langfuse (consistent with single-file pipeline)
-                    pixmap_previews = self._collect_pixmap_previews(document)
-                    pixmap_metrics = document.metadata.get("pixmap_metrics") if document.metadata else None
-                    
-                    doc_logger.end_span("parsing", {
-                        "pages_parsed": len(document.pages),
-                        "pixmap_metrics": pixmap_metrics or {},
-                        "pixmap_previews": [
-                            {
-                                "page_number": preview["page_number"],
-                                "image": preview["media"],
-                            }
-                            for preview in pixmap_previews
-                        ],
-                    })
-                    doc_logger.record_event("parsing", {
-                        "document_id": document.id,
-                        "filename": document.filename,
-                        "page_count": len(document.pages),
-                        "pixmap_count": len(pixmap_previews),
-                    })
+                        chunk_count = sum(len(page.chunks) for page in document.pages)
+                        doc_logger.end_span("chunking", {
+                            "chunk_count": chunk_count,
+                            **self._timing_details(chunking_timing),
+                        })
+                        doc_logger.record_event("chunking", {
+                            "document_id": document.id,
+                            "filename": document.filename,
+                            "chunk_count": chunk_count,
+                        })
                     
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
 
-                    # Cleaning (with parallel page processing)
-                    doc_job.mark_stage_started("cleaning")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
+                        # Enrichment
+                        doc_job.mark_stage_started("enrichment")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
                     
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
 
-                    doc_logger.start_span("cleaning", {"page_count": len(document.pages)})
+                        doc_logger.start_span("enrichment")
                     
-                    if self.parallel.enable:
-                        document = await self.parallel.clean_pages_parallel(
-                            document,
-                            doc_logger=doc_logger,
-                        )
-                    else:
-                        loop = asyncio.get_event_loop()
-                        document = await loop.run_in_executor(
-                            None,
-                            self.runner.cleaning.clean,
+                        document, enrichment_timing = await self._run_cpu_stage(
+                            "enrichment",
+                            self.runner.enrichment.enrich,
                             document,
+                            stage_timings,
                         )
 
-                    doc_job.mark_stage_completed("cleaning")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
+                        doc_job.mark_stage_completed("enrichment")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
                     
-                    doc_logger.end_span("cleaning", {"pages_cleaned": len(document.pages)})
-                    doc_logger.record_event("cleaning", {
-                        "document_id": document.id,
-                        "filename": document.filename,
-                        "page_count": len(document.pages),
-                    })
+                        doc_logger.end_span("enrichment", {
+                            "has_document_summary": bool(document.metadata.get("summary")),
+                            **self._timing_details(enrichment_timing),
+                        })
+                        doc_logger.record_event("enrichment", {
+                            "document_id": document.id,
+                            "filename": document.filename,
+                            "has_document_summary": bool(document.metadata.get("summary")),
+                        })
                     
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
 
-                    # Chunking
-                    doc_job.mark_stage_started("chunking")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
-                    
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
+                        # Vectorization
+                        doc_job.mark_stage_started("vectorization")
+                        self.batch_repo.update_document_job(batch_id, doc_job)
                     
-                    doc_logger.start_span("chunking")
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
 
-                    loop = asyncio.get_event_loop()
-                    document = await loop.run_in_executor(
-                        None,
-                        self.runner.chunking.chunk,
-                        document,
-                    )
-
-                    doc_job.mark_stage_completed("chunking")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
-                    
-                    chunk_count = sum(len(page.chunks) for page in document.pages)
-                    doc_logger.end_span("chunking", {"chunk_count": chunk_count})
-                    doc_logger.record_event("chunking", {
-                        "document_id": document.id,
-                        "filename": document.filename,
-                        "chunk_count": chunk_count,
-                    })
+                        doc_logger.start_span("vectorization")
                     
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
-
-                    # Enrichment
-                    doc_job.mark_stage_started("enrichment")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
-                    
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
-
-                    doc_logger.start_span("enrichment")
-                    
-                    document = await loop.run_in_executor(
-                        None,
-                        self.runner.enrichment.enrich,
-                        document,
-                    )
-
-                    doc_job.mark_stage_completed("enrichment")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
-                    
-                    doc_logger.end_span("enrichment", {
-                        "has_document_summary": bool(document.metadata.get("summary"))
-                    })
-                    doc_logger.record_event("enrichment", {
-                        "document_id": document.id,
-                        "filename": document.filename,
-                        "has_document_summary": bool(document.metadata.get("summary")),
-                    })
-                    
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
-
-                    # Vectorization
-                    doc_job.mark_stage_started("vectorization")
-                    self.batch_repo.update_document_job(batch_id, doc_job)
-                    
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
-
-                    doc_logger.start_span("vectorization")
-                    
-                    document = await loop.run_in_executor(
-                        None,
-                        self.runner.vectorization.vectorize,
-                        document,
-                    )
+                        document = await asyncio.to_thread(
+                            self._stage_fn(self.runner.vectorization.vectorize),
+                            document,
+                        )
 
-                    doc_job.mark_stage_completed("vectorization")
-                    doc_job.mark_completed()
-                    self.batch_repo.update_document_job(batch_id, doc_job)
+                        doc_job.mark_stage_completed("vectorization")
+                        doc_job.mark_completed()
+                        self.batch_repo.update_document_job(batch_id, doc_job)
                     
-                    vector_count = sum(
-                        1 for page in document.pages 
-                        for chunk in page.chunks 
-                        if hasattr(chunk, 'embedding') and chunk.embedding is not None
-                    )
-                    doc_logger.end_span("vectorization", {"vector_count": vector_count})
-                    doc_logger.record_event("vectorization", {
-                        "document_id": document.id,
-                        "filename": document.filename,
-                        "vector_count": vector_count,
-                    })
+                        vector_count = sum(
+                            1 for page in document.pages 
+                            for chunk in page.chunks 
+                            if hasattr(chunk, 'embedding') and chunk.embedding is not None
+                        )
+                        doc_logger.end_span("vectorization", {"vector_count": vector_count})
+                        doc_logger.record_event("vectorization", {
+                            "document_id": document.id,
+                            "filename": document.filename,
+                            "vector_count": vector_count,
+                        })
                     
-                    if progress_callback:
-                        progress_callback(batch_id, doc_job)
+                        if progress_callback:
+                            progress_callback(batch_id, doc_job)
 
                     # Save final document
                     if self.run_manager.document_repository:
@@ -473,11 +526,22 @@ class BatchPipelineRunner:
             "status": batch.status if batch else "failed",
         })
         
+        stage_report = stage_timings.as_dict()
+        if stage_report:
+            logger.info(
+                "⏱️ Batch %s CPU stages: %s",
+                batch_id,
+                ", ".join(
+                    f"{stage} cpu={totals['cpu_ms']:.0f}ms wall={totals['wall_ms']:.0f}ms"
+                    for stage, totals in stage_report.items()
+                ),
+            )
         batch_logger.record_event("batch_completed", {
             "batch_id": batch_id,
             "completed": batch.completed_documents if batch else 0,
             "failed": batch.failed_documents if batch else 0,
             "total": batch.total_documents if batch else 0,
+            "stage_timings": stage_report,
         })
 
         return batch or BatchJob(
@@ -486,6 +550,102 @@ class BatchPipelineRunner:
             status="failed",
         )
 
+    async def _run_streamed_stages(
+        self,
+        batch_id: str,
+        doc_job: DocumentJob,
+        document: Document,
+        file_bytes: bytes | None,
+        doc_logger,
+        progress_callback: Callable[[str, DocumentJob], None] | None,
+    ) -> Document:
+        """Run parsing through vectorization as a page-level stream.
+
+        Stages overlap, so job progress marks a stage completed once its last
+        page has passed through it and moves on to the next stage.
+        """
+        assert self.streaming_pipeline  # for mypy
+
+        def on_stage_complete(stage: str) -> None:
+            doc_job.mark_stage_completed(stage)
+            next_index = STREAMED_STAGES.index(stage) + 1
+            if next_index < len(STREAMED_STAGES):
+                doc_job.mark_stage_started(STREAMED_STAGES[next_index])
+            self.batch_repo.update_document_job(batch_id, doc_job)
+            if progress_callback:
+                progress_callback(batch_id, doc_job)
+
+        doc_job.mark_stage_started(STREAMED_STAGES[0])
+        self.batch_repo.update_document_job(batch_id, doc_job)
+        if progress_callback:
+            progress_callback(batch_id, doc_job)
+
+        doc_logger.start_span("page_streaming", {"filename": document.filename})
+        document = await self.streaming_pipeline.run(
+            document,
+            file_bytes,
+            doc_logger=doc_logger,
+            on_stage_complete=on_stage_complete,
+        )
+        doc_job.mark_completed()
+        self.batch_repo.update_document_job(batch_id, doc_job)
+
+        chunk_count = sum(len(page.chunks) for page in document.pages)
+        doc_logger.end_span("page_streaming", {
+            "pages_parsed": len(document.pages),
+            "pixmap_metrics": document.metadata.get("pixmap_metrics") or {},
+            "chunk_count": chunk_count,
+            "has_document_summary": bool(document.summary),
+        })
+        doc_logger.record_event("page_streaming", {
+            "document_id": document.id,
+            "filename": document.filename,
+            "page_count": len(document.pages),
+            "chunk_count": chunk_count,
+        })
+        if progress_callback:
+            progress_callback(batch_id, doc_job)
+        return document
+
+    def _offloads(self, stage: str) -> bool:
+        return self.cpu_stage_pool is not None and self.cpu_stage_pool.handles(stage)
+
+    async def _run_cpu_stage(
+        self,
+        stage: str,
+        fn: Callable[[Document], Document],
+        document: Document,
+        timings: StageTimingReport,
+    ) -> tuple[Document, StageTiming]:
+        """Run a whole-document stage in the CPU stage pool if it handles it, else on a thread."""
+        if self._offloads(stage):
+            assert self.cpu_stage_pool is not None  # for mypy
+            document, timing = await asyncio.to_thread(self.cpu_stage_pool.run, stage, document)
+        else:
+            document, timing = await asyncio.to_thread(measure_stage, self._stage_fn(fn), document)
+        timings.add(stage, timing)
+        return document, timing
+
+    def _stage_fn(self, fn: Callable[[Document], Document]) -> Callable[[Document], Document]:
+        """``fn`` granted ownership of its input when the runner allows in-place stages.
+
+        Only used after parsing: from there on each document is private to this
+        batch flow, which keeps no earlier version of it around.
+        """
+        if self.runner.in_place_stages:
+            return partial(run_owned, fn)
+        return fn
+
+    @staticmethod
+    def _timing_details(timing: StageTiming | None) -> dict[str, Any]:
+        if timing is None:
+            return {}
+        return {
+            "wall_ms": round(timing.wall_ms, 1),
+            "cpu_ms": round(timing.cpu_ms, 1),
+            "in_worker_process": timing.in_worker_process,
+        }
+
     def _collect_pixmap_previews(self, document: Document) -> list[dict[str, Any]]:
         """Return Langfuse media previews for the first few pixmaps."""
         if (
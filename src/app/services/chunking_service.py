@@ -4,11 +4,12 @@ import logging
 import time
 from uuid import uuid4
 
-from typing import Any
+from typing import Any, Sequence
 
 from ..application.interfaces import ObservabilityRecorder
-from ..domain.models import Chunk, Document, Metadata
+from ..domain.models import Chunk, Document, Metadata, Page
 from ..parsing.schemas import ParsedPage, ParsedTextComponent, ParsedImageComponent, ParsedTableComponent
+from .fingerprint import component_identity
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,24 @@ class ChunkingService:
         self.component_merge_threshold = component_merge_threshold
         self.max_component_tokens = max_component_tokens
 
+    def config_fingerprint(self) -> dict[str, object]:
+        """Configuration that determines chunking output, used for incremental re-runs."""
+        return {
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "text_splitter": component_identity(self.text_splitter),
+            "strategy": self.strategy,
+            "component_merge_threshold": self.component_merge_threshold,
+            "max_component_tokens": self.max_component_tokens,
+        }
+
+    @staticmethod
+    def _page_cleaning_metadata(document: Document, page_number: int) -> dict[str, Any] | None:
+        """A copy of the page's cleaning metadata; keys become strings once a document round-trips JSON."""
+        cleaning_metadata_by_page = document.metadata.get("cleaning_metadata_by_page") or {}
+        page_meta = cleaning_metadata_by_page.get(page_number, cleaning_metadata_by_page.get(str(page_number)))
+        return dict(page_meta) if page_meta is not None else None
+
     def _simulate_latency(self) -> None:
         if self.latency > 0:
             time.sleep(self.latency)
@@ -49,6 +68,34 @@ class ChunkingService:
             self.strategy,
         )
         
+        updated_document = self._chunk_with_strategy(document, size, overlap)
+        updated_document = updated_document.model_copy(update={"status": "chunked"})
+        self.record_chunked(updated_document.id, updated_document.pages)
+        return updated_document
+
+    def record_chunked(self, document_id: str, pages: Sequence[Page]) -> None:
+        """Record the chunking stage event; the streaming page pipeline calls it once every page is chunked."""
+        details = {
+            "document_id": document_id,
+            "page_count": len(pages),
+            "chunk_count": sum(len(page.chunks) for page in pages),
+        }
+        if self.strategy in ("component", "hybrid"):
+            details["strategy"] = "component"
+        self.observability.record_event(stage="chunking", details=details)
+
+    def chunk_page(self, document: Document, page: Page) -> Page:
+        """Chunk a single page against the document's parsing and cleaning metadata.
+
+        Used by the streaming page pipeline, which reports the chunking stage
+        once through ``record_chunked``, so no stage event is recorded here.
+        """
+        page_view = document.model_copy(update={"pages": [page]})
+        return self._chunk_with_strategy(page_view).pages[0]
+
+    def _chunk_with_strategy(
+        self, document: Document, size: int | None = None, overlap: int | None = None
+    ) -> Document:
         # Route to appropriate chunking strategy
         if self.strategy == "component":
             return self._chunk_by_components(document, size, overlap)
@@ -63,7 +110,7 @@ class ChunkingService:
         size = size or self.chunk_size
         overlap = overlap if overlap is not None else self.chunk_overlap
         normalized_overlap = min(overlap, size - 1) if size > 1 else 0
-        updated_document = document
+        batch = document.chunk_batch()
         parsed_pages_meta = document.metadata.get("parsed_pages", {})
 
         for page in document.pages:
@@ -76,6 +123,7 @@ class ChunkingService:
 
             cleaned_text = page.cleaned_text
             parsed_page = parsed_pages_meta.get(str(page.page_number)) or parsed_pages_meta.get(str(page.page_number))
+            page_cleaning_meta = self._page_cleaning_metadata(document, page.page_number)
 
             segments = self._split_text(raw_text, size, normalized_overlap)
             cursor = 0
@@ -95,12 +143,9 @@ class ChunkingService:
                 # Attach cleaning metadata from document metadata if available
                 # Cleaning service stores metadata keyed by page_number
                 chunk_extra = {}
-                cleaning_metadata_by_page = document.metadata.get("cleaning_metadata_by_page", {})
-                if page.page_number in cleaning_metadata_by_page:
-                    page_cleaning_meta = cleaning_metadata_by_page[page.page_number].copy()
+                if page_cleaning_meta is not None:
                     # Add segment_id (chunk.id) to link metadata to this chunk
-                    page_cleaning_meta["segment_id"] = chunk_id
-                    chunk_extra["cleaning"] = page_cleaning_meta
+                    chunk_extra["cleaning"] = {**page_cleaning_meta, "segment_id": chunk_id}
 
                 parsed_matches = self._match_parsed_segments(chunk_raw_text, parsed_page)
                 if parsed_matches:
@@ -125,7 +170,7 @@ class ChunkingService:
                     end_offset=end,
                     metadata=metadata,
                 )
-                updated_document = updated_document.add_chunk(page.page_number, chunk)
+                batch.add(page.page_number, chunk)
 
                 chunk_index += 1
                 if not self.text_splitter and end < len(raw_text):
@@ -134,16 +179,7 @@ class ChunkingService:
                         next_cursor = start + 1
                     cursor = next_cursor
 
-        updated_document = updated_document.model_copy(update={"status": "chunked"})
-        self.observability.record_event(
-            stage="chunking",
-            details={
-                "document_id": updated_document.id,
-                "page_count": len(updated_document.pages),
-                "chunk_count": sum(len(page.chunks) for page in updated_document.pages),
-            },
-        )
-        return updated_document
+        return batch.build()
 
     @staticmethod
     def _match_parsed_segments(chunk_text: str, parsed_page: dict | None) -> list[dict[str, str]]:
@@ -216,7 +252,7 @@ class ChunkingService:
     
     def _chunk_by_components(self, document: Document, size: int | None = None, overlap: int | None = None) -> Document:
         """Component-aware chunking strategy: chunk based on parsed components."""
-        updated_document = document
+        batch = document.chunk_batch()
         parsed_pages_meta = document.metadata.get("parsed_pages", {})
         
         # Use provided size/overlap or fall back to instance defaults
@@ -238,8 +274,9 @@ class ChunkingService:
                     page.page_number,
                 )
                 # Fallback to fixed-size for this page
-                updated_document = self._chunk_page_fixed_size(
-                    updated_document, page, chunk_size, chunk_overlap
+                batch.extend(
+                    page.page_number,
+                    self._chunk_page_fixed_size(document, page, chunk_size, chunk_overlap),
                 )
                 continue
             
@@ -280,27 +317,15 @@ class ChunkingService:
                     parsed_page=parsed_page,
                 )
                 if chunk:
-                    updated_document = updated_document.add_chunk(page.page_number, chunk)
+                    batch.add(page.page_number, chunk)
                     total_chunks_created += 1
         
-        updated_document = updated_document.model_copy(update={"status": "chunked"})
-        
         logger.info(
             "✅ Component chunking complete: created %d chunks across %d pages",
             total_chunks_created,
             len(document.pages),
         )
-        
-        self.observability.record_event(
-            stage="chunking",
-            details={
-                "document_id": updated_document.id,
-                "strategy": "component",
-                "page_count": len(updated_document.pages),
-                "chunk_count": total_chunks_created,
-            },
-        )
-        return updated_document
+        return batch.build()
     
     def _group_components(
         self,
@@ -433,9 +458,8 @@ class ChunkingService:
         
         # Attach cleaning metadata if available
         chunk_extra = {}
-        cleaning_metadata_by_page = document.metadata.get("cleaning_metadata_by_page", {})
-        if page.page_number in cleaning_metadata_by_page:
-            page_cleaning_meta = cleaning_metadata_by_page[page.page_number].copy()
+        page_cleaning_meta = self._page_cleaning_metadata(document, page.page_number)
+        if page_cleaning_meta is not None:
             page_cleaning_meta["segment_id"] = chunk_id
             chunk_extra["cleaning"] = page_cleaning_meta
         
@@ -498,20 +522,21 @@ class ChunkingService:
         page: Any,
         size: int,
         overlap: int,
-    ) -> Document:
+    ) -> list[Chunk]:
         """Chunk a single page using fixed-size strategy."""
         raw_text = page.text or ""
         if not raw_text:
-            return document
+            return []
         
         cleaned_text = page.cleaned_text
         normalized_overlap = min(overlap, size - 1) if size > 1 else 0
+        page_cleaning_meta = self._page_cleaning_metadata(document, page.page_number)
         
         segments = self._split_text(raw_text, size, normalized_overlap)
         cursor = 0
         chunk_index = 0
         
-        updated_document = document
+        chunks: list[Chunk] = []
         
         for segment in segments:
             start = self._find_segment_start(raw_text, segment, cursor)
@@ -525,11 +550,8 @@ class ChunkingService:
                 chunk_cleaned_text = chunk_cleaned_text.rstrip()
             
             chunk_extra = {}
-            cleaning_metadata_by_page = document.metadata.get("cleaning_metadata_by_page", {})
-            if page.page_number in cleaning_metadata_by_page:
-                page_cleaning_meta = cleaning_metadata_by_page[page.page_number].copy()
-                page_cleaning_meta["segment_id"] = chunk_id
-                chunk_extra["cleaning"] = page_cleaning_meta
+            if page_cleaning_meta is not None:
+                chunk_extra["cleaning"] = {**page_cleaning_meta, "segment_id": chunk_id}
             
             metadata = Metadata(
                 document_id=document.id,
@@ -552,7 +574,7 @@ class ChunkingService:
                 metadata=metadata,
             )
             
-            updated_document = updated_document.add_chunk(page.page_number, chunk)
+            chunks.append(chunk)
             chunk_index += 1
             
             if end < len(raw_text):
@@ -561,4 +583,4 @@ class ChunkingService:
                     next_cursor = start + 1
                 cursor = next_cursor
         
-        return updated_document
+        return chunks
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
 import time
-from typing import Callable
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
 
-from ..application.interfaces import CleaningLLM, ObservabilityRecorder
+from ..application.interfaces import CleanedPageCache, CleaningLLM, ObservabilityRecorder
+from ..parsing.pixmap_store import PixmapStore
 from ..parsing.schemas import CleanedPage, ParsedPage
-from ..domain.models import Document
+from ..domain.models import Document, Page
+from .document_ownership import owns
+from .fingerprint import component_identity
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PageCleaningResult:
+    """Outcome of cleaning a single page."""
+
+    page: Page
+    page_metadata: dict[str, Any]
+    cleaned_segments: CleanedPage | None = None
+    cache_hit: bool = False
+
+
 class CleaningService:
     """Normalizes text and records cleaning metadata."""
 
@@ -22,12 +38,24 @@ class CleaningService:
         normalizer: Callable[[str], str] | None = None,
         latency: float = 0.0,
         structured_cleaner: CleaningLLM | None = None,
+        cleaning_cache: CleanedPageCache | None = None,
+        pixmap_store: PixmapStore | None = None,
     ) -> None:
         self.observability = observability
         self.profile = profile
         self.normalizer = normalizer or self._default_normalizer
         self.latency = latency
         self.structured_cleaner = structured_cleaner
+        self.cleaning_cache = cleaning_cache
+        self.pixmap_store = pixmap_store
+
+    def config_fingerprint(self) -> dict[str, object]:
+        """Configuration that determines cleaning output, used for incremental re-runs."""
+        return {
+            "profile": self.profile,
+            "normalizer": getattr(self.normalizer, "__qualname__", repr(self.normalizer)),
+            "structured_cleaner": component_identity(self.structured_cleaner),
+        }
 
     @staticmethod
     def _default_normalizer(text: str) -> str:
@@ -43,86 +71,151 @@ class CleaningService:
         """
         if self.latency > 0:
             time.sleep(self.latency)
+        parsed_pages_meta = document.metadata.get("parsed_pages", {})
+        pixmap_assets = document.metadata.get("pixmap_assets", {})
+        in_place = owns(document)
+        results = [
+            self.clean_page(
+                page,
+                parsed_payload=parsed_pages_meta.get(str(page.page_number)) or parsed_pages_meta.get(page.page_number),
+                pixmap_path=pixmap_assets.get(str(page.page_number)),
+                in_place=in_place,
+            )
+            for page in document.pages
+        ]
+        return self.assemble_cleaned_document(document, results)
+
+    def clean_page(
+        self,
+        page: Page,
+        parsed_payload: dict | None = None,
+        pixmap_path: str | None = None,
+        in_place: bool = False,
+    ) -> PageCleaningResult:
+        """Clean a single page and build the metadata chunking attaches to its chunks.
+
+        With ``in_place`` the cleaned text is set on ``page`` itself instead of
+        a copy; only pass it for pages of a document the caller owns.
+        """
+        cleaned_segments: CleanedPage | None = None
+        cache_hit = False
+        if self.structured_cleaner and parsed_payload:
+            parsed_page = ParsedPage.model_validate(parsed_payload)
+            cleaned_segments, cache_hit = self._clean_structured_page(parsed_page, pixmap_path)
+        return self._cleaning_result(page, cleaned_segments, cache_hit, in_place)
+
+    async def aclean_page(
+        self,
+        page: Page,
+        parsed_payload: dict | None = None,
+        pixmap_path: str | None = None,
+    ) -> PageCleaningResult:
+        """``clean_page`` that awaits the structured cleaner's native async call instead of holding a thread."""
+        if not (self.structured_cleaner and parsed_payload):
+            return await asyncio.to_thread(self.clean_page, page, parsed_payload, pixmap_path)
+        parsed_page = ParsedPage.model_validate(parsed_payload)
+        cleaned_segments, cache_hit = await self._aclean_structured_page(parsed_page, pixmap_path)
+        return self._cleaning_result(page, cleaned_segments, cache_hit, in_place=False)
+
+    def _cleaning_result(
+        self,
+        page: Page,
+        cleaned_segments: CleanedPage | None,
+        cache_hit: bool,
+        in_place: bool,
+    ) -> PageCleaningResult:
+        raw_text = page.text or ""
+        cleaned_page_text = self.normalizer(raw_text)
+        if cleaned_segments is not None:
+            cleaned_page_text = "\n\n".join(segment.text for segment in cleaned_segments.segments).strip() or cleaned_page_text
+        
+        # Log raw vs cleaned text comparison
+        logger.info("=" * 80)
+        logger.info("CLEANING - Document: %s, Page: %s", page.document_id, page.page_number)
+        logger.info("=" * 80)
+        logger.info("RAW TEXT (Before Cleaning):")
+        logger.info("-" * 80)
+        logger.info("%s", raw_text[:1000] + ("..." if len(raw_text) > 1000 else ""))
+        logger.info("-" * 80)
+        logger.info("CLEANED TEXT (After Cleaning):")
+        logger.info("-" * 80)
+        logger.info("%s", cleaned_page_text[:1000] + ("..." if len(cleaned_page_text) > 1000 else ""))
+        logger.info("-" * 80)
+        logger.info("STATISTICS:")
+        logger.info("  Raw text length: %d characters, %d tokens", len(raw_text), len(raw_text.split()))
+        logger.info("  Cleaned text length: %d characters, %d tokens", len(cleaned_page_text), len(cleaned_page_text.split()))
+        logger.info("  Difference: %d characters, %d tokens", 
+                   len(cleaned_page_text) - len(raw_text),
+                   len(cleaned_page_text.split()) - len(raw_text.split()))
+        logger.info("=" * 80)
+        
+        # Generate segment-level cleaning metadata for this page
+        # This will be attached to chunks during chunking stage
+        cleaned_tokens_count = len(cleaned_page_text.split())
+        diff_hash_input = f"{raw_text}::{cleaned_page_text}"
+        diff_hash = hashlib.sha256(diff_hash_input.encode("utf-8")).hexdigest()
+        
+        # Determine cleaning operations applied (simplified for now)
+        cleaning_ops = []
+        if raw_text != cleaned_page_text:
+            # Detect whitespace normalization
+            if " ".join(raw_text.split()) == cleaned_page_text:
+                cleaning_ops.append("whitespace")
+            # Future: detect other operations (case normalization, etc.)
+        
+        # Store cleaning metadata keyed by page number for chunking to retrieve
+        page_meta = {
+            "cleaned_tokens_count": cleaned_tokens_count,
+            "diff_hash": diff_hash,
+            "cleaning_ops": cleaning_ops,
+            "needs_review": False,  # Can be enhanced with quality checks
+            "profile": self.profile,
+        }
+        if cleaned_segments:
+            page_meta["llm_segments"] = cleaned_segments.model_dump()
+
+        if in_place:
+            page.cleaned_text = cleaned_page_text
+        else:
+            page = page.model_copy(update={"cleaned_text": cleaned_page_text})
+        return PageCleaningResult(
+            page=page,
+            page_metadata=page_meta,
+            cleaned_segments=cleaned_segments,
+            cache_hit=cache_hit,
+        )
+
+    def assemble_cleaned_document(
+        self,
+        document: Document,
+        results: Sequence[PageCleaningResult],
+    ) -> Document:
+        """Combine per-page cleaning results into the cleaned document and record the stage."""
         page_summaries: list[dict[str, int]] = []
         updated_pages = []
-        updated_metadata = document.metadata.copy()
-
+        in_place = owns(document)
+        updated_metadata = document.metadata if in_place else document.metadata.copy()
         updated_metadata["cleaning_metadata_by_page"] = {}
         llm_segments: dict[str, CleanedPage] = {}
+        cache_hits = 0
+        cache_misses = 0
 
-        parsed_pages_meta = updated_metadata.get("parsed_pages", {})
-        pixmap_assets = updated_metadata.get("pixmap_assets", {})
-        
-        for page in document.pages:
-            raw_text = page.text or ""
-            cleaned_page_text = self.normalizer(raw_text)
-            cleaned_segments: CleanedPage | None = None
-
-            if self.structured_cleaner:
-                parsed_payload = parsed_pages_meta.get(str(page.page_number)) or parsed_pages_meta.get(page.page_number)
-                pixmap_path = pixmap_assets.get(str(page.page_number))
-                
-                if parsed_payload:
-                    parsed_page = ParsedPage.model_validate(parsed_payload)
-                    cleaned_segments = self._run_structured_cleaner(parsed_page, pixmap_path)
-                    cleaned_page_text = "\n\n".join(segment.text for segment in cleaned_segments.segments).strip() or cleaned_page_text
-                    llm_segments[str(page.page_number)] = cleaned_segments
-            
-            # Log raw vs cleaned text comparison
-            logger.info("=" * 80)
-            logger.info("CLEANING - Document: %s, Page: %s", document.id, page.page_number)
-            logger.info("=" * 80)
-            logger.info("RAW TEXT (Before Cleaning):")
-            logger.info("-" * 80)
-            logger.info("%s", raw_text[:1000] + ("..." if len(raw_text) > 1000 else ""))
-            logger.info("-" * 80)
-            logger.info("CLEANED TEXT (After Cleaning):")
-            logger.info("-" * 80)
-            logger.info("%s", cleaned_page_text[:1000] + ("..." if len(cleaned_page_text) > 1000 else ""))
-            logger.info("-" * 80)
-            logger.info("STATISTICS:")
-            logger.info("  Raw text length: %d characters, %d tokens", len(raw_text), len(raw_text.split()))
-            logger.info("  Cleaned text length: %d characters, %d tokens", len(cleaned_page_text), len(cleaned_page_text.split()))
-            logger.info("  Difference: %d characters, %d tokens", 
-                       len(cleaned_page_text) - len(raw_text),
-                       len(cleaned_page_text.split()) - len(raw_text.split()))
-            logger.info("=" * 80)
-            
-            updated_page = page.model_copy(update={"cleaned_text": cleaned_page_text})
-            updated_pages.append(updated_page)
-            
-            # Generate segment-level cleaning metadata for this page
-            # This will be attached to chunks during chunking stage
-            cleaned_tokens_count = len(cleaned_page_text.split())
-            diff_hash_input = f"{raw_text}::{cleaned_page_text}"
-            diff_hash = hashlib.sha256(diff_hash_input.encode("utf-8")).hexdigest()
-            
-            # Determine cleaning operations applied (simplified for now)
-            cleaning_ops = []
-            if raw_text != cleaned_page_text:
-                # Detect whitespace normalization
-                if " ".join(raw_text.split()) == cleaned_page_text:
-                    cleaning_ops.append("whitespace")
-                # Future: detect other operations (case normalization, etc.)
-            
-            # Store cleaning metadata keyed by page number for chunking to retrieve
-            page_meta = {
-                "cleaned_tokens_count": cleaned_tokens_count,
-                "diff_hash": diff_hash,
-                "cleaning_ops": cleaning_ops,
-                "needs_review": False,  # Can be enhanced with quality checks
-                "profile": self.profile,
-            }
-            if cleaned_segments:
-                page_meta["llm_segments"] = cleaned_segments.model_dump()
-            updated_metadata["cleaning_metadata_by_page"][page.page_number] = page_meta
-            
+        for result in sorted(results, key=lambda item: item.page.page_number):
+            page = result.page
+            updated_pages.append(page)
+            updated_metadata["cleaning_metadata_by_page"][page.page_number] = result.page_metadata
+            if result.cleaned_segments:
+                llm_segments[str(page.page_number)] = result.cleaned_segments
+                if result.cache_hit:
+                    cache_hits += 1
+                elif self.cleaning_cache is not None:
+                    cache_misses += 1
             page_summaries.append(
                 {
                     "page_number": page.page_number,
-                    "cleaned_tokens": cleaned_tokens_count,
-                    "characters": len(cleaned_page_text),
-                    "diff_hash": diff_hash,
+                    "cleaned_tokens": result.page_metadata["cleaned_tokens_count"],
+                    "characters": len(page.cleaned_text or ""),
+                    "diff_hash": result.page_metadata["diff_hash"],
                 }
             )
 
@@ -131,13 +224,18 @@ class CleaningService:
         updated_metadata["cleaning_profile"] = self.profile
         updated_metadata["cleaning_report"] = page_summaries
         
-        updated_document = document.model_copy(
-            update={
-                "pages": updated_pages,
-                "status": "cleaned",
-                "metadata": updated_metadata,
-            }
-        )
+        if in_place:
+            updated_document = document
+            updated_document.pages = updated_pages
+            updated_document.status = "cleaned"
+        else:
+            updated_document = document.model_copy(
+                update={
+                    "pages": updated_pages,
+                    "status": "cleaned",
+                    "metadata": updated_metadata,
+                }
+            )
         
         self.observability.record_event(
             stage="cleaning",
@@ -145,10 +243,100 @@ class CleaningService:
                 "document_id": updated_document.id,
                 "profile": self.profile,
                 "pages_cleaned": len(page_summaries),
+                "cache": {"hits": cache_hits, "misses": cache_misses},
             },
         )
         return updated_document
 
     def _run_structured_cleaner(self, parsed_page: ParsedPage, pixmap_path: str | None = None) -> CleanedPage:
+        cleaned_page, _ = self._clean_structured_page(parsed_page, pixmap_path)
+        return cleaned_page
+
+    async def _arun_structured_cleaner(self, parsed_page: ParsedPage, pixmap_path: str | None = None) -> CleanedPage:
+        cleaned_page, _ = await self._aclean_structured_page(parsed_page, pixmap_path)
+        return cleaned_page
+
+    def _clean_structured_page(
+        self, parsed_page: ParsedPage, pixmap_path: str | None = None
+    ) -> tuple[CleanedPage, bool]:
+        """Clean a page through the structured cleaner, consulting the cleaning cache first.
+
+        Returns the cleaned page and whether it was served from the cache.
+        """
         assert self.structured_cleaner  # for mypy
-        return self.structured_cleaner.clean_page(parsed_page, pixmap_path)
+        cache_key, cached_page = self._cached_cleaning(parsed_page, pixmap_path)
+        if cached_page is not None:
+            return cached_page, True
+        cleaned_page = self.structured_cleaner.clean_page(parsed_page, pixmap_path)
+        self._store_cleaning(cache_key, cleaned_page)
+        return cleaned_page, False
+
+    async def _aclean_structured_page(
+        self, parsed_page: ParsedPage, pixmap_path: str | None = None
+    ) -> tuple[CleanedPage, bool]:
+        """``_clean_structured_page`` over the cleaner's ``aclean_page`` when it offers one.
+
+        Cleaners without a native async call run in the default executor.
+        """
+        aclean_page = getattr(self.structured_cleaner, "aclean_page", None)
+        if aclean_page is None:
+            return await asyncio.to_thread(self._clean_structured_page, parsed_page, pixmap_path)
+        cache_key, cached_page = await asyncio.to_thread(self._cached_cleaning, parsed_page, pixmap_path)
+        if cached_page is not None:
+            return cached_page, True
+        cleaned_page = await aclean_page(parsed_page, pixmap_path)
+        await asyncio.to_thread(self._store_cleaning, cache_key, cleaned_page)
+        return cleaned_page, False
+
+    def _cached_cleaning(
+        self, parsed_page: ParsedPage, pixmap_path: str | None
+    ) -> tuple[dict[str, object] | None, CleanedPage | None]:
+        """The page's cleaning cache key and its cached result, if any."""
+        cache_key = self._cleaning_cache_key(parsed_page, pixmap_path)
+        if cache_key is None:
+            return None, None
+        cached_page = self.cleaning_cache.get(cache_key)
+        if cached_page is None:
+            return cache_key, None
+        return cache_key, cached_page.model_copy(update={"document_id": parsed_page.document_id})
+
+    def _store_cleaning(self, cache_key: dict[str, object] | None, cleaned_page: CleanedPage) -> None:
+        # A fallback (LLM failed, raw text returned) must not be served to later runs
+        if cache_key is not None and cleaned_page.cleaning_status == "success":
+            self.cleaning_cache.put(cache_key, cleaned_page)
+
+    def _cleaning_cache_key(self, parsed_page: ParsedPage, pixmap_path: str | None) -> dict[str, object] | None:
+        """Build the content address for a cleaning request, or None when caching does not apply.
+
+        The parsed page is hashed canonically without its document id and pixmap
+        location, so identical content re-ingested under a new id still hits.
+        """
+        if self.cleaning_cache is None:
+            return None
+        identity = getattr(self.structured_cleaner, "cache_identity", None)
+        if not identity:
+            return None
+        canonical = json.dumps(
+            parsed_page.model_dump(mode="json", exclude={"document_id", "pixmap_path", "pixmap_size_bytes"}),
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        pixmap_sha256 = None
+        if identity.get("uses_pixmap") and pixmap_path:
+            if self.pixmap_store is not None:
+                # Hashes the bytes parsing already holds in memory
+                pixmap_sha256 = self.pixmap_store.sha256(pixmap_path)
+                if pixmap_sha256 is None:
+                    return None
+            else:
+                try:
+                    with open(pixmap_path, "rb") as handle:
+                        pixmap_sha256 = hashlib.sha256(handle.read()).hexdigest()
+                except OSError:
+                    return None
+        return {
+            "parsed_page_sha256": hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+            "profile": self.profile,
+            "pixmap_sha256": pixmap_sha256,
+            **identity,
+        }
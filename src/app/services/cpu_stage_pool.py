@@ -0,0 +1,239 @@
+"""Process pool for the CPU-bound document stages of batch runs."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+from ..application.interfaces import ObservabilityRecorder
+from ..domain.models import Document
+from .chunking_service import ChunkingService
+from .cleaning_service import CleaningService
+from .document_ownership import run_owned
+from .enrichment_service import EnrichmentService
+
+logger = logging.getLogger(__name__)
+
+DocumentStage = Callable[[Document], Document]
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Wall-clock and CPU time one document spent in a stage.
+
+    ``cpu_ms`` well below ``wall_ms`` for a pure-CPU stage means the stage
+    waited, typically on the GIL behind other documents' threads.
+    """
+
+    wall_ms: float
+    cpu_ms: float
+    in_worker_process: bool = False
+
+
+class StageTimingReport:
+    """Per-stage totals of ``StageTiming`` across the documents of a batch."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: dict[str, dict[str, Any]] = {}
+
+    def add(self, stage: str, timing: StageTiming) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(
+                stage, {"documents": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "in_worker_process": 0}
+            )
+            totals["documents"] += 1
+            totals["wall_ms"] += timing.wall_ms
+            totals["cpu_ms"] += timing.cpu_ms
+            totals["in_worker_process"] += int(timing.in_worker_process)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                stage: {
+                    **totals,
+                    "wall_ms": round(totals["wall_ms"], 1),
+                    "cpu_ms": round(totals["cpu_ms"], 1),
+                    "cpu_to_wall": round(totals["cpu_ms"] / totals["wall_ms"], 2) if totals["wall_ms"] else None,
+                }
+                for stage, totals in self._totals.items()
+            }
+
+
+def measure_stage(fn: DocumentStage, document: Document) -> tuple[Document, StageTiming]:
+    """Run ``fn`` on the calling thread and time it (CPU time of this thread only)."""
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    result = fn(document)
+    return result, StageTiming(
+        wall_ms=(time.perf_counter() - wall_start) * 1000,
+        cpu_ms=(time.thread_time() - cpu_start) * 1000,
+    )
+
+
+def cpu_bound_stages(
+    chunking: ChunkingService,
+    cleaning: CleaningService,
+    enrichment: EnrichmentService,
+) -> dict[str, DocumentStage]:
+    """The document stages that need no LLM calls with this configuration.
+
+    Chunking always qualifies. Cleaning qualifies when it only normalizes text
+    (no structured LLM cleaner) and enrichment when no summary generator is
+    configured; otherwise those stages are dominated by network waits and stay
+    on threads.
+    """
+    stages: dict[str, DocumentStage] = {"chunking": _detached(chunking).chunk}
+    if cleaning.structured_cleaner is None:
+        detached_cleaning = _detached(cleaning)
+        detached_cleaning.cleaning_cache = None
+        detached_cleaning.pixmap_store = None
+        stages["cleaning"] = detached_cleaning.clean
+    if enrichment.summary_generator is None:
+        stages["enrichment"] = _detached(enrichment).enrich
+    return stages
+
+
+class CpuStagePool:
+    """Runs CPU-bound document stages in worker processes, outside the GIL.
+
+    The stage callables (bound methods of detached service copies) are shipped
+    to each worker once, when it starts. Per call only the document crosses
+    the process boundary, as compact JSON that omits default-valued fields.
+    Stage events the services record in the worker are sent back and replayed
+    on ``observability`` so traces look the same as with threads.
+
+    Stages that cannot be pickled are dropped with a warning; callers check
+    ``handles`` and run those on threads as before.
+    """
+
+    def __init__(
+        self,
+        stages: Mapping[str, DocumentStage],
+        observability: ObservabilityRecorder,
+        max_workers: int | None = None,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.observability = observability
+        self._stages: dict[str, DocumentStage] = {}
+        for name, fn in stages.items():
+            try:
+                pickle.dumps(fn)
+            except Exception as exc:
+                logger.warning("Stage %s cannot be sent to worker processes (%s); it stays on threads", name, exc)
+                continue
+            self._stages[name] = fn
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._closed = False
+
+    @property
+    def stages(self) -> list[str]:
+        return list(self._stages)
+
+    def handles(self, stage: str) -> bool:
+        return stage in self._stages
+
+    def run(self, stage: str, document: Document) -> tuple[Document, StageTiming]:
+        """Run ``stage`` on ``document`` in a worker process (blocking).
+
+        ``cpu_ms`` covers the worker's time plus the calling thread's share of
+        the handoff (serializing the document and reading the result back).
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        payload = document.model_dump_json(exclude_defaults=True).encode("utf-8")
+        executor = self._ensure_executor()
+        try:
+            result_payload, events, worker_cpu_s = executor.submit(_run_stage, stage, payload).result()
+        except BrokenProcessPool as exc:
+            self._reset_executor(executor, exc)
+            raise
+        result = Document.model_validate_json(result_payload)
+        for event_stage, details in events:
+            self.observability.record_event(stage=event_stage, details=details)
+        return result, StageTiming(
+            wall_ms=(time.perf_counter() - wall_start) * 1000,
+            cpu_ms=(worker_cpu_s + time.thread_time() - cpu_start) * 1000,
+            in_worker_process=True,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("CpuStagePool has been shut down")
+            if self._executor is None:
+                logger.info(
+                    "🚀 Starting CPU stage pool with %d workers (stages=%s)",
+                    self.max_workers,
+                    ", ".join(self._stages),
+                )
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self._stages,),
+                )
+            return self._executor
+
+    def _reset_executor(self, executor: ProcessPoolExecutor, exc: BaseException) -> None:
+        """Drop a broken executor so the next document starts a fresh one."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        logger.warning("CPU stage pool broke, restarting workers: %s", exc)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ----------------------------------------------------------------------
+# Worker process side
+# ----------------------------------------------------------------------
+_worker_stages: dict[str, DocumentStage] = {}
+_worker_events: list[tuple[str, dict[str, Any]]] = []
+
+
+class _EventBuffer(ObservabilityRecorder):
+    """Observability for detached services: buffers events for the parent to replay."""
+
+    def record_event(
+        self,
+        stage: str,
+        details: Mapping[str, Any] | None = None,
+        trace_id: str | None = None,
+    ) -> None:
+        _worker_events.append((stage, dict(details or {})))
+
+
+def _detached(service: Any) -> Any:
+    """Shallow copy of ``service`` whose events are buffered instead of recorded."""
+    detached = copy.copy(service)
+    detached.observability = _EventBuffer()
+    return detached
+
+
+def _init_worker(stages: dict[str, DocumentStage]) -> None:
+    _worker_stages.update(stages)
+
+
+def _run_stage(stage: str, payload: bytes) -> tuple[bytes, list[tuple[str, dict[str, Any]]], float]:
+    cpu_start = time.process_time()
+    _worker_events.clear()
+    # The document was just deserialized here, so the stage may update it in place
+    document = run_owned(_worker_stages[stage], Document.model_validate_json(payload))
+    result = document.model_dump_json(exclude_defaults=True).encode("utf-8")
+    return result, list(_worker_events), time.process_time() - cpu_start
@@ -0,0 +1,51 @@
+"""Copy-free stage execution for documents the caller holds the only reference to.
+
+Stages treat their input ``Document`` as immutable: every chunk they touch is
+rebuilt through ``model_copy`` (chunk, its metadata, its ``extra`` dict, the
+page and the document), so a caller that kept the input still sees it as it
+was. Inside a pipeline run nobody keeps the intermediate documents, and those
+copies are pure overhead — several allocations per chunk per stage.
+
+``run_owned`` lets a runner hand a stage its input for exclusive use. While it
+runs, ``owns(document)`` is true for that one object and the stage updates
+it, its pages and chunks in place, returning the same object. Calls made
+outside ``run_owned`` (the public API) still copy and never mutate their input.
+
+Ownership is tracked per context, so it follows ``asyncio.to_thread`` into the
+worker thread and does not leak into concurrent runs.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+from ..domain.models import Document
+
+_owned_document: ContextVar[int | None] = ContextVar("owned_document", default=None)
+
+
+@contextmanager
+def owned_document(document: Document) -> Iterator[Document]:
+    """Grant the code in this block exclusive ownership of ``document``.
+
+    Only grant it when nothing else will read ``document`` or any page, chunk
+    or metadata dict reachable from it afterwards: stages mutate all of those.
+    """
+    token = _owned_document.set(id(document))
+    try:
+        yield document
+    finally:
+        _owned_document.reset(token)
+
+
+def owns(document: Document) -> bool:
+    """True when the current context holds exclusive ownership of ``document``."""
+    return _owned_document.get() == id(document)
+
+
+def run_owned(stage: Callable[[Document], Document], document: Document) -> Document:
+    """Run ``stage`` on ``document`` with ownership granted, so it may update it in place."""
+    with owned_document(document):
+        return stage(document)
@@ -0,0 +1,201 @@
+"""Coalesces concurrent embedding calls into full batches."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from ..application.interfaces import EmbeddingGenerator
+from .llm_scheduler import PRIORITY_CLASSES, current_llm_priority, llm_priority
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Request:
+    """One caller's ``embed`` call, filled in as its texts come back."""
+
+    vectors: list[Sequence[float] | None]
+    remaining: int
+    done: threading.Event = field(default_factory=threading.Event)
+    error: BaseException | None = None
+
+
+@dataclass(frozen=True)
+class _Item:
+    request: _Request
+    index: int
+    text: str
+    enqueued_at: float
+    priority: str
+
+
+class EmbeddingBatcher(EmbeddingGenerator):
+    """Embedding generator that merges texts from concurrent callers into batches.
+
+    Pages embedded in parallel (across the page pipeline and across the
+    documents of a batch run) each bring a handful of chunks. Instead of one
+    small request per page, their texts queue here and go to the wrapped
+    generator in batches of ``batch_size``; a batch is sent early once its
+    oldest text has waited ``max_wait_ms``. Up to ``max_in_flight`` batches
+    are embedded at once, and each caller gets its vectors back in order.
+
+    Texts are batched per LLM priority class (see ``llm_priority``): a batch
+    only holds texts of one class and is embedded under that class, so an
+    interactive upload's chunks are not scheduled as the batch work that
+    happens to share the dispatcher. When several classes have a batch
+    ready, the higher class goes first.
+    """
+
+    def __init__(
+        self,
+        generator: EmbeddingGenerator,
+        batch_size: int = 32,
+        max_wait_ms: float = 20.0,
+        max_in_flight: int = 4,
+    ) -> None:
+        self.generator = generator
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.max_in_flight = max(1, max_in_flight)
+        self._cond = threading.Condition()
+        self._queues: dict[str, deque[_Item]] = {priority: deque() for priority in PRIORITY_CLASSES}
+        self._closed = False
+        self._dispatcher: threading.Thread | None = None
+        self._slots = threading.Semaphore(self.max_in_flight)
+        self._executor: ThreadPoolExecutor | None = None
+        self._stats = {"calls": 0, "texts": 0, "batches": 0}
+
+    @property
+    def dimension(self) -> int:
+        return self.generator.dimension
+
+    @property
+    def cache_identity(self) -> object:
+        """Batching does not change vectors; cache entries belong to the wrapped model."""
+        return getattr(self.generator, "cache_identity", None)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return dict(self._stats)
+
+    def embed(self, texts: Sequence[str]) -> Sequence[Sequence[float]]:
+        if not texts:
+            return []
+        request = _Request(vectors=[None] * len(texts), remaining=len(texts))
+        now = time.monotonic()
+        priority = current_llm_priority()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("EmbeddingBatcher is closed")
+            self._ensure_dispatcher()
+            self._stats["calls"] += 1
+            self._stats["texts"] += len(texts)
+            self._queues[priority].extend(
+                _Item(request, index, text, now, priority) for index, text in enumerate(texts)
+            )
+            self._cond.notify()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.vectors  # type: ignore[return-value]
+
+    def close(self) -> None:
+        """Embed whatever is still queued, then stop the dispatcher."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            dispatcher = self._dispatcher
+        if dispatcher is not None:
+            dispatcher.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        stats = self.stats
+        if stats["batches"]:
+            logger.info(
+                "📦 Embedding batcher sent %d batch(es) for %d text(s) from %d call(s)",
+                stats["batches"],
+                stats["texts"],
+                stats["calls"],
+            )
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_in_flight,
+                thread_name_prefix="embedding-batch",
+            )
+            self._dispatcher = threading.Thread(
+                target=self._dispatch,
+                name="embedding-batcher",
+                daemon=True,
+            )
+            self._dispatcher.start()
+
+    def _dispatch(self) -> None:
+        assert self._executor is not None  # for mypy
+        while True:
+            with self._cond:
+                while not self._has_queued() and not self._closed:
+                    self._cond.wait()
+                if not self._has_queued():
+                    return
+                priority = self._ready_priority()
+                while priority is None:
+                    self._cond.wait(max(0.0, self._next_deadline() - time.monotonic()))
+                    priority = self._ready_priority()
+                queue = self._queues[priority]
+                batch = [queue.popleft() for _ in range(min(self.batch_size, len(queue)))]
+                self._stats["batches"] += 1
+            # Back-pressure: wait for a free slot instead of queueing batches in the pool
+            self._slots.acquire()
+            self._executor.submit(self._embed_batch, priority, batch)
+
+    def _has_queued(self) -> bool:
+        return any(self._queues.values())
+
+    def _ready_priority(self) -> str | None:
+        """Highest class with a full batch or an expired wait; any queued class once closing."""
+        now = time.monotonic()
+        for priority in PRIORITY_CLASSES:
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            if self._closed or len(queue) >= self.batch_size or queue[0].enqueued_at + self.max_wait <= now:
+                return priority
+        return None
+
+    def _next_deadline(self) -> float:
+        return min(queue[0].enqueued_at + self.max_wait for queue in self._queues.values() if queue)
+
+    def _embed_batch(self, priority: str, batch: list[_Item]) -> None:
+        try:
+            # The wrapped generator's rate limiter schedules the request by the callers' class
+            with llm_priority(priority):
+                vectors = self.generator.embed([item.text for item in batch])
+        except BaseException as exc:
+            for item in batch:
+                item.request.error = exc
+                item.request.done.set()
+            return
+        finally:
+            self._slots.release()
+        if len(vectors) != len(batch):
+            error = RuntimeError(f"Embedding generator returned {len(vectors)} vectors for {len(batch)} texts")
+            for item in batch:
+                item.request.error = error
+                item.request.done.set()
+            return
+        with self._cond:
+            for item, vector in zip(batch, vectors):
+                request = item.request
+                request.vectors[item.index] = vector
+                request.remaining -= 1
+                if request.remaining == 0:
+                    request.done.set()
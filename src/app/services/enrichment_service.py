@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Sequence
 
 from ..application.interfaces import SummaryGenerator, ObservabilityRecorder
-from ..domain.models import Document
+from ..domain.models import Document, Page
+from .document_ownership import owns
+from .fingerprint import component_identity
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class EnrichmentContext:
+    """Document-level context shared by every chunk during enrichment."""
+
+    document_summary: str
+    page_summaries: dict[int, str | None]
+    section_headings: dict[int, str | None]
+
+
 class EnrichmentService:
     """Adds lightweight metadata such as titles and summaries to chunks."""
 
@@ -25,6 +37,13 @@ class EnrichmentService:
         self.summary_generator = summary_generator
         self.use_llm_summarization = use_llm_summarization
 
+    def config_fingerprint(self) -> dict[str, object]:
+        """Configuration that determines enrichment output, used for incremental re-runs."""
+        return {
+            "use_llm_summarization": self.use_llm_summarization,
+            "summary_generator": component_identity(self.summary_generator),
+        }
+
     def _simulate_latency(self) -> None:
         if self.latency > 0:
             time.sleep(self.latency)
@@ -39,6 +58,53 @@ class EnrichmentService:
             self.use_llm_summarization,
         )
         
+        context = self.build_context(document)
+        in_place = owns(document)
+        updated_pages = [
+            self.enrich_page(page, document.filename, context, in_place=in_place) for page in document.pages
+        ]
+        document_summary = context.document_summary
+        total_chunks_enriched = sum(len(page.chunks) for page in updated_pages)
+        
+        if in_place:
+            updated_document = document
+            updated_document.pages = updated_pages
+            updated_document.summary = document_summary
+            updated_document.status = "enriched"
+        else:
+            updated_document = document.model_copy(
+                update={
+                    "pages": updated_pages,
+                    "summary": document_summary,  # Now a real LLM-generated summary
+                    "status": "enriched",
+                }
+            )
+        
+        logger.info(
+            "✅ Enrichment complete: %d chunks enriched with contextualized text",
+            total_chunks_enriched,
+        )
+        
+        self.record_enriched(updated_document.id, updated_pages, document_summary)
+        return updated_document
+
+    def record_enriched(self, document_id: str, pages: Sequence[Page], document_summary: str | None) -> None:
+        """Record the enrichment stage event; the streaming page pipeline calls it once every page is enriched."""
+        self.observability.record_event(
+            stage="enrichment",
+            details={
+                "document_id": document_id,
+                "chunk_count": sum(len(page.chunks) for page in pages),
+                "has_document_summary": bool(document_summary),
+            },
+        )
+
+    def build_context(self, document: Document) -> EnrichmentContext:
+        """Compute the document-wide context every chunk is enriched with.
+
+        Needs every page parsed (and cleaned, for the summary fallback), so it is
+        the one barrier the streaming page pipeline keeps before enrichment.
+        """
         # FIRST: Generate document-level summary
         document_summary = self._generate_document_summary(document)
         
@@ -56,56 +122,39 @@ class EnrichmentService:
         
         # Extract section headings for context
         section_headings = self._extract_section_headings(document)
-        
-        summaries: list[str] = []
-        updated_pages = []
-        total_chunks_enriched = 0
-        
-        for page in document.pages:
-            page_summary = page_summaries.get(page.page_number)
-            section_heading = section_headings.get(page.page_number)
-            
-            updated_chunks = []
-            for chunk in page.chunks:
-                # Enrich chunk with hierarchical context
-                enriched_chunk = self._enrich_chunk_with_context(
-                    chunk=chunk,
-                    document_title=document.filename,
-                    document_summary=document_summary,
-                    page_summary=page_summary,
-                    section_heading=section_heading,
-                )
-                updated_chunks.append(enriched_chunk)
-                total_chunks_enriched += 1
-                
-                if enriched_chunk.metadata and enriched_chunk.metadata.summary:
-                    summaries.append(enriched_chunk.metadata.summary)
-            
-            updated_page = page.model_copy(update={"chunks": updated_chunks})
-            updated_pages.append(updated_page)
-        
-        updated_document = document.model_copy(
-            update={
-                "pages": updated_pages,
-                "summary": document_summary,  # Now a real LLM-generated summary
-                "status": "enriched",
-            }
-        )
-        
-        logger.info(
-            "✅ Enrichment complete: %d chunks enriched with contextualized text",
-            total_chunks_enriched,
+        return EnrichmentContext(
+            document_summary=document_summary,
+            page_summaries=page_summaries,
+            section_headings=section_headings,
         )
-        
-        self.observability.record_event(
-            stage="enrichment",
-            details={
-                "document_id": updated_document.id,
-                "chunk_count": total_chunks_enriched,
-                "has_document_summary": bool(document_summary),
-            },
-        )
-        return updated_document
+
+    def enrich_page(
+        self,
+        page: Page,
+        document_title: str,
+        context: EnrichmentContext,
+        in_place: bool = False,
+    ) -> Page:
+        """Enrich every chunk on a page with the hierarchical document context.
+
+        With ``in_place`` the page and its chunks are updated rather than copied;
+        only pass it for pages of a document the caller owns.
+        """
+        updated_chunks = [
+            self._enrich_chunk_with_context(
+                chunk=chunk,
+                document_title=document_title,
+                document_summary=context.document_summary,
+                page_summary=context.page_summaries.get(page.page_number),
+                section_heading=context.section_headings.get(page.page_number),
+                in_place=in_place,
+            )
+            for chunk in page.chunks
+        ]
+        if in_place:
+            page.chunks = updated_chunks
+            return page
+        return page.model_copy(update={"chunks": updated_chunks})
 
     def _summarize_chunk(self, text: str) -> str:
         if not text:
@@ -183,6 +232,7 @@ class EnrichmentService:
         document_summary: str,
         page_summary: str | None,
         section_heading: str | None,
+        in_place: bool = False,
     ) -> Any:
         """Enrich chunk with summaries and generate contextualized text."""
         from ..domain.models import Chunk, Metadata
@@ -225,7 +275,14 @@ class EnrichmentService:
         contextualized_text = f"[{context_prefix}]\n\n{chunk.cleaned_text or chunk.text}"
         
         # Update metadata
-        if chunk.metadata:
+        if chunk.metadata and in_place:
+            updated_metadata = chunk.metadata
+            updated_metadata.summary = chunk_summary
+            updated_metadata.document_title = document_title
+            updated_metadata.document_summary = document_summary
+            updated_metadata.page_summary = page_summary
+            updated_metadata.section_heading = section_heading
+        elif chunk.metadata:
             updated_metadata = chunk.metadata.model_copy(update={
                 "summary": chunk_summary,
                 "document_title": document_title,
@@ -253,6 +310,10 @@ class EnrichmentService:
             updated_metadata.component_type or "text",
         )
         
+        if in_place:
+            chunk.metadata = updated_metadata
+            chunk.contextualized_text = contextualized_text
+            return chunk
         return chunk.model_copy(update={
             "metadata": updated_metadata,
             "contextualized_text": contextualized_text,
@@ -0,0 +1,27 @@
+"""Stage fingerprints used to skip unchanged stages on re-runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Mapping
+
+
+def component_identity(component: object | None) -> object:
+    """Return a component's ``cache_identity`` when it exposes one, else its class name."""
+    if component is None:
+        return None
+    return getattr(component, "cache_identity", None) or component.__class__.__name__
+
+
+def stage_fingerprint(stage: str, upstream: str | None, inputs: Mapping[str, Any]) -> str:
+    """Hash a stage's configuration chained to the fingerprint of the stage before it.
+
+    Chaining means any upstream change invalidates every downstream stage.
+    """
+    payload = json.dumps(
+        {"stage": stage, "upstream": upstream, "inputs": dict(inputs)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 import hashlib
 import time
+from typing import BinaryIO
 
 from ..application.interfaces import ObservabilityRecorder
 from ..domain.models import Document
@@ -26,6 +27,25 @@ class IngestionService:
         if self.latency > 0:
             time.sleep(self.latency)
 
+    def spool(self, document: Document, stream: BinaryIO) -> Document:
+        """Store an upload straight from ``stream`` instead of reading it into memory.
+
+        Records ``raw_file_path``, ``raw_file_checksum`` and ``size_bytes``; run
+        the pipeline without file bytes afterwards and ingestion keeps them
+        while later stages read (memory-map) the stored file.
+        """
+        if self.repository is None:
+            raise RuntimeError("No ingestion repository configured to spool uploads to")
+        stored = self.repository.store_stream(
+            document_id=document.id,
+            filename=document.filename,
+            stream=stream,
+        )
+        updated_metadata = document.metadata.copy()
+        updated_metadata["raw_file_path"] = stored.path
+        updated_metadata["raw_file_checksum"] = stored.sha256
+        return document.model_copy(update={"metadata": updated_metadata, "size_bytes": stored.size_bytes})
+
     def ingest(self, document: Document, file_bytes: bytes | None = None) -> Document:
         self._simulate_latency()
         updated_metadata = document.metadata.copy()
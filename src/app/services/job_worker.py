@@ -0,0 +1,122 @@
+"""Worker loop that drains the durable job queue."""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import traceback
+from typing import Callable, Mapping
+from uuid import uuid4
+
+from ..domain.job_models import QueuedJob
+from ..persistence.ports import JobQueue
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[QueuedJob], None]
+
+
+class JobWorker:
+    """Leases jobs from a ``JobQueue`` and runs them with the matching handler.
+
+    Any number of workers (threads, processes or hosts sharing the queue's
+    storage) can run side by side. While a handler runs, a heartbeat thread
+    keeps the lease alive; if the worker dies the lease expires and another
+    worker picks the job up. A handler that raises has its job requeued with
+    exponential backoff until the queue's attempt limit is reached. A job
+    whose lease expired on its last attempt never reaches a handler again;
+    its kind's ``expired_handlers`` entry is called instead, so whatever the
+    job was updating can be marked failed.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Mapping[str, JobHandler],
+        expired_handlers: Mapping[str, JobHandler] | None = None,
+        worker_id: str | None = None,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 20.0,
+        retry_base_delay: float = 5.0,
+        retry_max_delay: float = 300.0,
+    ) -> None:
+        self.queue = queue
+        self.handlers = dict(handlers)
+        self.expired_handlers = dict(expired_handlers or {})
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+
+    def run(self, stop: threading.Event | None = None, max_jobs: int | None = None) -> int:
+        """Process jobs until ``stop`` is set (or ``max_jobs`` ran); return how many ran."""
+        stop = stop or threading.Event()
+        processed = 0
+        logger.info("👷 Job worker %s started (kinds=%s)", self.worker_id, ", ".join(self.handlers))
+        while not stop.is_set() and (max_jobs is None or processed < max_jobs):
+            if self.run_once():
+                processed += 1
+            else:
+                stop.wait(self.poll_interval)
+        logger.info("👷 Job worker %s stopped after %d job(s)", self.worker_id, processed)
+        return processed
+
+    def run_once(self) -> bool:
+        """Lease and run a single job; False when none was available."""
+        job = self.queue.lease(self.worker_id, kinds=list(self.handlers), on_expired=self._lease_expired)
+        if job is None:
+            return False
+        logger.info(
+            "▶️ Running %s job %s (attempt %d/%d)", job.kind, job.id, job.attempts, job.max_attempts
+        )
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(job, finished),
+            name=f"job-heartbeat-{job.id[:8]}",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            self.handlers[job.kind](job)
+        except Exception as exc:
+            delay = self.retry_delay(job.attempts)
+            updated = self.queue.fail(
+                job.id,
+                self.worker_id,
+                f"{exc}\n{traceback.format_exc(limit=5)}",
+                retry_delay=delay,
+            )
+            if updated is not None and updated.status == "failed":
+                logger.error("❌ %s job %s failed after %d attempt(s): %s", job.kind, job.id, job.attempts, exc)
+            else:
+                logger.warning("🔁 %s job %s failed (%s); retrying in %.0fs", job.kind, job.id, exc, delay)
+        else:
+            self.queue.complete(job.id, self.worker_id)
+            logger.info("✅ Completed %s job %s", job.kind, job.id)
+        finally:
+            finished.set()
+            heartbeat.join()
+        return True
+
+    def retry_delay(self, attempts: int) -> float:
+        return min(self.retry_max_delay, self.retry_base_delay * 2 ** max(0, attempts - 1))
+
+    def _lease_expired(self, job: QueuedJob) -> None:
+        logger.error("❌ %s job %s failed: its lease expired on attempt %d", job.kind, job.id, job.attempts)
+        handler = self.expired_handlers.get(job.kind)
+        if handler is None:
+            return
+        try:
+            handler(job)
+        except Exception:
+            logger.exception("Expired-job handler for %s job %s failed", job.kind, job.id)
+
+    def _heartbeat(self, job: QueuedJob, finished: threading.Event) -> None:
+        while not finished.wait(self.heartbeat_interval):
+            if not self.queue.heartbeat(job.id, self.worker_id):
+                logger.warning("Lost the lease on %s job %s; another worker may pick it up", job.kind, job.id)
+                return
@@ -0,0 +1,226 @@
+"""Priority scheduling of LLM requests across interactive, batch and backfill work."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Literal, Mapping
+
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+LLMPriority = Literal["interactive", "batch", "backfill"]
+PRIORITY_CLASSES: tuple[LLMPriority, ...] = ("interactive", "batch", "backfill")
+DEFAULT_PRIORITY_WEIGHTS: dict[str, float] = {"interactive": 8.0, "batch": 2.0, "backfill": 1.0}
+
+# Work not started under llm_priority() (e.g. a script driving the services
+# directly) competes as batch work
+_current_priority: ContextVar[str] = ContextVar("llm_priority", default="batch")
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[None]:
+    """Tag LLM requests made in this context (and tasks/threads it starts) with ``priority``."""
+    if priority not in PRIORITY_CLASSES:
+        raise ValueError(f"Unknown LLM priority {priority!r}; expected one of {PRIORITY_CLASSES}")
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_llm_priority() -> str:
+    return _current_priority.get()
+
+
+@dataclass
+class _Ticket:
+    """One request waiting for its turn."""
+
+    priority: str
+    tokens: int
+    estimated_tokens: int
+    start_tag: float
+    finish_tag: float
+    grant: Callable[[], None]
+    enqueued_at: float = field(default_factory=time.monotonic)
+    cancelled: bool = False
+
+
+@dataclass
+class _ClassMetrics:
+    granted: int = 0
+    wait_ms_total: float = 0.0
+    max_wait_ms: float = 0.0
+
+
+class LLMScheduler:
+    """Orders LLM requests by priority class before they draw on the shared rate limit.
+
+    Requests are tagged with the priority of the context that made them (see
+    ``llm_priority``): dashboard and API uploads run as ``interactive``,
+    batch jobs as ``batch`` or ``backfill``. Each class has its own queue and
+    requests leave them by weighted fair queuing on their virtual finish
+    tags, so with the default weights an interactive request waits behind at
+    most one in-flight batch request rather than a whole 50-document batch,
+    while batch work still gets a share of the quota when both are busy.
+
+    A single dispatcher thread admits the chosen request through the
+    wrapped ``RateLimiter`` and then releases its caller, so the limiter's
+    request/token budget and 429 back-off apply unchanged. The scheduler
+    offers the limiter's interface (``acquire``, ``acquire_blocking``,
+    ``record_success``, ``record_throttle``) and can be handed to anything
+    that takes a rate limiter.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        weights: Mapping[str, float] | None = None,
+    ) -> None:
+        self.rate_limiter = rate_limiter
+        self.weights = {**DEFAULT_PRIORITY_WEIGHTS, **(weights or {})}
+        self._cond = threading.Condition()
+        self._queues: dict[str, deque[_Ticket]] = {priority: deque() for priority in PRIORITY_CLASSES}
+        self._last_finish = {priority: 0.0 for priority in PRIORITY_CLASSES}
+        self._virtual_time = 0.0
+        self._metrics = {priority: _ClassMetrics() for priority in PRIORITY_CLASSES}
+        self._dispatcher: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Queue depth and wait times per priority class."""
+        with self._cond:
+            stats: dict[str, dict[str, float]] = {}
+            for priority in PRIORITY_CLASSES:
+                metrics = self._metrics[priority]
+                stats[priority] = {
+                    "queue_depth": sum(1 for ticket in self._queues[priority] if not ticket.cancelled),
+                    "granted": metrics.granted,
+                    "avg_wait_ms": round(metrics.wait_ms_total / metrics.granted, 2) if metrics.granted else 0.0,
+                    "max_wait_ms": round(metrics.max_wait_ms, 2),
+                    "weight": self.weights[priority],
+                }
+            return stats
+
+    async def acquire(self, tokens: int = 1, estimated_tokens: int = 0) -> None:
+        """Wait (asynchronously) for this context's turn and rate-limit budget."""
+        loop = asyncio.get_running_loop()
+        granted: asyncio.Future[None] = loop.create_future()
+
+        def grant() -> None:
+            try:
+                loop.call_soon_threadsafe(_resolve, granted)
+            except RuntimeError:  # the caller's loop has already shut down
+                pass
+
+        ticket = self._enqueue(tokens, estimated_tokens, grant)
+        try:
+            await granted
+        except asyncio.CancelledError:
+            self._cancel(ticket)
+            raise
+
+    def acquire_blocking(self, tokens: int = 1, estimated_tokens: int = 0) -> None:
+        """Synchronous ``acquire`` for clients running in worker threads."""
+        granted = threading.Event()
+        self._enqueue(tokens, estimated_tokens, granted.set)
+        granted.wait()
+
+    def record_success(self) -> None:
+        self.rate_limiter.record_success()
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        self.rate_limiter.record_throttle(retry_after)
+
+    def close(self) -> None:
+        """Admit whatever is still queued, then stop the dispatcher."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            dispatcher = self._dispatcher
+        if dispatcher is not None:
+            dispatcher.join()
+
+    async def __aenter__(self) -> LLMScheduler:
+        await self.acquire(1)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+    def _enqueue(self, tokens: int, estimated_tokens: int, grant: Callable[[], None]) -> _Ticket:
+        priority = current_llm_priority()
+        # Cost in the units the limiter is tightest on: provider tokens when
+        # the caller estimated them, requests otherwise
+        cost = max(1, estimated_tokens or tokens)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("LLMScheduler is closed")
+            start_tag = max(self._virtual_time, self._last_finish[priority])
+            finish_tag = start_tag + cost / self.weights[priority]
+            self._last_finish[priority] = finish_tag
+            ticket = _Ticket(priority, tokens, estimated_tokens, start_tag, finish_tag, grant)
+            self._queues[priority].append(ticket)
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch,
+                    name="llm-scheduler",
+                    daemon=True,
+                )
+                self._dispatcher.start()
+            self._cond.notify()
+        return ticket
+
+    def _cancel(self, ticket: _Ticket) -> None:
+        with self._cond:
+            ticket.cancelled = True
+
+    def _next_ticket(self) -> _Ticket | None:
+        """Pop the queued request with the smallest finish tag (caller holds the lock)."""
+        while True:
+            for queue in self._queues.values():
+                while queue and queue[0].cancelled:
+                    queue.popleft()
+            heads = [queue[0] for queue in self._queues.values() if queue]
+            if heads:
+                ticket = min(heads, key=lambda head: head.finish_tag)
+                self._queues[ticket.priority].popleft()
+                self._virtual_time = max(self._virtual_time, ticket.start_tag)
+                return ticket
+            if self._closed:
+                return None
+            self._cond.wait()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._cond:
+                ticket = self._next_ticket()
+            if ticket is None:
+                return
+            # Serial on purpose: the next request is chosen only once budget
+            # is available, so late interactive arrivals can still jump ahead
+            self.rate_limiter.acquire_blocking(ticket.tokens, ticket.estimated_tokens)
+            waited_ms = (time.monotonic() - ticket.enqueued_at) * 1000
+            with self._cond:
+                metrics = self._metrics[ticket.priority]
+                metrics.granted += 1
+                metrics.wait_ms_total += waited_ms
+                metrics.max_wait_ms = max(metrics.max_wait_ms, waited_ms)
+            if waited_ms > 5000:
+                logger.debug("%s LLM request waited %.0fms for its turn", ticket.priority, waited_ms)
+            ticket.grant()
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -136,15 +136,13 @@ class ParallelPageProcessor:
                 pixmap_info = pixmap_map.get(page.page_number)
                 pixmap_path = str(pixmap_info.path) if pixmap_info else None
 
-                # Run the structured parser (blocking call)
-                loop = asyncio.get_event_loop()
-                parsed_page, latency = await loop.run_in_executor(
-                    None,
-                    self.parsing._run_structured_parser,
-                    document.id,
-                    page.page_number,
-                    "" if pixmap_info else page.text,  # Empty text when using vision
-                    pixmap_path,
+                # Run the structured parser over the LLM's native async calls
+                parsed_page, latency = await self.parsing._arun_structured_parser(
+                    document_id=document.id,
+                    page_number=page.page_number,
+                    raw_text="" if pixmap_info else page.text,  # Empty text when using vision
+                    pixmap_path=pixmap_path,
+                    file_checksum=document.metadata.get("raw_file_checksum"),
                 )
 
                 # Update page metadata with parsed info
@@ -220,12 +218,10 @@ class ParallelPageProcessor:
                     await self.rate_limiter.acquire(1)
 
                 # Run the cleaning operation (blocking call)
-                loop = asyncio.get_event_loop()
                 
                 # Apply normalizer to page text
                 raw_text = page.text or ""
-                cleaned_text = await loop.run_in_executor(
-                    None,
+                cleaned_text = await asyncio.to_thread(
                     self.cleaning.normalizer,
                     raw_text,
                 )
@@ -243,9 +239,7 @@ class ParallelPageProcessor:
                             str(page.page_number)
                         )
                         
-                        cleaned_segments = await loop.run_in_executor(
-                            None,
-                            self.cleaning._run_structured_cleaner,
+                        cleaned_segments = await self.cleaning._arun_structured_cleaner(
                             parsed_page,
                             pixmap_path,
                         )
@@ -1,19 +1,54 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
 import time
 from time import perf_counter
-from typing import Sequence
+from typing import Iterator, Sequence
 import logging
 
-from ..application.interfaces import DocumentParser, ObservabilityRecorder, ParsingLLM
+from ..application.interfaces import DocumentParser, ObservabilityRecorder, ParsedPageCache, ParsingLLM
 from ..parsing.schemas import ParsedPage
 from ..domain.models import Document, Page
+from ..parsing.mapped_file import MappedFile
+from ..parsing.pdf_backend import share_pdf
+from ..parsing.page_triage import PageLayout, PageTriage
+from ..parsing.pixmap_encoding import PixmapEncoding
 from ..parsing.pixmap_factory import PixmapFactory, PixmapGenerationError, PixmapInfo
+from ..parsing.pixmap_store import PixmapStore
+from .fingerprint import component_identity
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ParsePlan:
+    """Page texts and pixmaps extracted up front so pages can be parsed independently."""
+
+    parser_name: str
+    page_texts: list[str]
+    pixmap_map: dict[int, PixmapInfo]
+    file_checksum: str | None
+    page_layouts: dict[int, PageLayout] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PageParseResult:
+    """Outcome of parsing a single page."""
+
+    page: Page
+    parsed_page: ParsedPage | None = None
+    pixmap: PixmapInfo | None = None
+    pixmap_skipped: int = 0
+    latency_ms: float | None = None
+    cache_hit: bool = False
+    triaged: bool = False
+
+
 class ParsingService:
     """Converts an ingested document into a structured set of pages."""
 
@@ -32,6 +67,10 @@ class ParsingService:
         pixmap_max_height: int | None = None,
         pixmap_resize_quality: str = "LANCZOS",
         pixmap_generator: PixmapFactory | None = None,
+        parse_cache: ParsedPageCache | None = None,
+        pixmap_store: PixmapStore | None = None,
+        pixmap_encoding: PixmapEncoding | None = None,
+        page_triage: PageTriage | None = None,
     ) -> None:
         self.observability = observability
         self.latency = latency
@@ -42,6 +81,9 @@ class ParsingService:
         self.pixmap_dpi = pixmap_dpi
         self.max_pixmap_bytes = max_pixmap_bytes
         self.pixmap_generator = pixmap_generator
+        self.parse_cache = parse_cache
+        self.pixmap_store = pixmap_store
+        self.page_triage = page_triage
         if self.include_images and self.pixmap_generator is None:
             self.pixmap_generator = PixmapFactory(
                 self.pixmap_dir,
@@ -49,8 +91,22 @@ class ParsingService:
                 max_width=pixmap_max_width,
                 max_height=pixmap_max_height,
                 resize_quality=pixmap_resize_quality,
+                pixmap_store=pixmap_store,
+                encoding=pixmap_encoding,
             )
 
+    def config_fingerprint(self) -> dict[str, object]:
+        """Configuration that determines parsing output, used for incremental re-runs."""
+        return {
+            "parsers": [parser.__class__.__name__ for parser in self.parsers],
+            "structured_parser": component_identity(self.structured_parser),
+            "include_images": self.include_images,
+            "pixmap_dpi": self.pixmap_dpi,
+            "max_pixmap_bytes": self.max_pixmap_bytes,
+            "pixmap_generator": component_identity(self.pixmap_generator),
+            "page_triage": component_identity(self.page_triage),
+        }
+
     def _simulate_latency(self) -> None:
         if self.latency > 0:
             time.sleep(self.latency)
@@ -60,79 +116,227 @@ class ParsingService:
         if document.pages:
             return document
 
+        plan = self.prepare_pages(document, file_bytes)
+        results = [
+            self.parse_page(document.id, plan, page_number, text)
+            for page_number, text in enumerate(plan.page_texts, start=1)
+        ]
+        return self.assemble_parsed_document(document, plan, results)
+
+    def prepare_pages(
+        self,
+        document: Document,
+        file_bytes: bytes | None = None,
+        pixmap_map: dict[int, PixmapInfo] | None = None,
+    ) -> ParsePlan:
+        """Extract page texts and pixmaps so pages can be parsed independently.
+
+        ``pixmap_map`` lets callers supply pixmaps rendered elsewhere (e.g. by the
+        parallel pixmap factory); when omitted, pixmaps are rendered here.
+        """
+        payload = file_bytes or self.open_raw_file(document)
+        if payload and document.file_type.lower() == "pdf":
+            # Text extraction, pixmap rendering and triage share one open document
+            with share_pdf(payload):
+                return self._prepare_pages(document, payload, pixmap_map)
+        return self._prepare_pages(document, payload, pixmap_map)
+
+    def _prepare_pages(
+        self,
+        document: Document,
+        payload: bytes | None,
+        pixmap_map: dict[int, PixmapInfo] | None,
+    ) -> ParsePlan:
         parser = self._resolve_parser(document.file_type)
-        payload = file_bytes or self._load_raw_file(document)
-        pages_added = 0
+        if pixmap_map is None:
+            pixmap_map = self._render_pixmaps(document.id, payload, document.file_type)
+        page_texts: list[str] = []
+        if parser and payload:
+            page_texts = list(parser.parse(self._parser_payload(parser, payload), document.filename))
+        if not page_texts:
+            page_texts = [self._placeholder_text(document)]
+        return ParsePlan(
+            parser_name=parser.__class__.__name__ if parser else "placeholder",
+            page_texts=page_texts,
+            pixmap_map=pixmap_map,
+            file_checksum=self._file_checksum(document, payload),
+            page_layouts=self._analyze_layouts(document, payload),
+        )
+
+    def stream_pages(
+        self,
+        document: Document,
+        file_bytes: bytes | None = None,
+        pixmap_map: dict[int, PixmapInfo] | None = None,
+    ) -> tuple[ParsePlan, Iterator[tuple[int, str]]]:
+        """Like ``prepare_pages``, but page texts arrive as they are extracted.
+
+        Returns the plan and an iterator of ``(page_number, text)`` pairs. The
+        plan's ``page_texts`` grows as the iterator is consumed, so it is only
+        complete once the iterator is exhausted. Parsers without ``iter_pages``
+        are extracted in full up front.
+        """
+        payload = file_bytes or self.open_raw_file(document)
+        parser = self._resolve_parser(document.file_type)
+        iter_pages = getattr(parser, "iter_pages", None) if payload else None
+        if iter_pages is None:
+            plan = self.prepare_pages(document, payload, pixmap_map)
+            return plan, enumerate(plan.page_texts, start=1)
+
+        with share_pdf(payload) if document.file_type.lower() == "pdf" else nullcontext():
+            if pixmap_map is None:
+                pixmap_map = self._render_pixmaps(document.id, payload, document.file_type)
+            plan = ParsePlan(
+                parser_name=parser.__class__.__name__,
+                page_texts=[],
+                pixmap_map=pixmap_map,
+                file_checksum=self._file_checksum(document, payload),
+                page_layouts=self._analyze_layouts(document, payload),
+            )
+        return plan, self._stream_page_texts(document, plan, iter_pages(self._parser_payload(parser, payload), document.filename))
+
+    def _stream_page_texts(
+        self,
+        document: Document,
+        plan: ParsePlan,
+        texts: Iterator[str],
+    ) -> Iterator[tuple[int, str]]:
+        for text in texts:
+            plan.page_texts.append(text)
+            yield len(plan.page_texts), text
+        if not plan.page_texts:
+            plan.page_texts.append(self._placeholder_text(document))
+            yield 1, plan.page_texts[0]
+
+    def _placeholder_text(self, document: Document) -> str:
+        return (
+            f"Parsed placeholder text for {document.filename}. "
+            f"Approximate size: {document.size_bytes} bytes."
+        )
+
+    def _file_checksum(self, document: Document, payload: bytes | None) -> str | None:
+        return document.metadata.get("raw_file_checksum") or (
+            hashlib.sha256(payload).hexdigest() if payload else None
+        )
+
+    def _analyze_layouts(self, document: Document, payload: bytes | None) -> dict[int, PageLayout]:
+        if self.page_triage and self.structured_parser and payload and document.file_type.lower() == "pdf":
+            return self.page_triage.analyze(payload)
+        return {}
+
+    def needs_structured_parser(self, plan: ParsePlan, page_number: int) -> bool:
+        """Whether a page goes to the structured (LLM) parser rather than the local text-layer builder."""
+        if not self.structured_parser:
+            return False
+        layout = plan.page_layouts.get(page_number)
+        return not (self.page_triage and layout and self.page_triage.is_simple(layout))
+
+    def parse_page(self, document_id: str, plan: ParsePlan, page_number: int, text: str) -> PageParseResult:
+        """Build a page and, when a structured parser is configured, its parsed layout."""
+        page = Page(document_id=document_id, page_number=page_number, text=text)
+        if not self.structured_parser:
+            return PageParseResult(page=page)
+        pixmap_info, skipped = self._pixmap_for_page(plan.pixmap_map, page_number)
+        if not self.needs_structured_parser(plan, page_number):
+            assert self.page_triage  # for mypy
+            parsed_page = self.page_triage.build_parsed_page(document_id, plan.page_layouts[page_number])
+            if pixmap_info:
+                # Still attached so vision cleaning can look at the page
+                parsed_page = parsed_page.model_copy(
+                    update={
+                        "pixmap_path": str(pixmap_info.path),
+                        "pixmap_size_bytes": pixmap_info.size_bytes,
+                    }
+                )
+            return PageParseResult(
+                page=page,
+                parsed_page=parsed_page,
+                pixmap=pixmap_info,
+                pixmap_skipped=skipped,
+                triaged=True,
+            )
+        # For image-only parsing, pass empty string for raw_text when pixmap is available
+        parsed_page, latency, cache_hit = self._parse_structured_page(
+            document_id=document_id,
+            page_number=page_number,
+            raw_text="" if pixmap_info else text,  # Empty string when using vision parsing
+            pixmap_path=str(pixmap_info.path) if pixmap_info else None,
+            file_checksum=plan.file_checksum,
+        )
+        return self._parse_result(page, parsed_page, pixmap_info, skipped, latency, cache_hit)
+
+    async def aparse_page(self, document_id: str, plan: ParsePlan, page_number: int, text: str) -> PageParseResult:
+        """``parse_page`` that awaits the structured parser's native async call instead of holding a thread."""
+        if not self.needs_structured_parser(plan, page_number):
+            return await asyncio.to_thread(self.parse_page, document_id, plan, page_number, text)
+        page = Page(document_id=document_id, page_number=page_number, text=text)
+        pixmap_info, skipped = self._pixmap_for_page(plan.pixmap_map, page_number)
+        parsed_page, latency, cache_hit = await self._aparse_structured_page(
+            document_id=document_id,
+            page_number=page_number,
+            raw_text="" if pixmap_info else text,
+            pixmap_path=str(pixmap_info.path) if pixmap_info else None,
+            file_checksum=plan.file_checksum,
+        )
+        return self._parse_result(page, parsed_page, pixmap_info, skipped, latency, cache_hit)
+
+    def _parse_result(
+        self,
+        page: Page,
+        parsed_page: ParsedPage,
+        pixmap_info: PixmapInfo | None,
+        skipped: int,
+        latency: float,
+        cache_hit: bool,
+    ) -> PageParseResult:
+        if pixmap_info:
+            parsed_page = parsed_page.model_copy(
+                update={
+                    "pixmap_path": str(pixmap_info.path),
+                    "pixmap_size_bytes": pixmap_info.size_bytes,
+                }
+            )
+        return PageParseResult(
+            page=page,
+            parsed_page=parsed_page,
+            pixmap=pixmap_info,
+            pixmap_skipped=skipped,
+            latency_ms=latency,
+            cache_hit=cache_hit,
+        )
+
+    def assemble_parsed_document(
+        self,
+        document: Document,
+        plan: ParsePlan,
+        results: Sequence[PageParseResult],
+    ) -> Document:
+        """Combine per-page parse results into the parsed document and record the stage."""
         updated_document = document
         parsed_pages_meta = document.metadata.get("parsed_pages", {}).copy()
         pixmap_assets_meta = document.metadata.get("pixmap_assets", {}).copy()
         pixmap_metrics = document.metadata.get("pixmap_metrics", {}).copy()
-        pixmap_map = self._render_pixmaps(document.id, payload, document.file_type)
         structured_latencies_ms: list[float] = []
+        parse_cache_hits = 0
+        triaged_pages = 0
         pixmap_total_bytes = 0
         pixmap_attached = 0
         pixmap_skipped = 0
 
-        if parser and payload:
-            page_texts = parser.parse(payload, document.filename)
-            for index, text in enumerate(page_texts, start=1):
-                updated_document = updated_document.add_page(Page(document_id=document.id, page_number=index, text=text))
-                pages_added += 1
-                if self.structured_parser:
-                    pixmap_info, skipped = self._pixmap_for_page(pixmap_map, index)
-                    if pixmap_info:
-                        pixmap_total_bytes += pixmap_info.size_bytes
-                        pixmap_attached += 1
-                        pixmap_assets_meta[str(index)] = str(pixmap_info.path)
-                    else:
-                        pixmap_skipped += skipped
-                    # For image-only parsing, pass empty string for raw_text when pixmap is available
-                    parsed_page, latency = self._run_structured_parser(
-                        document_id=document.id,
-                        page_number=index,
-                        raw_text="" if pixmap_info else text,  # Empty string when using vision parsing
-                        pixmap_path=str(pixmap_info.path) if pixmap_info else None,
-                    )
-                    if pixmap_info:
-                        parsed_page = parsed_page.model_copy(
-                            update={
-                                "pixmap_path": str(pixmap_info.path),
-                                "pixmap_size_bytes": pixmap_info.size_bytes,
-                            }
-                        )
-                    structured_latencies_ms.append(latency)
-                    parsed_pages_meta[str(index)] = parsed_page.model_dump()
-
-        if pages_added == 0:
-            placeholder_text = (
-                f"Parsed placeholder text for {document.filename}. "
-                f"Approximate size: {document.size_bytes} bytes."
-            )
-            updated_document = updated_document.add_page(Page(document_id=document.id, page_number=1, text=placeholder_text))
-            if self.structured_parser:
-                pixmap_info, skipped = self._pixmap_for_page(pixmap_map, 1)
-                if pixmap_info:
-                    pixmap_total_bytes += pixmap_info.size_bytes
-                    pixmap_attached += 1
-                    pixmap_assets_meta["1"] = str(pixmap_info.path)
-                else:
-                    pixmap_skipped += skipped
-                # For image-only parsing, pass empty string for raw_text when pixmap is available
-                parsed_page, latency = self._run_structured_parser(
-                    document_id=document.id,
-                    page_number=1,
-                    raw_text="" if pixmap_info else placeholder_text,  # Empty string when using vision parsing
-                    pixmap_path=str(pixmap_info.path) if pixmap_info else None,
-                )
-                if pixmap_info:
-                    parsed_page = parsed_page.model_copy(
-                        update={
-                            "pixmap_path": str(pixmap_info.path),
-                            "pixmap_size_bytes": pixmap_info.size_bytes,
-                        }
-                    )
-                structured_latencies_ms.append(latency)
-                parsed_pages_meta["1"] = parsed_page.model_dump()
+        for result in sorted(results, key=lambda item: item.page.page_number):
+            page_number = result.page.page_number
+            updated_document = updated_document.add_page(result.page)
+            if result.pixmap:
+                pixmap_total_bytes += result.pixmap.size_bytes
+                pixmap_attached += 1
+                pixmap_assets_meta[str(page_number)] = str(result.pixmap.path)
+            pixmap_skipped += result.pixmap_skipped
+            parse_cache_hits += int(result.cache_hit)
+            triaged_pages += int(result.triaged)
+            if result.latency_ms is not None:
+                structured_latencies_ms.append(result.latency_ms)
+            if result.parsed_page is not None:
+                parsed_pages_meta[str(page_number)] = result.parsed_page.model_dump()
 
         updated_metadata = document.metadata.copy()
         if parsed_pages_meta:
@@ -171,17 +375,37 @@ class ParsingService:
             if structured_latencies_ms
             else None
         )
+        generated = list(plan.pixmap_map.values())
+        render_dpis = [info.dpi for info in generated if info.dpi is not None]
         pixmap_metrics.update(
             {
-                "generated": len(pixmap_map),
+                "generated": len(plan.pixmap_map),
                 "attached": pixmap_attached,
                 "skipped": pixmap_skipped,
                 "total_size_bytes": pixmap_total_bytes,
                 "dpi": self.pixmap_dpi if self.include_images else None,
                 "avg_structured_latency_ms": avg_latency,
                 "parsing_failures_count": len(parsing_failures),  # NEW: Add failure count to metrics
+                "parse_cache_hits": parse_cache_hits,
+                "vision_skipped_pages": triaged_pages,
+                "formats": dict(Counter(info.mimetype for info in generated)),
+                "bytes_saved": sum(info.bytes_saved for info in generated),
+                "avg_render_dpi": round(sum(render_dpis) / len(render_dpis), 1) if render_dpis else None,
             }
         )
+        if parse_cache_hits:
+            logger.info(
+                "♻️ Reused %d cached parsed page(s) for doc=%s",
+                parse_cache_hits,
+                document.id,
+            )
+        if triaged_pages:
+            logger.info(
+                "⚡ Parsed %d/%d simple page(s) from the text layer without the LLM for doc=%s",
+                triaged_pages,
+                len(results),
+                document.id,
+            )
         if pixmap_metrics:
             updated_metadata["pixmap_metrics"] = pixmap_metrics
 
@@ -192,7 +416,7 @@ class ParsingService:
             details={
                 "document_id": updated_document.id,
                 "page_count": len(updated_document.pages),
-                "parser_used": parser.__class__.__name__ if parser else "placeholder",
+                "parser_used": plan.parser_name,
                 "pixmap": pixmap_metrics,
                 "parsing_failures_count": len(parsing_failures),  # NEW: Include in observability
             },
@@ -206,13 +430,21 @@ class ParsingService:
                 return parser
         return None
 
-    def _load_raw_file(self, document: Document) -> bytes | None:
+    @staticmethod
+    def _parser_payload(parser: DocumentParser, payload: bytes | None) -> bytes | None:
+        """Parsers that do not declare ``accepts_mapped_files`` get a plain bytes copy."""
+        if isinstance(payload, MappedFile) and not getattr(parser, "accepts_mapped_files", False):
+            return payload[:]
+        return payload
+
+    def open_raw_file(self, document: Document) -> MappedFile | None:
+        """Memory-map the stored upload, or None when there is none to read."""
         path_value = document.metadata.get("raw_file_path")
         if not path_value:
             return None
         try:
-            return Path(path_value).read_bytes()
-        except OSError:
+            return MappedFile.open(path_value)
+        except (OSError, ValueError):
             return None
 
     def _run_structured_parser(
@@ -222,9 +454,54 @@ class ParsingService:
         page_number: int,
         raw_text: str,
         pixmap_path: str | None = None,
+        file_checksum: str | None = None,
     ) -> tuple[ParsedPage, float]:
+        parsed_page, duration_ms, _ = self._parse_structured_page(
+            document_id=document_id,
+            page_number=page_number,
+            raw_text=raw_text,
+            pixmap_path=pixmap_path,
+            file_checksum=file_checksum,
+        )
+        return parsed_page, duration_ms
+
+    async def _arun_structured_parser(
+        self,
+        *,
+        document_id: str,
+        page_number: int,
+        raw_text: str,
+        pixmap_path: str | None = None,
+        file_checksum: str | None = None,
+    ) -> tuple[ParsedPage, float]:
+        parsed_page, duration_ms, _ = await self._aparse_structured_page(
+            document_id=document_id,
+            page_number=page_number,
+            raw_text=raw_text,
+            pixmap_path=pixmap_path,
+            file_checksum=file_checksum,
+        )
+        return parsed_page, duration_ms
+
+    def _parse_structured_page(
+        self,
+        *,
+        document_id: str,
+        page_number: int,
+        raw_text: str,
+        pixmap_path: str | None = None,
+        file_checksum: str | None = None,
+    ) -> tuple[ParsedPage, float, bool]:
+        """Parse a page through the structured parser, consulting the parse cache first.
+
+        Returns the parsed page, the elapsed time in milliseconds and whether
+        the result was served from the cache.
+        """
         assert self.structured_parser  # for mypy
         start = perf_counter()
+        cache_key, cached_page = self._cached_parse(document_id, page_number, raw_text, pixmap_path, file_checksum)
+        if cached_page is not None:
+            return cached_page, (perf_counter() - start) * 1000, True
         parsed_page = self.structured_parser.parse_page(
             document_id=document_id,
             page_number=page_number,
@@ -232,13 +509,121 @@ class ParsingService:
             pixmap_path=pixmap_path,
         )
         duration_ms = (perf_counter() - start) * 1000
+        return self._store_parse(cache_key, parsed_page, pixmap_path), duration_ms, False
+
+    async def _aparse_structured_page(
+        self,
+        *,
+        document_id: str,
+        page_number: int,
+        raw_text: str,
+        pixmap_path: str | None = None,
+        file_checksum: str | None = None,
+    ) -> tuple[ParsedPage, float, bool]:
+        """``_parse_structured_page`` over the parser's ``aparse_page`` when it offers one.
+
+        Parsers without a native async call run in the default executor.
+        """
+        aparse_page = getattr(self.structured_parser, "aparse_page", None)
+        if aparse_page is None:
+            return await asyncio.to_thread(
+                self._parse_structured_page,
+                document_id=document_id,
+                page_number=page_number,
+                raw_text=raw_text,
+                pixmap_path=pixmap_path,
+                file_checksum=file_checksum,
+            )
+        start = perf_counter()
+        cache_key, cached_page = await asyncio.to_thread(
+            self._cached_parse, document_id, page_number, raw_text, pixmap_path, file_checksum
+        )
+        if cached_page is not None:
+            return cached_page, (perf_counter() - start) * 1000, True
+        parsed_page = await aparse_page(
+            document_id=document_id,
+            page_number=page_number,
+            raw_text=raw_text,
+            pixmap_path=pixmap_path,
+        )
+        duration_ms = (perf_counter() - start) * 1000
+        parsed_page = await asyncio.to_thread(self._store_parse, cache_key, parsed_page, pixmap_path)
+        return parsed_page, duration_ms, False
+
+    def _cached_parse(
+        self,
+        document_id: str,
+        page_number: int,
+        raw_text: str,
+        pixmap_path: str | None,
+        file_checksum: str | None,
+    ) -> tuple[dict[str, object] | None, ParsedPage | None]:
+        """The page's parse cache key and its cached parse, if any."""
+        cache_key = self._parse_cache_key(
+            file_checksum=file_checksum,
+            page_number=page_number,
+            raw_text=raw_text,
+            pixmap_path=pixmap_path,
+        )
+        if cache_key is None:
+            return None, None
+        cached_page = self.parse_cache.get(cache_key)
+        if cached_page is None:
+            return cache_key, None
+        return cache_key, cached_page.model_copy(update={"document_id": document_id, "pixmap_path": pixmap_path})
+
+    def _store_parse(
+        self, cache_key: dict[str, object] | None, parsed_page: ParsedPage, pixmap_path: str | None
+    ) -> ParsedPage:
+        """Attach the pixmap to a fresh parse and cache it when it succeeded."""
         parsed_page = parsed_page.model_copy(
             update={
                 "pixmap_path": getattr(parsed_page, "pixmap_path", None) or pixmap_path,
                 "pixmap_size_bytes": getattr(parsed_page, "pixmap_size_bytes", None),
             }
         )
-        return parsed_page, duration_ms
+        if cache_key is not None and parsed_page.parsing_status == "success":
+            self.parse_cache.put(cache_key, parsed_page)
+        return parsed_page
+
+    def _parse_cache_key(
+        self,
+        *,
+        file_checksum: str | None,
+        page_number: int,
+        raw_text: str,
+        pixmap_path: str | None,
+    ) -> dict[str, object] | None:
+        """Build the content address for a page, or None when caching does not apply.
+
+        Parsers that do not expose a ``cache_identity`` (prompt hash + model) are
+        never cached, since their output cannot be tied to a stable configuration.
+        """
+        if self.parse_cache is None or not file_checksum:
+            return None
+        identity = getattr(self.structured_parser, "cache_identity", None)
+        if not identity:
+            return None
+        pixmap_sha256 = None
+        if pixmap_path:
+            pixmap_sha256 = self._pixmap_sha256(pixmap_path)
+            if pixmap_sha256 is None:
+                return None
+        return {
+            "file_checksum": file_checksum,
+            "page_number": page_number,
+            "pixmap_sha256": pixmap_sha256,
+            "raw_text_sha256": None if pixmap_path else hashlib.sha256(raw_text.encode("utf-8")).hexdigest(),
+            **identity,
+        }
+
+    def _pixmap_sha256(self, pixmap_path: str) -> str | None:
+        if self.pixmap_store is not None:
+            return self.pixmap_store.sha256(pixmap_path)
+        try:
+            return hashlib.sha256(Path(pixmap_path).read_bytes()).hexdigest()
+        except OSError:
+            return None
 
     def _render_pixmaps(self, document_id: str, payload: bytes | None, file_type: str) -> dict[int, PixmapInfo]:
         if not (self.include_images and payload and file_type.lower() == "pdf" and self.pixmap_generator):
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import mimetypes
 import os
 from datetime import datetime
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Mapping
 
 try:
     from langfuse.media import LangfuseMedia
@@ -18,7 +19,9 @@ from ..domain.models import Document
 from ..domain.run_models import PipelineResult, PipelineStage
 from .chunking_service import ChunkingService
 from .cleaning_service import CleaningService
+from .document_ownership import run_owned
 from .enrichment_service import EnrichmentService
+from .fingerprint import stage_fingerprint
 from .parsing_service import ParsingService
 from .ingestion_service import IngestionService
 from .vector_service import VectorService
@@ -40,6 +43,7 @@ class PipelineRunner:
         vectorization: VectorService,
         observability: ObservabilityRecorder,
         langfuse_handler: Any | None = None,
+        in_place_stages: bool = False,
     ) -> None:
         self.ingestion = ingestion
         self.parsing = parsing
@@ -49,6 +53,8 @@ class PipelineRunner:
         self.vectorization = vectorization
         self.observability = observability
         self.langfuse_handler = langfuse_handler
+        # Let stages update the run's own intermediate documents instead of copying them
+        self.in_place_stages = in_place_stages
         self.pixmap_preview_limit = max(0, DEFAULT_PIXMAP_PREVIEW_LIMIT)
 
     STAGE_SEQUENCE: Iterable[tuple[str, str]] = (
@@ -67,8 +73,21 @@ class PipelineRunner:
         run_id: str | None = None,
         file_bytes: bytes | None = None,
         progress_callback: Callable[[PipelineStage, Document], None] | None = None,
+        previous_snapshots: Mapping[str, Document] | None = None,
     ) -> PipelineResult:
+        """Run every stage in ``STAGE_SEQUENCE`` and return the final document.
+
+        Each stage stamps a fingerprint of its configuration (chained to the
+        upstream stage) into ``metadata["stage_fingerprints"]``. When
+        ``previous_snapshots`` maps a stage name to the document a prior run
+        produced after that stage, and the fingerprints match, the snapshot is
+        reused instead of executing the stage again.
+        """
         stages: list[PipelineStage] = []
+        reused_stages: set[str] = set()
+        upstream_fingerprint: str | None = None
+        # Whether the current document (and all it references) is private to this run
+        exclusive = False
         
         # Create Langfuse trace for this pipeline run if handler is available
         langfuse_trace = None
@@ -127,8 +146,46 @@ class PipelineRunner:
                 logger = logging.getLogger(__name__)
                 logger.warning("Failed to create Langfuse trace: %s", exc)
 
+        def run_stage(name: str, current: Document, operation: Callable[[Document], Document]) -> Document:
+            nonlocal upstream_fingerprint, exclusive
+            fingerprint = self._fingerprint_stage(name, current, upstream_fingerprint, file_bytes)
+            upstream_fingerprint = fingerprint
+            snapshot = (previous_snapshots or {}).get(name)
+            if (
+                fingerprint
+                and snapshot is not None
+                and snapshot.metadata.get("stage_fingerprints", {}).get(name) == fingerprint
+            ):
+                reused_stages.add(name)
+                # Later outputs may share objects with the caller's snapshot
+                exclusive = False
+                logging.getLogger(__name__).info(
+                    "♻️ Reusing %s output for doc=%s (inputs unchanged)", name, current.id
+                )
+                result = snapshot
+                if "langfuse_trace_id" in current.metadata:
+                    result = result.model_copy(
+                        update={"metadata": {**result.metadata, "langfuse_trace_id": current.metadata["langfuse_trace_id"]}}
+                    )
+                return result
+            owned = self.in_place_stages and exclusive
+            result = run_owned(operation, current) if owned else operation(current)
+            if fingerprint:
+                fingerprints = {**result.metadata.get("stage_fingerprints", {}), name: fingerprint}
+                if owned:
+                    result.metadata["stage_fingerprints"] = fingerprints
+                else:
+                    result = result.model_copy(
+                        update={"metadata": {**result.metadata, "stage_fingerprints": fingerprints}}
+                    )
+            # Ingestion's output still shares objects with the caller's document
+            exclusive = not reused_stages and name != "ingestion"
+            return result
+
         def register_stage(stage: PipelineStage) -> None:
             stage.completed_at = datetime.utcnow()
+            if stage.name in reused_stages:
+                stage.details["reused"] = True
             stages.append(stage)
             if progress_callback:
                 progress_callback(stage, document)
@@ -155,7 +212,7 @@ class PipelineRunner:
 
         stage_start = perf_counter()
         ingestion_span = create_langfuse_span("ingestion", {"filename": document.filename})
-        document = self.ingestion.ingest(document, file_bytes=file_bytes)
+        document = run_stage("ingestion", document, lambda doc: self.ingestion.ingest(doc, file_bytes=file_bytes))
         ingestion_duration = (perf_counter() - stage_start) * 1000
         end_langfuse_span(ingestion_span, {
             "status": document.status,
@@ -179,7 +236,7 @@ class PipelineRunner:
 
         stage_start = perf_counter()
         parsing_span = create_langfuse_span("parsing", {"page_count": len(document.pages)})
-        document = self.parsing.parse(document, file_bytes=file_bytes)
+        document = run_stage("parsing", document, lambda doc: self.parsing.parse(doc, file_bytes=file_bytes))
         pixmap_metrics = document.metadata.get("pixmap_metrics") if document.metadata else None
         parsed_pages_meta = document.metadata.get("parsed_pages", {})
         pixmap_previews = self._collect_pixmap_previews(document)
@@ -239,7 +296,7 @@ class PipelineRunner:
 
         stage_start = perf_counter()
         cleaning_span = create_langfuse_span("cleaning")
-        document = self.cleaning.clean(document)
+        document = run_stage("cleaning", document, self.cleaning.clean)
         cleaning_report = document.metadata.get("cleaning_report", [])
         cleaning_duration = (perf_counter() - stage_start) * 1000
         end_langfuse_span(cleaning_span, {
@@ -260,7 +317,7 @@ class PipelineRunner:
 
         stage_start = perf_counter()
         chunking_span = create_langfuse_span("chunking")
-        document = self.chunking.chunk(document)
+        document = run_stage("chunking", document, self.chunking.chunk)
         chunk_count = sum(len(page.chunks) for page in document.pages)
         chunking_duration = (perf_counter() - stage_start) * 1000
         end_langfuse_span(chunking_span, {"chunk_count": chunk_count})
@@ -295,7 +352,7 @@ class PipelineRunner:
 
         stage_start = perf_counter()
         enrichment_span = create_langfuse_span("enrichment")
-        document = self.enrichment.enrich(document)
+        document = run_stage("enrichment", document, self.enrichment.enrich)
         enrichment_duration = (perf_counter() - stage_start) * 1000
         end_langfuse_span(enrichment_span, {
             "document_summary": document.summary or "",
@@ -323,7 +380,7 @@ class PipelineRunner:
 
         stage_start = perf_counter()
         vectorization_span = create_langfuse_span("vectorization")
-        document = self.vectorization.vectorize(document)
+        document = run_stage("vectorization", document, self.vectorization.vectorize)
         vector_count = sum(len(page.chunks) for page in document.pages)
         vectorization_duration = (perf_counter() - stage_start) * 1000
         end_langfuse_span(vectorization_span, {
@@ -360,11 +417,43 @@ class PipelineRunner:
 
         self.observability.record_event(
             stage="pipeline_complete",
-            details={"document_id": document.id, "stages": [stage.name for stage in stages]},
+            details={
+                "document_id": document.id,
+                "stages": [stage.name for stage in stages],
+                "reused_stages": sorted(reused_stages),
+            },
             trace_id=trace_id,
         )
         return PipelineResult(document=document, stages=stages)
 
+    def _fingerprint_stage(
+        self,
+        name: str,
+        document: Document,
+        upstream: str | None,
+        file_bytes: bytes | None,
+    ) -> str | None:
+        """Return the stage fingerprint, or None when the inputs have no stable identity."""
+        if name == "ingestion":
+            checksum = (
+                hashlib.sha256(file_bytes).hexdigest()
+                if file_bytes
+                else document.metadata.get("raw_file_checksum")
+            )
+            if not checksum:
+                return None
+            return stage_fingerprint(name, None, {"file_checksum": checksum})
+        if upstream is None:
+            return None
+        services = {
+            "parsing": self.parsing,
+            "cleaning": self.cleaning,
+            "chunking": self.chunking,
+            "enrichment": self.enrichment,
+            "vectorization": self.vectorization,
+        }
+        return stage_fingerprint(name, upstream, services[name].config_fingerprint())
+
     def _collect_pixmap_previews(self, document: Document) -> list[dict[str, Any]]:
         """Return Langfuse media previews for the first few pixmaps."""
         if (
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
 from typing import Optional
 
@@ -11,89 +12,177 @@ logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
-    """Token bucket rate limiter for controlling API request rates.
-    
-    Implements the token bucket algorithm to limit requests per minute.
-    Supports async/await for non-blocking rate limiting in concurrent contexts.
-    
+    """Adaptive rate limiter budgeting requests and provider tokens per minute.
+
+    Two token buckets are kept: one for requests and, when
+    ``tokens_per_minute`` is set, one for estimated provider tokens (a 300-DPI
+    vision page costs far more than a chunk summary). An acquire reserves from
+    both and waits until the reservation is covered, so concurrent callers
+    are served in arrival order.
+
+    The refill rates adapt AIMD-style to provider feedback: every
+    ``record_throttle`` (a 429) multiplies them by ``decrease_factor`` and
+    pauses all callers for the provider's Retry-After; every
+    ``record_success`` adds back ``increase_fraction`` of the configured
+    rate. Rates never drop below ``min_rate_fraction`` of the configuration.
+
+    One instance is shared by every LLM-backed client. State is guarded by a
+    thread lock, so async callers (``acquire``) and worker threads
+    (``acquire_blocking``) draw from the same budget.
+
     Example:
-        >>> limiter = RateLimiter(requests_per_minute=60)
-        >>> await limiter.acquire(tokens=1)  # Waits if rate limit would be exceeded
-        >>> # Make API call here
+        >>> limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=150_000)
+        >>> await limiter.acquire(1, estimated_tokens=1_200)  # Waits if over budget
+        >>> # Make API call here, then report the outcome
+        >>> limiter.record_success()
     """
 
-    def __init__(self, requests_per_minute: int, burst_size: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        requests_per_minute: int,
+        burst_size: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        token_burst_size: Optional[int] = None,
+        min_rate_fraction: float = 0.1,
+        decrease_factor: float = 0.5,
+        increase_fraction: float = 0.05,
+    ) -> None:
         """Initialize the rate limiter.
-        
+
         Args:
             requests_per_minute: Maximum number of requests allowed per minute
             burst_size: Maximum burst capacity (defaults to requests_per_minute)
+            tokens_per_minute: Provider token budget per minute (None = requests only)
+            token_burst_size: Token burst capacity (defaults to tokens_per_minute)
+            min_rate_fraction: Floor for the adaptive rate, as a fraction of the configured rate
+            decrease_factor: Rate multiplier applied on every throttle response
+            increase_fraction: Fraction of the configured rate restored per success
         """
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size or requests_per_minute
         self.tokens = float(self.burst_size)
+        self.tokens_per_minute = tokens_per_minute
+        self.token_burst_size = token_burst_size or tokens_per_minute or 0
+        self.token_budget = float(self.token_burst_size)
+        self.min_rate_fraction = min_rate_fraction
+        self.decrease_factor = decrease_factor
+        self.increase_fraction = increase_fraction
+        self.rate_scale = 1.0
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
-        
-        # Calculate token refill rate (tokens per second)
-        self.refill_rate = requests_per_minute / 60.0
-
-    async def acquire(self, tokens: int = 1) -> None:
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "throttled": 0, "waited_ms": 0}
+
+    @property
+    def refill_rate(self) -> float:
+        """Current request refill rate in requests per second."""
+        return self.requests_per_minute / 60.0 * self.rate_scale
+
+    @property
+    def token_refill_rate(self) -> float:
+        """Current provider-token refill rate in tokens per second."""
+        return (self.tokens_per_minute or 0) / 60.0 * self.rate_scale
+
+    @property
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {**self._stats, "rate_scale": round(self.rate_scale, 3)}
+
+    async def acquire(self, tokens: int = 1, estimated_tokens: int = 0) -> None:
         """Acquire tokens, waiting if necessary to respect rate limit.
-        
+
         This method will block (asynchronously) until enough tokens are available.
-        
+
         Args:
-            tokens: Number of tokens to acquire (default 1)
+            tokens: Number of requests to acquire (default 1)
+            estimated_tokens: Provider tokens the request is expected to consume
         """
-        async with self._lock:
-            while True:
-                # Refill tokens based on elapsed time
-                now = time.monotonic()
-                elapsed = now - self.last_update
-                self.tokens = min(self.burst_size, self.tokens + elapsed * self.refill_rate)
-                self.last_update = now
-
-                # Check if we have enough tokens
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
-                    return
-
-                # Calculate wait time needed
-                tokens_needed = tokens - self.tokens
-                wait_time = tokens_needed / self.refill_rate
-
-                logger.debug(
-                    "Rate limit reached, waiting %.2fs for %d tokens",
-                    wait_time,
-                    tokens,
-                )
-
-                # Wait for tokens to refill (release lock while waiting)
-                # Use a small buffer to avoid timing precision issues
-                await asyncio.sleep(wait_time + 0.01)
-
-    def try_acquire(self, tokens: int = 1) -> bool:
+        wait_time = self._reserve(tokens, estimated_tokens)
+        if wait_time > 0:
+            logger.debug("Rate limit reached, waiting %.2fs for %d request(s)", wait_time, tokens)
+            await asyncio.sleep(wait_time)
+
+    def acquire_blocking(self, tokens: int = 1, estimated_tokens: int = 0) -> None:
+        """Synchronous ``acquire`` for clients running in worker threads."""
+        wait_time = self._reserve(tokens, estimated_tokens)
+        if wait_time > 0:
+            logger.debug("Rate limit reached, waiting %.2fs for %d request(s)", wait_time, tokens)
+            time.sleep(wait_time)
+
+    def try_acquire(self, tokens: int = 1, estimated_tokens: int = 0) -> bool:
         """Try to acquire tokens without waiting.
-        
+
         Args:
-            tokens: Number of tokens to acquire (default 1)
-            
+            tokens: Number of requests to acquire (default 1)
+            estimated_tokens: Provider tokens the request is expected to consume
+
         Returns:
             True if tokens were acquired, False if rate limit would be exceeded
         """
-        # Refill tokens based on elapsed time
-        now = time.monotonic()
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._paused_until or self.tokens < tokens:
+                return False
+            if self.tokens_per_minute and self.token_budget < estimated_tokens:
+                return False
+            self.tokens -= tokens
+            if self.tokens_per_minute:
+                self.token_budget -= estimated_tokens
+            self._stats["acquired"] += tokens
+            return True
+
+    def record_success(self) -> None:
+        """Additive increase: a request went through without being throttled."""
+        with self._lock:
+            if self.rate_scale < 1.0:
+                self._refill(time.monotonic())
+                self.rate_scale = min(1.0, self.rate_scale + self.increase_fraction)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease after a 429, pausing everyone for ``retry_after`` seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate_scale = max(self.min_rate_fraction, self.rate_scale * self.decrease_factor)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            self._stats["throttled"] += 1
+            scale = self.rate_scale
+        logger.warning(
+            "🚦 Provider throttled request; rate scaled to %.0f%% (retry after %ss)",
+            scale * 100,
+            retry_after if retry_after is not None else "-",
+        )
+
+    def _refill(self, now: float) -> None:
         elapsed = now - self.last_update
         self.tokens = min(self.burst_size, self.tokens + elapsed * self.refill_rate)
+        if self.tokens_per_minute:
+            self.token_budget = min(
+                self.token_burst_size,
+                self.token_budget + elapsed * self.token_refill_rate,
+            )
         self.last_update = now
 
-        # Check if we have enough tokens
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
+    def _reserve(self, tokens: int, estimated_tokens: int) -> float:
+        """Take ``tokens`` (and ``estimated_tokens``) now; return how long to wait for them.
 
-        return False
+        Buckets may go negative: the deficit is the queue of callers ahead,
+        and each new reservation waits for it to refill.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= tokens
+            wait_time = max(0.0, -self.tokens / self.refill_rate)
+            if self.tokens_per_minute and estimated_tokens:
+                self.token_budget -= estimated_tokens
+                wait_time = max(wait_time, -self.token_budget / self.token_refill_rate)
+            wait_time = max(wait_time, self._paused_until - now)
+            self._stats["acquired"] += tokens
+            self._stats["waited_ms"] += int(wait_time * 1000)
+            return wait_time
 
     async def __aenter__(self) -> RateLimiter:
         """Context manager entry - acquire one token."""
@@ -103,10 +192,3 @@ class RateLimiter:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit - no-op."""
         pass
-
-
-
-
-
-
-
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
 from uuid import uuid4
 
+from ..domain.job_models import QueuedJob
 from ..domain.models import Document
 from ..domain.run_models import PipelineResult, PipelineRunRecord, PipelineStage
-from ..persistence.ports import DocumentRepository, PipelineRunRepository
+from ..persistence.ports import DocumentRepository, IngestionRepository, JobQueue, PipelineRunRepository
 from ..application.interfaces import TaskScheduler
+from .llm_scheduler import llm_priority
 from .pipeline_runner import PipelineRunner
 
+PIPELINE_RUN_JOB = "pipeline_run"
+
 
 class PipelineRunManager:
     """Coordinates pipeline execution with persistence."""
@@ -18,10 +23,16 @@ class PipelineRunManager:
         repository: PipelineRunRepository,
         runner: PipelineRunner,
         document_repository: DocumentRepository | None = None,
+        keep_stage_snapshots: bool = False,
+        job_queue: JobQueue | None = None,
+        ingestion_repository: IngestionRepository | None = None,
     ) -> None:
         self.repository = repository
         self.runner = runner
         self.document_repository = document_repository
+        self.keep_stage_snapshots = keep_stage_snapshots
+        self.job_queue = job_queue
+        self.ingestion_repository = ingestion_repository
 
     def create_run(
         self,
@@ -50,18 +61,32 @@ class PipelineRunManager:
         document: Document,
         scheduler: TaskScheduler,
         file_bytes: bytes | None = None,
+        previous_run_id: str | None = None,
     ) -> None:
+        if self.job_queue is not None:
+            # Durable path: a worker process runs it, and it survives API restarts
+            self.enqueue_run(record, document, file_bytes=file_bytes, previous_run_id=previous_run_id)
+            return
+
         def progress_callback(stage: PipelineStage, updated_document: Document) -> None:
             self.repository.update_stage(record.id, stage, updated_document)
+            if self.keep_stage_snapshots:
+                self.repository.save_stage_snapshot(record.id, stage.name, updated_document)
 
         def task() -> None:
             try:
-                result = self.runner.run(
-                    document,
-                    file_bytes=file_bytes,
-                    progress_callback=progress_callback,
-                    run_id=record.id,
-                )
+                run_kwargs = {}
+                if previous_run_id:
+                    run_kwargs["previous_snapshots"] = self.repository.get_stage_snapshots(previous_run_id)
+                # Someone is watching this run in the dashboard
+                with llm_priority("interactive"):
+                    result = self.runner.run(
+                        document,
+                        file_bytes=file_bytes,
+                        progress_callback=progress_callback,
+                        run_id=record.id,
+                        **run_kwargs,
+                    )
                 self.repository.complete_run(record.id, result)
                 if self.document_repository:
                     self.document_repository.save(result.document)
@@ -70,8 +95,123 @@ class PipelineRunManager:
 
         scheduler.schedule(task)
 
+    def enqueue_run(
+        self,
+        record: PipelineRunRecord,
+        document: Document,
+        file_bytes: bytes | None = None,
+        previous_run_id: str | None = None,
+    ) -> QueuedJob:
+        """Hand a created run to the job queue for a ``JobWorker`` to execute.
+
+        The upload is stored through the ingestion repository first so that a
+        worker on another process can read it back.
+        """
+        if self.job_queue is None:
+            raise RuntimeError("No job queue configured")
+        raw_file_path = document.metadata.get("raw_file_path")
+        raw_file_checksum = document.metadata.get("raw_file_checksum")
+        if file_bytes and self.ingestion_repository:
+            raw_file_path = self.ingestion_repository.store(
+                document_id=document.id,
+                filename=document.filename,
+                data=file_bytes,
+            )
+            raw_file_checksum = hashlib.sha256(file_bytes).hexdigest()
+        if not raw_file_path:
+            raise ValueError(f"Run {record.id} has no stored upload for a worker to read")
+        return self.job_queue.enqueue(
+            PIPELINE_RUN_JOB,
+            {
+                "run_id": record.id,
+                "raw_file_path": str(raw_file_path),
+                "raw_file_checksum": raw_file_checksum,
+                "previous_run_id": previous_run_id,
+            },
+        )
+
+    def run_queued_job(self, job: QueuedJob) -> None:
+        """``JobWorker`` handler for ``PIPELINE_RUN_JOB``: run or resume a queued run.
+
+        Every finished stage is snapshotted, so when a worker dies mid-run the
+        next attempt reuses the stages already completed (their fingerprints
+        still match) and continues from the first unfinished one.
+        """
+        run_id = job.payload["run_id"]
+        record = self.repository.get_run(run_id)
+        if record is None or record.document is None:
+            raise ValueError(f"Run {run_id} not found")
+        if record.status == "completed":
+            return
+        # The upload is already stored: ingestion keeps these instead of storing it again
+        document = self._fresh_document(record.document, ("content_type",))
+        document.metadata["raw_file_path"] = job.payload["raw_file_path"]
+        if job.payload.get("raw_file_checksum"):
+            document.metadata["raw_file_checksum"] = job.payload["raw_file_checksum"]
+        previous_snapshots: dict[str, Document] = {}
+        if job.payload.get("previous_run_id"):
+            previous_snapshots.update(self.repository.get_stage_snapshots(job.payload["previous_run_id"]))
+        previous_snapshots.update(self.repository.get_stage_snapshots(run_id))
+
+        def progress_callback(stage: PipelineStage, updated_document: Document) -> None:
+            self.repository.update_stage(run_id, stage, updated_document)
+            self.repository.save_stage_snapshot(run_id, stage.name, updated_document)
+
+        try:
+            with llm_priority("interactive"):
+                result = self.runner.run(
+                    document,
+                    progress_callback=progress_callback,
+                    run_id=run_id,
+                    previous_snapshots=previous_snapshots,
+                )
+        except Exception as exc:
+            # Earlier attempts are retried by the worker; only the last one fails the run
+            if job.is_final_attempt:
+                self.repository.fail_run(run_id, str(exc))
+            raise
+        self.repository.complete_run(run_id, result)
+        if self.document_repository:
+            self.document_repository.save(result.document)
+
+    def fail_expired_job(self, job: QueuedJob) -> None:
+        """``JobWorker`` expired handler for ``PIPELINE_RUN_JOB``: fail the job's run.
+
+        The worker died on the job's last attempt, so nothing else will move
+        the run out of "running".
+        """
+        run_id = job.payload["run_id"]
+        record = self.repository.get_run(run_id)
+        if record is None or record.status in ("completed", "failed"):
+            return
+        self.repository.fail_run(run_id, job.last_error or "lease expired")
+
+    def rerun(
+        self,
+        previous_run_id: str,
+        scheduler: TaskScheduler,
+        file_bytes: bytes | None = None,
+    ) -> PipelineRunRecord | None:
+        """Re-process a previous run's document, reusing stages whose inputs are unchanged.
+
+        Returns the new run record, or None if the previous run has no stored document.
+        """
+        previous = self.repository.get_run(previous_run_id)
+        if previous is None or previous.document is None:
+            return None
+        document = self._fresh_document(previous.document, ("raw_file_path", "raw_file_checksum"))
+        record = self.create_run(
+            filename=previous.filename,
+            content_type=previous.content_type,
+            file_path=previous.file_path,
+            document=document,
+        )
+        self.run_async(record, document, scheduler, file_bytes=file_bytes, previous_run_id=previous_run_id)
+        return record
+
     def run_sync(self, document: Document, file_bytes: bytes | None = None) -> PipelineResult:
-        result = self.runner.run(document, file_bytes=file_bytes, run_id=document.id)
+        with llm_priority("interactive"):
+            result = self.runner.run(document, file_bytes=file_bytes, run_id=document.id)
         if self.document_repository:
             self.document_repository.save(result.document)
         return result
@@ -81,3 +221,15 @@ class PipelineRunManager:
 
     def list_runs(self, limit: int = 10) -> list[PipelineRunRecord]:
         return self.repository.list_runs(limit)
+
+    @staticmethod
+    def _fresh_document(source: Document, carried_keys: tuple[str, ...]) -> Document:
+        """The unprocessed document behind ``source``, keeping only ``carried_keys`` metadata."""
+        return Document(
+            id=source.id,
+            filename=source.filename,
+            file_type=source.file_type,
+            size_bytes=source.size_bytes,
+            uploaded_at=source.uploaded_at,
+            metadata={key: source.metadata[key] for key in carried_keys if key in source.metadata},
+        )
@@ -0,0 +1,355 @@
+"""Page-level streaming pipeline: each page flows through the stages on its own."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from ..application.interfaces import ObservabilityRecorder
+from ..domain.models import Document, Page
+from ..parsing.parallel_pixmap_factory import ParallelPixmapFactory, PixmapInfo
+from .cleaning_service import PageCleaningResult
+from .enrichment_service import EnrichmentContext
+from .parsing_service import PageParseResult, ParsePlan
+from .rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from .chunking_service import ChunkingService
+    from .cleaning_service import CleaningService
+    from .enrichment_service import EnrichmentService
+    from .parsing_service import ParsingService
+    from .vector_service import VectorService
+
+logger = logging.getLogger(__name__)
+
+STREAMED_STAGES = ("parsing", "cleaning", "chunking", "enrichment", "vectorization")
+
+_DONE = object()
+
+
+class StreamingPagePipeline:
+    """Streams pages through parse -> clean -> chunk -> enrich -> embed.
+
+    Every stage is a small pool of workers connected by bounded asyncio queues,
+    so a page moves on as soon as its previous stage finishes instead of
+    waiting for the slowest page of the document. Parsing and cleaning await
+    the LLM's native async calls; the other blocking service calls run in the
+    default executor, exactly as ParallelPageProcessor does.
+
+    Enrichment needs the document summary and section headings, which depend
+    on every page's parse output. That context is built once parsing and
+    cleaning have drained; chunking keeps flowing meanwhile, and chunked pages
+    park on an unbounded queue in front of enrichment so the barrier cannot
+    back-pressure the stages it is waiting on.
+
+    The Document is assembled at the end with the same metadata the
+    stage-by-stage services produce.
+    """
+
+    def __init__(
+        self,
+        observability: ObservabilityRecorder,
+        parsing_service: ParsingService,
+        cleaning_service: CleaningService,
+        chunking_service: ChunkingService,
+        enrichment_service: EnrichmentService,
+        vector_service: VectorService,
+        parallel_pixmap_factory: ParallelPixmapFactory | None = None,
+        rate_limiter: RateLimiter | None = None,
+        max_workers: int = 4,
+        queue_size: int = 8,
+    ) -> None:
+        """Initialize the streaming page pipeline.
+
+        Args:
+            observability: Recorder for the pipeline-level summary event
+            parsing_service: Service for parsing individual pages
+            cleaning_service: Service for cleaning individual pages
+            chunking_service: Service for chunking individual pages
+            enrichment_service: Service for enriching chunks with document context
+            vector_service: Service for embedding chunks and storing vectors
+            parallel_pixmap_factory: Factory for parallel pixmap generation
+            rate_limiter: Rate limiter for LLM-backed stages (optional)
+            max_workers: Concurrent pages per stage
+            queue_size: Pages buffered between two stages before upstream waits
+        """
+        self.observability = observability
+        self.parsing = parsing_service
+        self.cleaning = cleaning_service
+        self.chunking = chunking_service
+        self.enrichment = enrichment_service
+        self.vectorization = vector_service
+        self.pixmap_factory = parallel_pixmap_factory
+        self.rate_limiter = rate_limiter
+        self.max_workers = max(1, max_workers)
+        self.queue_size = max(1, queue_size)
+
+    async def run(
+        self,
+        document: Document,
+        file_bytes: bytes | None,
+        doc_logger=None,
+        on_stage_complete: Callable[[str], None] | None = None,
+    ) -> Document:
+        """Run every page through all streamed stages and return the vectorized document.
+
+        Args:
+            document: Ingested document without pages
+            file_bytes: Raw file bytes (falls back to the stored raw file)
+            doc_logger: Optional batch logger for per-page progress
+            on_stage_complete: Called with the stage name once its last page finished
+        """
+        loop = asyncio.get_running_loop()
+        started = perf_counter()
+        pixmap_map = await self._render_pixmaps(document, file_bytes, doc_logger)
+        plan: ParsePlan
+        plan, page_stream = await asyncio.to_thread(
+            self.parsing.stream_pages, document, file_bytes, pixmap_map=pixmap_map
+        )
+        # Known once text extraction has finished; pages start flowing before that
+        page_count: int | None = None
+        logger.info(
+            "🌊 Streaming pages for doc=%s (workers=%d, queue=%d)",
+            document.id,
+            self.max_workers,
+            self.queue_size,
+        )
+
+        parse_results: dict[int, PageParseResult] = {}
+        clean_results: dict[int, PageCleaningResult] = {}
+        embedded_pages: dict[int, Page] = {}
+        cache_stats: dict[str, int] = {"hits": 0, "misses": 0}
+        stage_elapsed_ms: dict[str, float] = {}
+        context_future: asyncio.Future[tuple[Document, EnrichmentContext]] = loop.create_future()
+
+        def stage_finished(stage: str) -> None:
+            stage_elapsed_ms[stage] = round((perf_counter() - started) * 1000, 2)
+            if on_stage_complete:
+                on_stage_complete(stage)
+
+        async def parse(item: tuple[int, str]) -> PageParseResult:
+            page_number, text = item
+            if self.rate_limiter and self.parsing.needs_structured_parser(plan, page_number):
+                await self.rate_limiter.acquire(1)
+            result = await self.parsing.aparse_page(document.id, plan, page_number, text)
+            parse_results[page_number] = result
+            return result
+
+        async def clean(parsed: PageParseResult) -> PageCleaningResult:
+            if self.rate_limiter and self.cleaning.structured_cleaner and parsed.parsed_page:
+                await self.rate_limiter.acquire(1)
+            result = await self.cleaning.aclean_page(
+                parsed.page,
+                parsed_payload=parsed.parsed_page.model_dump() if parsed.parsed_page else None,
+                pixmap_path=str(parsed.pixmap.path) if parsed.pixmap else None,
+            )
+            clean_results[parsed.page.page_number] = result
+            if doc_logger:
+                doc_logger.record_event("cleaning_page_complete", {
+                    "document_id": document.id,
+                    "filename": document.filename,
+                    "page_number": parsed.page.page_number,
+                    "page_count": page_count,
+                    "cleaned_tokens": result.page_metadata["cleaned_tokens_count"],
+                })
+            return result
+
+        async def chunk(cleaned: PageCleaningResult) -> Page:
+            page_number = cleaned.page.page_number
+            parsed_page = parse_results[page_number].parsed_page
+            page_view = document.model_copy(
+                update={
+                    "metadata": {
+                        **document.metadata,
+                        "parsed_pages": {str(page_number): parsed_page.model_dump()} if parsed_page else {},
+                        "cleaning_metadata_by_page": {page_number: cleaned.page_metadata},
+                    }
+                }
+            )
+            return await asyncio.to_thread(self.chunking.chunk_page, page_view, cleaned.page)
+
+        async def enrich(page: Page) -> Page:
+            _, context = await context_future
+            return await asyncio.to_thread(
+                self.enrichment.enrich_page,
+                page,
+                document.filename,
+                context,
+            )
+
+        async def embed(page: Page) -> None:
+            page_stats: dict[str, int] = {}
+            embedded_pages[page.page_number] = await asyncio.to_thread(
+                self.vectorization.embed_page,
+                page,
+                page_stats,
+            )
+            for key, value in page_stats.items():
+                cache_stats[key] = cache_stats.get(key, 0) + value
+
+        async def build_context() -> None:
+            try:
+                await cleaning_done.wait()
+                cleaned_document = await asyncio.to_thread(
+                    self._assemble_cleaned, document, plan, parse_results, clean_results
+                )
+                context = await asyncio.to_thread(self.enrichment.build_context, cleaned_document)
+            except asyncio.CancelledError:
+                context_future.cancel()
+                raise
+            except Exception as exc:
+                context_future.set_exception(exc)
+                raise
+            context_future.set_result((cleaned_document, context))
+
+        queues = {
+            "parsing": asyncio.Queue(maxsize=self.queue_size),
+            "cleaning": asyncio.Queue(maxsize=self.queue_size),
+            "chunking": asyncio.Queue(maxsize=self.queue_size),
+            # Unbounded: pages wait here for the document context (see class docstring)
+            "enrichment": asyncio.Queue(),
+            "vectorization": asyncio.Queue(maxsize=self.queue_size),
+        }
+        cleaning_done = asyncio.Event()
+
+        async def feed() -> None:
+            nonlocal page_count
+            try:
+                while True:
+                    # Extraction may be slow (or run in a process pool); pull pages off the loop
+                    item = await asyncio.to_thread(next, page_stream, None)
+                    if item is None:
+                        break
+                    await queues["parsing"].put(item)
+            finally:
+                with suppress(ValueError):  # still executing in the thread after a cancel
+                    close = getattr(page_stream, "close", None)
+                    if close:
+                        close()
+            page_count = len(plan.page_texts)
+            await queues["parsing"].put(_DONE)
+
+        def on_finished(stage: str) -> None:
+            stage_finished(stage)
+            if stage == "cleaning":
+                cleaning_done.set()
+
+        tasks = [
+            asyncio.ensure_future(feed()),
+            asyncio.ensure_future(build_context()),
+            asyncio.ensure_future(self._stage("parsing", queues["parsing"], queues["cleaning"], parse, on_finished)),
+            asyncio.ensure_future(self._stage("cleaning", queues["cleaning"], queues["chunking"], clean, on_finished)),
+            asyncio.ensure_future(self._stage("chunking", queues["chunking"], queues["enrichment"], chunk, on_finished)),
+            asyncio.ensure_future(self._stage("enrichment", queues["enrichment"], queues["vectorization"], enrich, on_finished)),
+            asyncio.ensure_future(self._stage("vectorization", queues["vectorization"], None, embed, on_finished)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        cleaned_document, context = context_future.result()
+        enriched_document = cleaned_document.model_copy(
+            update={"summary": context.document_summary, "status": "enriched"}
+        )
+        pages = [embedded_pages[number] for number in sorted(embedded_pages)]
+        # Same stage events as the stage-by-stage path, so batch traces match
+        self.chunking.record_chunked(document.id, pages)
+        self.enrichment.record_enriched(document.id, pages, context.document_summary)
+        vectorized = await asyncio.to_thread(
+            self.vectorization.publish_vectors,
+            enriched_document,
+            pages,
+            cache_stats,
+        )
+
+        chunk_count = sum(len(page.chunks) for page in vectorized.pages)
+        self.observability.record_event(
+            stage="page_streaming",
+            details={
+                "document_id": vectorized.id,
+                "page_count": len(vectorized.pages),
+                "chunk_count": chunk_count,
+                "has_document_summary": bool(context.document_summary),
+                "stage_completed_ms": stage_elapsed_ms,
+            },
+        )
+        logger.info(
+            "✅ Streaming pipeline complete: doc=%s, %d pages, %d chunks in %.0f ms",
+            vectorized.id,
+            len(vectorized.pages),
+            chunk_count,
+            (perf_counter() - started) * 1000,
+        )
+        return vectorized
+
+    async def _stage(
+        self,
+        name: str,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue | None,
+        handle: Callable[[Any], Awaitable[Any]],
+        on_finished: Callable[[str], None],
+    ) -> None:
+        """Drain ``inbox`` with ``max_workers`` workers and forward results to ``outbox``."""
+
+        async def worker() -> None:
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    # Leave the marker for sibling workers
+                    await inbox.put(_DONE)
+                    return
+                result = await handle(item)
+                if outbox is not None:
+                    await outbox.put(result)
+
+        await asyncio.gather(*(worker() for _ in range(self.max_workers)))
+        if outbox is not None:
+            await outbox.put(_DONE)
+        on_finished(name)
+
+    async def _render_pixmaps(
+        self,
+        document: Document,
+        file_bytes: bytes | None,
+        doc_logger=None,
+    ) -> dict[int, PixmapInfo] | None:
+        """Render pixmaps with the parallel factory, or None to let parsing render them."""
+        if not (
+            self.pixmap_factory
+            and self.parsing.include_images
+            and file_bytes
+            and document.file_type.lower() == "pdf"
+        ):
+            return None
+        try:
+            return await self.pixmap_factory.generate_async(
+                document.id,
+                file_bytes,
+                doc_logger=doc_logger,
+                filename=document.filename,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Parallel pixmap generation failed, falling back to sequential: %s",
+                exc,
+                exc_info=True,
+            )
+            return None
+
+    def _assemble_cleaned(
+        self,
+        document: Document,
+        plan: ParsePlan,
+        parse_results: dict[int, PageParseResult],
+        clean_results: dict[int, PageCleaningResult],
+    ) -> Document:
+        parsed_document = self.parsing.assemble_parsed_document(document, plan, list(parse_results.values()))
+        return self.cleaning.assemble_cleaned_document(parsed_document, list(clean_results.values()))
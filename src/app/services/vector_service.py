@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import time
+from itertools import islice
 from random import Random
 from typing import Sequence
 
-from ..application.interfaces import EmbeddingGenerator, ObservabilityRecorder, VectorStoreAdapter
-from ..domain.models import Document
+from ..application.interfaces import EmbeddingCache, EmbeddingGenerator, ObservabilityRecorder, VectorStoreAdapter
+from ..domain.models import Document, Page
+from .document_ownership import owns
+from .fingerprint import component_identity
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +25,8 @@ class VectorService:
     
     The service follows hexagonal architecture principles:
     - Depends only on ObservabilityRecorder interface (port)
-    - Returns immutable Document instances
+    - Returns immutable Document instances (updates in place only for documents
+      a runner granted it via ``run_owned``)
     - Can be easily swapped with a real embedding service
     - Fully testable via dependency injection
     """
@@ -34,6 +39,7 @@ class VectorService:
         dimension: int = 8,
         seed: int = 42,
         latency: float = 0.0,
+        embedding_cache: EmbeddingCache | None = None,
     ) -> None:
         self.observability = observability
         self.embedding_generator = embedding_generator
@@ -41,16 +47,60 @@ class VectorService:
         self.dimension = embedding_generator.dimension if embedding_generator else dimension
         self.random = Random(seed)
         self.latency = latency
+        self.embedding_cache = embedding_cache
+
+    def config_fingerprint(self) -> dict[str, object]:
+        """Configuration that determines vectors, used for incremental re-runs."""
+        return {
+            "dimension": self.dimension,
+            "embedding_generator": component_identity(self.embedding_generator),
+        }
 
     def _vector_for_text(self, text: str) -> list[float]:
         self.random.seed(hash(text) & 0xFFFFFFFF)
         return [round(self.random.random(), 3) for _ in range(self.dimension)]
 
-    def _embed_batch(self, texts: Sequence[str]) -> Sequence[Sequence[float]]:
+    def _embed_batch(
+        self, texts: Sequence[str], cache_stats: dict[str, int] | None = None
+    ) -> Sequence[Sequence[float]]:
         if self.embedding_generator:
+            identity = getattr(self.embedding_generator, "cache_identity", None)
+            if self.embedding_cache is not None and identity:
+                return self._embed_with_cache(texts, identity, cache_stats)
             return self.embedding_generator.embed(texts)
         return [self._vector_for_text(text) for text in texts]
 
+    def _embed_with_cache(
+        self,
+        texts: Sequence[str],
+        identity: dict[str, object],
+        cache_stats: dict[str, int] | None,
+    ) -> list[Sequence[float]]:
+        """Serve vectors from the embedding cache and embed only unseen texts once each."""
+        assert self.embedding_generator and self.embedding_cache  # for mypy
+        keys = [
+            {**identity, "text_sha256": hashlib.sha256(text.encode("utf-8")).hexdigest()}
+            for text in texts
+        ]
+        vectors: list[Sequence[float] | None] = [self.embedding_cache.get(key) for key in keys]
+        missing: dict[str, list[int]] = {}
+        for index, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(texts[index], []).append(index)
+
+        if missing:
+            misses = list(missing)
+            for text, vector in zip(misses, self.embedding_generator.embed(misses)):
+                indexes = missing[text]
+                self.embedding_cache.put(keys[indexes[0]], vector)
+                for index in indexes:
+                    vectors[index] = vector
+
+        if cache_stats is not None:
+            cache_stats["hits"] = cache_stats.get("hits", 0) + len(texts) - sum(len(v) for v in missing.values())
+            cache_stats["misses"] = cache_stats.get("misses", 0) + len(missing)
+        return vectors  # type: ignore[return-value]
+
     def vectorize(self, document: Document) -> Document:
         if self.latency > 0:
             time.sleep(self.latency)
@@ -61,64 +111,109 @@ class VectorService:
             self.dimension,
         )
         
-        vector_attached = 0
-        contextualized_count = 0
-        sample_vectors: list[dict[str, object]] = []
+        cache_stats: dict[str, int] = {"hits": 0, "misses": 0}
+        # One embedding call for the whole document so the generator sees full
+        # batches rather than a few chunks per page
+        page_texts = [self._chunk_texts(page) for page in document.pages]
+        embeddings = self._embed_batch([text for texts in page_texts for text in texts], cache_stats)
+        in_place = owns(document)
         updated_pages = []
-        
-        for page in document.pages:
-            updated_chunks = []
-            # Use contextualized_text for embedding (with context prefix)
-            # Fall back to cleaned_text or raw text if contextualized_text is not available
-            chunk_texts = [
-                chunk.contextualized_text or chunk.cleaned_text or chunk.text or "" 
-                for chunk in page.chunks
-            ]
-            
-            # Log which chunks have contextualized text
-            for chunk in page.chunks:
-                if chunk.contextualized_text:
-                    contextualized_count += 1
-            
-            embeddings = self._embed_batch(chunk_texts)
+        offset = 0
+        for page, texts in zip(document.pages, page_texts):
+            updated_pages.append(
+                self._attach_vectors(page, embeddings[offset:offset + len(texts)], in_place=in_place)
+            )
+            offset += len(texts)
+        return self.publish_vectors(document, updated_pages, cache_stats)
+
+    def embed_page(self, page: Page, cache_stats: dict[str, int] | None = None) -> Page:
+        """Attach a vector to every chunk on a page."""
+        return self._attach_vectors(page, self._embed_batch(self._chunk_texts(page), cache_stats))
+
+    def _chunk_texts(self, page: Page) -> list[str]:
+        # Use contextualized_text for embedding (with context prefix)
+        # Fall back to cleaned_text or raw text if contextualized_text is not available
+        return [
+            chunk.contextualized_text or chunk.cleaned_text or chunk.text or "" 
+            for chunk in page.chunks
+        ]
+
+    def _attach_vectors(
+        self, page: Page, embeddings: Sequence[Sequence[float]], in_place: bool = False
+    ) -> Page:
+        """Store each chunk's vector in its ``metadata.extra``.
+
+        With ``in_place`` (the page belongs to an owned document) the existing
+        ``extra`` dicts are updated and ``page`` itself is returned.
+        """
+        if in_place:
             for chunk, vector in zip(page.chunks, embeddings):
-                
                 if chunk.metadata:
-                    updated_extra = chunk.metadata.extra.copy()
-                    updated_extra["vector"] = vector
-                    updated_extra["vector_dimension"] = self.dimension
-                    updated_extra["used_contextualized_text"] = bool(chunk.contextualized_text)
-                    updated_metadata = chunk.metadata.model_copy(update={"extra": updated_extra})
-                    updated_chunk = chunk.model_copy(update={"metadata": updated_metadata})
-                else:
-                    updated_chunk = chunk
-                
-                updated_chunks.append(updated_chunk)
-                vector_attached += 1
-                if len(sample_vectors) < 3:
-                    sample_vectors.append({"chunk_id": chunk.id, "vector": vector})
-            
-            updated_page = page.model_copy(update={"chunks": updated_chunks})
-            updated_pages.append(updated_page)
+                    extra = chunk.metadata.extra
+                    extra["vector"] = vector
+                    extra["vector_dimension"] = self.dimension
+                    extra["used_contextualized_text"] = bool(chunk.contextualized_text)
+            return page
+        updated_chunks = []
+        for chunk, vector in zip(page.chunks, embeddings):
+            if chunk.metadata:
+                updated_extra = chunk.metadata.extra.copy()
+                updated_extra["vector"] = vector
+                updated_extra["vector_dimension"] = self.dimension
+                updated_extra["used_contextualized_text"] = bool(chunk.contextualized_text)
+                updated_metadata = chunk.metadata.model_copy(update={"extra": updated_extra})
+                updated_chunk = chunk.model_copy(update={"metadata": updated_metadata})
+            else:
+                updated_chunk = chunk
+            updated_chunks.append(updated_chunk)
+        return page.model_copy(update={"chunks": updated_chunks})
+
+    def publish_vectors(
+        self,
+        document: Document,
+        updated_pages: Sequence[Page],
+        cache_stats: dict[str, int],
+    ) -> Document:
+        """Store embedded pages on the document, upsert them and record the stage."""
+        updated_pages = list(updated_pages)
+        vector_attached = sum(len(page.chunks) for page in updated_pages)
+        contextualized_count = sum(
+            1 for page in updated_pages for chunk in page.chunks if chunk.contextualized_text
+        )
+        sample_vectors: list[dict[str, object]] = [
+            {"chunk_id": chunk.id, "vector": chunk.metadata.extra.get("vector") if chunk.metadata else None}
+            for chunk in islice((chunk for page in updated_pages for chunk in page.chunks), 3)
+        ]
         
         logger.info(
             "✅ Vectorization complete: %d vectors created, %d used contextualized text",
             vector_attached,
             contextualized_count,
         )
+        if self.embedding_cache is not None and cache_stats.get("hits"):
+            logger.info(
+                "♻️ Reused %d cached embedding(s), embedded %d new text(s)",
+                cache_stats["hits"],
+                cache_stats["misses"],
+            )
 
-        updated_metadata = document.metadata.copy()
+        if owns(document):
+            updated_document = document
+            updated_document.pages = updated_pages
+            updated_document.status = "vectorized"
+            updated_metadata = document.metadata
+        else:
+            updated_metadata = document.metadata.copy()
+            updated_document = document.model_copy(
+                update={
+                    "pages": updated_pages,
+                    "status": "vectorized",
+                    "metadata": updated_metadata,
+                }
+            )
         updated_metadata["vector_dimension"] = self.dimension
         updated_metadata["vector_samples"] = sample_vectors
         
-        updated_document = document.model_copy(
-            update={
-                "pages": updated_pages,
-                "status": "vectorized",
-                "metadata": updated_metadata,
-            }
-        )
-        
         if self.vector_store:
             payload = []
             for page in updated_pages:
@@ -142,6 +237,7 @@ class VectorService:
                 "document_id": updated_document.id,
                 "chunk_vectors": vector_attached,
                 "dimension": self.dimension,
+                "cache": cache_stats,
             },
         )
         return updated_document
@@ -0,0 +1,68 @@
+"""Job worker entry point: runs queued pipeline work outside the API process.
+
+Start as many as the box allows, each in its own process:
+
+    JOB_QUEUE__ENABLED=true python -m src.app.worker
+
+Every worker shares the job queue database with the API; runs it leased
+when a worker died are picked up again once their lease expires and resume
+from their last completed stage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import threading
+
+from .config import settings
+from .observability.logging_setup import setup_logging
+from .services.job_worker import JobWorker
+from .services.run_manager import PIPELINE_RUN_JOB
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run queued pipeline jobs.")
+    parser.add_argument("--worker-id", help="Name for this worker's leases (default: host:pid:random)")
+    parser.add_argument("--max-jobs", type=int, help="Exit after this many jobs")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    if not settings.job_queue.enabled:
+        logger.error("JOB_QUEUE__ENABLED is false: the API runs pipelines itself and queues nothing")
+        return 1
+
+    from .container import get_app_container
+
+    container = get_app_container()
+    worker = JobWorker(
+        container.job_queue,
+        {PIPELINE_RUN_JOB: container.pipeline_run_manager.run_queued_job},
+        expired_handlers={PIPELINE_RUN_JOB: container.pipeline_run_manager.fail_expired_job},
+        worker_id=args.worker_id,
+        poll_interval=settings.job_queue.poll_interval_seconds,
+        heartbeat_interval=settings.job_queue.heartbeat_seconds,
+        retry_base_delay=settings.job_queue.retry_base_delay_seconds,
+    )
+
+    stop = threading.Event()
+
+    def request_stop(signum: int, _frame: object) -> None:
+        # Finish the current job; its lease is released by completing or failing it
+        logger.info("Received signal %s; stopping after the current job", signum)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    try:
+        worker.run(stop, max_jobs=args.max_jobs)
+    finally:
+        container.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
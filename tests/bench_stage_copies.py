@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""Micro-benchmark: allocations per chunk in the post-chunking document stages.
+
+Runs cleaning, enrichment and vectorization over a synthetic chunked document
+twice: as public calls (every stage copies the chunks it touches) and owned,
+the way ``PipelineRunner`` runs them with ``in_place_stages`` (stages update
+the document in place). For each mode it reports per chunk:
+
+- new objects: models, dicts and lists in the output that were not in the input
+- peak bytes: tracemalloc peak above the input document while the stages run
+
+Usage:
+    python tests/bench_stage_copies.py [--pages 200] [--chunks-per-page 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterator
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.app.application.interfaces import NullObservabilityRecorder  # noqa: E402
+from src.app.domain.models import Chunk, Document, Metadata, Page  # noqa: E402
+from src.app.services.cleaning_service import CleaningService  # noqa: E402
+from src.app.services.document_ownership import run_owned  # noqa: E402
+from src.app.services.enrichment_service import EnrichmentService  # noqa: E402
+from src.app.services.vector_service import VectorService  # noqa: E402
+
+
+def build_chunked_document(pages: int, chunks_per_page: int) -> Document:
+    document = Document(filename="bench.pdf", file_type="pdf", status="chunked")
+    text = "Lorem ipsum dolor sit amet consectetur adipiscing elit " * 4
+    for page_number in range(1, pages + 1):
+        chunks = []
+        for index in range(chunks_per_page):
+            chunk = Chunk(
+                document_id=document.id,
+                page_number=page_number,
+                text=text,
+                start_offset=index * len(text),
+                end_offset=(index + 1) * len(text),
+                cleaned_text=text,
+            )
+            chunk.metadata = Metadata(
+                document_id=document.id,
+                page_number=page_number,
+                chunk_id=chunk.id,
+                start_offset=chunk.start_offset,
+                end_offset=chunk.end_offset,
+                title=f"Chunk {index}",
+                extra={"cleaning": {"segment_id": chunk.id}},
+            )
+            chunks.append(chunk)
+        document.pages.append(
+            Page(document_id=document.id, page_number=page_number, text=text * chunks_per_page, chunks=chunks)
+        )
+    return document
+
+
+def iter_objects(document: Document) -> Iterator[object]:
+    """The models and containers a stage may copy, from the document down to ``extra``."""
+    yield document
+    yield document.metadata
+    yield document.pages
+    for page in document.pages:
+        yield page
+        yield page.chunks
+        for chunk in page.chunks:
+            yield chunk
+            if chunk.metadata:
+                yield chunk.metadata
+                yield chunk.metadata.extra
+
+
+def run_mode(stages: list[Callable[[Document], Document]], owned: bool, pages: int, per_page: int) -> dict[str, float]:
+    document = build_chunked_document(pages, per_page)
+    chunk_count = pages * per_page
+    before = {id(obj) for obj in iter_objects(document)}
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    result = document
+    for stage in stages:
+        result = run_owned(stage, result) if owned else stage(result)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    new_objects = sum(1 for obj in iter_objects(result) if id(obj) not in before)
+    return {
+        "new_objects_per_chunk": new_objects / chunk_count,
+        "peak_bytes_per_chunk": (peak - baseline) / chunk_count,
+        "seconds": elapsed,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--chunks-per-page", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    observability = NullObservabilityRecorder()
+    stages = [
+        CleaningService(observability=observability).clean,
+        EnrichmentService(observability=observability, use_llm_summarization=False).enrich,
+        VectorService(observability=observability, dimension=8).vectorize,
+    ]
+    print(f"{args.pages} pages x {args.chunks_per_page} chunks, cleaning -> enrichment -> vectorization")
+    print(f"{'mode':<8}{'new objects/chunk':>20}{'peak bytes/chunk':>20}{'seconds':>10}")
+    for label, owned in (("copy", False), ("owned", True)):
+        stats = run_mode(stages, owned, args.pages, args.chunks_per_page)
+        print(
+            f"{label:<8}{stats['new_objects_per_chunk']:>20.2f}"
+            f"{stats['peak_bytes_per_chunk']:>20.0f}{stats['seconds']:>10.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import shutil
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -18,6 +20,13 @@ RUN_RAG_TESTS = os.getenv("RUN_RAG_TESTS") == "1"
 # Only use mocks if neither contract tests nor RAG tests are enabled
 USE_MOCKS = not RUN_CONTRACT_TESTS and not RUN_RAG_TESTS
 
+# Keep the parse/cleaning/embedding caches out of the repo's artifacts/cache so
+# test runs neither leave files behind nor hit entries written by earlier runs
+TEST_CACHE_DIR = Path(tempfile.mkdtemp(prefix="rag-pipeline-test-cache-"))
+os.environ["CACHE__PARSE_CACHE_DIR"] = str(TEST_CACHE_DIR / "parsing")
+os.environ["CACHE__CLEANING_CACHE_DIR"] = str(TEST_CACHE_DIR / "cleaning")
+os.environ["EMBEDDINGS__CACHE_DIR"] = str(TEST_CACHE_DIR / "embeddings")
+
 if USE_MOCKS:
     # Force mock providers *before* any application modules are imported so the
     # container never wires real LLMs during unit tests.
@@ -26,6 +35,17 @@ if USE_MOCKS:
     os.environ.setdefault("CHUNKING__INCLUDE_IMAGES", "false")
     os.environ.pop("OPENAI_API_KEY", None)
     os.environ.pop("LLM__API_KEY", None)
+    # Mock outputs are cheap; caching them would make results depend on test order
+    os.environ["CACHE__PARSE_CACHE_ENABLED"] = "false"
+    os.environ["CACHE__CLEANING_CACHE_ENABLED"] = "false"
+    os.environ["EMBEDDINGS__CACHE_ENABLED"] = "false"
+
+
+@pytest.fixture(autouse=True, scope="session")
+def remove_test_cache_dir():
+    """Delete the session's cache directory once the run ends."""
+    yield
+    shutil.rmtree(TEST_CACHE_DIR, ignore_errors=True)
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -1,6 +1,7 @@
 """Tests for batch processing functionality."""
 
 import asyncio
+import time
 from datetime import datetime
 from pathlib import Path
 from uuid import uuid4
@@ -291,6 +292,33 @@ class TestBatchRepository:
         batches = repo.list_batches(limit=10)
         assert len(batches) == 3
 
+    def test_list_batches_from_catalog(self, tmp_path):
+        """Test paging and filtering batches through the catalog."""
+        from datetime import timedelta
+
+        from src.app.persistence.adapters.catalog_sqlite import SQLiteCatalog
+
+        # A batch stored before the catalog existed is indexed on first use
+        FileSystemBatchJobRepository(tmp_path / "batches").create_batch(
+            BatchJob(id="batch-old", created_at=datetime(2026, 1, 1))
+        )
+        catalog = SQLiteCatalog(tmp_path / "catalog.sqlite3")
+        repo = FileSystemBatchJobRepository(tmp_path / "batches", catalog=catalog)
+        for i in range(3):
+            batch = BatchJob(id=f"batch-{i}", created_at=datetime(2026, 1, 2) + timedelta(minutes=i))
+            batch.add_document_job(DocumentJob(document_id=f"doc-{i}", filename=f"doc{i}.pdf"))
+            repo.create_batch(batch)
+
+        doc_job = DocumentJob(document_id="doc-1", filename="doc1.pdf")
+        doc_job.mark_completed()
+        repo.update_document_job("batch-1", doc_job)
+
+        assert [batch.id for batch in repo.list_batches(limit=2)] == ["batch-2", "batch-1"]
+        assert [batch.id for batch in repo.list_batches(limit=2, offset=2)] == ["batch-0", "batch-old"]
+        completed = repo.list_entries(status="completed")
+        assert [entry.id for entry in completed] == ["batch-1"]
+        assert completed[0].details["completed_documents"] == 1
+
     def test_get_nonexistent_batch(self, tmp_path):
         """Test getting a batch that doesn't exist."""
         repo = FileSystemBatchJobRepository(tmp_path)
@@ -338,6 +366,300 @@ class TestRateLimiter:
             # Inside context, token is acquired
             pass
 
+    async def test_rate_limiter_waits_for_token_budget(self):
+        """A request larger than the remaining token budget waits for it to refill."""
+        from src.app.services.rate_limiter import RateLimiter
+
+        # 6000 tokens/minute = 100 tokens/second
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=6000, token_burst_size=100)
+
+        assert limiter.try_acquire(1, estimated_tokens=100)
+        assert not limiter.try_acquire(1, estimated_tokens=50)
+
+        started = time.monotonic()
+        await limiter.acquire(1, estimated_tokens=10)
+        assert time.monotonic() - started >= 0.08
+
+    async def test_rate_limiter_throttle_slows_and_pauses(self):
+        """A 429 halves the rates and holds callers for Retry-After; successes recover."""
+        from src.app.services.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=60_000, min_rate_fraction=0.2)
+
+        limiter.record_throttle(retry_after=0.1)
+        assert limiter.refill_rate == pytest.approx(50.0)
+        assert limiter.token_refill_rate == pytest.approx(500.0)
+        assert not limiter.try_acquire(1)
+
+        started = time.monotonic()
+        limiter.acquire_blocking(1, estimated_tokens=10)
+        assert time.monotonic() - started >= 0.08
+
+        for _ in range(5):
+            limiter.record_throttle()
+        assert limiter.rate_scale == pytest.approx(0.2)
+
+        for _ in range(100):
+            limiter.record_success()
+        assert limiter.rate_scale == 1.0
+        assert limiter.stats["throttled"] == 6
+
+
+@pytest.mark.asyncio
+class TestLLMScheduler:
+    """Tests for priority scheduling of LLM requests."""
+
+    async def test_interactive_request_overtakes_queued_batch_requests(self):
+        """An interactive request is admitted ahead of batch requests already waiting."""
+        from src.app.services.llm_scheduler import LLMScheduler, llm_priority
+        from src.app.services.rate_limiter import RateLimiter
+
+        # One request every 50ms
+        scheduler = LLMScheduler(RateLimiter(requests_per_minute=1200, burst_size=1))
+        order: list[str] = []
+
+        async def request(priority: str, label: str) -> None:
+            with llm_priority(priority):
+                await scheduler.acquire(1)
+            order.append(label)
+
+        batch = [asyncio.create_task(request("batch", f"batch-{index}")) for index in range(6)]
+        await asyncio.sleep(0.02)
+        await asyncio.gather(request("interactive", "interactive"), *batch)
+        scheduler.close()
+
+        assert order.index("interactive") <= 2
+        stats = scheduler.stats
+        assert stats["batch"]["granted"] == 6
+        assert stats["interactive"]["granted"] == 1
+        assert stats["batch"]["queue_depth"] == 0
+        assert stats["batch"]["max_wait_ms"] > stats["interactive"]["max_wait_ms"]
+
+    async def test_priority_follows_work_into_threads(self):
+        """Requests from worker threads keep the priority of the context that started them."""
+        from src.app.services.llm_scheduler import LLMScheduler, current_llm_priority, llm_priority
+        from src.app.services.rate_limiter import RateLimiter
+
+        scheduler = LLMScheduler(RateLimiter(requests_per_minute=6000))
+
+        def call_llm() -> str:
+            scheduler.acquire_blocking(1, estimated_tokens=500)
+            return current_llm_priority()
+
+        with llm_priority("backfill"):
+            assert await asyncio.to_thread(call_llm) == "backfill"
+        assert current_llm_priority() == "batch"
+        scheduler.close()
+
+        assert scheduler.stats["backfill"]["granted"] == 1
+        with pytest.raises(ValueError):
+            with llm_priority("urgent"):
+                pass
+
+
+class _RecordingEmbedder:
+    """Embedding generator that records the batches it receives."""
+
+    dimension = 1
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.batches: list[list[str]] = []
+        self.fail_on = fail_on
+
+    def embed(self, texts):
+        self.batches.append(list(texts))
+        if self.fail_on in texts:
+            raise RuntimeError("embedding backend down")
+        return [[float(text.split("-")[1])] for text in texts]
+
+
+class TestEmbeddingBatcher:
+    """Tests for cross-document embedding coalescing."""
+
+    def test_concurrent_calls_share_full_batches(self):
+        """Small per-page calls from many threads go out as full batches."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.app.services.embedding_batcher import EmbeddingBatcher
+
+        embedder = _RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, batch_size=16, max_wait_ms=2000)
+        pages = [[f"p{page}-{page * 10 + index}" for index in range(4)] for page in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(batcher.embed, pages))
+        batcher.close()
+
+        for texts, vectors in zip(pages, results):
+            assert vectors == [[float(text.split("-")[1])] for text in texts]
+        assert [len(batch) for batch in embedder.batches] == [16, 16]
+        assert batcher.stats == {"calls": 8, "texts": 32, "batches": 2}
+
+    def test_partial_batch_is_sent_after_max_wait(self):
+        from src.app.services.embedding_batcher import EmbeddingBatcher
+
+        embedder = _RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, batch_size=32, max_wait_ms=10)
+        try:
+            assert batcher.embed(["a-1", "a-2"]) == [[1.0], [2.0]]
+        finally:
+            batcher.close()
+        assert embedder.batches == [["a-1", "a-2"]]
+
+    def test_batches_keep_each_callers_llm_priority(self):
+        """Interactive and batch texts go out in separate batches, each under its own priority."""
+        import threading
+
+        from src.app.services.embedding_batcher import EmbeddingBatcher
+        from src.app.services.llm_scheduler import current_llm_priority, llm_priority
+
+        class PriorityRecordingEmbedder(_RecordingEmbedder):
+            def __init__(self) -> None:
+                super().__init__()
+                self.priorities: dict[str, str] = {}
+
+            def embed(self, texts):
+                for text in texts:
+                    self.priorities[text] = current_llm_priority()
+                return super().embed(texts)
+
+        embedder = PriorityRecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, batch_size=4, max_wait_ms=50)
+        results: dict[str, list] = {}
+
+        def embed_interactive() -> None:
+            with llm_priority("interactive"):
+                results["interactive"] = list(batcher.embed(["i-1", "i-2"]))
+
+        try:
+            caller = threading.Thread(target=embed_interactive)
+            caller.start()
+            results["batch"] = list(batcher.embed(["b-3", "b-4"]))
+            caller.join()
+        finally:
+            batcher.close()
+
+        assert results == {"interactive": [[1.0], [2.0]], "batch": [[3.0], [4.0]]}
+        assert sorted(sorted(batch) for batch in embedder.batches) == [["b-3", "b-4"], ["i-1", "i-2"]]
+        assert embedder.priorities == {"i-1": "interactive", "i-2": "interactive", "b-3": "batch", "b-4": "batch"}
+
+    def test_errors_reach_every_caller_in_the_batch(self):
+        from src.app.services.embedding_batcher import EmbeddingBatcher
+
+        batcher = EmbeddingBatcher(_RecordingEmbedder(fail_on="a-2"), batch_size=8, max_wait_ms=5)
+        try:
+            with pytest.raises(RuntimeError, match="embedding backend down"):
+                batcher.embed(["a-1", "a-2"])
+        finally:
+            batcher.close()
+
+    def test_short_vector_list_fails_instead_of_hanging(self):
+        from src.app.services.embedding_batcher import EmbeddingBatcher
+
+        class DroppingEmbedder(_RecordingEmbedder):
+            def embed(self, texts):
+                return super().embed(texts)[:-1]
+
+        batcher = EmbeddingBatcher(DroppingEmbedder(), batch_size=8, max_wait_ms=5)
+        try:
+            with pytest.raises(RuntimeError, match="returned 1 vectors for 2 texts"):
+                batcher.embed(["a-1", "a-2"])
+        finally:
+            batcher.close()
+
+
+class _RecordingObservability:
+    def __init__(self) -> None:
+        self.events = []
+
+    def record_event(self, stage, details=None, trace_id=None):
+        self.events.append((stage, dict(details or {})))
+
+
+def _cpu_stage_document() -> Document:
+    from src.app.domain.models import Page
+
+    document = Document(filename="manual.pdf", file_type="pdf")
+    pages = [
+        Page(document_id=document.id, page_number=number, text=f"Page {number}   text " * 40)
+        for number in (1, 2, 3)
+    ]
+    return document.model_copy(update={"pages": pages})
+
+
+class TestCpuStagePool:
+    """Tests for running CPU-bound stages in worker processes."""
+
+    def test_worker_process_output_matches_in_thread_run(self):
+        from src.app.application.interfaces import NullObservabilityRecorder
+        from src.app.services.chunking_service import ChunkingService
+        from src.app.services.cleaning_service import CleaningService
+        from src.app.services.cpu_stage_pool import CpuStagePool, cpu_bound_stages, measure_stage
+        from src.app.services.enrichment_service import EnrichmentService
+
+        null = NullObservabilityRecorder()
+        chunking = ChunkingService(observability=null, chunk_size=60, chunk_overlap=0, strategy="fixed")
+        cleaning = CleaningService(observability=null)
+        enrichment = EnrichmentService(observability=null)
+        recorder = _RecordingObservability()
+        pool = CpuStagePool(cpu_bound_stages(chunking, cleaning, enrichment), recorder, max_workers=2)
+        document = _cpu_stage_document()
+        try:
+            assert pool.stages == ["chunking", "cleaning", "enrichment"]
+            cleaned, timing = pool.run("cleaning", document)
+            chunked, _ = pool.run("chunking", cleaned)
+        finally:
+            pool.shutdown()
+
+        expected, thread_timing = measure_stage(chunking.chunk, cleaning.clean(document))
+
+        def chunk_view(doc):
+            return [
+                (chunk.page_number, chunk.cleaned_text, chunk.metadata.extra["cleaning"]["diff_hash"])
+                for page in doc.pages
+                for chunk in page.chunks
+            ]
+
+        assert chunked.status == expected.status == "chunked"
+        assert chunk_view(chunked) == chunk_view(expected)
+        assert timing.in_worker_process and not thread_timing.in_worker_process
+        assert timing.wall_ms > 0 and timing.cpu_ms > 0
+        # Events recorded in the worker are replayed on the parent's recorder
+        assert [stage for stage, _ in recorder.events] == ["cleaning", "chunking"]
+        assert recorder.events[1][1]["chunk_count"] == sum(len(page.chunks) for page in chunked.pages)
+
+    def test_llm_stages_stay_on_threads(self):
+        from src.app.application.interfaces import NullObservabilityRecorder
+        from src.app.services.chunking_service import ChunkingService
+        from src.app.services.cleaning_service import CleaningService
+        from src.app.services.cpu_stage_pool import StageTiming, StageTimingReport, cpu_bound_stages
+        from src.app.services.enrichment_service import EnrichmentService
+
+        class StubSummaries:
+            def summarize(self, text):
+                return text[:10]
+
+        null = NullObservabilityRecorder()
+        stages = cpu_bound_stages(
+            ChunkingService(observability=null),
+            CleaningService(observability=null, structured_cleaner=object()),
+            EnrichmentService(observability=null, summary_generator=StubSummaries()),
+        )
+        assert list(stages) == ["chunking"]
+
+        report = StageTimingReport()
+        report.add("chunking", StageTiming(wall_ms=40.0, cpu_ms=10.0))
+        report.add("chunking", StageTiming(wall_ms=20.0, cpu_ms=20.0, in_worker_process=True))
+        assert report.as_dict() == {
+            "chunking": {
+                "documents": 2,
+                "wall_ms": 60.0,
+                "cpu_ms": 30.0,
+                "in_worker_process": 1,
+                "cpu_to_wall": 0.5,
+            }
+        }
+
 
 # Note: More comprehensive integration tests would require mocking LLM calls
 # and testing the full batch pipeline, which is better suited for end-to-end tests
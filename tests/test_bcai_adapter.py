@@ -6,6 +6,7 @@ Actual API calls are mocked to avoid network dependencies in CI.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import Mock, patch
 
@@ -183,6 +184,177 @@ class TestBCAILLM:
         assert "response_format" in payload
         assert payload["response_format"]["type"] == "json_schema"
 
+    @pytest.mark.asyncio
+    async def test_bcai_llm_achat_uses_pooled_async_client(self, monkeypatch, mock_bcai_response):
+        """Async chat goes over one shared httpx client instead of the sync session."""
+        import httpx
+
+        from src.app.adapters.llama_index import bcai_llm
+        from llama_index.core.base.llms.base import ChatMessage
+        from llama_index.core.base.llms.types import MessageRole
+
+        requests_seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            return httpx.Response(200, json=mock_bcai_response)
+
+        clients: list[httpx.AsyncClient] = []
+        real_client = httpx.AsyncClient
+
+        def build_client(**kwargs):
+            client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+            clients.append(client)
+            return client
+
+        monkeypatch.setattr(bcai_llm.httpx, "AsyncClient", build_client)
+        llm = bcai_llm.BCAILLM(
+            api_base="https://bcai-test.web.boeing.com",
+            api_key="test-pat-key",
+            model="gpt-4o-mini",
+        )
+        llm._session.post = Mock(side_effect=AssertionError("sync session used from async path"))
+
+        messages = [ChatMessage(role=MessageRole.USER, content="Hello BCAI")]
+        results = await asyncio.gather(*(llm.achat(messages) for _ in range(5)))
+        await llm.aclose()
+
+        assert [result.message.content for result in results] == ["This is a test response from BCAI."] * 5
+        assert len(clients) == 1
+        assert len(requests_seen) == 5
+        assert requests_seen[0].headers["Authorization"] == "basic test-pat-key"
+        payload = json.loads(requests_seen[0].content)
+        assert payload["messages"][0]["content"] == [{"type": "text", "text": "Hello BCAI"}]
+        assert "conversation_guid" in payload
+
+    def test_bcai_llm_closes_async_client_with_its_event_loop(self, monkeypatch, mock_bcai_response):
+        """Each event loop gets its own client, closed before that loop closes."""
+        import httpx
+
+        from src.app.adapters.llama_index import bcai_llm
+
+        clients: list[httpx.AsyncClient] = []
+        real_client = httpx.AsyncClient
+
+        def build_client(**kwargs):
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, json=mock_bcai_response))
+            clients.append(real_client(transport=transport, **kwargs))
+            return clients[-1]
+
+        monkeypatch.setattr(bcai_llm.httpx, "AsyncClient", build_client)
+        llm = bcai_llm.BCAILLM(
+            api_base="https://bcai-test.web.boeing.com",
+            api_key="test-pat-key",
+            model="gpt-4o-mini",
+        )
+
+        asyncio.run(llm.acomplete("first loop"))
+        assert len(clients) == 1 and clients[0].is_closed
+        asyncio.run(llm.acomplete("second loop"))
+
+        assert len(clients) == 2 and clients[1].is_closed
+        assert llm._async_clients == {}
+
+    @pytest.mark.asyncio
+    async def test_bcai_llm_async_does_not_retry_client_errors(self, monkeypatch):
+        """4xx responses fail fast with the response body in the error."""
+        import httpx
+
+        from src.app.adapters.llama_index import bcai_llm
+
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(400, text="bad schema")
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            bcai_llm.httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        llm = bcai_llm.BCAILLM(
+            api_base="https://bcai-test.web.boeing.com",
+            api_key="test-pat-key",
+            max_retries=2,
+        )
+
+        with pytest.raises(RuntimeError, match="bad schema"):
+            await llm.acomplete("Test prompt")
+        await llm.aclose()
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_bcai_llm_async_retries_then_wraps_non_json_bodies(self, monkeypatch):
+        """A 200 with a non-JSON body is retried and then raised as RuntimeError, like the sync path."""
+        import httpx
+
+        from src.app.adapters.llama_index import bcai_llm
+
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, text="<html>gateway</html>")
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            bcai_llm.httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        llm = bcai_llm.BCAILLM(
+            api_base="https://bcai-test.web.boeing.com",
+            api_key="test-pat-key",
+            max_retries=2,
+        )
+        monkeypatch.setattr(llm, "_retry_delay", lambda *args: 0.0)
+
+        with pytest.raises(RuntimeError):
+            await llm.acomplete("Test prompt")
+        await llm.aclose()
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_bcai_llm_retries_429_through_shared_rate_limiter(self, monkeypatch, mock_bcai_response):
+        """A 429 throttles the shared limiter and the request is retried after Retry-After."""
+        import httpx
+
+        from src.app.adapters.llama_index import bcai_llm
+        from src.app.services.rate_limiter import RateLimiter
+
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"}, text="slow down")
+            return httpx.Response(200, json=mock_bcai_response)
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            bcai_llm.httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        llm = bcai_llm.BCAILLM(
+            api_base="https://bcai-test.web.boeing.com",
+            api_key="test-pat-key",
+            max_retries=2,
+        )
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=1_000_000)
+        llm.use_rate_limiter(limiter)
+
+        response = await llm.acomplete("Test prompt")
+        await llm.aclose()
+
+        assert response.text == "This is a test response from BCAI."
+        assert len(calls) == 2
+        assert limiter.stats["throttled"] == 1
+        assert limiter.stats["acquired"] == 2
+        assert limiter.rate_scale == pytest.approx(0.5 + limiter.increase_fraction)
+
 
 class TestBCAIEmbedding:
     """Test the BCAI Embedding adapter."""
@@ -281,6 +453,106 @@ class TestBCAIEmbedding:
         assert len(results) == 2
         assert all(len(emb) == 1536 for emb in results)
 
+    def test_bcai_embedding_batches_concurrently_in_input_order(self, monkeypatch):
+        """Batches overlap in flight, are rate limited, and come back in input order."""
+        import httpx
+
+        from src.app.adapters.llama_index import bcai_embedding
+
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak_in_flight
+            texts = json.loads(request.content)["input"]
+            texts = texts if isinstance(texts, list) else [texts]
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            # Later batches answer first
+            await asyncio.sleep(0.05 / int(texts[0].split()[-1]) if texts[0] != "Text 0" else 0.06)
+            in_flight -= 1
+            data = [
+                {"embedding": [float(text.split()[-1])] * 3, "index": index}
+                for index, text in reversed(list(enumerate(texts)))
+            ]
+            return httpx.Response(200, json={"data": data})
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            bcai_embedding.httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+        class CountingLimiter:
+            acquired = 0
+
+            async def acquire(self, tokens: int = 1, estimated_tokens: int = 0) -> None:
+                CountingLimiter.acquired += tokens
+
+            def record_success(self) -> None:
+                pass
+
+            def record_throttle(self, retry_after: float | None = None) -> None:
+                raise AssertionError("no request was throttled")
+
+        embedding = bcai_embedding.BCAIEmbedding(
+            api_base="https://bcai-test.web.boeing.com",
+            api_key="test-pat-key",
+            dimensions=3,
+            batch_size=4,
+            max_concurrent_batches=3,
+            rate_limiter=CountingLimiter(),
+        )
+        try:
+            texts = [f"Text {index}" for index in range(25)]
+            results = embedding.get_text_embedding_batch(texts)
+            async_results = asyncio.run(embedding.aget_text_embedding_batch(texts))
+        finally:
+            embedding.close()
+
+        assert [vector[0] for vector in results] == [float(index) for index in range(25)]
+        assert async_results == results
+        assert 1 < peak_in_flight <= 3
+        assert CountingLimiter.acquired == 14  # 7 batches per call
+
+    def test_bcai_embedding_async_batches_retry_then_wrap_non_json_bodies(self, monkeypatch):
+        """A 200 with a non-JSON body is retried and then raised as RuntimeError, like the sync path."""
+        import httpx
+
+        from src.app.adapters.llama_index import bcai_embedding
+
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, text="<html>gateway</html>")
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            bcai_embedding.httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        embedding = bcai_embedding.BCAIEmbedding(
+            api_base="https://bcai-test.web.boeing.com",
+            api_key="test-pat-key",
+            dimensions=3,
+            batch_size=2,
+            max_concurrent_batches=1,
+            max_retries=2,
+        )
+        monkeypatch.setattr(embedding, "_retry_delay", lambda *args: 0.0)
+        try:
+            with pytest.raises(RuntimeError, match="after 3 attempts"):
+                embedding.get_text_embedding_batch(["Text 0", "Text 1", "Text 2"])
+        finally:
+            embedding.close()
+
+        # Each of the two batches is retried up to max_retries before the embed fails
+        batches = [json.dumps(json.loads(request.content)["input"]) for request in calls]
+        assert sorted(batches.count(batch) for batch in set(batches)) == [3, 3]
+
 
 class TestBCAIIntegration:
     """Test BCAI integration with bootstrap configuration."""
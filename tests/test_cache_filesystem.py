@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from src.app.parsing.schemas import CleanedPage, CleanedSegment, ParsedPage
+from src.app.persistence.adapters.cache_filesystem import (
+    FileSystemBlobCache,
+    FileSystemCleaningCache,
+    FileSystemEmbeddingCache,
+    FileSystemParseCache,
+    cache_key_digest,
+)
+
+
+def test_cache_key_digest_is_order_independent():
+    assert cache_key_digest({"a": 1, "b": "x"}) == cache_key_digest({"b": "x", "a": 1})
+    assert cache_key_digest({"a": 1}) != cache_key_digest({"a": 2})
+
+
+def test_blob_cache_evicts_least_recently_used(tmp_path):
+    cache = FileSystemBlobCache(tmp_path, max_bytes=20)
+    cache.put("aa01", b"0123456789")
+    cache.put("bb02", b"0123456789")
+    assert cache.get("aa01") == b"0123456789"  # refresh recency
+
+    cache.put("cc03", b"0123456789")
+
+    assert "bb02" not in cache
+    assert cache.get("aa01") is not None
+    assert cache.get("cc03") is not None
+    assert cache.total_bytes == 20
+
+
+def test_blob_cache_reloads_index_from_disk(tmp_path):
+    FileSystemBlobCache(tmp_path, max_bytes=100).put("aa01", b"payload")
+
+    reopened = FileSystemBlobCache(tmp_path, max_bytes=100)
+
+    assert len(reopened) == 1
+    assert reopened.get("aa01") == b"payload"
+
+
+def test_blob_cache_shares_a_directory_across_processes(tmp_path):
+    writer = FileSystemBlobCache(tmp_path, max_bytes=25, rescan_seconds=0)
+    reader = FileSystemBlobCache(tmp_path, max_bytes=25, rescan_seconds=0)
+
+    writer.put("aa01", b"0123456789")
+    assert reader.get("aa01") == b"0123456789"  # written after reader indexed the directory
+
+    writer.put("bb02", b"0123456789")
+    reader.put("cc03", b"0123456789")  # over budget once writer's entries are counted
+
+    assert not (tmp_path / "aa" / "aa01.json").exists()
+    assert reader.total_bytes == 20
+    assert writer.get("aa01") is None
+    assert writer.get("cc03") == b"0123456789"
+
+
+def test_parse_cache_round_trips_parsed_page(tmp_path):
+    cache = FileSystemParseCache(tmp_path)
+    key = {"file_checksum": "abc", "page_number": 1, "model": "m"}
+    page = ParsedPage(document_id="doc", page_number=1, raw_text="hello", page_summary="summary")
+
+    assert cache.get(key) is None
+    cache.put(key, page)
+
+    cached = cache.get(key)
+    assert cached is not None
+    assert cached.raw_text == "hello"
+    assert cached.page_summary == "summary"
+
+
+def test_cleaning_cache_promotes_disk_hits_into_memory(tmp_path):
+    key = {"parsed_page_sha256": "abc", "profile": "default"}
+    page = CleanedPage(document_id="doc", page_number=1, segments=[CleanedSegment(segment_id="s", text="t")])
+    FileSystemCleaningCache(tmp_path).put(key, page)
+
+    cache = FileSystemCleaningCache(tmp_path)
+    assert cache.get(key) == page
+    assert cache.get(key) == page
+    assert cache.get({"parsed_page_sha256": "other"}) is None
+
+    assert cache.stats == {"memory_hits": 1, "disk_hits": 1, "misses": 1}
+
+
+def test_embedding_cache_stores_float32_vectors(tmp_path):
+    key = {"model": "m", "dimensions": 3, "text_sha256": "abc"}
+    FileSystemEmbeddingCache(tmp_path).put(key, [0.5, 0.25, 1.0])
+
+    cache = FileSystemEmbeddingCache(tmp_path)
+
+    assert cache.get(key) == [0.5, 0.25, 1.0]
+    stored = [path for path in tmp_path.rglob("*.f32")]
+    assert len(stored) == 1
+    assert stored[0].stat().st_size == 3 * 4
@@ -151,6 +151,39 @@ def test_dashboard_upload_traces_pipeline():
     assert f'/dashboard/review?document_id={linked_document_id}' in dashboard_page.text
 
 
+def test_dashboard_rerun_reuses_unchanged_stages():
+    run_manager = get_app_container().pipeline_run_manager
+    keep_snapshots = run_manager.keep_stage_snapshots
+    run_manager.keep_stage_snapshots = True
+    try:
+        pdf_path = Path("tests/test_document.pdf")
+        with pdf_path.open("rb") as pdf_file:
+            response = client.post(
+                "/dashboard/upload",
+                files={"file": (pdf_path.name, pdf_file, "application/pdf")},
+            )
+        assert response.status_code == 200
+        run_id = re.search(r'data-run-id="([^"]+)"', response.text).group(1)
+        assert run_manager.get_run(run_id).status == "completed"
+
+        rerun = client.post(f"/dashboard/runs/{run_id}/rerun")
+    finally:
+        run_manager.keep_stage_snapshots = keep_snapshots
+
+    assert rerun.status_code == 200
+    rerun_id = re.search(r'data-run-id="([^"]+)"', rerun.text).group(1)
+    assert rerun_id != run_id
+    record = run_manager.get_run(rerun_id)
+    assert record.status == "completed"
+    reused = {name for name, stage in record.stage_map.items() if stage.details.get("reused")}
+    assert {"ingestion", "parsing", "cleaning", "chunking"} <= reused
+
+
+def test_dashboard_rerun_unknown_run_returns_404():
+    response = client.post("/dashboard/runs/does-not-exist/rerun")
+    assert response.status_code == 404
+
+
 def test_review_page_loads():
     response = client.get("/dashboard/review")
     assert response.status_code == 200
@@ -1,3 +1,5 @@
+import pytest
+
 from src.app.domain.models import Document, Page, Chunk, Metadata
 from src.app.persistence.adapters.document_filesystem import FileSystemDocumentRepository
 
@@ -123,3 +125,155 @@ def test_edit_segment_updates_text_and_page(tmp_path):
     
     page = document.pages[0]
     assert page.cleaned_text == corrected_text
+
+
+def _vectorized_document(chunk_count: int, dimension: int) -> Document:
+    document = Document(filename="v.pdf", file_type="pdf")
+    chunks = []
+    for index in range(chunk_count):
+        chunk = Chunk(document_id=document.id, page_number=1, text=f"chunk {index}", start_offset=0, end_offset=7)
+        chunk.metadata = Metadata(
+            document_id=document.id,
+            page_number=1,
+            chunk_id=chunk.id,
+            start_offset=0,
+            end_offset=7,
+            extra={"vector": [index + i / dimension for i in range(dimension)], "vector_dimension": dimension},
+        )
+        chunks.append(chunk)
+    return document.model_copy(
+        update={"pages": [Page(document_id=document.id, page_number=1, text="text", chunks=chunks)]}
+    )
+
+
+def test_document_vectors_are_stored_as_a_memory_mapped_matrix(tmp_path):
+    import json
+
+    import numpy as np
+
+    repository = FileSystemDocumentRepository(tmp_path)
+    document = _vectorized_document(chunk_count=20, dimension=1536)
+    inline_size = len(json.dumps(document.model_dump(mode="json"), indent=2))
+
+    repository.save(document)
+
+    assert (tmp_path / f"{document.id}.json").stat().st_size < inline_size * 0.1
+    loaded = repository.get(document.id)
+    vectors = repository.get_vectors(document.id)
+    assert isinstance(vectors, np.memmap) and vectors.dtype == np.float32 and vectors.shape == (20, 1536)
+    for original, chunk in zip(document.pages[0].chunks, loaded.pages[0].chunks):
+        assert "vector" not in chunk.metadata.extra
+        assert np.allclose(vectors[chunk.metadata.extra["vector_row"]], original.metadata.extra["vector"])
+
+    # Saving a loaded document keeps the vectors its chunks reference
+    repository.save(loaded.model_copy(update={"status": "reviewed"}))
+    assert np.array_equal(repository.get_vectors(document.id), vectors)
+
+
+def test_document_without_vectors_has_no_matrix(tmp_path):
+    repository = FileSystemDocumentRepository(tmp_path)
+    document = Document(filename="a.pdf", file_type="pdf")
+
+    repository.save(document)
+
+    assert repository.get_vectors(document.id) is None
+    assert [doc.id for doc in repository.list()] == [document.id]
+
+
+def test_document_codecs_round_trip_and_read_earlier_encodings(tmp_path):
+    pytest.importorskip("orjson")
+    pytest.importorskip("zstandard")
+    from src.app.persistence.adapters.document_codec import build_document_codec
+
+    document = _vectorized_document(chunk_count=3, dimension=4)
+    FileSystemDocumentRepository(tmp_path).save(document)
+
+    repository = FileSystemDocumentRepository(tmp_path, codec=build_document_codec("orjson", "zstd"))
+    # Written as indented JSON, still readable after the setting changes
+    assert repository.get(document.id).pages[0].chunks[0].metadata.extra["vector_row"] == 0
+
+    repository.save(document)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"{document.id}.json.zst",
+        f"{document.id}.vectors.npy",
+    ]
+    loaded = repository.get(document.id)
+    assert loaded.uploaded_at == document.uploaded_at
+    assert [chunk.id for chunk in loaded.pages[0].chunks] == [chunk.id for chunk in document.pages[0].chunks]
+    assert [doc.id for doc in repository.list()] == [document.id]
+
+
+def test_msgpack_document_codec_round_trip(tmp_path):
+    pytest.importorskip("msgpack")
+    from src.app.persistence.adapters.document_codec import build_document_codec
+
+    repository = FileSystemDocumentRepository(tmp_path, codec=build_document_codec("msgpack"))
+    repository_seed, document_id, _ = _seed_document_with_flagged_segment(tmp_path / "seed")
+    document = repository_seed.get(document_id)
+
+    repository.save(document)
+
+    assert (tmp_path / f"{document_id}.msgpack").exists()
+    assert repository.get(document_id) == document
+
+
+def test_catalog_lists_filters_and_paginates_documents(tmp_path):
+    from datetime import datetime, timedelta
+
+    from src.app.persistence.adapters.catalog_sqlite import SQLiteCatalog
+
+    documents_dir = tmp_path / "documents"
+    started = datetime(2026, 1, 1)
+    earlier = FileSystemDocumentRepository(documents_dir)
+    # Stored before the catalog existed: indexed when a repository first uses the catalog
+    earlier.save(Document(filename="old.pdf", file_type="pdf", status="vectorized", uploaded_at=started))
+
+    catalog = SQLiteCatalog(tmp_path / "catalog.sqlite3")
+    repository = FileSystemDocumentRepository(documents_dir, catalog=catalog)
+    for index in range(1, 4):
+        repository.save(
+            Document(
+                filename=f"doc-{index}.pdf",
+                file_type="pdf",
+                status="failed" if index == 2 else "vectorized",
+                uploaded_at=started + timedelta(minutes=index),
+            )
+        )
+
+    assert [doc.filename for doc in repository.list(limit=2)] == ["doc-3.pdf", "doc-2.pdf"]
+    assert [doc.filename for doc in repository.list(limit=2, offset=2)] == ["doc-1.pdf", "old.pdf"]
+    assert [doc.filename for doc in repository.list(status="failed")] == ["doc-2.pdf"]
+    assert catalog.count("document", status="vectorized") == 3
+
+    # Entries come from the index alone: a body that no longer parses is still listed
+    newest = repository.list_entries(limit=1)[0]
+    (documents_dir / f"{newest.id}.json").write_text("{not json")
+    assert [entry.filename for entry in repository.list_entries(limit=1)] == ["doc-3.pdf"]
+    assert newest.path == str(documents_dir / f"{newest.id}.json")
+    assert newest.details["file_type"] == "pdf"
+
+    # Rows whose file was deleted outside the repository are dropped on the next listing
+    (documents_dir / f"{newest.id}.json").unlink()
+    assert [doc.filename for doc in repository.list(limit=1)] == ["doc-2.pdf"]
+    assert catalog.get("document", newest.id) is None
+    # Without a catalog the same queries fall back to scanning the directory
+    assert [entry.filename for entry in earlier.list_entries(status="vectorized")] == ["doc-1.pdf", "old.pdf"]
+
+
+def test_repositories_sharing_a_catalog_keep_their_own_rows(tmp_path):
+    from src.app.persistence.adapters.catalog_sqlite import SQLiteCatalog
+
+    store_a = FileSystemDocumentRepository(tmp_path / "a")
+    store_b = FileSystemDocumentRepository(tmp_path / "b")
+    store_a.save(Document(filename="a.pdf", file_type="pdf"))
+    store_b.save(Document(filename="b.pdf", file_type="pdf"))
+
+    catalog = SQLiteCatalog(tmp_path / "catalog.sqlite3")
+    indexed_a = FileSystemDocumentRepository(tmp_path / "a", catalog=catalog)
+    # B's existing files are indexed although A already indexed the "document" kind
+    indexed_b = FileSystemDocumentRepository(tmp_path / "b", catalog=catalog)
+
+    assert [doc.filename for doc in indexed_b.list()] == ["b.pdf"]
+    assert [doc.filename for doc in indexed_a.list()] == ["a.pdf"]
+    assert catalog.count("document") == 2
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from src.app.persistence.adapters.job_queue_sqlite import SQLiteJobQueue
+from src.app.services.job_worker import JobWorker
+
+
+def test_lease_is_exclusive_and_complete_finishes_the_job(tmp_path):
+    queue = SQLiteJobQueue(tmp_path / "jobs.sqlite3")
+    job = queue.enqueue("pipeline_run", {"run_id": "run-1"})
+
+    leased = queue.lease("worker-a")
+    assert leased is not None and leased.id == job.id
+    assert leased.status == "leased"
+    assert leased.attempts == 1
+    assert leased.payload == {"run_id": "run-1"}
+    assert queue.lease("worker-b") is None
+
+    assert queue.heartbeat(job.id, "worker-a")
+    assert not queue.heartbeat(job.id, "worker-b")
+    queue.complete(job.id, "worker-a")
+    assert queue.get(job.id).status == "completed"
+    assert queue.counts() == {"completed": 1}
+
+
+def test_concurrent_workers_never_share_a_job(tmp_path):
+    queue = SQLiteJobQueue(tmp_path / "jobs.sqlite3")
+    for index in range(20):
+        queue.enqueue("pipeline_run", {"index": index})
+    leased: list[str] = []
+    lock = threading.Lock()
+
+    def drain(worker_id: str) -> None:
+        while (job := queue.lease(worker_id)) is not None:
+            with lock:
+                leased.append(job.id)
+
+    workers = [threading.Thread(target=drain, args=(f"worker-{index}",)) for index in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(leased) == 20
+    assert len(set(leased)) == 20
+
+
+def test_expired_lease_is_picked_up_by_another_worker(tmp_path):
+    queue = SQLiteJobQueue(tmp_path / "jobs.sqlite3", lease_seconds=0.05, max_attempts=2)
+    job = queue.enqueue("pipeline_run", {})
+
+    assert queue.lease("crashed-worker") is not None
+    assert queue.lease("worker-b") is None
+    time.sleep(0.1)
+
+    resumed = queue.lease("worker-b")
+    assert resumed is not None and resumed.id == job.id
+    assert resumed.attempts == 2
+    # The crashed worker cannot complete a job it no longer owns
+    queue.complete(job.id, "crashed-worker")
+    assert queue.get(job.id).status == "leased"
+
+    time.sleep(0.1)
+    # Out of attempts: failed rather than handed to a third worker
+    assert queue.lease("worker-c") is None
+    assert queue.get(job.id).status == "failed"
+
+
+def test_worker_retries_until_attempts_run_out(tmp_path):
+    queue = SQLiteJobQueue(tmp_path / "jobs.sqlite3", max_attempts=2)
+    job = queue.enqueue("flaky", {})
+    calls: list[int] = []
+
+    def handler(leased_job) -> None:
+        calls.append(leased_job.attempts)
+        raise RuntimeError("boom")
+
+    worker = JobWorker(queue, {"flaky": handler}, worker_id="worker-a", retry_base_delay=0.0)
+    assert worker.run_once()
+    requeued = queue.get(job.id)
+    assert requeued.status == "queued"
+    assert "boom" in requeued.last_error
+
+    assert worker.run_once()
+    assert queue.get(job.id).status == "failed"
+    assert calls == [1, 2]
+    assert not worker.run_once()
+
+
+def test_failed_job_backs_off_exponentially(tmp_path):
+    queue = SQLiteJobQueue(tmp_path / "jobs.sqlite3")
+    job = queue.enqueue("flaky", {})
+
+    def handler(leased_job) -> None:
+        raise RuntimeError("boom")
+
+    worker = JobWorker(queue, {"flaky": handler}, worker_id="worker-a", retry_base_delay=60.0)
+    assert worker.run_once()
+    assert queue.get(job.id).status == "queued"
+    assert not worker.run_once()  # still backing off
+
+    assert [worker.retry_delay(attempt) for attempt in (1, 2, 3)] == [60.0, 120.0, 240.0]
+    assert worker.retry_delay(10) == worker.retry_max_delay
+
+
+def test_worker_run_processes_jobs_and_heartbeats(tmp_path):
+    queue = SQLiteJobQueue(tmp_path / "jobs.sqlite3", lease_seconds=0.2)
+    job = queue.enqueue("slow", {})
+    expirations: list[float] = []
+
+    def handler(leased_job) -> None:
+        for _ in range(3):
+            time.sleep(0.1)
+            expirations.append(queue.get(leased_job.id).lease_expires_at.timestamp())
+
+    worker = JobWorker(queue, {"slow": handler}, worker_id="worker-a", heartbeat_interval=0.05)
+    assert worker.run(max_jobs=1) == 1
+
+    assert queue.get(job.id).status == "completed"
+    # Heartbeats pushed the lease out while the handler ran past the original lease
+    assert expirations == sorted(expirations) and expirations[-1] > expirations[0]
@@ -291,3 +291,59 @@ def test_parsing_adapter_falls_back_if_structured_api_fails(tmp_path):
     assert isinstance(result, ParsedPage)
     assert result.document_id == "doc"
     assert result.page_number == 1
+
+
+def test_parsing_adapter_aparse_page_awaits_native_async_calls(tmp_path):
+    """aparse_page runs the same parse over achat/astream_chat and never calls the blocking LLM methods."""
+    import asyncio
+
+    pixmap_path = tmp_path / "page.png"
+    _write_png(pixmap_path)
+
+    class AsyncStructuredLLM(StubStructuredLLM):
+        def chat(self, messages: list, **kwargs):
+            raise AssertionError("blocking chat() used from aparse_page")
+
+        async def achat(self, messages: list, **kwargs) -> StubStructuredResponse:
+            await asyncio.sleep(0)
+            self.chat_calls.append((messages, kwargs))
+            return StubStructuredResponse(self._parsed_page)
+
+    class AsyncLLM(StubLLM):
+        def as_structured_llm(self, pydantic_class: type) -> StubStructuredLLM:
+            self.structured_llm_calls.append(pydantic_class)
+            return self._structured_llms.setdefault(pydantic_class, AsyncStructuredLLM(self._parsed_page))
+
+        def stream_chat(self, messages: list, **kwargs):
+            raise AssertionError("blocking stream_chat() used from aparse_page")
+
+        async def astream_chat(self, messages: list, **kwargs):
+            chunks = [self._parsed_page.model_dump_json()]
+            self.calls.append({"messages": messages, "streaming": True, **kwargs})
+
+            async def stream():
+                for text in chunks:
+                    await asyncio.sleep(0)
+                    yield type("Chunk", (), {"delta": text})()
+
+            return stream()
+
+    for use_streaming in (False, True):
+        llm = AsyncLLM()
+        adapter = ImageAwareParsingAdapter(
+            llm=llm,
+            prompt_settings=PromptSettings(),
+            use_structured_outputs=True,
+            use_streaming=use_streaming,
+        )
+
+        result = asyncio.run(
+            adapter.aparse_page(document_id="doc", page_number=1, raw_text="text", pixmap_path=str(pixmap_path))
+        )
+
+        assert result.parsing_status == "success"
+        assert (result.document_id, result.page_number) == ("doc", 1)
+        if use_streaming:
+            assert llm.calls and llm.calls[0]["streaming"]
+        else:
+            assert llm._structured_llms[ParsedPage].chat_calls
@@ -138,3 +138,63 @@ def test_supported_types_is_sequence():
     assert "pdf" in parser.supported_types
     assert len(parser.supported_types) == 1
 
+
+def test_parse_reuses_document_opened_by_share_pdf(monkeypatch):
+    """Inside share_pdf the parser reads text from the already open document."""
+    from src.app.parsing import pdf_backend
+
+    test_pdf_path = Path(__file__).parent / "test_document.pdf"
+    if not test_pdf_path.exists():
+        pytest.skip(f"Test PDF not found at {test_pdf_path}")
+
+    pdf_bytes = test_pdf_path.read_bytes()
+    with pdf_backend.share_pdf(pdf_bytes) as shared:
+        assert shared is not None
+
+        def fail_open(_: bytes):
+            raise AssertionError("PDF should not be opened twice")
+
+        monkeypatch.setattr(pdf_backend, "_open_document", fail_open)
+        page_texts = PdfParserAdapter().parse(pdf_bytes, "test_document.pdf")
+        assert len(page_texts) == shared.page_count == 10
+
+
+def test_parse_falls_back_to_pdfplumber_without_pymupdf(monkeypatch):
+    """pdfplumber still extracts text when the PyMuPDF backend is unavailable."""
+    from src.app.parsing import pdf_backend
+
+    test_pdf_path = Path(__file__).parent / "test_document.pdf"
+    if not test_pdf_path.exists():
+        pytest.skip(f"Test PDF not found at {test_pdf_path}")
+
+    def unavailable(_: bytes):
+        raise pdf_backend.PdfBackendError("PyMuPDF missing")
+
+    monkeypatch.setattr(pdf_backend, "_open_document", unavailable)
+    page_texts = PdfParserAdapter().parse(test_pdf_path.read_bytes(), "test_document.pdf")
+
+    assert len(page_texts) == 10
+    assert any(page_texts)
+
+
+def test_parallel_extraction_matches_serial_page_order():
+    """Page ranges extracted across processes come back in the serial order."""
+    test_pdf_path = Path(__file__).parent / "test_document.pdf"
+    if not test_pdf_path.exists():
+        pytest.skip(f"Test PDF not found at {test_pdf_path}")
+
+    pdf_bytes = test_pdf_path.read_bytes()
+    serial = PdfParserAdapter().parse(pdf_bytes, "test_document.pdf")
+    parallel = PdfParserAdapter(parallel_workers=2, parallel_min_pages=2, pages_per_task=3)
+
+    try:
+        stream = parallel.iter_pages(pdf_bytes, "test_document.pdf")
+        assert next(stream) == serial[0]
+        assert [serial[0], *stream] == serial
+        executor = parallel._executor
+        assert parallel.parse(pdf_bytes, "test_document.pdf") == serial
+        # One pool serves every document instead of a fresh one per PDF
+        assert parallel._executor is executor
+    finally:
+        parallel.shutdown()
+    assert parallel._executor is None
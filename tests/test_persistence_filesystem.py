@@ -34,3 +34,101 @@ def test_filesystem_repository_persists_runs(tmp_path: Path):
 
     runs = repo.list_runs()
     assert runs and runs[0].id == run.id
+
+
+def test_filesystem_repository_keeps_vectors_out_of_document_json(tmp_path: Path):
+    import json
+
+    from src.app.domain.models import Chunk, Metadata, Page
+
+    repo = FileSystemPipelineRunRepository(tmp_path)
+    document = Document(filename="demo.pdf", file_type="pdf", size_bytes=10)
+    chunk = Chunk(document_id=document.id, page_number=1, text="alpha", start_offset=0, end_offset=5)
+    chunk.metadata = Metadata(
+        document_id=document.id,
+        page_number=1,
+        chunk_id=chunk.id,
+        start_offset=0,
+        end_offset=5,
+        extra={"vector": [0.25, 0.5, 0.75]},
+    )
+    document = document.model_copy(
+        update={"pages": [Page(document_id=document.id, page_number=1, text="alpha", chunks=[chunk])]}
+    )
+    run = PipelineRunRecord(
+        id="run-vectors",
+        created_at=document.uploaded_at,
+        filename="demo.pdf",
+        content_type="application/pdf",
+        file_path=None,
+    )
+    repo.start_run(run)
+    repo.complete_run(run.id, PipelineResult(document=document, stages=[]))
+    repo.save_stage_snapshot(run.id, "vectorization", document)
+
+    stored = json.loads((tmp_path / run.id / "document.json").read_text())
+    assert stored["pages"][0]["chunks"][0]["metadata"]["extra"] == {"vector_row": 0}
+    assert repo.get_document_vectors(run.id).tolist() == [[0.25, 0.5, 0.75]]
+    # Snapshots come back whole, since a re-run reuses them as stage output
+    snapshot = repo.get_stage_snapshots(run.id)["vectorization"]
+    assert snapshot.pages[0].chunks[0].metadata.extra == {"vector": [0.25, 0.5, 0.75]}
+
+
+def test_filesystem_repository_reads_documents_with_configured_codec(tmp_path: Path):
+    import pytest
+
+    pytest.importorskip("orjson")
+    from src.app.persistence.adapters.document_codec import build_document_codec
+
+    repo = FileSystemPipelineRunRepository(tmp_path, codec=build_document_codec("orjson"))
+    document = Document(filename="demo.pdf", file_type="pdf", size_bytes=10, metadata={"pages": {"1": "a"}})
+    run = PipelineRunRecord(
+        id="run-codec",
+        created_at=document.uploaded_at,
+        filename="demo.pdf",
+        content_type="application/pdf",
+        file_path=None,
+        document=document,
+    )
+    repo.start_run(run)
+    repo.save_stage_snapshot(run.id, "parsing", document)
+
+    assert (tmp_path / run.id / "document.json").read_bytes().startswith(b'{"id":')
+    assert repo.get_run(run.id).document == document
+    assert repo.get_stage_snapshots(run.id) == {"parsing": document}
+
+
+def test_filesystem_repository_lists_runs_from_catalog(tmp_path: Path):
+    from datetime import datetime, timedelta
+
+    from src.app.persistence.adapters.catalog_sqlite import SQLiteCatalog
+
+    catalog = SQLiteCatalog(tmp_path / "catalog.sqlite3")
+    repo = FileSystemPipelineRunRepository(tmp_path / "runs", catalog=catalog)
+    started = datetime(2026, 1, 1)
+    for index in range(3):
+        document = Document(filename=f"doc-{index}.pdf", file_type="pdf", size_bytes=10)
+        repo.start_run(
+            PipelineRunRecord(
+                id=f"run-{index}",
+                created_at=started + timedelta(minutes=index),
+                filename=document.filename,
+                content_type="application/pdf",
+                file_path=f"uploads/doc-{index}.pdf",
+                document=document,
+            )
+        )
+    repo.complete_run("run-0", PipelineResult(document=Document(filename="doc-0.pdf", file_type="pdf"), stages=[]))
+    repo.fail_run("run-1", "parser crashed")
+
+    assert [run.id for run in repo.list_runs(limit=2)] == ["run-2", "run-1"]
+    assert [run.id for run in repo.list_runs(limit=2, offset=2)] == ["run-0"]
+    assert [run.id for run in repo.list_runs(status="failed")] == ["run-1"]
+    failed = catalog.get("run", "run-1")
+    assert failed.status == "failed"
+    assert failed.details["error_message"] == "parser crashed"
+    assert failed.size_bytes == (tmp_path / "runs" / "run-1" / "document.json").stat().st_size
+
+    # A second repository over the same directories reads the same catalog
+    reopened = FileSystemPipelineRunRepository(tmp_path / "runs", catalog=catalog)
+    assert [entry.status for entry in reopened.list_entries()] == ["running", "failed", "completed"]
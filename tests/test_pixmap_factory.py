@@ -144,3 +144,238 @@ def test_pixmap_factory_no_resize_when_not_configured(tmp_path):
     # No-resize version should be larger
     assert width_no_resize > width_with_resize
     assert height_no_resize > height_with_resize
+
+
+def test_parallel_pixmap_factory_renders_pdf_from_shared_memory(tmp_path):
+    from src.app.parsing.parallel_pixmap_factory import ParallelPixmapFactory
+
+    pdf_path = Path(__file__).parent / "doc_short_clean.pdf"
+    if not pdf_path.exists():
+        pytest.skip("Sample PDF not available for pixmap test")
+
+    factory = ParallelPixmapFactory(tmp_path, dpi=72, max_workers=2)
+    result = factory.generate("doc_shared", pdf_path.read_bytes())
+
+    assert sorted(result) == [1, 2]
+    assert all(info.path.exists() and info.size_bytes > 0 for info in result.values())
+    # Only the rendered pages remain; the published PDF buffer is released
+    assert sorted(path.name for path in tmp_path.rglob("*") if path.is_file()) == [
+        "page_0001.png",
+        "page_0002.png",
+    ]
+
+
+def test_render_worker_reuses_open_pdf_across_pages(tmp_path):
+    from src.app.parsing import parallel_pixmap_factory as module
+    from src.app.parsing import pdf_backend
+
+    pdf_path = Path(__file__).parent / "doc_short_clean.pdf"
+    if not pdf_path.exists():
+        pytest.skip("Sample PDF not available for pixmap test")
+
+    shared_pdf = pdf_backend.SharedPdfBytes.publish(pdf_path.read_bytes(), tmp_path)
+    try:
+        opened = []
+        for page_num in (1, 2):
+            output_path = tmp_path / f"page_{page_num:04d}.png"
+            result = module._render_page_worker(
+                (page_num, shared_pdf.source, str(output_path), 72, None, None, "LANCZOS", "doc", False, None)
+            )
+            assert result.success, result.error_message
+            opened.append(pdf_backend._worker_pdfs[shared_pdf.source].document)
+        assert opened[0] is opened[1]
+    finally:
+        pdf_backend.close_worker_pdf()
+        shared_pdf.release()
+
+
+def test_worker_closes_pdf_when_the_parent_signals_release(tmp_path):
+    from src.app.parsing import parallel_pixmap_factory as module
+    from src.app.parsing import pdf_backend
+
+    pdf_path = Path(__file__).parent / "doc_short_clean.pdf"
+    if not pdf_path.exists():
+        pytest.skip("Sample PDF not available for pixmap test")
+
+    released = []
+    shared_pdf = pdf_backend.SharedPdfBytes.publish(pdf_path.read_bytes(), tmp_path, on_release=released.append)
+    try:
+        with pdf_backend.worker_pdf(shared_pdf.source):
+            result = module._render_page_worker(
+                (1, shared_pdf.source, str(tmp_path / "page_0001.png"), 72, None, None, "LANCZOS", "doc", False, None)
+            )
+            assert result.success, result.error_message
+            shared_pdf.release()
+            shared_pdf.release()
+            assert released == [shared_pdf.source]
+            pdf_backend.close_worker_pdf(shared_pdf.source)
+            # Still in use by a task: kept open
+            assert shared_pdf.source in pdf_backend._worker_pdfs
+
+        # Closed as soon as the last task using it finishes
+        assert shared_pdf.source not in pdf_backend._worker_pdfs
+    finally:
+        pdf_backend.close_worker_pdf()
+        shared_pdf.release()
+
+
+def _cached_worker_pdfs(_: object) -> list:
+    from src.app.parsing import pdf_backend
+
+    return list(pdf_backend._worker_pdfs)
+
+
+def test_shared_render_pool_workers_close_pdf_after_the_document(tmp_path):
+    from src.app.parsing.parallel_pixmap_factory import ParallelPixmapFactory
+    from src.app.parsing.render_pool import PixmapRenderPool
+
+    pdf_path = Path(__file__).parent / "doc_short_clean.pdf"
+    if not pdf_path.exists():
+        pytest.skip("Sample PDF not available for pixmap test")
+
+    pool = PixmapRenderPool(max_workers=1)
+    try:
+        factory = ParallelPixmapFactory(tmp_path, dpi=72, render_pool=pool)
+        assert factory.generate("doc", pdf_path.read_bytes())
+        # The close task was queued on the worker before this probe
+        assert pool.submit_document(_cached_worker_pdfs, [None])[0].result(timeout=30) == []
+    finally:
+        pool.shutdown()
+
+
+def _stamp_after_delay(delay: float) -> int:
+    import time
+
+    time.sleep(delay)
+    return time.monotonic_ns()
+
+
+def test_render_pool_interleaves_pages_across_documents():
+    from src.app.parsing.render_pool import PixmapRenderPool
+
+    pool = PixmapRenderPool(max_workers=1, max_in_flight=1)
+    try:
+        large = pool.submit_document(_stamp_after_delay, [0.05, 0.05, 0.05])
+        small = pool.submit_document(_stamp_after_delay, [0.0])
+        large_stamps = [future.result(timeout=30) for future in large]
+        small_stamp = small[0].result(timeout=30)
+    finally:
+        pool.shutdown()
+
+    # The small document does not wait for the large one to finish
+    assert small_stamp < large_stamps[-1]
+
+
+def test_parallel_pixmap_factory_reuses_shared_render_pool(tmp_path):
+    from src.app.parsing.parallel_pixmap_factory import ParallelPixmapFactory
+    from src.app.parsing.render_pool import PixmapRenderPool
+
+    pdf_path = Path(__file__).parent / "doc_short_clean.pdf"
+    if not pdf_path.exists():
+        pytest.skip("Sample PDF not available for pixmap test")
+
+    pool = PixmapRenderPool(max_workers=2)
+    try:
+        factory = ParallelPixmapFactory(tmp_path, dpi=72, render_pool=pool)
+        first = factory.generate("doc_a", pdf_path.read_bytes())
+        executor = pool._executor
+        second = factory.generate("doc_b", pdf_path.read_bytes())
+        assert pool._executor is executor
+    finally:
+        pool.shutdown()
+
+    assert sorted(first) == sorted(second) == [1, 2]
+    assert all(info.path.exists() for info in [*first.values(), *second.values()])
+
+
+def test_pixmap_factory_keeps_encoded_pages_in_store_without_disk(tmp_path):
+    from src.app.parsing.pixmap_store import PixmapStore
+
+    pdf_path = Path(__file__).parent / "doc_short_clean.pdf"
+    if not pdf_path.exists():
+        pytest.skip("Sample PDF not available for pixmap test")
+
+    store = PixmapStore(persist=False)
+    factory = PixmapFactory(tmp_path, dpi=72, pixmap_store=store)
+    result = factory.generate("doc_memory", pdf_path.read_bytes())
+
+    first_page = result[1]
+    assert not first_page.path.exists()
+    cached = store.get(first_page.path)
+    assert cached is not None and cached.size_bytes == first_page.size_bytes
+    assert cached.data.startswith(b"\x89PNG")
+    # The base64 payload is encoded once and shared by later callers
+    assert store.base64(first_page.path) is store.base64(first_page.path)
+
+
+def test_pixmap_store_persists_in_background_and_evicts_by_bytes(tmp_path):
+    from src.app.parsing.pixmap_store import PixmapStore
+
+    store = PixmapStore(max_bytes=10)
+    first, second = tmp_path / "doc" / "page_0001.png", tmp_path / "doc" / "page_0002.png"
+    store.put(first, b"12345678")
+    store.put(second, b"abcdefgh")
+    store.flush()
+    try:
+        assert first.read_bytes() == b"12345678"
+        assert len(store) == 1 and store.total_bytes == 8
+        # Evicted entries are read back from their persisted copy
+        assert store.get(first).data == b"12345678"
+        assert store.stats["disk_reads"] == 1
+    finally:
+        store.close()
+
+
+def _text_and_photo_pdf() -> bytes:
+    fitz = pytest.importorskip("fitz")
+    Image = pytest.importorskip("PIL.Image")
+    import io
+    import random
+
+    rng = random.Random(7)
+    # Smooth gradients with sensor-like noise, as in a photograph or scan
+    photo = Image.new("RGB", (400, 520))
+    photo.putdata([
+        tuple(min(255, max(0, base + rng.randint(-12, 12))) for base in (x // 2, y // 3, (x + y) // 4))
+        for y in range(520)
+        for x in range(400)
+    ])
+    buffer = io.BytesIO()
+    photo.save(buffer, format="PNG")
+
+    pdf = fitz.open()
+    text_page = pdf.new_page(width=612, height=792)
+    text_page.insert_text((72, 72), "Torque the fasteners to 25 Nm before inspection.")
+    photo_page = pdf.new_page(width=612, height=792)
+    photo_page.insert_image(photo_page.rect, stream=buffer.getvalue())
+    return pdf.tobytes()
+
+
+def test_adaptive_pixmap_factory_fits_dpi_and_uses_jpeg_for_photos(tmp_path):
+    from src.app.parsing.pixmap_encoding import PixmapEncoding
+    from src.app.parsing.pixmap_store import PixmapStore
+
+    store = PixmapStore(persist=False)
+    factory = PixmapFactory(
+        tmp_path,
+        dpi=300,
+        max_width=800,
+        max_height=800,
+        pixmap_store=store,
+        encoding=PixmapEncoding(adaptive=True, quality=70),
+    )
+    result = factory.generate("doc_adaptive", _text_and_photo_pdf())
+
+    text_page, photo_page = result[1], result[2]
+    assert text_page.mimetype == "image/png" and text_page.path.suffix == ".png"
+    assert photo_page.mimetype == "image/jpeg" and photo_page.path.suffix == ".jpg"
+    assert photo_page.bytes_saved > 0
+    # 792pt tall page fitted to 800px: rendered directly at ~72 DPI, not 300
+    assert text_page.dpi == pytest.approx(800 / 792 * 72, abs=0.1)
+    assert store.mimetype(photo_page.path) == "image/jpeg"
+
+    from PIL import Image
+    import io
+
+    with Image.open(io.BytesIO(store.get(photo_page.path).data)) as image:
+        assert max(image.size) <= 800
@@ -150,3 +150,173 @@ def test_run_manager_run_sync_saves_document():
 
     assert outcome.document.id == result.document.id
     assert fake_doc_repo.saved and fake_doc_repo.saved[0].id == result.document.id
+
+
+def test_run_manager_rerun_skips_stages_with_unchanged_fingerprints(tmp_path):
+    from src.app.application.interfaces import NullObservabilityRecorder
+    from src.app.persistence.adapters.filesystem import FileSystemPipelineRunRepository
+    from src.app.persistence.adapters.ingestion_filesystem import FileSystemIngestionRepository
+    from src.app.services.chunking_service import ChunkingService
+    from src.app.services.cleaning_service import CleaningService
+    from src.app.services.enrichment_service import EnrichmentService
+    from src.app.services.ingestion_service import IngestionService
+    from src.app.services.parsing_service import ParsingService
+    from src.app.services.vector_service import VectorService
+
+    class CountingParser:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def supports_type(self, file_type: str) -> bool:
+            return True
+
+        def parse(self, file_bytes: bytes, filename: str) -> list[str]:
+            self.calls += 1
+            return ["Alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu"]
+
+    observability = NullObservabilityRecorder()
+    parser = CountingParser()
+    chunking = ChunkingService(observability=observability, chunk_size=40, chunk_overlap=0, strategy="fixed")
+    runner = PipelineRunner(
+        ingestion=IngestionService(
+            observability=observability,
+            repository=FileSystemIngestionRepository(tmp_path / "ingestion"),
+        ),
+        parsing=ParsingService(observability=observability, parsers=[parser]),
+        cleaning=CleaningService(observability=observability),
+        chunking=chunking,
+        enrichment=EnrichmentService(observability=observability),
+        vectorization=VectorService(observability=observability),
+        observability=observability,
+    )
+    repository = FileSystemPipelineRunRepository(tmp_path / "runs")
+    manager = PipelineRunManager(repository, runner, keep_stage_snapshots=True)
+    document = Document(filename="demo.pdf", file_type="pdf")
+    first_run = manager.create_run(
+        filename=document.filename, content_type="application/pdf", file_path=None, document=document
+    )
+    manager.run_async(first_run, document, ImmediateScheduler(), file_bytes=b"pdf-bytes")
+
+    chunking.chunk_size = 20
+    rerun = manager.rerun(first_run.id, ImmediateScheduler())
+
+    assert rerun is not None
+    stored = repository.get_run(rerun.id)
+    assert stored.status == "completed"
+    assert parser.calls == 1
+    reused = {name for name, stage in stored.stage_map.items() if stage.details.get("reused")}
+    assert reused == {"ingestion", "parsing", "cleaning"}
+    first_chunks = sum(len(page.chunks) for page in repository.get_run(first_run.id).document.pages)
+    rerun_chunks = sum(len(page.chunks) for page in stored.document.pages)
+    assert rerun_chunks > first_chunks
+
+
+def test_queued_run_resumes_from_last_completed_stage(tmp_path):
+    from src.app.application.interfaces import NullObservabilityRecorder
+    from src.app.persistence.adapters.filesystem import FileSystemPipelineRunRepository
+    from src.app.persistence.adapters.ingestion_filesystem import FileSystemIngestionRepository
+    from src.app.persistence.adapters.job_queue_sqlite import SQLiteJobQueue
+    from src.app.services.chunking_service import ChunkingService
+    from src.app.services.cleaning_service import CleaningService
+    from src.app.services.enrichment_service import EnrichmentService
+    from src.app.services.ingestion_service import IngestionService
+    from src.app.services.job_worker import JobWorker
+    from src.app.services.parsing_service import ParsingService
+    from src.app.services.run_manager import PIPELINE_RUN_JOB
+    from src.app.services.vector_service import VectorService
+
+    class CountingParser:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def supports_type(self, file_type: str) -> bool:
+            return True
+
+        def parse(self, file_bytes: bytes, filename: str) -> list[str]:
+            self.calls += 1
+            assert file_bytes == b"pdf-bytes"
+            return ["Alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu"]
+
+    class CrashOnceChunking(ChunkingService):
+        crashed = False
+
+        def chunk(self, document: Document) -> Document:
+            if not CrashOnceChunking.crashed:
+                CrashOnceChunking.crashed = True
+                raise RuntimeError("worker lost mid-run")
+            return super().chunk(document)
+
+    observability = NullObservabilityRecorder()
+    parser = CountingParser()
+    ingestion_repository = FileSystemIngestionRepository(tmp_path / "ingestion")
+    runner = PipelineRunner(
+        ingestion=IngestionService(observability=observability, repository=ingestion_repository),
+        parsing=ParsingService(observability=observability, parsers=[parser]),
+        cleaning=CleaningService(observability=observability),
+        chunking=CrashOnceChunking(observability=observability, chunk_size=40, chunk_overlap=0, strategy="fixed"),
+        enrichment=EnrichmentService(observability=observability),
+        vectorization=VectorService(observability=observability),
+        observability=observability,
+    )
+    repository = FileSystemPipelineRunRepository(tmp_path / "runs")
+    queue = SQLiteJobQueue(tmp_path / "jobs.sqlite3")
+    manager = PipelineRunManager(
+        repository,
+        runner,
+        job_queue=queue,
+        ingestion_repository=ingestion_repository,
+    )
+    document = Document(filename="demo.pdf", file_type="pdf", metadata={"content_type": "application/pdf"})
+    record = manager.create_run(
+        filename=document.filename, content_type="application/pdf", file_path=None, document=document
+    )
+
+    scheduler = ImmediateScheduler()
+    manager.run_async(record, document, scheduler, file_bytes=b"pdf-bytes")
+    assert not scheduler.scheduled
+    assert queue.counts() == {"queued": 1}
+
+    worker = JobWorker(queue, {PIPELINE_RUN_JOB: manager.run_queued_job}, retry_base_delay=0.0)
+    assert worker.run_once()  # attempt 1 dies in chunking
+    assert repository.get_run(record.id).status == "running"
+    assert worker.run_once()  # attempt 2 resumes
+
+    stored = repository.get_run(record.id)
+    assert stored.status == "completed"
+    assert queue.counts() == {"completed": 1}
+    assert parser.calls == 1
+    reused = {name for name, stage in stored.stage_map.items() if stage.details.get("reused")}
+    assert reused == {"ingestion", "parsing", "cleaning"}
+    assert sum(len(page.chunks) for page in stored.document.pages) > 0
+    assert stored.document.metadata["content_type"] == "application/pdf"
+
+
+def test_run_fails_when_its_job_lease_expires_on_the_last_attempt(tmp_path):
+    import time
+
+    from src.app.persistence.adapters.job_queue_sqlite import SQLiteJobQueue
+    from src.app.services.job_worker import JobWorker
+    from src.app.services.run_manager import PIPELINE_RUN_JOB
+
+    repository = FakePipelineRunRepository()
+    queue = SQLiteJobQueue(tmp_path / "jobs.sqlite3", lease_seconds=0.05, max_attempts=1)
+    manager = PipelineRunManager(repository, StubPipelineRunner(build_result()), job_queue=queue)
+    document = Document(filename="demo.pdf", file_type="pdf", metadata={"raw_file_path": "uploads/demo.pdf"})
+    record = manager.create_run(
+        filename=document.filename, content_type="application/pdf", file_path=None, document=document
+    )
+    manager.enqueue_run(record, document)
+
+    # A worker leases the only attempt and dies without a heartbeat
+    assert queue.lease("crashed-worker") is not None
+    time.sleep(0.1)
+
+    worker = JobWorker(
+        queue,
+        {PIPELINE_RUN_JOB: manager.run_queued_job},
+        expired_handlers={PIPELINE_RUN_JOB: manager.fail_expired_job},
+    )
+    assert not worker.run_once()
+    assert queue.counts() == {"failed": 1}
+    assert repository.get_run(record.id).status == "failed"
+    assert repository.failed == ["lease expired"]
@@ -6,7 +6,12 @@ import pytest
 
 from src.app.adapters.pdf_parser import PdfParserAdapter
 from src.app.application.interfaces import NullObservabilityRecorder
-from src.app.domain.models import Document
+from src.app.domain.models import Document, Page
+from src.app.persistence.adapters.cache_filesystem import (
+    FileSystemCleaningCache,
+    FileSystemEmbeddingCache,
+    FileSystemParseCache,
+)
 from src.app.persistence.adapters.ingestion_filesystem import FileSystemIngestionRepository
 from src.app.services.chunking_service import ChunkingService
 from src.app.services.cleaning_service import CleaningService
@@ -15,7 +20,7 @@ from src.app.services.parsing_service import ParsingService
 from src.app.services.ingestion_service import IngestionService
 from src.app.services.pipeline_runner import PipelineRunner
 from src.app.services.vector_service import VectorService
-from src.app.parsing.schemas import ParsedPage
+from src.app.parsing.schemas import CleanedPage, CleanedSegment, ParsedPage, ParsedTextComponent
 from src.app.parsing.pixmap_factory import PixmapInfo
 
 
@@ -49,6 +54,30 @@ def test_ingestion_persists_raw_file(tmp_path):
     assert updated.metadata["raw_file_checksum"]
 
 
+def test_ingestion_spools_stream_in_chunks(tmp_path, monkeypatch):
+    import hashlib
+    import io
+
+    from src.app.persistence.adapters import ingestion_filesystem
+
+    monkeypatch.setattr(ingestion_filesystem, "STREAM_CHUNK_SIZE", 4)
+    repository = FileSystemIngestionRepository(tmp_path)
+    service = IngestionService(observability=build_null_observability(), repository=repository)
+    payload = b"Example PDF bytes streamed in pieces"
+
+    spooled = service.spool(build_document(), io.BytesIO(payload))
+
+    stored_path = Path(spooled.metadata["raw_file_path"])
+    assert stored_path.read_bytes() == payload
+    assert spooled.metadata["raw_file_checksum"] == hashlib.sha256(payload).hexdigest()
+    assert spooled.size_bytes == len(payload)
+    assert not list(stored_path.parent.glob("*.part"))
+    # Ingestion keeps the spooled file instead of storing it again
+    ingested = service.ingest(spooled)
+    assert ingested.metadata["raw_file_path"] == str(stored_path)
+    assert len(list(stored_path.parent.iterdir())) == 1
+
+
 def test_parsing_creates_pages():
     """Test that parsing creates pages (may use placeholder if no parser provided)."""
     observability = build_null_observability()
@@ -77,6 +106,29 @@ def test_parsing_uses_parser_with_file_bytes():
     assert result.pages[0].text == "Page One"
 
 
+def test_parsing_streams_pages_from_parsers_with_iter_pages():
+    class StreamingParser:
+        def supports_type(self, file_type: str) -> bool:
+            return True
+
+        def parse(self, file_bytes: bytes, filename: str) -> list[str]:
+            raise AssertionError("streaming should not extract the whole file up front")
+
+        def iter_pages(self, file_bytes: bytes, filename: str):
+            yield "Page One"
+            yield "Page Two"
+
+    parsing = ParsingService(observability=build_null_observability(), parsers=[StreamingParser()])
+    document = IngestionService(observability=build_null_observability()).ingest(build_document())
+
+    plan, pages = parsing.stream_pages(document, file_bytes=b"payload")
+    assert plan.page_texts == []
+    assert next(pages) == (1, "Page One")
+    assert plan.page_texts == ["Page One"]
+    assert list(pages) == [(2, "Page Two")]
+    assert plan.page_texts == ["Page One", "Page Two"]
+
+
 def test_parsing_reads_from_stored_path(tmp_path):
     """Test that parsing can read file bytes from stored path using a stub parser."""
     class PathParser:
@@ -97,6 +149,23 @@ def test_parsing_reads_from_stored_path(tmp_path):
     assert result.pages[0].text == "Stored bytes"
 
 
+def test_parsing_memory_maps_stored_pdf(tmp_path):
+    fitz = pytest.importorskip("fitz")
+    from src.app.adapters.pdf_parser import PdfParserAdapter
+    from src.app.parsing.mapped_file import MappedFile
+
+    pdf = fitz.open()
+    pdf.new_page().insert_text((72, 72), "Mapped page text")
+    stored = tmp_path / "doc.pdf"
+    stored.write_bytes(pdf.tobytes())
+    parsing = ParsingService(observability=build_null_observability(), parsers=[PdfParserAdapter()])
+    document = build_document().model_copy(update={"metadata": {"raw_file_path": str(stored)}})
+
+    mapped = parsing.open_raw_file(document)
+    assert isinstance(mapped, MappedFile) and len(mapped) == stored.stat().st_size
+    assert parsing.parse(document).pages[0].text == "Mapped page text"
+
+
 def test_parsing_attaches_pixmap_metadata_when_enabled(tmp_path):
     class StubParser:
         def supports_type(self, file_type: str) -> bool:
@@ -148,6 +217,99 @@ def test_parsing_attaches_pixmap_metadata_when_enabled(tmp_path):
     assert metrics["skipped"] == 0
 
 
+def test_parsing_reuses_cached_pages_for_reingested_file(tmp_path):
+    class StubParser:
+        def supports_type(self, file_type: str) -> bool:
+            return True
+
+        def parse(self, file_bytes: bytes, filename: str) -> list[str]:
+            return ["Parsed content"]
+
+    class StructuredStub:
+        cache_identity = {"prompt_sha256": "prompt", "model": "stub-model"}
+
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def parse_page(self, *, document_id: str, page_number: int, raw_text: str, pixmap_path: str | None = None):
+            self.calls += 1
+            return ParsedPage(document_id=document_id, page_number=page_number, raw_text="from llm")
+
+    class PixmapStubGenerator:
+        def __init__(self, path: Path) -> None:
+            self._info = PixmapInfo(page_number=1, path=path, size_bytes=path.stat().st_size)
+
+        def generate(self, document_id: str, pdf_bytes: bytes):
+            return {1: self._info}
+
+    pixmap_path = tmp_path / "page_0001.png"
+    pixmap_path.write_bytes(b"img-bytes")
+    structured_parser = StructuredStub()
+    parsing = ParsingService(
+        observability=build_null_observability(),
+        parsers=[StubParser()],
+        structured_parser=structured_parser,
+        include_images=True,
+        pixmap_generator=PixmapStubGenerator(pixmap_path),
+        parse_cache=FileSystemParseCache(tmp_path / "cache"),
+    )
+
+    first = parsing.parse(build_document(), file_bytes=b"fake-pdf")
+    second_document = build_document()
+    second = parsing.parse(second_document, file_bytes=b"fake-pdf")
+
+    assert structured_parser.calls == 1
+    assert first.metadata["pixmap_metrics"]["parse_cache_hits"] == 0
+    assert second.metadata["pixmap_metrics"]["parse_cache_hits"] == 1
+    cached_meta = second.metadata["parsed_pages"]["1"]
+    assert cached_meta["raw_text"] == "from llm"
+    assert cached_meta["document_id"] == second_document.id
+
+    pixmap_path.write_bytes(b"different-img-bytes")
+    parsing.parse(build_document(), file_bytes=b"fake-pdf")
+    assert structured_parser.calls == 2
+
+
+def test_parsing_triage_builds_text_pages_without_the_llm():
+    fitz = pytest.importorskip("fitz")
+    from src.app.parsing.page_triage import PageTriage
+
+    class StructuredStub:
+        def __init__(self) -> None:
+            self.pages: list[int] = []
+
+        def parse_page(self, *, document_id: str, page_number: int, raw_text: str, pixmap_path: str | None = None):
+            self.pages.append(page_number)
+            return ParsedPage(document_id=document_id, page_number=page_number, raw_text="from llm")
+
+    pdf = fitz.open()
+    text_page = pdf.new_page()
+    text_page.insert_text((72, 72), "Maintenance Procedure", fontsize=18)
+    body = "Inspect the actuator housing for cracks and corrosion before each flight. " * 2
+    for line in range(4):
+        text_page.insert_text((72, 110 + line * 14), body[:90], fontsize=10)
+    figure_page = pdf.new_page()
+    figure_page.insert_text((72, 72), "Figure 1", fontsize=10)
+    figure_page.draw_rect(fitz.Rect(72, 100, 300, 300))
+    for offset in range(0, 200, 10):
+        figure_page.draw_line((72 + offset, 100), (300, 300 - offset))
+
+    structured_parser = StructuredStub()
+    parsing = ParsingService(
+        observability=build_null_observability(),
+        parsers=[PdfParserAdapter()],
+        structured_parser=structured_parser,
+        page_triage=PageTriage(),
+    )
+    result = parsing.parse(build_document(), file_bytes=pdf.tobytes())
+
+    assert structured_parser.pages == [2]
+    local_page = result.metadata["parsed_pages"]["1"]
+    assert [component["text_type"] for component in local_page["components"]] == ["heading", "paragraph"]
+    assert local_page["raw_text"].startswith("## Maintenance Procedure")
+    assert result.metadata["pixmap_metrics"]["vision_skipped_pages"] == 1
+
+
 def test_parsing_with_real_pdf_parser():
     """Test that parsing service works with the real PDF parser adapter."""
     test_pdf_path = Path(__file__).parent / "test_document.pdf"
@@ -424,6 +586,73 @@ def test_vectorization_attaches_vectors():
     assert len(chunk.metadata.extra["vector"]) == 4
 
 
+def test_vectorization_reuses_cached_embeddings(tmp_path):
+    class CountingEmbeddingGenerator:
+        cache_identity = {"model": "stub-embedding", "dimensions": 3}
+        dimension = 3
+
+        def __init__(self) -> None:
+            self.embedded: list[str] = []
+
+        def embed(self, texts):
+            self.embedded.extend(texts)
+            return [[0.5, 0.25, float(len(text))] for text in texts]
+
+    observability = build_null_observability()
+    parsing = ParsingService(observability=observability)
+    chunking = ChunkingService(observability=observability)
+    generator = CountingEmbeddingGenerator()
+    vectorization = VectorService(
+        observability=observability,
+        embedding_generator=generator,
+        embedding_cache=FileSystemEmbeddingCache(tmp_path),
+    )
+
+    chunked = chunking.chunk(parsing.parse(build_document()), size=30, overlap=5)
+    first = vectorization.vectorize(chunked)
+    embedded_once = len(generator.embedded)
+    second = vectorization.vectorize(chunked)
+
+    assert embedded_once == len(set(generator.embedded))
+    assert len(generator.embedded) == embedded_once
+    first_vectors = [c.metadata.extra["vector"] for p in first.pages for c in p.chunks]
+    second_vectors = [c.metadata.extra["vector"] for p in second.pages for c in p.chunks]
+    assert second_vectors == first_vectors
+
+
+def test_vectorization_embeds_all_pages_in_one_call():
+    class BatchRecordingGenerator:
+        dimension = 2
+
+        def __init__(self) -> None:
+            self.calls: list[list[str]] = []
+
+        def embed(self, texts):
+            self.calls.append(list(texts))
+            return [[float(index), float(len(text))] for index, text in enumerate(texts)]
+
+    observability = build_null_observability()
+    parsing = ParsingService(observability=observability)
+    chunking = ChunkingService(observability=observability)
+    generator = BatchRecordingGenerator()
+    vectorization = VectorService(observability=observability, embedding_generator=generator)
+
+    document = chunking.chunk(
+        parsing.parse(build_document(), file_bytes=None), size=30, overlap=5
+    )
+    pages = [
+        document.pages[0],
+        document.pages[0].model_copy(update={"page_number": 2}),
+    ]
+    vectorized = vectorization.vectorize(document.model_copy(update={"pages": pages}))
+
+    chunk_count = sum(len(page.chunks) for page in pages)
+    assert len(generator.calls) == 1
+    assert len(generator.calls[0]) == chunk_count
+    vectors = [chunk.metadata.extra["vector"] for page in vectorized.pages for chunk in page.chunks]
+    assert [vector[0] for vector in vectors] == [float(index) for index in range(chunk_count)]
+
+
 class StubObservabilityRecorder:
     def __init__(self) -> None:
         self.events: list[tuple[str, dict]] = []
@@ -440,6 +669,107 @@ def test_ingestion_emits_observability_event():
     assert any(stage == "ingestion" for stage, _ in recorder.events)
 
 
+def test_cleaning_cache_skips_llm_for_identical_parsed_pages(tmp_path):
+    class StructuredCleanerStub:
+        cache_identity = {"prompt_sha256": "prompt", "model": "stub-model", "uses_pixmap": False}
+
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def clean_page(self, parsed_page: ParsedPage, pixmap_path: str | None = None) -> CleanedPage:
+            self.calls += 1
+            return CleanedPage(
+                document_id=parsed_page.document_id,
+                page_number=parsed_page.page_number,
+                segments=[CleanedSegment(segment_id="seg-1", text="Cleaned text")],
+            )
+
+    def parsed_document() -> Document:
+        document = build_document()
+        parsed_page = ParsedPage(
+            document_id=document.id,
+            page_number=1,
+            raw_text="Raw   text",
+            components=[ParsedTextComponent(id="comp-1", order=0, text="Raw   text")],
+        )
+        document = document.add_page(Page(document_id=document.id, page_number=1, text="Raw   text"))
+        return document.model_copy(update={"metadata": {"parsed_pages": {"1": parsed_page.model_dump()}}})
+
+    recorder = StubObservabilityRecorder()
+    cleaner = StructuredCleanerStub()
+    cleaning = CleaningService(
+        observability=recorder,
+        structured_cleaner=cleaner,
+        cleaning_cache=FileSystemCleaningCache(tmp_path, memory_entries=0),
+    )
+
+    cleaning.clean(parsed_document())
+    second_document = parsed_document()
+    result = cleaning.clean(second_document)
+
+    assert cleaner.calls == 1
+    assert result.pages[0].cleaned_text == "Cleaned text"
+    assert result.metadata["cleaned_pages_llm"]["1"]["document_id"] == second_document.id
+    cache_events = [details["cache"] for stage, details in recorder.events if stage == "cleaning"]
+    assert cache_events == [{"hits": 0, "misses": 1}, {"hits": 1, "misses": 0}]
+
+
+def test_cleaning_cache_does_not_store_fallback_after_llm_failure(tmp_path):
+    from types import SimpleNamespace
+
+    from src.app.adapters.llama_index.cleaning_adapter import CleaningAdapter
+    from src.app.config import PromptSettings
+
+    class FlakyLLM:
+        """Rate-limited on the first request, then answers."""
+
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def as_structured_llm(self, output_cls):
+            return self
+
+        def complete(self, prompt: str):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("429 Too Many Requests")
+            return SimpleNamespace(
+                raw=CleanedPage(
+                    document_id="doc",
+                    page_number=1,
+                    segments=[CleanedSegment(segment_id="comp-1", text="Cleaned text")],
+                )
+            )
+
+    def parsed_document() -> Document:
+        document = build_document()
+        parsed_page = ParsedPage(
+            document_id=document.id,
+            page_number=1,
+            raw_text="Raw   text",
+            components=[ParsedTextComponent(id="comp-1", order=0, text="Raw   text")],
+        )
+        document = document.add_page(Page(document_id=document.id, page_number=1, text="Raw   text"))
+        return document.model_copy(update={"metadata": {"parsed_pages": {"1": parsed_page.model_dump()}}})
+
+    llm = FlakyLLM()
+    recorder = StubObservabilityRecorder()
+    cleaning = CleaningService(
+        observability=recorder,
+        structured_cleaner=CleaningAdapter(llm=llm, prompt_settings=PromptSettings()),
+        cleaning_cache=FileSystemCleaningCache(tmp_path, memory_entries=0),
+    )
+
+    degraded = cleaning.clean(parsed_document())
+    result = cleaning.clean(parsed_document())
+
+    assert degraded.pages[0].cleaned_text == "Raw   text"
+    assert llm.calls == 2
+    assert result.pages[0].cleaned_text == "Cleaned text"
+    cache_events = [details["cache"] for stage, details in recorder.events if stage == "cleaning"]
+    assert cache_events == [{"hits": 0, "misses": 1}, {"hits": 0, "misses": 1}]
+
+
 def test_pipeline_runner_emits_completion_event():
     recorder = StubObservabilityRecorder()
     ingestion = IngestionService(observability=recorder)
@@ -609,3 +939,265 @@ def test_document_add_chunk_returns_new_instance():
     assert result is not original
     assert len(original.pages[0].chunks) == 0
     assert len(result.pages[0].chunks) == 1
+
+
+def test_document_add_chunks_matches_repeated_add_chunk():
+    """Test that the bulk chunk API produces what per-chunk add_chunk calls do."""
+    from src.app.domain.models import Chunk, Metadata, Page
+
+    document = build_document().add_page(Page(document_id="x", page_number=1, text="Test"))
+    foreign = Chunk(
+        document_id="other",
+        page_number=9,
+        text="Moved",
+        start_offset=0,
+        end_offset=5,
+        metadata=Metadata(document_id="other", page_number=9, chunk_id="stale", start_offset=0, end_offset=5),
+    )
+    owned = Chunk(document_id=document.id, page_number=1, text="Kept", start_offset=0, end_offset=4)
+    additions = [(1, owned), (3, foreign), (1, foreign)]
+
+    expected = document
+    for page_number, chunk in additions:
+        expected = expected.add_chunk(page_number, chunk)
+    batch = document.chunk_batch()
+    for page_number, chunk in additions:
+        batch.add(page_number, chunk)
+    result = batch.build()
+
+    assert len(batch) == 3
+    assert [page.page_number for page in result.pages] == [1, 3]
+    assert result.model_dump(exclude={"pages": {"__all__": {"id"}}}) == (
+        expected.model_dump(exclude={"pages": {"__all__": {"id"}}})
+    )
+    assert result.pages[0].chunks[0] is owned  # Already normalized chunks are not copied
+    assert result.pages[1].chunks[0].metadata.chunk_id == foreign.id
+    assert document.pages[0].chunks == []
+
+
+def test_chunking_large_document_in_one_bulk_build():
+    from src.app.domain.models import Page
+
+    document = build_document()
+    pages = [Page(document_id=document.id, page_number=n, text="word " * 200) for n in range(1, 1001)]
+    document = document.model_copy(update={"pages": pages})
+    chunking = ChunkingService(observability=build_null_observability(), chunk_size=100, chunk_overlap=0, strategy="fixed")
+
+    chunked = chunking.chunk(document)
+
+    assert [page.page_number for page in chunked.pages] == list(range(1, 1001))
+    assert sum(len(page.chunks) for page in chunked.pages) == 10_000
+    assert chunked.pages[-1].chunks[-1].metadata.title == "sample.pdf-p1000-c9"
+
+
+def test_owned_stages_update_in_place_with_same_result():
+    from src.app.services.document_ownership import run_owned
+
+    observability = build_null_observability()
+    parsing = ParsingService(observability=observability)
+    chunking = ChunkingService(observability=observability, chunk_size=30, chunk_overlap=5, strategy="fixed")
+    stages = [
+        CleaningService(observability=observability).clean,
+        EnrichmentService(observability=observability).enrich,
+        VectorService(observability=observability, dimension=4).vectorize,
+    ]
+    parsed = parsing.parse(IngestionService(observability=observability).ingest(build_document()))
+    copied = owned = chunking.chunk(parsed.model_copy(update={"pages": [page.model_copy() for page in parsed.pages]}))
+    for stage in stages:
+        owned_input = owned.model_copy(deep=True)
+        before = copied.model_dump()
+        copied = stage(copied)
+        owned = run_owned(stage, owned_input)
+
+        assert owned is owned_input
+        assert copied.model_dump() == owned.model_dump()
+        # Outside run_owned the public API still leaves its input untouched
+        assert copied.model_dump() != before
+    assert all("vector" in chunk.metadata.extra for page in owned.pages for chunk in page.chunks)
+
+
+def test_pipeline_runner_in_place_stages_leave_caller_documents_untouched():
+    observability = build_null_observability()
+
+    def build_runner(in_place_stages: bool) -> PipelineRunner:
+        return PipelineRunner(
+            ingestion=IngestionService(observability=observability),
+            parsing=ParsingService(observability=observability),
+            cleaning=CleaningService(observability=observability),
+            chunking=ChunkingService(observability=observability),
+            enrichment=EnrichmentService(observability=observability),
+            vectorization=VectorService(observability=observability, dimension=4),
+            observability=observability,
+            in_place_stages=in_place_stages,
+        )
+
+    document = build_document()
+    document_before = document.model_dump()
+    copied = build_runner(False).run(document, file_bytes=b"pdf-bytes").document
+    first = build_runner(True).run(document, file_bytes=b"pdf-bytes").document
+
+    assert document.model_dump() == document_before
+    assert first.metadata["stage_fingerprints"] == copied.metadata["stage_fingerprints"]
+    assert [
+        (chunk.contextualized_text, chunk.metadata.extra["vector"]) for page in first.pages for chunk in page.chunks
+    ] == [(chunk.contextualized_text, chunk.metadata.extra["vector"]) for page in copied.pages for chunk in page.chunks]
+
+    # Reused snapshots belong to the caller: stages after them must copy
+    snapshot = first.model_copy(deep=True)
+    snapshot_before = snapshot.model_dump()
+    runner = build_runner(True)
+    runner.enrichment.use_llm_summarization = False
+    rerun = runner.run(document, file_bytes=b"pdf-bytes", previous_snapshots={"chunking": snapshot}).document
+
+    assert snapshot.model_dump() == snapshot_before
+    assert rerun.status == "vectorized"
+
+
+@pytest.mark.asyncio
+async def test_streaming_page_pipeline_cleans_pages_before_slow_page_parses():
+    import threading
+    import time
+
+    from src.app.services.streaming_page_pipeline import StreamingPagePipeline
+
+    order: list[str] = []
+    lock = threading.Lock()
+
+    class StubParser:
+        def supports_type(self, file_type: str) -> bool:
+            return True
+
+        def parse(self, file_bytes: bytes, filename: str) -> list[str]:
+            return ["Slow   first page", "Second page text", "Third page text"]
+
+    class SlowFirstPageParser:
+        def parse_page(self, *, document_id: str, page_number: int, raw_text: str, pixmap_path: str | None = None):
+            if page_number == 1:
+                time.sleep(0.3)
+            with lock:
+                order.append(f"parsed-{page_number}")
+            return ParsedPage(
+                document_id=document_id,
+                page_number=page_number,
+                raw_text=raw_text,
+                components=[ParsedTextComponent(order=0, text=raw_text)],
+                page_summary=f"Summary {page_number}",
+            )
+
+    class RecordingCleaner:
+        def clean_page(self, parsed_page: ParsedPage, pixmap_path: str | None = None) -> CleanedPage:
+            with lock:
+                order.append(f"cleaned-{parsed_page.page_number}")
+            return CleanedPage(
+                document_id=parsed_page.document_id,
+                page_number=parsed_page.page_number,
+                segments=[CleanedSegment(segment_id="s1", text=" ".join(parsed_page.raw_text.split()))],
+            )
+
+    def build_services(recorder):
+        return dict(
+            parsing_service=ParsingService(
+                observability=recorder, parsers=[StubParser()], structured_parser=SlowFirstPageParser()
+            ),
+            cleaning_service=CleaningService(observability=recorder, structured_cleaner=RecordingCleaner()),
+            chunking_service=ChunkingService(observability=recorder, chunk_size=8, chunk_overlap=0),
+            enrichment_service=EnrichmentService(observability=recorder),
+            vector_service=VectorService(observability=recorder, dimension=4),
+        )
+
+    recorder = StubObservabilityRecorder()
+    pipeline = StreamingPagePipeline(observability=recorder, max_workers=2, queue_size=1, **build_services(recorder))
+    completed_stages: list[str] = []
+    document = build_document()
+
+    streamed = await pipeline.run(document, b"bytes", on_stage_complete=completed_stages.append)
+
+    assert order.index("cleaned-2") < order.index("parsed-1")
+    assert completed_stages == ["parsing", "cleaning", "chunking", "enrichment", "vectorization"]
+    assert streamed.status == "vectorized"
+    assert [page.page_number for page in streamed.pages] == [1, 2, 3]
+
+    services = build_services(build_null_observability())
+    staged = PipelineRunner(
+        ingestion=IngestionService(observability=build_null_observability()),
+        parsing=services["parsing_service"],
+        cleaning=services["cleaning_service"],
+        chunking=services["chunking_service"],
+        enrichment=services["enrichment_service"],
+        vectorization=services["vector_service"],
+        observability=build_null_observability(),
+    ).run(document, file_bytes=b"bytes").document
+
+    assert streamed.summary == staged.summary
+    assert [page.cleaned_text for page in streamed.pages] == [page.cleaned_text for page in staged.pages]
+    assert [[chunk.contextualized_text for chunk in page.chunks] for page in streamed.pages] == [
+        [chunk.contextualized_text for chunk in page.chunks] for page in staged.pages
+    ]
+    assert streamed.metadata["cleaning_report"] == staged.metadata["cleaning_report"]
+    assert set(streamed.metadata["parsed_pages"]) == {"1", "2", "3"}
+    assert all("vector" in chunk.metadata.extra for page in streamed.pages for chunk in page.chunks)
+    assert any(stage == "page_streaming" for stage, _ in recorder.events)
+    recorded_stages = [stage for stage, _ in recorder.events]
+    assert [stage for stage in recorded_stages if stage in completed_stages] == completed_stages
+    chunking_event = next(details for stage, details in recorder.events if stage == "chunking")
+    assert chunking_event["chunk_count"] == sum(len(page.chunks) for page in streamed.pages)
+
+
+@pytest.mark.asyncio
+async def test_streaming_page_pipeline_awaits_native_async_parser_and_cleaner():
+    import asyncio
+    import threading
+
+    from src.app.services.streaming_page_pipeline import StreamingPagePipeline
+
+    class StubParser:
+        def supports_type(self, file_type: str) -> bool:
+            return True
+
+        def parse(self, file_bytes: bytes, filename: str) -> list[str]:
+            return ["First page", "Second page"]
+
+    loop_thread = threading.current_thread()
+    both_parsing = asyncio.Barrier(2)
+
+    class AsyncParser:
+        def parse_page(self, **kwargs):
+            raise AssertionError("blocking parse_page used by the streaming pipeline")
+
+        async def aparse_page(self, *, document_id: str, page_number: int, raw_text: str, pixmap_path: str | None = None):
+            assert threading.current_thread() is loop_thread
+            # Both pages are in flight at once on the event loop, without a thread each
+            await asyncio.wait_for(both_parsing.wait(), timeout=5)
+            return ParsedPage(
+                document_id=document_id,
+                page_number=page_number,
+                raw_text=raw_text,
+                components=[ParsedTextComponent(order=0, text=raw_text)],
+            )
+
+    class AsyncCleaner:
+        def clean_page(self, parsed_page: ParsedPage, pixmap_path: str | None = None) -> CleanedPage:
+            raise AssertionError("blocking clean_page used by the streaming pipeline")
+
+        async def aclean_page(self, parsed_page: ParsedPage, pixmap_path: str | None = None) -> CleanedPage:
+            assert threading.current_thread() is loop_thread
+            return CleanedPage(
+                document_id=parsed_page.document_id,
+                page_number=parsed_page.page_number,
+                segments=[CleanedSegment(segment_id="s1", text=parsed_page.raw_text.upper())],
+            )
+
+    recorder = StubObservabilityRecorder()
+    pipeline = StreamingPagePipeline(
+        observability=recorder,
+        parsing_service=ParsingService(observability=recorder, parsers=[StubParser()], structured_parser=AsyncParser()),
+        cleaning_service=CleaningService(observability=recorder, structured_cleaner=AsyncCleaner()),
+        chunking_service=ChunkingService(observability=recorder, chunk_size=8, chunk_overlap=0),
+        enrichment_service=EnrichmentService(observability=recorder),
+        vector_service=VectorService(observability=recorder, dimension=4),
+        max_workers=2,
+    )
+
+    streamed = await pipeline.run(build_document(), b"bytes")
+
+    assert [page.cleaned_text for page in streamed.pages] == ["FIRST PAGE", "SECOND PAGE"]
@@ -86,6 +86,22 @@ class TestUploadDocumentUseCase:
         assert saved is not None
         assert saved.id == document.id
 
+    def test_execute_spools_stream_to_ingestion_storage(self, tmp_path):
+        import io
+
+        from src.app.persistence.adapters.ingestion_filesystem import FileSystemIngestionRepository
+
+        runner = build_pipeline_runner()
+        runner.ingestion.repository = FileSystemIngestionRepository(tmp_path / "ingestion")
+        use_case = UploadDocumentUseCase(runner=runner, repository=FileSystemDocumentRepository(tmp_path / "docs"))
+
+        document = use_case.execute(filename="test.docx", file_type="docx", stream=io.BytesIO(b"streamed content"))
+
+        assert document.status == "vectorized"
+        assert document.size_bytes == len(b"streamed content")
+        assert open(document.metadata["raw_file_path"], "rb").read() == b"streamed content"
+        assert document.metadata["raw_file_checksum"]
+
     def test_execute_handles_extension_parsing(self, tmp_path):
         runner = build_pipeline_runner()
         repository = FileSystemDocumentRepository(tmp_path)